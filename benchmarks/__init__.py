@@ -0,0 +1,201 @@
+"""Benchmarks of Qt.py
+
+Each benchmark is a module of this package run with `python -m`, e.g.
+
+    $ python -m benchmarks.startup --binding PySide6
+
+Results are written to JSON in `.benchmarks`, or `--output`. Pass a previous
+result, or a directory of previous results, with `--baseline` to compare
+against it, any metric that got worse by more than `--threshold` is reported
+as a regression and the exit code is non-zero.
+
+Metrics ending with "_per_s" are rates where higher is better, lower is better
+for all other metrics.
+
+"""
+
+import os
+import re
+import sys
+import json
+import platform
+import statistics
+import subprocess
+from argparse import ArgumentParser
+from pathlib import Path
+
+from build_stubs import binding_version
+
+REPO_ROOT = Path(__file__).parent.parent
+RESULTS_PATH = Path("./.benchmarks")
+
+# Imports Qt.py from src, not any installed copy
+QT_PATH = REPO_ROOT / "src"
+
+# Relative increase of a metric reported as a regression
+DEFAULT_THRESHOLD = 0.1
+
+
+def qt_version():
+    """Return the version of Qt.py being benchmarked, without importing it"""
+    source = (QT_PATH / "Qt.py").read_text(encoding="utf-8")
+    return re.search(r'^__version__ = "(.+)"', source, re.MULTILINE).group(1)
+
+
+def environment(binding):
+    """Return a description of what the results were measured with"""
+    return {
+        "qt.py": qt_version(),
+        "binding": binding,
+        "binding_version": binding_version(binding),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+    }
+
+
+def run_python(code, binding, path=(), env=None):
+    """Run `code` in a fresh interpreter and return the JSON it prints last
+
+    Args:
+        code (str): Source code to run with `python -c`.
+        binding (str): Value of QT_PREFERRED_BINDING.
+        path (list): Directories prepended to PYTHONPATH, after Qt.py's src.
+        env (dict, optional): Additional environment variables.
+
+    """
+    full_env = dict(os.environ)
+    full_env.update(env or {})
+    full_env["QT_PREFERRED_BINDING"] = binding
+    full_env.pop("QT_PREFERRED_BINDING_JSON", None)
+    full_env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    full_env["PYTHONPATH"] = os.pathsep.join(
+        [str(p) for p in path]
+        + [str(QT_PATH)]
+        + [p for p in [os.environ.get("PYTHONPATH")] if p]
+    )
+
+    output = subprocess.check_output(
+        [sys.executable, "-c", code],
+        env=full_env,
+        universal_newlines=True,
+    )
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def summarize(samples):
+    """Combine repeated measurements of the same metrics
+
+    The median of each metric is used so a single slow run does not count as a
+    regression. The fastest wall time is kept as well.
+
+    """
+    summary = {}
+    for name in samples[0]:
+        values = [s[name] for s in samples if s[name] is not None]
+        summary[name] = statistics.median(values) if values else None
+    if "wall_ms" in summary:
+        summary["wall_ms_min"] = min(s["wall_ms"] for s in samples)
+    return summary
+
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD):
+    """Return the metrics of `results` that regressed relative to `baseline`
+
+    Returns:
+        list: A (case, metric, baseline value, value) tuple per regression.
+
+    """
+    regressions = []
+    for case, metrics in sorted(results.items()):
+        for metric, value in sorted(metrics.items()):
+            previous = baseline.get(case, {}).get(metric)
+            if value is None or not previous:
+                continue
+            if metric.endswith("_per_s"):
+                regressed = value < previous * (1 - threshold)
+            else:
+                regressed = value > previous * (1 + threshold)
+            if regressed:
+                regressions.append((case, metric, previous, value))
+    return regressions
+
+
+def argument_parser(description):
+    """Return an ArgumentParser with the arguments shared by all benchmarks"""
+    parser = ArgumentParser(description=description)
+    parser.add_argument(
+        "--binding",
+        default=os.getenv("QT_PREFERRED_BINDING") or "PySide6",
+        help="Benchmark Qt.py using this Qt binding. Example: PySide6",
+    )
+    parser.add_argument(
+        "--output",
+        help="Write the results to this JSON file, or to "
+        "<benchmark>_<binding>.json in this directory unless it ends with "
+        ".json. Defaults to .benchmarks",
+    )
+    parser.add_argument(
+        "--baseline",
+        help="Compare the results to the results stored in this JSON file, or "
+        "to the file of the same name in this directory",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Report metrics that increased by more than this fraction of "
+        "the baseline. Default: %(default)s",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="Measure each case this many times. Default: %(default)s",
+    )
+    return parser
+
+
+def finish(name, args, results, **details):
+    """Write `results` and compare them to the baseline, return an exit code
+
+    Args:
+        name (str): Name of the benchmark.
+        args (Namespace): Arguments parsed by `argument_parser()`.
+        results (dict): Metrics of each case measured by the benchmark.
+        **details: Added to the description of the environment, e.g. the code
+            path Qt.py used.
+
+    """
+    data = {"benchmark": name, "environment": environment(args.binding)}
+    data["environment"].update(details)
+    data["results"] = results
+
+    output = Path(args.output or RESULTS_PATH)
+    if output.suffix != ".json":
+        # Allows running all benchmarks with the same arguments
+        output = output / f"{name}_{args.binding}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with output.open("w") as f:
+        json.dump(data, f, indent=4, sort_keys=True)
+    print(f"--> Wrote {output}")
+
+    if not args.baseline:
+        return 0
+
+    baseline_path = Path(args.baseline)
+    if baseline_path.is_dir():
+        # Allows comparing all benchmarks against a previous results directory
+        baseline_path = baseline_path / output.name
+    with baseline_path.open() as f:
+        baseline = json.load(f)
+    # Only the version of Qt.py is expected to differ from the baseline
+    expected = dict(baseline.get("environment", {}), **{"qt.py": qt_version()})
+    if expected != data["environment"]:
+        print("--> Warning: The baseline was measured in another environment")
+
+    regressions = compare(results, baseline.get("results", {}), args.threshold)
+    for case, metric, previous, value in regressions:
+        print(f"--> Regression: {case} {metric} {previous:.2f} -> {value:.2f}")
+    if not regressions:
+        print(f"--> No regressions compared to {baseline_path}")
+    return 1 if regressions else 0
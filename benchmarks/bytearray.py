@@ -0,0 +1,104 @@
+"""Measure how fast bytes move in and out of QByteArray
+
+Compares `QtCompat.byteArrayView` and `QtCompat.byteArrayFromBuffer` to the
+conversions that copy, and a round trip through a QBuffer, for small and large
+payloads. Each case reports the megabytes moved per second.
+
+Usage:
+    $ python -m benchmarks.bytearray --binding PyQt6
+
+"""
+
+from . import argument_parser, finish, run_python
+
+# Payload sizes in bytes
+SIZES = [64 * 1024, 16 * 1024 * 1024]
+
+RUNNER = """\
+import json, time
+from Qt import QtCore, QtCompat
+
+size = {size!r}
+# Not zeros, which may all be read from the same page of memory
+payload = bytes(range(256)) * (size // 256)
+array = QtCore.QByteArray(payload)
+target = bytearray(payload)
+# Assigning to a bytearray slice copies other buffers first, a memoryview does not
+target_view = memoryview(target)
+device = QtCore.QBuffer()
+device.open(QtCore.QIODevice.OpenModeFlag.ReadWrite)
+
+
+def view():
+    target_view[:] = QtCompat.byteArrayView(array)
+
+
+def to_bytes():
+    bytes(array)
+
+
+def data():
+    array.data()
+
+
+def from_bytes():
+    QtCompat.byteArrayFromBuffer(payload)
+
+
+def from_memoryview():
+    QtCompat.byteArrayFromBuffer(target_view)
+
+
+def qbuffer():
+    device.seek(0)
+    device.write(array)
+    device.seek(0)
+    device.read(size)
+
+
+cases = {{
+    "view": view,
+    "bytes": to_bytes,
+    "data": data,
+    "from-bytes": from_bytes,
+    "from-memoryview": from_memoryview,
+    "qbuffer": qbuffer,
+}}
+
+results = {{}}
+for name, func in cases.items():
+    best = None
+    for _ in range({repeat!r}):
+        number = 0
+        start = time.perf_counter()
+        while True:
+            func()
+            number += 1
+            elapsed = time.perf_counter() - start
+            if number >= 3 and elapsed > 0.1:
+                break
+        per_call = elapsed / number
+        best = per_call if best is None else min(best, per_call)
+    results[name] = {{"mb_per_s": size / best / 1024 / 1024}}
+
+print(json.dumps(results))
+"""
+
+
+def main(argv=None):
+    parser = argument_parser(__doc__.splitlines()[0])
+    args = parser.parse_args(argv)
+
+    results = {}
+    for size in SIZES:
+        code = RUNNER.format(size=size, repeat=args.repeat)
+        for name, metrics in run_python(code, args.binding).items():
+            case = f"{name}-{size // 1024}KiB"
+            results[case] = metrics
+            print(f"--> {case}: {metrics['mb_per_s']:.0f} MB/s")
+
+    return finish("bytearray", args, results)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
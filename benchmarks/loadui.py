@@ -0,0 +1,233 @@
+"""Measure the time and memory it takes to `QtCompat.loadUi` large forms
+
+Designer files of increasing size are generated with tabs, group boxes, nested
+layouts and a promoted custom widget. Each file is loaded in a fresh
+interpreter under the offscreen platform, with and without `baseinstance`.
+
+PyQt bindings load the file with `uic.loadUi`, PySide bindings with Qt.py's own
+`_UiLoader`. The path used is stored with the results.
+
+Usage:
+    $ python -m benchmarks.loadui --binding PySide6
+    $ python -m benchmarks.loadui --binding PySide6 --sizes 10 100
+
+"""
+
+import tempfile
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+from . import argument_parser, finish, run_python, summarize
+
+SIZES = [10, 100, 1000, 5000]
+
+# Widgets of each tab, group box and nested horizontal layout
+TAB_SIZE = 100
+GROUP_SIZE = 10
+ROW_SIZE = 2
+
+# Each leaf widget is created from this list in turn, the last one is promoted
+WIDGETS = [
+    ("QLabel", "text", "string"),
+    ("QLineEdit", "text", "string"),
+    ("QPushButton", "text", "string"),
+    ("QCheckBox", "text", "string"),
+    ("QSpinBox", "maximum", "number"),
+    ("BenchWidget", "text", "string"),
+]
+
+CUSTOM_WIDGET = """\
+from Qt import QtWidgets
+
+
+class BenchWidget(QtWidgets.QLabel):
+    pass
+"""
+
+RUNNER = """\
+import gc, json, sys, time, tracemalloc
+try:
+    import resource
+except ImportError:
+    resource = None
+
+import Qt
+from Qt import QtCore, QtWidgets, QtCompat
+
+app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
+
+
+def peak_rss():
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes
+    return rss / 1024 if sys.platform == "darwin" else rss
+
+
+def load():
+    base = QtWidgets.QWidget() if {baseinstance!r} else None
+    start = time.perf_counter()
+    widget = QtCompat.loadUi({path!r}, base)
+    return widget, (time.perf_counter() - start) * 1000
+
+
+def delete(widget):
+    widget.deleteLater()
+    QtCore.QCoreApplication.sendPostedEvents(None, QtCore.QEvent.Type.DeferredDelete)
+    gc.collect()
+
+
+rss_before = peak_rss()
+widget, first = load()
+rss_after = peak_rss()
+assert len(widget.findChildren(QtWidgets.QWidget)) >= {count!r}
+if {count!r} >= 6:
+    # The promoted widget must be created from the generated module
+    assert type(widget.findChild(QtWidgets.QLabel, "widget5")).__name__ == "BenchWidget"
+delete(widget)
+del widget
+
+times = []
+for _ in range({repeat!r}):
+    widget, wall = load()
+    times.append(wall)
+    delete(widget)
+    del widget
+
+tracemalloc.start()
+widget, _ = load()
+tracemalloc_peak = tracemalloc.get_traced_memory()[1]
+tracemalloc.stop()
+
+print(json.dumps({{
+    "loader": "uic" if hasattr(Qt, "_uic") else "_UiLoader",
+    "first_ms": first,
+    "times": times,
+    "peak_rss_delta_kb": None if rss_before is None else rss_after - rss_before,
+    "tracemalloc_peak_kb": tracemalloc_peak / 1024,
+}}))
+"""
+
+
+def _sub(parent, tag, text=None, **attrib):
+    element = ET.SubElement(parent, tag, attrib)
+    element.text = text
+    return element
+
+
+def _property(parent, name, kind, value):
+    _sub(_sub(parent, "property", name=name), kind, str(value))
+
+
+def generate_ui(count, path):
+    """Write a Designer file with `count` leaf widgets to `path`"""
+    ui = ET.Element("ui", version="4.0")
+    _sub(ui, "class", "Form")
+    form = _sub(ui, "widget", **{"class": "QWidget", "name": "Form"})
+    form_layout = _sub(form, "layout", **{"class": "QVBoxLayout", "name": "formLayout"})
+    tabs = _sub(
+        _sub(form_layout, "item"), "widget", **{"class": "QTabWidget", "name": "tabs"}
+    )
+
+    group_layout = row_layout = None
+    for index in range(count):
+        if index % TAB_SIZE == 0:
+            name = f"tab{index // TAB_SIZE}"
+            tab = _sub(tabs, "widget", **{"class": "QWidget", "name": name})
+            # Designer stores tab titles as an attribute, not a property
+            _sub(_sub(tab, "attribute", name="title"), "string", name)
+            tab_layout = _sub(
+                tab, "layout", **{"class": "QVBoxLayout", "name": name + "Layout"}
+            )
+
+        if index % GROUP_SIZE == 0:
+            name = f"group{index // GROUP_SIZE}"
+            group = _sub(
+                _sub(tab_layout, "item"),
+                "widget",
+                **{"class": "QGroupBox", "name": name},
+            )
+            _property(group, "title", "string", name)
+            group_layout = _sub(
+                group, "layout", **{"class": "QGridLayout", "name": name + "Layout"}
+            )
+            cell = 0
+
+        if index % ROW_SIZE == 0:
+            # Nest a horizontal layout in each cell of the grid
+            item = _sub(group_layout, "item", row=str(cell // 2), column=str(cell % 2))
+            row_layout = _sub(
+                item, "layout", **{"class": "QHBoxLayout", "name": f"row{index}"}
+            )
+            cell += 1
+
+        class_name, prop, kind = WIDGETS[index % len(WIDGETS)]
+        widget = _sub(
+            _sub(row_layout, "item"),
+            "widget",
+            **{"class": class_name, "name": f"widget{index}"},
+        )
+        _property(widget, prop, kind, index if kind == "number" else class_name)
+
+    custom_widgets = _sub(ui, "customwidgets")
+    custom_widget = _sub(custom_widgets, "customwidget")
+    _sub(custom_widget, "class", "BenchWidget")
+    _sub(custom_widget, "extends", "QLabel")
+    _sub(custom_widget, "header", "benchwidgets.h")
+    _sub(ui, "resources")
+    _sub(ui, "connections")
+
+    ET.ElementTree(ui).write(str(path), encoding="UTF-8", xml_declaration=True)
+
+
+def measure(binding, count, baseinstance, repeat, tempdir):
+    """Return the loader used and the metrics of loading a form of `count` widgets"""
+    path = Path(tempdir) / f"form{count}.ui"
+    if not path.exists():
+        generate_ui(count, path)
+
+    code = RUNNER.format(
+        path=str(path), baseinstance=baseinstance, count=count, repeat=repeat
+    )
+    data = run_python(code, binding, path=[tempdir])
+
+    result = summarize([{"wall_ms": wall} for wall in data["times"]])
+    result["first_ms"] = data["first_ms"]
+    result["us_per_widget"] = result["wall_ms"] * 1000 / count
+    result["tracemalloc_peak_kb"] = data["tracemalloc_peak_kb"]
+    result["peak_rss_delta_kb"] = data["peak_rss_delta_kb"]
+    if data["peak_rss_delta_kb"] is not None:
+        result["kb_per_widget"] = data["peak_rss_delta_kb"] / count
+    return data["loader"], result
+
+
+def main(argv=None):
+    parser = argument_parser(__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=SIZES,
+        help="Number of widgets of each form. Default: %(default)s",
+    )
+    args = parser.parse_args(argv)
+
+    results = {}
+    loader = None
+    with tempfile.TemporaryDirectory() as tempdir:
+        (Path(tempdir) / "benchwidgets.py").write_text(CUSTOM_WIDGET)
+        for count in args.sizes:
+            for baseinstance in (False, True):
+                case = f"{count}-{'baseinstance' if baseinstance else 'new'}"
+                loader, results[case] = measure(
+                    args.binding, count, baseinstance, args.repeat, tempdir
+                )
+                wall, cost = results[case]["wall_ms"], results[case]["us_per_widget"]
+                print(f"--> {case}: {wall:.1f} ms, {cost:.1f} us per widget")
+
+    return finish("loadui", args, results, loader=loader)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
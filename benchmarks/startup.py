@@ -0,0 +1,123 @@
+"""Measure the time and memory it takes to `import Qt`
+
+Each measurement is made in a fresh interpreter, for each module subset:
+
+- cold: `import Qt` including importing the binding's modules.
+- warm: `import Qt` after the binding's modules were imported, which measures
+    the cost of Qt.py itself.
+
+Subsets limit the modules Qt.py sets up with a generated QtSiteConfig, the
+same way a studio would.
+
+Usage:
+    $ python -m benchmarks.startup --binding PySide6
+    $ python -m benchmarks.startup --binding PySide6 \\
+        --baseline .benchmarks/startup_PySide6.json --output new.json
+
+"""
+
+import tempfile
+import textwrap
+from pathlib import Path
+
+from . import argument_parser, finish, run_python, summarize
+
+# The modules Qt.py sets up for each subset, None sets up all common modules
+SUBSETS = {
+    "all": None,
+    "widgets": ["QtCore", "QtGui", "QtWidgets"],
+    "core": ["QtCore"],
+}
+
+SITE_CONFIG = """\
+def update_members(members):
+    for name in list(members):
+        if name not in {modules!r}:
+            members.pop(name)
+"""
+
+RUNNER = """\
+import json, sys, time
+try:
+    import resource
+except ImportError:
+    resource = None
+
+for name in {preload!r}:
+    try:
+        __import__({binding!r} + "." + name)
+    except ImportError:
+        pass
+
+if {trace!r}:
+    import tracemalloc
+    tracemalloc.start()
+
+start = time.perf_counter()
+import Qt
+wall = time.perf_counter() - start
+
+result = {{"wall_ms": wall * 1000}}
+if {trace!r}:
+    current, peak = tracemalloc.get_traced_memory()
+    result = {{"tracemalloc_kb": current / 1024, "tracemalloc_peak_kb": peak / 1024}}
+elif resource:
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes
+    result["peak_rss_kb"] = rss / 1024 if sys.platform == "darwin" else rss
+else:
+    result["peak_rss_kb"] = None
+
+assert Qt.__binding__ == {binding!r}, Qt.__binding__
+print(json.dumps(result))
+"""
+
+
+def modules_of(subset):
+    """Return the modules of `subset`, defaulting to the common members"""
+    if SUBSETS[subset] is not None:
+        return SUBSETS[subset]
+    code = "import Qt, json; print(json.dumps(list(Qt._common_members)))"
+    return run_python(code, "None")
+
+
+def measure(binding, subset, warm, repeat):
+    """Return the metrics of one case, measured `repeat` times"""
+    modules = modules_of(subset)
+    preload = modules if warm else []
+
+    with tempfile.TemporaryDirectory() as tempdir:
+        path = []
+        if SUBSETS[subset] is not None:
+            site_config = Path(tempdir) / "QtSiteConfig.py"
+            site_config.write_text(SITE_CONFIG.format(modules=modules))
+            path.append(tempdir)
+
+        def run(trace):
+            code = RUNNER.format(binding=binding, preload=preload, trace=trace)
+            return run_python(textwrap.dedent(code), binding, path=path)
+
+        # Tracing allocations slows down the import, so measure it separately
+        result = summarize([run(trace=False) for _ in range(repeat)])
+        result.update(run(trace=True))
+
+    return result
+
+
+def main(argv=None):
+    parser = argument_parser(__doc__.splitlines()[0])
+    args = parser.parse_args(argv)
+
+    results = {}
+    for subset in SUBSETS:
+        for warm in (False, True):
+            case = f"{subset}-{'warm' if warm else 'cold'}"
+            results[case] = measure(args.binding, subset, warm, args.repeat)
+            wall, rss = results[case]["wall_ms"], results[case]["peak_rss_kb"]
+            print(f"--> {case}: {wall:.1f} ms, {rss} kB peak RSS")
+
+    return finish("startup", args, results)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,247 @@
+#!/usr/bin/env python
+"""Generate .pyi stubs of the Qt.py namespace for a Qt binding
+
+The stubs in src/Qt-stubs expose every member of PySide6, while Qt.py only
+exposes the members `_install()` adds for the binding in use. This script reads
+the .pyi stubs shipped with a binding, without importing it, and writes a
+stub-only `Qt` package that re-exports exactly those members:
+
+- The `_common_members` found in the binding's stubs.
+- The `_misplaced_members` of the binding, under their Qt.py names.
+- The `_missing_members` as `Qt.MissingMember` placeholders.
+- The binding neutral `QtCompat` stub from src/Qt-stubs.
+
+Usage:
+    $ python build_stubs.py --binding PySide6 --output build/stubs/PySide6
+
+Then point the type checker at the output directory, e.g. `mypy_path` for mypy
+or `stubPath` for pyright. Stubs found there take precedence over the `Qt-stubs`
+installed with Qt.py.
+
+"""
+
+import ast
+import os
+import sys
+import shutil
+import importlib.util
+from argparse import ArgumentParser
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).parent
+STUBS_PATH = REPO_ROOT / "src" / "Qt-stubs"
+
+HEADER = """\
+# Generated by build_stubs.py for {binding} {version}. Do not edit.
+"""
+# Members defined by Qt.py itself, see _install()
+INIT_TEMPLATE = """\
+{header}
+{imports}
+
+__binding__: str
+__qt_version__: str
+__binding_version__: str
+__version__: str
+IsPyQt6: bool
+IsPyQt5: bool
+IsPyQt4: bool
+IsPySide: bool
+IsPySide2: bool
+IsPySide6: bool
+
+QT_VERBOSE: bool
+QT_PREFERRED_BINDING: str
+
+class MissingMember:
+    def __init__(self, name: str, details: str = ...) -> None: ...
+    def __getattr__(self, name: str) -> typing.NoReturn: ...
+    def __call__(self, *a: typing.Any, **kw: typing.Any) -> typing.NoReturn: ...
+
+def _warn(text: str) -> None: ...
+"""
+
+
+def load_qt():
+    """Import Qt.py from src without importing any binding"""
+    os.environ["QT_PREFERRED_BINDING"] = "None"
+    os.environ.pop("QT_PREFERRED_BINDING_JSON", None)
+    sys.path.insert(0, str(REPO_ROOT / "src"))
+    import Qt
+
+    return Qt
+
+
+def binding_stubs_path(binding):
+    """Return the directory containing the .pyi stubs of `binding`"""
+    for name in (binding + "-stubs", binding):
+        spec = importlib.util.find_spec(name)
+        if spec and spec.submodule_search_locations:
+            return Path(list(spec.submodule_search_locations)[0])
+    raise ImportError("No stubs found for %s" % binding)
+
+
+def binding_version(binding):
+    """Return the version of the distribution of `binding`, without importing it"""
+    try:
+        import importlib.metadata as metadata
+    except ImportError:
+        # Python 3.7
+        import pkg_resources
+
+        try:
+            return pkg_resources.get_distribution(binding).version
+        except pkg_resources.DistributionNotFound:
+            return "unknown"
+
+    try:
+        return metadata.version(binding)
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def stub_names(path):
+    """Return the names defined at the top level of the stub file `path`"""
+    if not path.exists():
+        return set()
+
+    names = set()
+    tree = ast.parse(path.read_text(encoding="utf-8"), str(path))
+    for node in tree.body:
+        if isinstance(node, (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)):
+            names.add(node.name)
+        elif isinstance(node, ast.Assign):
+            names.update(t.id for t in node.targets if isinstance(t, ast.Name))
+        elif isinstance(node, ast.AnnAssign) and isinstance(node.target, ast.Name):
+            names.add(node.target.id)
+        elif isinstance(node, (ast.Import, ast.ImportFrom)):
+            # Only explicit re-exports are visible to type checkers
+            names.update(a.asname for a in node.names if a.asname == a.name)
+    return names
+
+
+def exposed_members(Qt, binding, stubs_path):
+    """Return the members Qt.py exposes for `binding`
+
+    Returns:
+        dict: For each Qt.py module, a dict of the name of each member in Qt.py
+            mapped to a (binding module, name in binding) tuple. The tuple is
+            None for members installed as a `Qt.MissingMember`.
+
+    """
+    cache = {}
+
+    def defined(module, name):
+        if module not in cache:
+            cache[module] = stub_names(stubs_path / (module + ".pyi"))
+        return name in cache[module]
+
+    modules = {}
+    for module, members in Qt._common_members.items():
+        if not (stubs_path / (module + ".pyi")).exists():
+            # _setup() skips modules that can't be imported for this binding
+            continue
+        modules[module] = {
+            member: (module, member) for member in members if defined(module, member)
+        }
+
+    for src, dsts in Qt._misplaced_members.get(binding, {}).items():
+        if src == "__extras__":
+            continue
+        src_parts = src.split(".")
+        if len(src_parts) != 2 or not defined(*src_parts):
+            # Misplaced members without a source are skipped by Qt.py too
+            continue
+        for dst in Qt._misplaced_destinations(dsts):
+            if isinstance(dst, (list, tuple)):
+                # Custom functions, these are covered by the QtCompat stub
+                continue
+            dst_parts = dst.split(".")
+            if len(dst_parts) != 2 or dst_parts[0] == "QtCompat":
+                continue
+            if dst_parts[0] not in modules and dst_parts[0] not in Qt._common_members:
+                continue
+            modules.setdefault(dst_parts[0], {})[dst_parts[1]] = tuple(src_parts)
+
+    for module, members in Qt._missing_members.items():
+        for member in members:
+            modules.setdefault(module, {}).setdefault(member, None)
+
+    return modules
+
+
+def format_module(binding, members, header):
+    """Return the contents of the .pyi stub of a Qt.py module"""
+    lines = [header]
+    imports = {}
+    missing = []
+    for name, source in sorted(members.items()):
+        if source is None:
+            missing.append(name)
+            continue
+        imports.setdefault(source[0], []).append("%s as %s" % (source[1], name))
+
+    if missing:
+        lines.append("from Qt import MissingMember")
+    for module, names in sorted(imports.items()):
+        lines.append("from %s.%s import (" % (binding, module))
+        lines.extend("    %s," % name for name in names)
+        lines.append(")")
+    if missing:
+        lines.append("")
+        lines.extend("%s: MissingMember" % name for name in missing)
+
+    # Renamed imports are only re-exported when listed in __all__
+    lines.append("")
+    lines.append("__all__ = [")
+    lines.extend('    "%s",' % name for name in sorted(members))
+    lines.append("]")
+
+    return "\n".join(lines) + "\n"
+
+
+def build(binding, output):
+    """Write the stubs of Qt.py for `binding` to `output`/Qt"""
+    Qt = load_qt()
+    stubs_path = binding_stubs_path(binding)
+    header = HEADER.format(binding=binding, version=binding_version(binding))
+
+    package = Path(output) / "Qt"
+    if package.exists():
+        shutil.rmtree(package)
+    package.mkdir(parents=True)
+
+    modules = exposed_members(Qt, binding, stubs_path)
+    for module, members in sorted(modules.items()):
+        with (package / (module + ".pyi")).open("w") as f:
+            f.write(format_module(binding, members, header))
+
+    # QtCompat does not depend on the binding
+    shutil.copy(STUBS_PATH / "QtCompat.pyi", package / "QtCompat.pyi")
+
+    imports = ["import typing", ""]
+    imports.extend(
+        "from . import %s as %s" % (m, m) for m in sorted(list(modules) + ["QtCompat"])
+    )
+    with (package / "__init__.pyi").open("w") as f:
+        f.write(INIT_TEMPLATE.format(header=header, imports="\n".join(imports)))
+
+    print("--> Wrote %d modules to %s" % (len(modules) + 1, package))
+    return package
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--binding",
+        required=True,
+        help="Generate for this Qt binding. Example: PySide6",
+    )
+    parser.add_argument(
+        "--output",
+        help="Directory to write the Qt stubs package to. "
+        "Defaults to build/stubs/<binding>",
+    )
+    args = parser.parse_args()
+
+    build(args.binding, args.output or Path("build") / "stubs" / args.binding)
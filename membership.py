@@ -1,15 +1,28 @@
 import os
 import re
+import zlib
+import base64
 import pkgutil
+import importlib
 import json
 import platform
 from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor
 from functools import reduce
 from pprint import pprint
 from pathlib import Path
 
 
 MEMBERSHIP_PATH = Path("./.members")
+# The method and enum names of each class are written here for each binding
+CLASS_MEMBERSHIP_PATH = MEMBERSHIP_PATH / "methods"
+# Binding memberships are cached here per binding, binding version and python
+# version. `--clean` does not remove this directory so re-running the
+# membership tox environments only introspects bindings whose version changed.
+CACHE_PATH = MEMBERSHIP_PATH / ".cache"
+# Increment this when the data gathered by `binding_members` changes so any
+# existing cache files are regenerated.
+CACHE_VERSION = 2
 
 SKIP_MODULES = [
     "PyQt5.Qt",  # This module only exists in PyQt5 and is not exposed by Qt.py
@@ -26,9 +39,6 @@ SKIP_MEMBERS = [
     "QWinEventNotifier",  # This class is only available on Windows.
 ]
 
-# Will contain all modules for the current binding
-MODULES = []
-
 # Flags from environment variables
 QT_VERBOSE = bool(os.getenv("QT_VERBOSE"))
 
@@ -42,6 +52,31 @@ MISPLACED_MODULES = [
     "QtOpenGL",
 ]
 
+# The method and enum level index generated from the common class members. It
+# is written next to the other generated files and copied next to Qt.py, see
+# the "Subset" section of the README.md.
+MEMBER_INDEX_NAME = "Qt_members.py"
+MEMBER_INDEX_TEMPLATE = '''"""Method and enum level members common to all Qt bindings
+
+Generated by `python membership.py --generate-common-members` from:
+{sources}
+
+`members` is zlib compressed and base85 encoded text, with a line for each
+class common to all bindings, such as
+"QtWidgets.QHeaderView<QtWidgets.QAbstractItemView setSectionResizeMode ...".
+Each line holds the class, the base class it inherits the rest of its common
+members from after a "<", if any, and its own common methods and enums,
+separated by spaces.
+
+"""
+
+members = b"""
+{members}
+"""
+'''
+# Characters of each line of the encoded member index
+MEMBER_INDEX_WIDTH = 79
+
 
 def read_json(filename):
     """Read JSON, return dict"""
@@ -52,7 +87,7 @@ def read_json(filename):
 
 def write_json(dictionary, filename):
     """Write dictionary to JSON"""
-    filename.parent.mkdir(exist_ok=True)
+    filename.parent.mkdir(parents=True, exist_ok=True)
     with filename.open("w") as data_file:
         json.dump(dictionary, data_file, indent=4, sort_keys=True)
     print("--> Wrote " + filename.name)
@@ -151,6 +186,72 @@ def compare(dicts):
     return ret
 
 
+def compare_classes(dicts, common_members):
+    """Combine the class members of multiple Qt bindings.
+
+    Only classes listed in `common_members` are compared. A base class is only
+    kept if it is the same common class for all bindings.
+
+    Returns:
+        dict: The base class and sorted common members of each class keyed by
+            the class name relative to Qt.py, e.g. "QtWidgets.QHeaderView".
+    """
+    ret = {}
+    if not dicts:
+        return ret
+
+    for module, classes in common_members.items():
+        for cls in classes:
+            found = [d.get(module, {}).get(cls) for d in dicts.values()]
+            if None in found:
+                # Not a class in all bindings, e.g. a function or constant.
+                continue
+            bases = {f["base"] for f in found}
+            base = bases.pop() if len(bases) == 1 else None
+            if base:
+                base_module, _, base_cls = base.partition(".")
+                if base_cls not in common_members.get(base_module, []):
+                    base = None
+            members = reduce(lambda x, y: x & y, [set(f["members"]) for f in found])
+            ret[f"{module}.{cls}"] = {"base": base, "members": sorted(members)}
+
+    return ret
+
+
+def member_index(common_classes):
+    """Return the lines of the compact member index, one per class.
+
+    Members that a class shares with its base class are omitted from the class
+    and the base is added after a "<" instead, e.g. "Class<Base member ...".
+    Qt.py follows the base classes when looking up a member.
+    """
+    lines = []
+    for name, data in sorted(common_classes.items()):
+        members = set(data["members"])
+        base = data["base"]
+        if base in common_classes:
+            members -= set(common_classes[base]["members"])
+            name = f"{name}<{base}"
+        lines.append(" ".join([name] + sorted(members)))
+    return lines
+
+
+def write_member_index(class_memberships, common_members):
+    """Write the member index module shipped next to Qt.py"""
+    common_classes = compare_classes(class_memberships, common_members)
+    sources = "\n".join(f"    {name}" for name in sorted(class_memberships))
+    text = "\n".join(member_index(common_classes)).encode("utf-8")
+    encoded = base64.b85encode(zlib.compress(text, 9)).decode("ascii")
+    members = "\n".join(
+        encoded[i : i + MEMBER_INDEX_WIDTH]
+        for i in range(0, len(encoded), MEMBER_INDEX_WIDTH)
+    )
+    filename = MEMBERSHIP_PATH / MEMBER_INDEX_NAME
+    with filename.open("w") as data_file:
+        data_file.write(MEMBER_INDEX_TEMPLATE.format(sources=sources, members=members))
+    print("--> Wrote " + filename.name)
+
+
 def membership_table(binding_maps):
     rows = {}
     headers = (
@@ -209,8 +310,11 @@ def clean_common_members():
     """Remove the temporary .json files generated by this script."""
     if not MEMBERSHIP_PATH.exists():
         return
-    for f in MEMBERSHIP_PATH.iterdir():
-        if f.suffix not in (".json", ".md"):
+    files = list(MEMBERSHIP_PATH.iterdir())
+    if CLASS_MEMBERSHIP_PATH.exists():
+        files.extend(CLASS_MEMBERSHIP_PATH.iterdir())
+    for f in files:
+        if f.suffix not in (".json", ".md") and f.name != MEMBER_INDEX_NAME:
             continue
         print(f"--> Removing membership file: {f}")
         f.unlink()
@@ -272,6 +376,198 @@ def sort_qt_file(path):
     return qt_major, binding, qt_ver, py_ver
 
 
+def qualified_name(cls):
+    """Return the name of `cls` relative to its binding, e.g. QtCore.QObject"""
+    module = cls.__module__.split(".", 1)[-1]
+    return f"{module}.{cls.__name__}"
+
+
+def class_members(cls):
+    """Return the public method and enum names of `cls`.
+
+    Values of enums nested in `cls` are included as "Enum.Value" so fully
+    qualified enum names such as "Qt.ItemDataRole.DisplayRole" are recorded.
+    """
+    members = set()
+    for name in dir(cls):
+        if name.startswith("_"):
+            continue
+        members.add(name)
+        try:
+            value = getattr(cls, name)
+        except AttributeError:
+            continue
+        if not isinstance(value, type) or value is cls:
+            continue
+        for enum_name in dir(value):
+            if enum_name.startswith("_"):
+                continue
+            try:
+                if isinstance(getattr(value, enum_name), value):
+                    members.add(f"{name}.{enum_name}")
+            except Exception:
+                # Some bindings raise errors other than AttributeError when
+                # getting members of a type that isn't really an enum.
+                continue
+    return sorted(members)
+
+
+def module_members(modname):
+    """Import `modname` and return the names of its public members.
+
+    This is run in a worker process for each module of a binding.
+
+    Returns:
+        tuple: The module name, a list of member names or `None` if the
+            module could not be imported, a dict of the base class and
+            members of each class and a list of warning strings.
+    """
+    warnings = []
+    try:
+        module = importlib.import_module(modname)
+    except (ImportError, AttributeError, SyntaxError) as error:
+        warnings.append(f"WARNING: Skipped import {modname} {error}")
+        return modname, None, {}, warnings
+
+    members = []
+    classes = {}
+    for member in dir(module):
+        if member in SKIP_MEMBERS or member.startswith("_"):
+            continue
+        try:
+            value = getattr(module, member)
+        except AttributeError as error:
+            warnings.append(f"WARNING: Skipped member {modname}.{member} {error}")
+            continue
+        members.append(member)
+
+        if isinstance(value, type) and modname.count(".") == 1:
+            bases = value.__mro__[1:2]
+            classes[member] = {
+                "base": qualified_name(bases[0]) if bases else None,
+                "members": class_members(value),
+            }
+
+    return modname, members, classes, warnings
+
+
+def binding_modules(binding):
+    """Return the names of all modules found in `binding` that are not skipped"""
+    modules = []
+    for _, modname, _ in pkgutil.walk_packages(
+        path=binding.__path__, prefix=binding.__name__ + ".", onerror=lambda x: None
+    ):
+        if modname not in SKIP_MODULES:
+            modules.append(modname)
+    return modules
+
+
+def binding_members(binding, jobs=None):
+    """Introspect every module of `binding` using a pool of worker processes.
+
+    Args:
+        binding (module): The imported Qt binding package.
+        jobs (int, optional): Number of worker processes. Defaults to the
+            number of processors on the machine.
+
+    Returns:
+        tuple: Sorted member names of each module of the binding. Members of
+            nested modules are reported by the name of their top level module.
+            And the base class and members of each class of each module.
+    """
+    members = {}
+    classes = {}
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        results = executor.map(module_members, binding_modules(binding))
+        for modname, names, module_classes, warnings in results:
+            for warning in warnings:
+                print(warning)
+
+            parts = modname.split(".")
+            found = members.setdefault(parts[1], set())
+            if len(parts) > 2:
+                # Nested modules are recorded as members of their top module
+                found.add(parts[2])
+            elif names:
+                found.update(names)
+            if module_classes:
+                classes[parts[1]] = module_classes
+
+    return {key: sorted(value) for key, value in members.items()}, classes
+
+
+def binding_version(binding):
+    """Return the version string of the imported `binding` package"""
+    if "PySide" in binding.__name__:
+        return binding.__version__
+    return importlib.import_module(binding.__name__ + ".QtCore").PYQT_VERSION_STR
+
+
+def cache_settings():
+    """Return the settings a cached membership file must have been made with"""
+    return {
+        "version": CACHE_VERSION,
+        "skip_members": sorted(SKIP_MEMBERS),
+        "skip_modules": sorted(SKIP_MODULES),
+    }
+
+
+def read_cache(filename):
+    """Return cached members and class members for `filename`.
+
+    Returns `None` if the cache doesn't exist or is out of date.
+    """
+    path = CACHE_PATH / filename
+    if not path.exists():
+        return None
+    data = read_json(path)
+    if data.get("settings") != cache_settings():
+        return None
+    return data["members"], data["classes"]
+
+
+def write_cache(members, classes, filename):
+    """Cache members so they are re-used for the same binding and versions"""
+    CACHE_PATH.mkdir(parents=True, exist_ok=True)
+    write_json(
+        {"settings": cache_settings(), "members": members, "classes": classes},
+        CACHE_PATH / filename,
+    )
+
+
+def generate_binding_members(name, jobs=None, use_cache=True):
+    """Write the membership .json file for the Qt binding `name`.
+
+    Args:
+        name (str): The name of the binding to import. Example: PySide6
+        jobs (int, optional): Number of worker processes used to introspect
+            the binding's modules.
+        use_cache (bool, optional): Re-use the members generated by a previous
+            run for the same binding, binding version and python version.
+    """
+    binding = importlib.import_module(name)
+
+    # Write to disk in the .members folder with python and Qt version info.
+    qtver = binding_version(binding)
+    pyver = platform.python_version()
+    filename = f"{binding.__name__}-{qtver}_py-{pyver}.json"
+
+    cached = read_cache(filename) if use_cache else None
+    if cached is None:
+        members, classes = binding_members(binding, jobs)
+        write_cache(members, classes, filename)
+    else:
+        print(f"--> Using cached membership for {filename}")
+        members, classes = cached
+
+    if QT_VERBOSE:
+        # Debug
+        pprint(members)
+
+    write_json(members, MEMBERSHIP_PATH / filename)
+    write_json(classes, CLASS_MEMBERSHIP_PATH / filename)
+
+
 def generate_common_members():
     """Generate files with commonly shared members"""
 
@@ -283,6 +579,18 @@ def generate_common_members():
     # Generate a mapping of all common members
     write_member_files(memberships, "common_members.json", "members.md")
 
+    # Generate the method and enum level index of all common members
+    class_memberships = {}
+    for name in memberships:
+        filename = CLASS_MEMBERSHIP_PATH / f"{name}.json"
+        if filename.exists():
+            class_memberships[name] = read_json(filename)
+    if len(class_memberships) == len(memberships):
+        common_members = compare(memberships)["members"]
+        write_member_index(class_memberships, common_members)
+    else:
+        print("--> Skipped member index, not all bindings have class members")
+
     # Generate a mapping of all common Qt5 members
     qt5_common = members_for_binding_names(BINDING_NAMES_QT5, memberships)
     if qt5_common:
@@ -313,6 +621,18 @@ if __name__ == "__main__":
         dest="generate",
         help="Combine generated bindings into common_members",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        help="Number of processes used to introspect the binding. "
+        "Defaults to the number of processors on the machine.",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_false",
+        dest="use_cache",
+        help="Ignore cached membership and re-introspect the binding.",
+    )
 
     args = parser.parse_args()
 
@@ -321,83 +641,4 @@ if __name__ == "__main__":
     if args.generate:
         generate_common_members()
     elif args.binding:
-        # Import <binding>
-        binding = __import__(args.binding)
-
-        for _, modname, _ in pkgutil.walk_packages(
-            path=binding.__path__, prefix=binding.__name__ + ".", onerror=lambda x: None
-        ):
-            if modname not in SKIP_MODULES:
-                MODULES.append(modname)
-                basemodule = modname[: modname.rfind(".")]
-                submodule = modname[modname.rfind(".") + 1 :]
-                try:
-                    import_statement = "from " + basemodule + " import " + submodule
-                    exec(import_statement)
-                except (ImportError, AttributeError, SyntaxError) as error:
-                    # SyntaxError catched here because e.g. _port3
-                    # running on Python 2...
-                    print("WARNING: Skipped import", modname, error)
-
-                try:
-                    raw_members = []  # avoid Hound errors
-                    exec("raw_members = dir(" + submodule + ")")
-                    members = []
-                    for member in raw_members:
-                        if member not in SKIP_MEMBERS and not member.startswith("_"):
-                            try:
-                                import_statement = (
-                                    "from "
-                                    + basemodule
-                                    + "."
-                                    + submodule
-                                    + " import "
-                                    + member
-                                )
-                                exec(import_statement)
-                                # print(import_statement)
-                                MODULES.append(modname + "." + member)
-                            except (AttributeError, SyntaxError) as error:
-                                # SyntaxError catched here because e.g. _port3
-                                # running on Python 2...
-                                print("WARNING: Skipped import", modname, error)
-                except NameError as error:
-                    print("WARNING: Skipped dir() command", modname, error)
-
-        # Remove duplicates and sort
-        MODULES = sorted(set(MODULES))
-
-        if QT_VERBOSE:
-            # Print all modules (for debugging)
-            for module in MODULES:
-                print(module)
-
-        # Create dictionary
-        members = {}
-        for module in MODULES:
-            key = module.split(".")[1]
-            if key not in members:
-                members[key] = []
-            try:
-                value = module.split(".")[2]
-                members[key].append(value)
-            except IndexError:
-                pass
-
-        # Sort and remove duplicates
-        sorted_members = {}
-        for key, value in members.copy().items():
-            sorted_members[key] = sorted(set(value))
-
-        if QT_VERBOSE:
-            # Debug
-            pprint(sorted_members)
-
-        # Write to disk in the .members folder with python and Qt version info.
-        if "PySide" in args.binding:
-            qtver = binding.__version__
-        else:
-            qtver = binding.QtCore.PYQT_VERSION_STR
-        pyver = platform.python_version()
-        filepath = MEMBERSHIP_PATH / f"{binding.__name__}-{qtver}_py-{pyver}.json"
-        write_json(sorted_members, filepath)
+        generate_binding_members(args.binding, args.jobs, args.use_cache)
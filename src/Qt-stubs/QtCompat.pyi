@@ -1,7 +1,12 @@
 import typing
+import asyncio
+import concurrent.futures
 
 from . import QtWidgets
 from . import QtCore
+from . import QtGui
+
+_T = typing.TypeVar("_T")
 
 class QHeaderView:
     @typing.overload
@@ -17,16 +22,269 @@ class QHeaderView:
         header: QtWidgets.QHeaderView, mode: QtWidgets.QHeaderView.ResizeMode
     ) -> None: ...
 
+class ColumnarTableModel(QtCore.QAbstractTableModel):
+    def __init__(
+        self,
+        headers: typing.Sequence[str],
+        typecodes: typing.Optional[typing.Sequence[typing.Optional[str]]] = ...,
+        formats: typing.Optional[
+            typing.Sequence[typing.Union[str, typing.Callable[[typing.Any], str], None]]
+        ] = ...,
+        cacheSize: int = ...,
+        parent: typing.Optional[QtCore.QObject] = ...,
+    ) -> None: ...
+    def appendColumns(self, columns: typing.Sequence[typing.Any]) -> None: ...
+    def appendRows(
+        self, rows: typing.Iterable[typing.Sequence[typing.Any]]
+    ) -> None: ...
+    def columnData(self, column: int) -> typing.Any: ...
+    def setColumns(self, columns: typing.Sequence[typing.Any]) -> None: ...
+
+class DataChangedCoalescer(QtCore.QObject):
+    def __init__(
+        self, interval: int = ..., parent: typing.Optional[QtCore.QObject] = ...
+    ) -> None: ...
+    def dataChanged(
+        self,
+        model: QtCore.QAbstractItemModel,
+        topLeft: QtCore.QModelIndex,
+        bottomRight: typing.Optional[QtCore.QModelIndex] = ...,
+        roles: typing.Optional[typing.Sequence[int]] = ...,
+    ) -> None: ...
+    def flush(self) -> None: ...
+    def interval(self) -> int: ...
+    def setInterval(self, interval: int) -> None: ...
+
+class FilterProxyModel(QtCore.QAbstractProxyModel):
+    def __init__(self, parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+    def filterColumns(self) -> typing.Optional[typing.List[int]]: ...
+    def filterRole(self) -> int: ...
+    def filterText(self) -> str: ...
+    def setFilterColumns(
+        self, columns: typing.Optional[typing.Iterable[int]]
+    ) -> None: ...
+    def setFilterRole(
+        self, role: typing.Union[int, QtCore.Qt.ItemDataRole]
+    ) -> None: ...
+    def setFilterText(self, text: str) -> None: ...
+    def setSortRole(self, role: typing.Union[int, QtCore.Qt.ItemDataRole]) -> None: ...
+    def sortColumn(self) -> int: ...
+    def sortOrder(self) -> QtCore.Qt.SortOrder: ...
+    def sortRole(self) -> int: ...
+
+class LazyTreeModel(QtCore.QAbstractItemModel):
+    loadFailed: typing.ClassVar[QtCore.Signal]  # noqa: N815
+    def __init__(
+        self,
+        loader: typing.Callable[[typing.Any], typing.Iterable[typing.Any]],
+        root: typing.Any = ...,
+        headers: typing.Optional[typing.Sequence[str]] = ...,
+        display: typing.Optional[typing.Callable[[typing.Any, int], typing.Any]] = ...,
+        hasChildren: typing.Optional[typing.Callable[[typing.Any], bool]] = ...,
+        pageSize: int = ...,
+        threadPool: typing.Optional[QtCore.QThreadPool] = ...,
+        parent: typing.Optional[QtCore.QObject] = ...,
+    ) -> None: ...
+    def item(self, index: QtCore.QModelIndex) -> typing.Any: ...
+    def setRoot(self, root: typing.Any) -> None: ...
+
+class ThreadPoolExecutor(QtCore.QObject, concurrent.futures.Executor):
+    finished: typing.ClassVar[QtCore.Signal]
+    progress: typing.ClassVar[QtCore.Signal]
+    def __init__(
+        self,
+        threadPool: typing.Optional[QtCore.QThreadPool] = ...,
+        parent: typing.Optional[QtCore.QObject] = ...,
+    ) -> None: ...
+    def threadPool(self) -> QtCore.QThreadPool: ...
+    def submitWithPriority(
+        self,
+        priority: int,
+        fn: typing.Callable[..., _T],
+        *args: typing.Any,
+        **kwargs: typing.Any,
+    ) -> concurrent.futures.Future[_T]: ...
+    @staticmethod
+    def reportProgress(value: typing.Any) -> None: ...
+
+class AsyncioEventLoop(asyncio.SelectorEventLoop):
+    def __init__(self) -> None: ...
+
+class StallWatchdog(QtCore.QObject):
+    stalled: typing.ClassVar[QtCore.Signal]
+    def __init__(
+        self,
+        threshold: float = ...,
+        interval: int = ...,
+        path: typing.Optional[str] = ...,
+        maxStalls: int = ...,
+        dumpInterval: float = ...,
+        parent: typing.Optional[QtCore.QObject] = ...,
+    ) -> None: ...
+    def start(self) -> None: ...
+    def stop(self) -> None: ...
+    def isActive(self) -> bool: ...
+    def histogram(self) -> typing.List[typing.Tuple[float, int]]: ...
+    def stalls(self) -> typing.List[typing.Dict[str, typing.Any]]: ...
+    def skippedStalls(self) -> int: ...
+    def clear(self) -> None: ...
+
+class SignalProfiler:
+    def __init__(self, sampleEvery: int = ...) -> None: ...
+    def install(self) -> None: ...
+    def uninstall(self) -> None: ...
+    def isInstalled(self) -> bool: ...
+    def setEnabled(self, enabled: bool) -> None: ...
+    def isEnabled(self) -> bool: ...
+    def setSampleEvery(self, sampleEvery: int) -> None: ...
+    def sampleEvery(self) -> int: ...
+    def clear(self) -> None: ...
+    def report(self) -> typing.List[typing.Dict[str, typing.Any]]: ...
+    def toJson(self, path: typing.Optional[str] = ...) -> str: ...
+    def dumpStats(self, path: str) -> None: ...
+
+class WidgetProfiler:
+    def __init__(self, widget: QtWidgets.QWidget) -> None: ...
+    def start(self) -> None: ...
+    def stop(self) -> None: ...
+    def isActive(self) -> bool: ...
+    def clear(self) -> None: ...
+    def report(self) -> typing.List[typing.Dict[str, typing.Any]]: ...
+    def tree(self) -> typing.Optional[typing.Dict[str, typing.Any]]: ...
+    def writeFoldedStacks(self, path: str) -> None: ...
+
+class LeakTracker(QtCore.QObject):
+    snapshotTaken: typing.ClassVar[QtCore.Signal]  # noqa: N815
+    def __init__(
+        self,
+        budget: float = ...,
+        maxSnapshots: int = ...,
+        parent: typing.Optional[QtCore.QObject] = ...,
+    ) -> None: ...
+    def snapshot(self) -> typing.Dict[str, int]: ...
+    def start(self, interval: int = ...) -> None: ...
+    def stop(self) -> None: ...
+    def isActive(self) -> bool: ...
+    def snapshots(self) -> typing.List[typing.Dict[str, int]]: ...
+    @staticmethod
+    def diff(
+        old: typing.Mapping[str, int], new: typing.Mapping[str, int]
+    ) -> typing.Dict[str, int]: ...
+    @staticmethod
+    def findDeleted() -> typing.List[QtCore.QObject]: ...
+    @staticmethod
+    def referrers(obj: object) -> typing.List[str]: ...
+
+class ThumbnailLoader(QtCore.QObject):
+    thumbnailsReady: typing.ClassVar[QtCore.Signal]  # noqa: N815
+    thumbnailFailed: typing.ClassVar[QtCore.Signal]  # noqa: N815
+    def __init__(
+        self,
+        size: typing.Optional[QtCore.QSize] = ...,
+        cacheSize: int = ...,
+        cacheDir: typing.Optional[str] = ...,
+        cacheFormat: str = ...,
+        checkFiles: bool = ...,
+        threadPool: typing.Optional[QtCore.QThreadPool] = ...,
+        parent: typing.Optional[QtCore.QObject] = ...,
+    ) -> None: ...
+    def request(
+        self, path: str, size: typing.Optional[QtCore.QSize] = ..., priority: int = ...
+    ) -> typing.Optional[QtGui.QImage]: ...
+    def cached(
+        self, path: str, size: typing.Optional[QtCore.QSize] = ...
+    ) -> typing.Optional[QtGui.QImage]: ...
+    def isLoading(
+        self, path: str, size: typing.Optional[QtCore.QSize] = ...
+    ) -> bool: ...
+    def cancel(self, path: str, size: typing.Optional[QtCore.QSize] = ...) -> None: ...
+    def cancelAll(self) -> None: ...
+    def invalidate(self, path: typing.Optional[str] = ...) -> None: ...
+    def cachedBytes(self) -> int: ...
+
+class PixmapCache:
+    def __init__(self, namespace: str, budget: typing.Optional[int] = ...) -> None: ...
+    def namespace(self) -> str: ...
+    def find(
+        self, key: typing.Union[str, typing.Tuple[typing.Any, ...]]
+    ) -> typing.Optional[QtGui.QPixmap]: ...
+    def insert(
+        self,
+        key: typing.Union[str, typing.Tuple[typing.Any, ...]],
+        pixmap: QtGui.QPixmap,
+    ) -> bool: ...
+    def remove(self, key: typing.Union[str, typing.Tuple[typing.Any, ...]]) -> None: ...
+    def invalidate(self) -> None: ...
+    def setBudget(self, budget: typing.Optional[int]) -> None: ...
+    def budget(self) -> typing.Optional[int]: ...
+    def stats(self) -> typing.Dict[str, int]: ...
+    def resetStats(self) -> None: ...
+    @staticmethod
+    def setCacheLimit(budget: int) -> None: ...
+    @staticmethod
+    def cacheLimit() -> int: ...
+
+def byteArrayFromBuffer(buffer: typing.Any) -> QtCore.QByteArray: ...
+def byteArrayView(array: QtCore.QByteArray) -> memoryview: ...
+def compileResource(qrc: str, cacheDir: typing.Optional[str] = ...) -> str: ...
+def dataChanged(
+    self: QtCore.QAbstractItemModel,
+    topleft: QtCore.QModelIndex,
+    bottomright: QtCore.QModelIndex,
+    roles: typing.Optional[typing.Sequence[int]] = ...,
+) -> None: ...
+def dataChangedLater(
+    model: QtCore.QAbstractItemModel,
+    topLeft: QtCore.QModelIndex,
+    bottomRight: typing.Optional[QtCore.QModelIndex] = ...,
+    roles: typing.Optional[typing.Sequence[int]] = ...,
+) -> None: ...
 def delete(obj: object) -> None: ...
 def getCppPointer(obj: object) -> typing.Tuple[int, ...]: ...
+def headlessApplication(
+    level: str = ...,
+    argv: typing.Optional[typing.List[str]] = ...,
+    platform: str = ...,
+    fonts: typing.Optional[typing.List[str]] = ...,
+) -> QtCore.QCoreApplication: ...
+def imageBits(image: QtGui.QImage) -> memoryview: ...
+def imageFromBuffer(
+    buffer: typing.Any,
+    width: int,
+    height: int,
+    format: QtGui.QImage.Format,
+    bytesPerLine: typing.Optional[int] = ...,
+) -> QtGui.QImage: ...
+def isCommonMember(name: str) -> typing.Optional[bool]: ...
 def isValid(obj: object) -> bool: ...
+def linesFromBuffer(values: typing.Any) -> typing.List[QtCore.QLineF]: ...
 def loadUi(
     uifile: str, baseinstance: typing.Optional[QtWidgets.QWidget] = ...
 ) -> QtWidgets.QWidget: ...
 def load_ui(
     uifile: str, baseinstance: typing.Optional[QtWidgets.QWidget] = ...
 ) -> QtWidgets.QWidget: ...
+def memoryReport(
+    widget: typing.Optional[QtWidgets.QWidget] = ...,
+) -> typing.Dict[str, typing.Any]: ...
+def painterPathFromBuffer(
+    values: typing.Any, closed: bool = ...
+) -> QtGui.QPainterPath: ...
+def polygonFromBuffer(values: typing.Any) -> QtGui.QPolygonF: ...
+def registerResource(
+    path: str, root: str = ..., cacheDir: typing.Optional[str] = ...
+) -> str: ...
 def translate(context: str, sourceText: str, *args: typing.Any) -> str: ...
+def unregisterResource(
+    path: str, root: str = ..., cacheDir: typing.Optional[str] = ...
+) -> bool: ...
+def updateRows(
+    model: QtCore.QAbstractItemModel,
+    rows: typing.List[typing.Any],
+    newRows: typing.Sequence[typing.Any],
+    key: typing.Optional[typing.Callable[[typing.Any], typing.Hashable]] = ...,
+    parent: typing.Optional[QtCore.QModelIndex] = ...,
+) -> typing.Dict[str, int]: ...
 def wrapInstance(
     address: int, qt_type: type
 ) -> object | QtCore.QObject | QtWidgets.QWidget: ...
@@ -57,6 +57,7 @@ __all__ = [
 QT_VERBOSE = bool(os.getenv("QT_VERBOSE"))
 QT_PREFERRED_BINDING_JSON = os.getenv("QT_PREFERRED_BINDING_JSON", "")
 QT_PREFERRED_BINDING = os.getenv("QT_PREFERRED_BINDING", "")
+QT_MODULES = os.getenv("QT_MODULES", "")
 
 # Reference to Qt.py
 Qt = sys.modules[__name__]
@@ -881,6 +882,133 @@ _missing_members = {
     },
 }
 
+""" Member index
+
+The classes of _common_members only tell us whether a class is available in
+all bindings, not its methods or enums. These are recorded by the membership
+tox environments in a compressed index, the "Qt_members.py" module, shipped
+next to Qt.py. It holds a line for each class such as
+"QtWidgets.QHeaderView<QtWidgets.QAbstractItemView setSectionResizeMode ..."
+and is only loaded the first time a method or enum is looked up.
+"""
+
+
+def _parse_member_index(text):
+    """Return {class: (base, members)} from the lines of a member index
+
+    Arguments:
+        text (str): Lines of "Class<Base member member ...", where "<Base"
+            is optional.
+
+    """
+    index = {}
+    for line in text.splitlines():
+        cls, _, members = line.partition(" ")
+        cls, _, base = cls.partition("<")
+        if cls:
+            index[cls] = (base or None, frozenset(members.split()))
+
+    return index
+
+
+def _load_member_index():
+    """Return the member index as parsed by _parse_member_index
+
+    Returns None if no member index is installed next to Qt.py.
+
+    """
+    if not hasattr(Qt, "_member_index"):
+        import base64
+        import zlib
+
+        package = __name__.rpartition(".")[0]
+        try:
+            module = importlib.import_module(
+                package + ".Qt_members" if package else "Qt_members"
+            )
+        except ImportError:
+            _log("No member index found")
+            Qt._member_index = None
+        else:
+            text = zlib.decompress(base64.b85decode(b"".join(module.members.split())))
+            Qt._member_index = _parse_member_index(text.decode("utf-8"))
+
+    return Qt._member_index
+
+
+def _is_common_member(name):
+    """Return whether `name` is a member common to all bindings
+
+    Methods and enums are looked up in the member index, following the base
+    classes recorded in it. Everything else is looked up in _common_members.
+
+    Usage:
+        >> QtCompat.isCommonMember("QtWidgets.QHeaderView.setSectionResizeMode")
+        True
+
+    Arguments:
+        name (str): Name relative to Qt.py such as "QtWidgets",
+            "QtWidgets.QHeaderView" or "QtCore.Qt.ItemDataRole.DisplayRole".
+
+    Returns:
+        bool or None: None if `name` is a method or enum and no member index
+            is installed.
+
+    """
+    parts = name.split(".", 2)
+    if parts[0] not in _common_members:
+        return False
+    if len(parts) > 1 and parts[1] not in _common_members[parts[0]]:
+        return False
+    if len(parts) < 3:
+        return True
+
+    index = _load_member_index()
+    if index is None:
+        return None
+
+    cls = parts[0] + "." + parts[1]
+    visited = set()
+    while cls in index and cls not in visited:
+        visited.add(cls)
+
+        # Continue with the base class the remaining members are inherited from
+        cls, members = index[cls]
+        if parts[2] in members:
+            return True
+
+    return False
+    if len(parts) > 1 and parts[1] not in _common_members[parts[0]]:
+        return False
+    if len(parts) < 3:
+        return True
+
+    import bisect
+
+    index = _load_member_index()
+    if index is None:
+        return None
+
+    cls = parts[0] + "." + parts[1]
+    visited = set()
+    while cls and cls not in visited:
+        visited.add(cls)
+
+        member = cls + "." + parts[2]
+        i = bisect.bisect_left(index, member)
+        if i < len(index) and index[i] == member:
+            return True
+
+        # Continue with the base class the remaining members are inherited from
+        base = cls + " < "
+        i = bisect.bisect_left(index, base)
+        if i < len(index) and index[i].startswith(base):
+            cls = index[i][len(base) :]
+        else:
+            cls = None
+
+    return False
+
 
 def _qInstallMessageHandler(handler):
     """Install a message handler that works in all bindings
@@ -1010,6 +1138,3828 @@ def _isvalid(object):
         raise AttributeError("'module' has no attribute isValid")
 
 
+def _qimage_bits(image):
+    """Return the pixel data of a QImage as a writable memoryview
+
+    PySide returns a memoryview from `QImage.bits()` whereas PyQt returns a
+    `sip.voidptr` without a size. This returns a memoryview of unsigned bytes
+    covering all of the image's scanlines, without copying them.
+
+    Usage:
+        See :func:`QtCompat.imageBits()`
+
+    Arguments:
+        image (QImage): Image to access the pixels of. Each scanline is
+            `image.bytesPerLine()` long, use `view.cast("B", (height, stride))`
+            for a 2D view.
+
+    Note:
+        Like `QImage.bits()` this detaches the image from any copies sharing
+        its data. The view is only valid while the image is alive and not
+        modified by other means, e.g. `QImage.convertTo()`.
+
+    """
+    if image.isNull():
+        return memoryview(bytearray())
+
+    bits = image.bits()
+    if hasattr(bits, "setsize"):
+        # PyQt, sip.voidptr
+        bits.setsize(image.sizeInBytes())
+    view = memoryview(bits)
+    if view.format != "B" or view.ndim != 1:
+        view = view.cast("B")
+    return view
+
+
+def _qimage_from_buffer(buffer, width, height, format, bytesPerLine=None):
+    """Create a QImage reading its pixels from `buffer` without copying them
+
+    Usage:
+        See :func:`QtCompat.imageFromBuffer()`
+
+    Arguments:
+        buffer (object): Any C contiguous object supporting the buffer
+            protocol, such as a bytearray, memoryview or numpy array.
+            Read-only buffers such as bytes are copied.
+        width (int): Width of the image in pixels.
+        height (int): Height of the image in pixels.
+        format (QImage.Format): Pixel format of the data in `buffer`.
+        bytesPerLine (int, optional): Stride of each scanline in bytes,
+            defaults to tightly packed scanlines.
+
+    Note:
+        The buffer is kept alive as long as the returned image, but not by
+        shallow copies of it such as `QImage(image)`. Use `image.copy()` to
+        detach from the buffer. Changes made to the buffer are visible in the
+        image. PySide writes changes made to the image into the buffer, PyQt
+        copies the pixels the first time the image is changed.
+
+    """
+    view = memoryview(buffer)
+    if not view.c_contiguous:
+        raise ValueError("buffer must be C contiguous")
+    if view.readonly:
+        # PySide would paint into immutable objects such as bytes
+        view = memoryview(bytearray(view))
+    view = view.cast("B")
+
+    depth = Qt._QtGui.QImage.toPixelFormat(format).bitsPerPixel()
+    row = (width * depth + 7) // 8
+    if bytesPerLine is None:
+        bytesPerLine = row
+    elif bytesPerLine < row:
+        raise ValueError(
+            "bytesPerLine %d is less than %d bytes of %d pixels"
+            % (bytesPerLine, row, width)
+        )
+
+    # Qt reads past the end of the buffer instead of failing
+    required = bytesPerLine * (height - 1) + row if height > 0 else 0
+    if view.nbytes < required:
+        raise ValueError(
+            "buffer of %d bytes is smaller than the %d bytes required"
+            % (view.nbytes, required)
+        )
+
+    image = Qt._QtGui.QImage(view, width, height, bytesPerLine, format)
+
+    # Keep the memory alive, the view also prevents resizing e.g. a bytearray
+    image._qtpy_buffer = view
+    return image
+
+
+def _qbytearray_view(array):
+    """Return a read-only memoryview of the contents of a QByteArray
+
+    Usage:
+        See :func:`QtCompat.byteArrayView()`
+
+    Arguments:
+        array (QByteArray): Array to view the contents of without copying
+            them, if the binding supports the buffer protocol on QByteArray.
+            Otherwise the contents are copied once with `QByteArray.data()`.
+
+    Note:
+        The view is only valid while `array` is alive and not resized.
+
+    """
+    try:
+        view = memoryview(array)
+    except TypeError:
+        return memoryview(array.data())
+
+    if view.format != "B" or view.ndim != 1:
+        view = view.cast("B")
+    # Python 3.7 has no memoryview.toreadonly
+    return view.toreadonly() if hasattr(view, "toreadonly") else view
+
+
+def _qbytearray_from_buffer(buffer):
+    """Create a QByteArray from an object supporting the buffer protocol
+
+    A QByteArray always owns its data, so this copies `buffer` once. PySide
+    only accepts bytes and bytearray, other buffers would otherwise be copied
+    to bytes first.
+
+    Usage:
+        See :func:`QtCompat.byteArrayFromBuffer()`
+
+    Arguments:
+        buffer (object): Any object supporting the buffer protocol, such as
+            bytes, bytearray, memoryview, array.array or mmap.
+
+    """
+    if isinstance(buffer, (bytes, bytearray)):
+        return Qt._QtCore.QByteArray(buffer)
+
+    view = memoryview(buffer)
+    if not view.c_contiguous:
+        # Copies the elements in order, the QByteArray takes ownership of it
+        return Qt._QtCore.QByteArray(view.tobytes())
+    view = view.cast("B")
+
+    if Qt.IsPyQt5 or Qt.IsPyQt6:
+        # PyQt accepts any buffer
+        return Qt._QtCore.QByteArray(view)
+
+    try:
+        # Copy straight into the memory of a new array
+        array = Qt._QtCore.QByteArray(view.nbytes, 0)
+        memoryview(array)[:] = view
+    except (TypeError, ValueError):
+        return Qt._QtCore.QByteArray(view.tobytes())
+    return array
+
+
+def _float_buffer(values, step):
+    """Return `values` as a flat memoryview of doubles
+
+    Arguments:
+        values (object): A buffer of floats or integers, such as an
+            array.array or a numpy array of any shape, or a sequence of numbers.
+        step (int): The number of values must be a multiple of this.
+
+    """
+    try:
+        view = memoryview(values)
+    except TypeError:
+        import array
+
+        view = memoryview(array.array("d", values))
+
+    if not view.c_contiguous:
+        view = memoryview(view.tobytes()).cast(view.format)
+
+    # Byte order and size prefixes of the native format, e.g. "<d" of ctypes
+    fmt = view.format.lstrip("@=" + ("<" if sys.byteorder == "little" else ">"))
+    if len(fmt) != 1 or fmt not in "dfbBhHiIlLqQ":
+        raise TypeError("Unsupported buffer format '%s'" % view.format)
+
+    view = view.cast("B").cast(fmt)
+    if fmt != "d":
+        import array
+
+        view = memoryview(array.array("d", view))
+
+    if len(view) % step:
+        raise ValueError(
+            "Expected a multiple of %d values, got %d values" % (step, len(view))
+        )
+    return view
+
+
+def _polygonf_memory(polygon, count):
+    """Return the first `count` points of a QPolygonF as a memoryview of doubles
+
+    Returns None if the binding does not expose the memory of the polygon.
+
+    """
+    data = polygon.data()
+    if hasattr(data, "setsize"):
+        # PyQt, sip.voidptr
+        data.setsize(count * 16)
+        return memoryview(data).cast("d")
+
+    # PySide, the first QPointF of the polygon. Only use it if it refers to the
+    # memory of the polygon rather than being a copy.
+    shiboken = getattr(Qt, "_shiboken6", None) or Qt._shiboken2
+    if shiboken.ownedByPython(data):
+        return None
+
+    import ctypes
+
+    address = _getcpppointer(data)
+    memory = (ctypes.c_double * (count * 2)).from_address(address)
+    return memoryview(memory).cast("B").cast("d")
+
+
+def _polygonf_from_buffer(values):
+    """Create a QPolygonF from a flat buffer of x, y coordinates
+
+    The coordinates are copied straight into the memory of the polygon in
+    bindings that expose it, PyQt with a `sip.voidptr` and PySide with the
+    address of the first point. Otherwise the points are created in a loop.
+
+    Usage:
+        See :func:`QtCompat.polygonFromBuffer()`
+
+    Arguments:
+        values (object): Buffer of x, y pairs such as a numpy array of
+            shape (N, 2), see `_float_buffer()`.
+
+    """
+    view = _float_buffer(values, 2)
+    count = len(view) // 2
+    QPointF, QPolygonF = Qt._QtCore.QPointF, Qt._QtGui.QPolygonF
+
+    polygon = QPolygonF()
+    if not count:
+        return polygon
+
+    try:
+        # QPointF is not two doubles if Qt was built with qreal as float
+        probe = QPolygonF([QPointF(1.0, 2.0), QPointF(3.0, 4.0)])
+        memory = _polygonf_memory(probe, 1)
+        if memory is not None and memory.tolist() == [1.0, 2.0]:
+            polygon.resize(count)
+            memory = _polygonf_memory(polygon, count)
+            if memory is not None:
+                memory[:] = view
+                return polygon
+    except (AttributeError, TypeError, ValueError):
+        pass
+
+    points = iter(view.tolist())
+    return QPolygonF(list(map(QPointF, points, points)))
+
+
+def _painterpath_from_buffer(values, closed=False):
+    """Create a QPainterPath of lines through a flat buffer of x, y coordinates
+
+    Usage:
+        See :func:`QtCompat.painterPathFromBuffer()`
+
+    Arguments:
+        values (object): Buffer of x, y pairs, see `_polygonf_from_buffer()`.
+        closed (bool, optional): Whether to close the path back to its first
+            point.
+
+    """
+    path = Qt._QtGui.QPainterPath()
+    path.addPolygon(_polygonf_from_buffer(values))
+    if closed:
+        path.closeSubpath()
+    return path
+
+
+def _linesf_from_buffer(values):
+    """Create a list of QLineF from a flat buffer of x1, y1, x2, y2 coordinates
+
+    Usage:
+        See :func:`QtCompat.linesFromBuffer()`
+
+    Arguments:
+        values (object): Buffer of 4 values per line, such as a numpy array of
+            shape (N, 4) or an array of shape (N * 2, 2) of point pairs.
+
+    """
+    coordinates = iter(_float_buffer(values, 4).tolist())
+    return list(map(Qt._QtCore.QLineF, *[coordinates] * 4))
+
+
+def _role_value(role):
+    """Return the int value of an item data role, or any other enum
+
+    Views pass roles as int, calls from Python may pass the enum, which isn't
+    an int in PyQt6.
+
+    """
+    try:
+        return int(role)
+    except TypeError:
+        return Qt.QtCompat.enumValue(role)
+
+
+def _columnar_table_model():
+    """Return the class of QtCompat.ColumnarTableModel
+
+    The class is created once a binding is set up, it derives from the
+    binding's QAbstractTableModel.
+
+    """
+    import array
+    import collections
+
+    QtCore = Qt._QtCore
+    enum = Qt.QtCompat.enumValue
+    roles = QtCore.Qt.ItemDataRole
+    alignment = QtCore.Qt.AlignmentFlag
+
+    class ColumnarTableModel(QtCore.QAbstractTableModel):
+        """Read-only table model storing its values column by column
+
+        Each column is a single `array.array`, numpy array or list rather than
+        an item per cell, and display strings are only formatted for the cells
+        a view asks for. `data()` looks up the role in a dict instead of
+        comparing it to each role in turn.
+
+        Usage:
+            >> model = QtCompat.ColumnarTableModel(
+            ..     ["Name", "Size"], typecodes=[None, "q"], formats=[None, "{:,}"]
+            .. )
+            >> model.appendRows([("a.exr", 1024), ("b.exr", 2048)])
+            >> model.appendColumns([names, numpy.array(sizes)])
+
+        Arguments:
+            headers (list): Header of each column.
+            typecodes (list, optional): `array.array` typecode of each column,
+                None stores the column in a list. Defaults to lists.
+            formats (list, optional): Format of the display string of each
+                column, either a `str.format` string or a callable taking the
+                value. None uses `str`.
+            cacheSize (int, optional): Display strings kept per column, the
+                strings formatted first are formatted again when needed.
+            parent (QObject, optional): Parent of the model.
+
+        """
+
+        def __init__(
+            self, headers, typecodes=None, formats=None, cacheSize=10000, parent=None
+        ):
+            super(ColumnarTableModel, self).__init__(parent)
+            self._headers = list(headers)
+            self._cacheSize = cacheSize
+            typecodes = typecodes or [None] * len(self._headers)
+            self._columns = [
+                [] if typecode is None else array.array(typecode)
+                for typecode in typecodes
+            ]
+            self._formats = [
+                format.format if isinstance(format, str) else format or str
+                for format in formats or [None] * len(self._headers)
+            ]
+            self._roles = {
+                enum(roles.DisplayRole): self._display,
+                enum(roles.EditRole): self._value,
+                enum(roles.UserRole): self._value,
+                enum(roles.TextAlignmentRole): self._alignment,
+            }
+            self._right = alignment.AlignRight | alignment.AlignVCenter
+            self._setup()
+
+        def _setup(self):
+            # Display strings formatted so far, by column then row
+            self._strings = [collections.OrderedDict() for _ in self._columns]
+            # numpy.ndarray.item returns Python scalars rather than numpy ones
+            self._getters = [
+                getattr(column, "item", None) or column.__getitem__
+                for column in self._columns
+            ]
+            self._numeric = [
+                isinstance(column, array.array)
+                or getattr(getattr(column, "dtype", None), "kind", None)
+                in ("i", "u", "f")
+                for column in self._columns
+            ]
+            self._count = len(self._columns[0]) if self._columns else 0
+
+        def _display(self, row, column):
+            strings = self._strings[column]
+            try:
+                return strings[row]
+            except KeyError:
+                value = self._getters[column](row)
+                text = strings[row] = self._formats[column](value)
+                if len(strings) > self._cacheSize:
+                    strings.popitem(last=False)
+                return text
+
+        def _value(self, row, column):
+            return self._getters[column](row)
+
+        def _alignment(self, row, column):
+            return self._right if self._numeric[column] else None
+
+        def rowCount(self, parent=None):
+            return 0 if parent is not None and parent.isValid() else self._count
+
+        def columnCount(self, parent=None):
+            return 0 if parent is not None and parent.isValid() else len(self._columns)
+
+        def data(self, index, role=roles.DisplayRole):
+            handler = self._roles.get(role)
+            if handler is None:
+                handler = self._roles.get(_role_value(role))
+                if handler is None:
+                    return None
+            return handler(index.row(), index.column())
+
+        def headerData(self, section, orientation, role=roles.DisplayRole):
+            if (
+                orientation == QtCore.Qt.Orientation.Horizontal
+                and _role_value(role) == enum(roles.DisplayRole)
+                and 0 <= section < len(self._headers)
+            ):
+                return self._headers[section]
+            return super(ColumnarTableModel, self).headerData(
+                section, orientation, role
+            )
+
+        def columnData(self, column):
+            """Return the array, numpy array or list storing `column`"""
+            return self._columns[column]
+
+        def setColumns(self, columns):
+            """Replace all values of the model, resetting it
+
+            The columns are stored as they are rather than copied, e.g. a
+            numpy array is shared with the caller.
+
+            """
+            columns = list(columns)
+            if len(columns) != len(self._headers):
+                raise ValueError(
+                    "Expected %d columns, got %d" % (len(self._headers), len(columns))
+                )
+            if len(set(map(len, columns))) > 1:
+                raise ValueError("All columns must have the same length")
+
+            self.beginResetModel()
+            self._columns = columns
+            self._setup()
+            self.endResetModel()
+
+        def appendColumns(self, columns):
+            """Append a batch of rows given as a sequence of values per column
+
+            Views are notified of the whole batch with one `rowsInserted`.
+
+            """
+            columns = list(columns)
+            if len(columns) != len(self._columns):
+                raise ValueError(
+                    "Expected %d columns, got %d" % (len(self._columns), len(columns))
+                )
+            counts = set(map(len, columns))
+            if len(counts) > 1:
+                raise ValueError("All columns must have the same length")
+            count = counts.pop() if counts else 0
+            if not count:
+                return
+
+            first = self._count
+            self.beginInsertRows(QtCore.QModelIndex(), first, first + count - 1)
+            for index, values in enumerate(columns):
+                column = self._columns[index]
+                if hasattr(column, "extend"):
+                    column.extend(values)
+                else:
+                    import numpy
+
+                    self._columns[index] = numpy.concatenate([column, values])
+            strings = self._strings
+            self._setup()
+            # Rows are only added, the strings formatted so far are still valid
+            self._strings = strings
+            self.endInsertRows()
+
+        def appendRows(self, rows):
+            """Append a batch of rows given as a sequence of values per row"""
+            rows = list(rows)
+            if rows:
+                self.appendColumns(list(zip(*rows)))
+
+    return ColumnarTableModel
+
+
+def _data_changed(self, topleft, bottomright, roles=None):
+    """Emit `dataChanged` of a model with the same arguments in all bindings
+
+    Usage:
+        See :func:`QtCompat.dataChanged()`
+
+    """
+    self.dataChanged.emit(topleft, bottomright, roles or [])
+
+
+def _merge_ranges(ranges):
+    """Merge (top, bottom, left, right) ranges of overlapping or adjacent rows
+
+    Returns a sorted list of row bands, each spanning the columns of all the
+    ranges merged into it.
+
+    """
+    merged = []
+    for top, bottom, left, right in sorted(ranges):
+        if merged and top <= merged[-1][1] + 1:
+            band = merged[-1]
+            band[1] = max(band[1], bottom)
+            band[2] = min(band[2], left)
+            band[3] = max(band[3], right)
+        else:
+            merged.append([top, bottom, left, right])
+    return merged
+
+
+def _data_changed_coalescer():
+    """Return the class of QtCompat.DataChangedCoalescer"""
+    import functools
+
+    QtCore = Qt._QtCore
+
+    def inserted(band, axis, first, count):
+        """Return `band` after inserting `count` rows or columns at `first`"""
+        start, end = band[axis * 2 : axis * 2 + 2]
+        if start >= first:
+            start += count
+        if end >= first:
+            # Including those inserted within the band
+            end += count
+        return band[: axis * 2] + (start, end) + band[axis * 2 + 2 :]
+
+    def removed(band, axis, first, last):
+        """Return `band` after removing rows or columns `first` to `last`"""
+        count = last - first + 1
+        start, end = band[axis * 2 : axis * 2 + 2]
+        if start > last:
+            start -= count
+        elif start >= first:
+            start = first
+        if end > last:
+            end -= count
+        elif end >= first:
+            end = first - 1
+        if start > end:
+            return None
+        return band[: axis * 2] + (start, end) + band[axis * 2 + 2 :]
+
+    def widened(band, axis):
+        """Return `band` spanning all rows or columns, clamped when emitted"""
+        return band[: axis * 2] + (0, sys.maxsize) + band[axis * 2 + 2 :]
+
+    class DataChangedCoalescer(QtCore.QObject):
+        """Collect changes of models and emit `dataChanged` for them at once
+
+        Changes are collected per model and parent index, and emitted when
+        control returns to the event loop, or after `interval` milliseconds.
+        Changes of overlapping or adjacent rows are merged into one
+        `dataChanged` spanning the columns and roles of each of them.
+
+        Changes follow rows and columns inserted or removed before they are
+        emitted. Moved rows or columns and changed layouts emit all rows or
+        columns of the parents involved, and a reset model emits nothing.
+
+        Usage:
+            >> coalescer = QtCompat.DataChangedCoalescer(interval=50)
+            >> for row in rows:
+            ..     coalescer.dataChanged(model, model.index(row, 2))
+            >> coalescer.flush()  # Optional, emits pending changes now
+
+        Arguments:
+            interval (int, optional): Milliseconds to collect changes for
+                before emitting them. Defaults to 0, once per event loop
+                iteration.
+            parent (QObject, optional): Parent of the coalescer.
+
+        """
+
+        # Merge the ranges of a model before they grow past this many
+        _compact_size = 1024
+
+        def __init__(self, interval=0, parent=None):
+            super(DataChangedCoalescer, self).__init__(parent)
+            # (model, parent) key -> [model, parent, ranges, roles]
+            self._pending = {}
+            # id(model) -> (signal, slot) of the changes of the model followed
+            self._watched = {}
+            self._timer = QtCore.QTimer(self)
+            self._timer.setSingleShot(True)
+            self._timer.setInterval(interval)
+            self._timer.timeout.connect(self.flush)
+
+        def interval(self):
+            """Return the milliseconds changes are collected for"""
+            return self._timer.interval()
+
+        def setInterval(self, interval):
+            """Collect changes for `interval` milliseconds before emitting them"""
+            self._timer.setInterval(interval)
+
+        def dataChanged(self, model, topLeft, bottomRight=None, roles=None):
+            """Add a change of the cells from `topLeft` to `bottomRight`
+
+            Arguments:
+                model (QAbstractItemModel): Model of the cells.
+                topLeft (QModelIndex): First changed cell.
+                bottomRight (QModelIndex, optional): Last changed cell, in the
+                    same parent as `topLeft`. Defaults to `topLeft`.
+                roles (list, optional): Roles that changed, defaults to all.
+
+            """
+            if bottomRight is None:
+                bottomRight = topLeft
+            parent = topLeft.parent()
+            if parent.isValid():
+                key = (id(model), parent.row(), parent.column(), parent.internalId())
+            else:
+                key = (id(model),)
+
+            entry = self._pending.get(key)
+            if entry is None:
+                persistent = None
+                if parent.isValid():
+                    persistent = QtCore.QPersistentModelIndex(parent)
+                entry = self._pending[key] = [model, persistent, [], set()]
+                self._watch(model)
+
+            ranges = entry[2]
+            ranges.append(
+                (
+                    topLeft.row(),
+                    bottomRight.row(),
+                    topLeft.column(),
+                    bottomRight.column(),
+                )
+            )
+            if len(ranges) > self._compact_size:
+                ranges[:] = map(tuple, _merge_ranges(ranges))
+
+            if not roles:
+                # Any role, no need to collect the others
+                entry[3] = None
+            elif entry[3] is not None:
+                entry[3].update(map(_role_value, roles))
+
+            if not self._timer.isActive():
+                self._timer.start()
+
+        def _watch(self, model):
+            """Follow the rows and columns of `model` until the next flush"""
+            if id(model) in self._watched:
+                return
+            slot = functools.partial
+            slots = [
+                (model.rowsInserted, slot(self._inserted, model, 0)),
+                (model.columnsInserted, slot(self._inserted, model, 1)),
+                (model.rowsRemoved, slot(self._removed, model, 0)),
+                (model.columnsRemoved, slot(self._removed, model, 1)),
+                (model.rowsMoved, slot(self._moved, model, 0)),
+                (model.columnsMoved, slot(self._moved, model, 1)),
+                (model.layoutChanged, slot(self._layoutChanged, model)),
+                (model.modelReset, slot(self._reset, model)),
+            ]
+            for signal, function in slots:
+                signal.connect(function)
+            self._watched[id(model)] = (model, slots)
+
+        def _unwatch(self):
+            watched, self._watched = self._watched, {}
+            for model, slots in watched.values():
+                if not _isvalid(model):
+                    continue
+                for signal, function in slots:
+                    signal.disconnect(function)
+
+        def _entries(self, model, parents=None):
+            """Yield the pending changes of `model` under any of `parents`"""
+            for entry in list(self._pending.values()):
+                if entry[0] is not model:
+                    continue
+                persistent = entry[1]
+                if parents is None:
+                    yield entry
+                    continue
+                for parent in parents:
+                    if persistent is None:
+                        if not parent.isValid():
+                            yield entry
+                            break
+                    elif (
+                        persistent.isValid()
+                        and parent.isValid()
+                        and persistent.row() == parent.row()
+                        and persistent.column() == parent.column()
+                        and persistent.internalId() == parent.internalId()
+                    ):
+                        yield entry
+                        break
+
+        def _inserted(self, model, axis, parent, first, last):
+            count = last - first + 1
+            for entry in self._entries(model, [parent]):
+                entry[2][:] = [inserted(band, axis, first, count) for band in entry[2]]
+
+        def _removed(self, model, axis, parent, first, last):
+            for entry in self._entries(model, [parent]):
+                bands = [removed(band, axis, first, last) for band in entry[2]]
+                entry[2][:] = [band for band in bands if band is not None]
+
+        def _moved(self, model, axis, parent, start, end, destination, index):
+            for entry in self._entries(model, [parent, destination]):
+                entry[2][:] = [widened(band, axis) for band in entry[2]]
+
+        def _layoutChanged(self, model, parents=None, hint=None):
+            # All parents may have changed when none are given
+            parents = list(parents) if parents else None
+            for entry in self._entries(model, parents):
+                entry[2][:] = [widened(band, 0) for band in entry[2]]
+
+        def _reset(self, model):
+            for key, entry in list(self._pending.items()):
+                if entry[0] is model:
+                    del self._pending[key]
+
+        def flush(self):
+            """Emit `dataChanged` for all pending changes now"""
+            self._timer.stop()
+            pending, self._pending = self._pending, {}
+            self._unwatch()
+
+            for model, persistent, ranges, roles in pending.values():
+                if not _isvalid(model):
+                    continue
+
+                if persistent is None:
+                    parent = QtCore.QModelIndex()
+                elif persistent.isValid():
+                    parent = model.index(
+                        persistent.row(), persistent.column(), persistent.parent()
+                    )
+                else:
+                    # The parent was removed since the change
+                    continue
+
+                # Bands widened to all rows or columns end at the last one
+                rows = model.rowCount(parent)
+                columns = _column_count(model, parent)
+                roles = sorted(roles) if roles else []
+                for top, bottom, left, right in _merge_ranges(ranges):
+                    bottom = min(bottom, rows - 1)
+                    right = min(right, columns - 1)
+                    if top > bottom or left > right:
+                        continue
+                    model.dataChanged.emit(
+                        model.index(top, left, parent),
+                        model.index(bottom, right, parent),
+                        roles,
+                    )
+
+    return DataChangedCoalescer
+
+
+def _data_changed_later(model, topLeft, bottomRight=None, roles=None):
+    """Emit `dataChanged` of `model` once control returns to the event loop
+
+    Changes are collected by a QtCompat.DataChangedCoalescer shared by all
+    models, see its `dataChanged()` method.
+
+    Usage:
+        See :func:`QtCompat.dataChangedLater()`
+
+    """
+    if not hasattr(Qt, "_coalescer"):
+        Qt._coalescer = Qt.QtCompat.DataChangedCoalescer()
+    Qt._coalescer.dataChanged(model, topLeft, bottomRight, roles)
+
+
+def _longest_increasing(values):
+    """Return the indices of a longest strictly increasing subsequence"""
+    import bisect
+
+    tails = []  # Smallest last value of a subsequence of each length
+    ends = []  # Index of that value
+    previous = [-1] * len(values)
+    for index, value in enumerate(values):
+        length = bisect.bisect_left(tails, value)
+        if length:
+            previous[index] = ends[length - 1]
+        if length == len(tails):
+            tails.append(value)
+            ends.append(index)
+        else:
+            tails[length] = value
+            ends[length] = index
+
+    result = []
+    index = ends[-1] if ends else -1
+    while index != -1:
+        result.append(index)
+        index = previous[index]
+    return result[::-1]
+
+
+def _column_count(model, parent=None):
+    """Return the number of columns of `model` under `parent`
+
+    QAbstractListModel.columnCount is private, lists have one column.
+
+    """
+    if isinstance(model, Qt._QtCore.QAbstractListModel):
+        return 1
+    return model.columnCount(parent or Qt._QtCore.QModelIndex())
+
+
+def _runs(indices):
+    """Return (first, last) of each run of consecutive integers of `indices`"""
+    runs = []
+    for index in indices:
+        if runs and runs[-1][1] == index - 1:
+            runs[-1][1] = index
+        else:
+            runs.append([index, index])
+    return runs
+
+
+def _move_rows(model, parent, rows, keys, target, stay):
+    """Move `rows` with `keys` into the order of `target`, return the count
+
+    Rows of `stay` are in increasing order of `target` and stay where they
+    are, all others are moved after the row preceding them in `target`,
+    adjacent rows at once.
+
+    """
+    # The rows are always in the order of a key known in advance,
+    # (original position, 0, 0) until moved and (original position of the
+    # staying row they follow, 1, position in target) after. A Fenwick tree
+    # counts the rows of each key, which finds the position of a row and the
+    # row at a position in O(log n) rather than O(n) with list.index().
+    original = {k: i for i, k in enumerate(keys)}
+    moved_key = {}
+    anchor = -1
+    for index, k in enumerate(target):
+        if k in stay:
+            anchor = original[k]
+        else:
+            moved_key[k] = (anchor, 1, index)
+    order = sorted([(i, 0, 0) for i in range(len(keys))] + list(moved_key.values()))
+    rank = {o: r for r, o in enumerate(order)}
+    size = len(order)
+    tree = [0] * (size + 1)
+    owner = [None] * size  # Key of the row of each rank
+    current = {}  # Rank of each key
+
+    def add(r, k):
+        owner[r] = k
+        delta = -1 if k is None else 1
+        r += 1
+        while r <= size:
+            tree[r] += delta
+            r += r & -r
+
+    def position(k):
+        # Number of rows before the row of `k`
+        r = current[k]
+        total = 0
+        while r:
+            total += tree[r]
+            r -= r & -r
+        return total
+
+    def at(position):
+        r = 0
+        step = 1 << size.bit_length()
+        while step:
+            if r + step <= size and tree[r + step] <= position:
+                r += step
+                position -= tree[r]
+            step >>= 1
+        return owner[r]
+
+    for i, k in enumerate(keys):
+        current[k] = rank[(i, 0, 0)]
+        add(current[k], k)
+
+    placed = set(stay)
+    moved = 0
+    end = 0
+    for index in [i for i, k in enumerate(target) if k not in stay]:
+        if index < end:
+            # Moved along with the previous rows
+            continue
+
+        # Move adjacent rows that follow each other in the new order at once
+        source = position(target[index])
+        count = 1
+        while (
+            index + count < len(target)
+            and target[index + count] not in placed
+            and source + count < len(keys)
+            and at(source + count) == target[index + count]
+        ):
+            count += 1
+
+        destination = position(target[index - 1]) + 1 if index else 0
+        block = target[index : index + count]
+        if not source <= destination <= source + count:
+            model.beginMoveRows(parent, source, source + count - 1, parent, destination)
+            moved_rows = rows[source : source + count]
+            del rows[source : source + count]
+            if destination > source:
+                destination -= count
+            rows[destination:destination] = moved_rows
+            model.endMoveRows()
+            moved += count
+
+        # Rows already after the preceding row are where their new key sorts
+        for k in block:
+            add(current[k], None)
+            current[k] = rank[moved_key[k]]
+            add(current[k], k)
+        placed.update(block)
+        end = index + count
+
+    return moved
+
+
+def _update_rows(model, rows, newRows, key=None, parent=None):
+    """Update the list of rows of a model to `newRows` without resetting it
+
+    Rows are matched by key. Rows of `rows` missing from `newRows` are
+    removed, rows new to `newRows` are inserted, and rows in a different
+    order are moved, each with the fewest batches of
+    `beginRemoveRows()`, `beginInsertRows()` and `beginMoveRows()`. Rows
+    whose value changed emit `dataChanged` per run of adjacent rows. Views
+    keep their selection and only update the rows that changed.
+
+    Usage:
+        See :func:`QtCompat.updateRows()`
+
+    Arguments:
+        model (QAbstractItemModel): Model displaying `rows`.
+        rows (list): The rows of the model under `parent`, updated in place.
+        newRows (list): The rows to update to.
+        key (callable, optional): Return the unique key of a row, defaults to
+            the row itself.
+        parent (QModelIndex, optional): Parent of the rows.
+
+    Returns:
+        dict: The number of rows "removed", "inserted", "moved" and "changed".
+
+    """
+    QtCore = Qt._QtCore
+    if parent is None:
+        parent = QtCore.QModelIndex()
+    keys = list(map(key, rows)) if key else list(rows)
+    new_keys = list(map(key, newRows)) if key else list(newRows)
+    positions = {k: i for i, k in enumerate(new_keys)}
+    if len(positions) != len(new_keys) or len(set(keys)) != len(keys):
+        raise ValueError("The keys of the rows must be unique")
+
+    stats = {"removed": 0, "inserted": 0, "moved": 0, "changed": 0}
+
+    # Remove rows from the bottom up, so the indices of the others stay valid
+    removed = [i for i, k in enumerate(keys) if k not in positions]
+    for first, last in reversed(_runs(removed)):
+        model.beginRemoveRows(parent, first, last)
+        del rows[first : last + 1]
+        del keys[first : last + 1]
+        model.endRemoveRows()
+    stats["removed"] = len(removed)
+
+    # Rows in increasing order of their new position stay where they are, all
+    # others are moved after the row preceding them in the new order
+    old_keys = set(keys)
+    target = [k for k in new_keys if k in old_keys]
+    if keys != target:
+        stay = {keys[i] for i in _longest_increasing([positions[k] for k in keys])}
+        stats["moved"] = _move_rows(model, parent, rows, keys, target, stay)
+
+    # Insert the new rows from the top down, the rows above are in place
+    inserted = [i for i, k in enumerate(new_keys) if k not in old_keys]
+    for first, last in _runs(inserted):
+        model.beginInsertRows(parent, first, last)
+        rows[first:first] = newRows[first : last + 1]
+        model.endInsertRows()
+    stats["inserted"] = len(inserted)
+
+    changed = [
+        (i, i, 0, 0)
+        for i, (row, new_row) in enumerate(zip(rows, newRows))
+        if row is not new_row and row != new_row
+    ]
+    rows[:] = newRows
+
+    if changed:
+        right = max(_column_count(model, parent) - 1, 0)
+        for top, bottom, _, _ in _merge_ranges(changed):
+            model.dataChanged.emit(
+                model.index(top, 0, parent), model.index(bottom, right, parent), []
+            )
+        stats["changed"] = len(changed)
+
+    return stats
+
+
+def _filter_proxy_model():
+    """Return the class of QtCompat.FilterProxyModel"""
+    import bisect
+
+    QtCore = Qt._QtCore
+    roles = QtCore.Qt.ItemDataRole
+
+    def sort_key(value):
+        # Missing values first, then numbers, then text
+        if value is None:
+            return (0, 0)
+        if isinstance(value, (int, float)):
+            return (1, value)
+        return (2, str(value).casefold())
+
+    class FilterProxyModel(QtCore.QAbstractProxyModel):
+        """Filter and sort the rows of a list or table model by their text
+
+        Unlike QSortFilterProxyModel no Python is called per row when the
+        filter changes. The text of the filtered columns of each source row
+        is normalized once into a search index, and filtering tests whether
+        the filter text is part of it. A filter extending the previous one
+        only searches the rows matching the previous one, e.g. while typing.
+        Sort keys are cached in the same way. Changed source rows update the
+        index, and rows entering or leaving the filter are inserted and
+        removed, so views keep their selection.
+
+        Only the top-level rows of the source model are filtered, it is meant
+        for lists and tables rather than trees.
+
+        Usage:
+            >> proxy = QtCompat.FilterProxyModel()
+            >> proxy.setSourceModel(model)
+            >> proxy.setFilterColumns([0, 2])
+            >> line_edit.textChanged.connect(proxy.setFilterText)
+            >> view.setModel(proxy)
+            >> view.setSortingEnabled(True)
+
+        """
+
+        def __init__(self, parent=None):
+            super(FilterProxyModel, self).__init__(parent)
+            self._filter_text = ""
+            self._filter_columns = None
+            self._filter_role = _role_value(roles.DisplayRole)
+            self._sort_role = _role_value(roles.DisplayRole)
+            self._sort_column = -1
+            self._sort_order = QtCore.Qt.SortOrder.AscendingOrder
+            self._connections = []
+            # Source rows in the order of the proxy rows
+            self._rows = []
+            self._clear()
+
+        def _clear(self):
+            source = self.sourceModel()
+            count = source.rowCount() if source is not None else 0
+            # Normalized text and sort key of each source row, None until used
+            self._search = [None] * count
+            self._keys = [None] * count
+            # Source rows matching the filter, in source order
+            self._matches = self._match(range(count))
+            # Proxy row of each source row, None until used
+            self._mapping = None
+
+        def _match(self, rows):
+            """Return the rows of `rows` matching the filter text"""
+            text = self._filter_text
+            if not text:
+                return list(rows)
+
+            search = self._search
+            missing = [row for row in rows if search[row] is None]
+            if missing:
+                source = self.sourceModel()
+                columns = self._filter_columns
+                if columns is None:
+                    columns = range(_column_count(source))
+                index, data, role = source.index, source.data, self._filter_role
+                for row in missing:
+                    values = (data(index(row, column), role) for column in columns)
+                    # Joined so the filter text can't match across columns
+                    search[row] = "\n".join(
+                        "" if value is None else str(value).casefold()
+                        for value in values
+                    )
+
+            return [row for row in rows if text in search[row]]
+
+        def _sorted(self, rows):
+            """Return `rows` in the order of the sort column"""
+            column = self._sort_column
+            if column < 0:
+                return list(rows)
+
+            keys = self._keys
+            missing = [row for row in rows if keys[row] is None]
+            if missing:
+                source = self.sourceModel()
+                index, data, role = source.index, source.data, self._sort_role
+                for row in missing:
+                    keys[row] = sort_key(data(index(row, column), role))
+
+            descending = self._sort_order == QtCore.Qt.SortOrder.DescendingOrder
+            return sorted(rows, key=keys.__getitem__, reverse=descending)
+
+        def _apply(self, rows):
+            """Update the rows of the proxy to the source rows `rows`"""
+            if rows == self._rows:
+                return
+            self._mapping = None
+            _update_rows(self, self._rows, rows)
+            self._mapping = None
+
+        def _proxy_rows(self):
+            if self._mapping is None:
+                self._mapping = {row: i for i, row in enumerate(self._rows)}
+            return self._mapping
+
+        def setSourceModel(self, model):
+            self.beginResetModel()
+            for signal, slot in self._connections:
+                signal.disconnect(slot)
+            self._connections = []
+
+            super(FilterProxyModel, self).setSourceModel(model)
+            if model is not None:
+                self._connections = [
+                    (model.dataChanged, self._on_data_changed),
+                    (model.headerDataChanged, self._on_header_data_changed),
+                    (model.rowsAboutToBeRemoved, self._on_rows_about_to_be_removed),
+                    (model.rowsRemoved, self._on_rows_removed),
+                    (model.rowsInserted, self._on_rows_inserted),
+                ]
+                # Changes of the whole model are passed on as a reset
+                for signal in (
+                    model.modelAboutToBeReset,
+                    model.layoutAboutToBeChanged,
+                    model.rowsAboutToBeMoved,
+                    model.columnsAboutToBeInserted,
+                    model.columnsAboutToBeRemoved,
+                    model.columnsAboutToBeMoved,
+                ):
+                    self._connections.append((signal, self._on_about_to_be_reset))
+                for signal in (
+                    model.modelReset,
+                    model.layoutChanged,
+                    model.rowsMoved,
+                    model.columnsInserted,
+                    model.columnsRemoved,
+                    model.columnsMoved,
+                ):
+                    self._connections.append((signal, self._on_reset))
+                for signal, slot in self._connections:
+                    signal.connect(slot)
+
+            self._clear()
+            self._rows[:] = self._sorted(self._matches)
+            self.endResetModel()
+
+        def filterText(self):
+            return self._filter_text
+
+        def setFilterText(self, text):
+            """Show the rows containing `text`, ignoring case"""
+            text = text.casefold()
+            if text == self._filter_text:
+                return
+            # Rows not matching the previous text can't match a longer one
+            if self._filter_text in text:
+                candidates = self._matches
+            else:
+                candidates = range(len(self._search))
+            self._filter_text = text
+            self._matches = self._match(candidates)
+            self._apply(self._sorted(self._matches))
+
+        def filterColumns(self):
+            return self._filter_columns
+
+        def setFilterColumns(self, columns):
+            """Search the text of `columns`, None searches all columns"""
+            self._filter_columns = None if columns is None else list(columns)
+            self._search = [None] * len(self._search)
+            self._refilter()
+
+        def filterRole(self):
+            return self._filter_role
+
+        def setFilterRole(self, role):
+            self._filter_role = _role_value(role)
+            self._search = [None] * len(self._search)
+            self._refilter()
+
+        def sortRole(self):
+            return self._sort_role
+
+        def setSortRole(self, role):
+            self._sort_role = _role_value(role)
+            self._keys = [None] * len(self._keys)
+            self.sort(self._sort_column, self._sort_order)
+
+        def sortColumn(self):
+            return self._sort_column
+
+        def sortOrder(self):
+            return self._sort_order
+
+        def _refilter(self):
+            self._matches = self._match(range(len(self._search)))
+            self._apply(self._sorted(self._matches))
+
+        def sort(self, column, order=QtCore.Qt.SortOrder.AscendingOrder):
+            """Sort by `column`, -1 restores the order of the source model"""
+            if column != self._sort_column:
+                self._keys = [None] * len(self._keys)
+            self._sort_column, self._sort_order = column, order
+
+            self.layoutAboutToBeChanged.emit()
+            persistent = self.persistentIndexList()
+            sources = [
+                (self._rows[index.row()], index.column()) for index in persistent
+            ]
+            self._rows[:] = self._sorted(self._matches)
+            self._mapping = None
+            mapping = self._proxy_rows()
+            self.changePersistentIndexList(
+                persistent,
+                [self.index(mapping[row], column) for row, column in sources],
+            )
+            self.layoutChanged.emit()
+
+        def index(self, row, column, parent=None):
+            if parent is not None and parent.isValid():
+                return QtCore.QModelIndex()
+            if not (0 <= row < len(self._rows) and 0 <= column < self.columnCount()):
+                return QtCore.QModelIndex()
+            return self.createIndex(row, column)
+
+        def parent(self, index=None):
+            if index is None:
+                # QObject.parent()
+                return super(FilterProxyModel, self).parent()
+            return QtCore.QModelIndex()
+
+        def rowCount(self, parent=None):
+            if parent is not None and parent.isValid():
+                return 0
+            return len(self._rows)
+
+        def columnCount(self, parent=None):
+            source = self.sourceModel()
+            if source is None or (parent is not None and parent.isValid()):
+                return 0
+            return _column_count(source)
+
+        def mapToSource(self, proxyIndex):
+            source = self.sourceModel()
+            if source is None or not proxyIndex.isValid():
+                return QtCore.QModelIndex()
+            return source.index(self._rows[proxyIndex.row()], proxyIndex.column())
+
+        def mapFromSource(self, sourceIndex):
+            if not sourceIndex.isValid() or sourceIndex.parent().isValid():
+                return QtCore.QModelIndex()
+            row = self._proxy_rows().get(sourceIndex.row())
+            if row is None:
+                return QtCore.QModelIndex()
+            return self.createIndex(row, sourceIndex.column())
+
+        def _on_data_changed(self, topLeft, bottomRight, roles=()):
+            if topLeft.parent().isValid():
+                return
+            first, last = topLeft.row(), bottomRight.row()
+            left, right = topLeft.column(), bottomRight.column()
+            rows = range(first, last + 1)
+            roles = [_role_value(role) for role in roles]
+
+            moved = False
+            if self._sort_column >= 0 and left <= self._sort_column <= right:
+                if not roles or self._sort_role in roles:
+                    self._keys[first : last + 1] = [None] * len(rows)
+                    moved = True
+
+            columns = self._filter_columns
+            if (not roles or self._filter_role in roles) and (
+                columns is None or any(left <= c <= right for c in columns)
+            ):
+                self._search[first : last + 1] = [None] * len(rows)
+            if self._filter_text and self._search[first] is None:
+                matched = self._match(rows)
+                mapping = self._proxy_rows()
+                if matched != [row for row in rows if row in mapping]:
+                    start = bisect.bisect_left(self._matches, first)
+                    end = bisect.bisect_right(self._matches, last)
+                    self._matches[start:end] = matched
+                    moved = True
+
+            if moved:
+                self._apply(self._sorted(self._matches))
+
+            mapping = self._proxy_rows()
+            proxy_rows = sorted(mapping[row] for row in rows if row in mapping)
+            for top, bottom in _runs(proxy_rows):
+                self.dataChanged.emit(
+                    self.index(top, left), self.index(bottom, right), roles
+                )
+
+        def _on_header_data_changed(self, orientation, first, last):
+            if orientation == QtCore.Qt.Orientation.Horizontal:
+                self.headerDataChanged.emit(orientation, first, last)
+
+        def _on_rows_about_to_be_removed(self, parent, first, last):
+            if parent.isValid():
+                return
+            rows = [row for row in self._rows if not first <= row <= last]
+            if len(rows) != len(self._rows):
+                self._apply(rows)
+
+        def _on_rows_removed(self, parent, first, last):
+            if parent.isValid():
+                return
+            count = last - first + 1
+            del self._search[first : last + 1]
+            del self._keys[first : last + 1]
+            self._matches = [
+                row - count if row > last else row
+                for row in self._matches
+                if not first <= row <= last
+            ]
+            self._rows[:] = [row - count if row > last else row for row in self._rows]
+            self._mapping = None
+
+        def _on_rows_inserted(self, parent, first, last):
+            if parent.isValid():
+                return
+            count = last - first + 1
+            self._search[first:first] = [None] * count
+            self._keys[first:first] = [None] * count
+            self._matches = [
+                row + count if row >= first else row for row in self._matches
+            ]
+            self._rows[:] = [row + count if row >= first else row for row in self._rows]
+            self._mapping = None
+
+            start = bisect.bisect_left(self._matches, first)
+            self._matches[start:start] = self._match(range(first, last + 1))
+            self._apply(self._sorted(self._matches))
+
+        def _on_about_to_be_reset(self, *args):
+            self.beginResetModel()
+
+        def _on_reset(self, *args):
+            self._clear()
+            self._rows[:] = self._sorted(self._matches)
+            self.endResetModel()
+
+    return FilterProxyModel
+
+
+def _signal(*types):
+    """Return a signal of `types`, Signal in PySide and pyqtSignal in PyQt
+
+    Classes deriving from the binding's classes are created before Qt.QtCore
+    is set up, so this can't use Qt.QtCore.Signal.
+
+    """
+    signal = getattr(Qt._QtCore, "Signal", None) or Qt._QtCore.pyqtSignal
+    return signal(*types)
+
+
+def _lazy_tree_model():
+    """Return the class of QtCompat.LazyTreeModel"""
+    import itertools
+
+    QtCore = Qt._QtCore
+    roles = QtCore.Qt.ItemDataRole
+    display_role = _role_value(roles.DisplayRole)
+
+    class Node(object):
+        __slots__ = ("item", "parent", "row", "children", "iterator", "more", "loading")
+
+        def __init__(self, item, parent, row, more):
+            self.item = item
+            self.parent = parent
+            self.row = row
+            # None until the first page is loaded
+            self.children = None
+            self.iterator = None
+            self.more = more
+            self.loading = False
+
+    class Emitter(QtCore.QObject):
+        loaded = _signal(object, object, object)
+
+    def load(loader, item, iterator, page_size):
+        """Return the next page of children of `item`
+
+        Returns the page, whether there are more and the iterator of the rest,
+        or the exception raised by the loader. May run in the thread pool, so
+        nodes are only changed with the result on the thread of the model.
+
+        """
+        try:
+            if iterator is None:
+                iterator = iter(loader(item))
+            # The extra item tells whether there are more pages
+            items = list(itertools.islice(iterator, page_size + 1))
+        except Exception as error:
+            return error
+        more = len(items) > page_size
+        if more:
+            iterator = itertools.chain(items[page_size:], iterator)
+        return items[:page_size], more, iterator
+
+    class Loader(QtCore.QRunnable):
+        def __init__(self, emitter, node, generation, args):
+            super(Loader, self).__init__()
+            self._args = emitter, node, generation, args
+
+        def run(self):
+            emitter, node, generation, args = self._args
+            result = load(*args)
+            # Unless the model was deleted meanwhile, queued to its thread,
+            # which adds the children
+            if _isvalid(emitter):
+                emitter.loaded.emit(node, generation, result)
+
+    class LazyTreeModel(QtCore.QAbstractItemModel):
+        """Tree model loading the children of items when they are expanded
+
+        Children are loaded a page at a time through `canFetchMore()` and
+        `fetchMore()`, which views call when an item is expanded or scrolled
+        to its last child. Memory and the time to show the tree grow with
+        what was expanded rather than with the size of the tree.
+
+        `loader` is called with an item and returns an iterable of its
+        children, e.g. a generator or `os.scandir()`. Only `pageSize` children
+        are taken from it per page. With a `threadPool` the pages are taken
+        from it in the pool and added to the model on the thread of the model.
+
+        Usage:
+            >> def children(path):
+            ..     return sorted(os.path.join(path, name) for name in os.listdir(path))
+            >> model = QtCompat.LazyTreeModel(
+            ..     children,
+            ..     root="/projects",
+            ..     display=lambda path, column: os.path.basename(path),
+            ..     hasChildren=os.path.isdir,
+            ..     threadPool=QtCore.QThreadPool.globalInstance(),
+            .. )
+            >> view.setModel(model)
+
+        Arguments:
+            loader (callable): Return an iterable of the children of an item.
+            root (object, optional): Item of the top level children.
+            headers (list, optional): Header of each column.
+            display (callable, optional): Return the display value of an item
+                and column. Defaults to `str(item)` in the first column.
+            hasChildren (callable, optional): Return whether an item may have
+                children before they are loaded. Defaults to True for all.
+            pageSize (int, optional): Children loaded at once. Default: 100.
+            threadPool (QThreadPool, optional): Load children in this pool.
+            parent (QObject, optional): Parent of the model.
+
+        """
+
+        # Emitted with the item whose children failed to load and the error
+        loadFailed = _signal(object, object)  # noqa: N815
+
+        def __init__(
+            self,
+            loader,
+            root=None,
+            headers=None,
+            display=None,
+            hasChildren=None,
+            pageSize=100,
+            threadPool=None,
+            parent=None,
+        ):
+            super(LazyTreeModel, self).__init__(parent)
+            self._loader = loader
+            self._headers = list(headers or [""])
+            self._display = display or (
+                lambda item, column: str(item) if column == 0 else None
+            )
+            self._has_children = hasChildren or (lambda item: True)
+            self._page_size = pageSize
+            self._pool = threadPool
+            self._generation = 0
+            self._changing = False
+            self._emitter = Emitter(self)
+            self._emitter.loaded.connect(self._on_loaded)
+            self._root = Node(root, None, 0, True)
+
+        def setRoot(self, root):
+            """Show the children of `root`, discarding all loaded items"""
+            self._changing = True
+            self.beginResetModel()
+            # Pages still loading belong to the previous root
+            self._generation += 1
+            self._root = Node(root, None, 0, True)
+            self.endResetModel()
+            self._changing = False
+
+        def item(self, index):
+            """Return the item of `index`, or the root item if it is invalid"""
+            if index.isValid():
+                return index.internalPointer().item
+            return self._root.item
+
+        def _node(self, index):
+            if index is None or not index.isValid():
+                return self._root
+            if index.column() > 0:
+                # Only the first column has children
+                return None
+            return index.internalPointer()
+
+        def _index(self, node):
+            if node is self._root:
+                return QtCore.QModelIndex()
+            return self.createIndex(node.row, 0, node)
+
+        def index(self, row, column, parent=None):
+            node = self._node(parent)
+            children = node.children or () if node else ()
+            if 0 <= row < len(children) and 0 <= column < len(self._headers):
+                return self.createIndex(row, column, children[row])
+            return QtCore.QModelIndex()
+
+        def parent(self, index=None):
+            if index is None:
+                # QObject.parent()
+                return super(LazyTreeModel, self).parent()
+            if not index.isValid():
+                return QtCore.QModelIndex()
+            return self._index(index.internalPointer().parent)
+
+        def rowCount(self, parent=None):
+            node = self._node(parent)
+            return len(node.children or ()) if node else 0
+
+        def columnCount(self, parent=None):
+            return len(self._headers)
+
+        def hasChildren(self, parent=None):
+            node = self._node(parent)
+            return bool(node and (node.children or node.more))
+
+        def canFetchMore(self, parent):
+            node = self._node(parent)
+            # Not while rows are inserted or reset, views may ask for more then
+            return bool(node and node.more and not node.loading and not self._changing)
+
+        def fetchMore(self, parent):
+            if not self.canFetchMore(parent):
+                return
+            node = self._node(parent)
+            node.loading = True
+            args = self._loader, node.item, node.iterator, self._page_size
+            if self._pool is None:
+                self._on_loaded(node, self._generation, load(*args))
+            else:
+                loader = Loader(self._emitter, node, self._generation, args)
+                self._pool.start(loader)
+
+        def _on_loaded(self, node, generation, result):
+            if generation != self._generation:
+                return
+            node.loading = False
+            if isinstance(result, Exception):
+                node.more = False
+                node.iterator = None
+                self.loadFailed.emit(node.item, result)
+                return
+
+            items, more, iterator = result
+            node.more = more
+            node.iterator = iterator if more else None
+            if node.children is None:
+                node.children = []
+            if not items:
+                if not node.children and node is not self._root:
+                    # Has no children after all, remove the expand arrow
+                    index = self._index(node)
+                    self.dataChanged.emit(index, index, ())
+                return
+
+            children = node.children
+            first = len(children)
+            has_children = self._has_children
+            self._changing = True
+            self.beginInsertRows(self._index(node), first, first + len(items) - 1)
+            children.extend(
+                Node(item, node, row, bool(has_children(item)))
+                for row, item in enumerate(items, first)
+            )
+            self.endInsertRows()
+            self._changing = False
+
+        def data(self, index, role=roles.DisplayRole):
+            if not index.isValid() or _role_value(role) != display_role:
+                return None
+            return self._display(index.internalPointer().item, index.column())
+
+        def headerData(self, section, orientation, role=roles.DisplayRole):
+            if (
+                orientation == QtCore.Qt.Orientation.Horizontal
+                and _role_value(role) == display_role
+                and 0 <= section < len(self._headers)
+            ):
+                return self._headers[section]
+            return super(LazyTreeModel, self).headerData(section, orientation, role)
+
+    return LazyTreeModel
+
+
+def _thread_pool_executor():
+    """Return the class of QtCompat.ThreadPoolExecutor"""
+    import threading
+    import concurrent.futures
+
+    QtCore = Qt._QtCore
+    # The executor and future of the task running in each thread
+    local = threading.local()
+
+    class Task(QtCore.QRunnable):
+        def __init__(self, executor, future, fn, args, kwargs):
+            super(Task, self).__init__()
+            self._args = executor, future, fn, args, kwargs
+
+        def run(self):
+            executor, future, fn, args, kwargs = self._args
+            self._args = None
+            if not future.set_running_or_notify_cancel():
+                executor._done(future)
+                return
+
+            local.task = executor, future
+            try:
+                result = fn(*args, **kwargs)
+            except BaseException as error:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+            finally:
+                local.task = None
+            executor._done(future)
+
+    class ThreadPoolExecutor(QtCore.QObject, concurrent.futures.Executor):
+        """Run callables in a QThreadPool, returning concurrent.futures.Future
+
+        Results are delivered to the thread of the executor, usually the GUI
+        thread, with the `finished` signal. Futures done while control was
+        away from the event loop are delivered together, in one emission
+        with the list of their futures. Tasks may report progress with
+        `reportProgress()`, delivered with the `progress` signal, where only
+        the latest value of each future since the last delivery is emitted.
+
+        Usage:
+            >> executor = QtCompat.ThreadPoolExecutor()
+            >> executor.finished.connect(on_finished)
+            >> future = executor.submit(read_file, path)
+            >> urgent = executor.submitWithPriority(10, read_file, other_path)
+            >> future.cancel()  # If it didn't start yet
+
+        Arguments:
+            threadPool (QThreadPool, optional): Pool to run the callables in,
+                defaults to QThreadPool.globalInstance().
+            parent (QObject, optional): Parent of the executor.
+
+        """
+
+        # Emitted with a list of the futures done since the last emission
+        finished = _signal(object)
+        # Emitted with a future and the latest value it reported
+        progress = _signal(object, object)
+        _ready = _signal()
+
+        def __init__(self, threadPool=None, parent=None):
+            super(ThreadPoolExecutor, self).__init__(parent)
+            self._pool = threadPool or QtCore.QThreadPool.globalInstance()
+            self._lock = threading.Lock()
+            self._pending = set()
+            self._finished = []
+            self._progress = {}
+            self._scheduled = False
+            self._shutdown = False
+            self._ready.connect(self._deliver)
+
+        def threadPool(self):
+            return self._pool
+
+        def submit(self, fn, *args, **kwargs):
+            return self.submitWithPriority(0, fn, *args, **kwargs)
+
+        def submitWithPriority(self, priority, fn, *args, **kwargs):
+            """Submit `fn` to run before tasks of a lower `priority`"""
+            future = concurrent.futures.Future()
+            with self._lock:
+                if self._shutdown:
+                    raise RuntimeError("Cannot schedule new futures after shutdown")
+                self._pending.add(future)
+            self._pool.start(Task(self, future, fn, args, kwargs), priority)
+            return future
+
+        @staticmethod
+        def reportProgress(value):
+            """Report the progress of the task calling this, e.g. a percentage
+
+            Does nothing when not called from a task of an executor.
+
+            """
+            task = getattr(local, "task", None)
+            if task is not None:
+                executor, future = task
+                executor._report(future, value)
+
+        def _report(self, future, value):
+            with self._lock:
+                self._progress[future] = value
+                schedule, self._scheduled = not self._scheduled, True
+            if schedule:
+                self._schedule()
+
+        def _done(self, future):
+            with self._lock:
+                self._pending.discard(future)
+                self._finished.append(future)
+                schedule, self._scheduled = not self._scheduled, True
+            if schedule:
+                self._schedule()
+
+        def _schedule(self):
+            try:
+                # Queued, when called from another thread than the executor's
+                self._ready.emit()
+            except RuntimeError:
+                # The executor was deleted
+                pass
+
+        def _deliver(self):
+            with self._lock:
+                finished, self._finished = self._finished, []
+                progress, self._progress = self._progress, {}
+                self._scheduled = False
+            # Progress first, for it to be complete by the time of `finished`
+            for future, value in progress.items():
+                self.progress.emit(future, value)
+            if finished:
+                self.finished.emit(finished)
+
+        def shutdown(self, wait=True, *, cancel_futures=False):
+            with self._lock:
+                self._shutdown = True
+                pending = list(self._pending)
+            if cancel_futures:
+                for future in pending:
+                    future.cancel()
+            if wait:
+                concurrent.futures.wait(pending)
+
+    return ThreadPoolExecutor
+
+
+def _asyncio_event_loop():
+    """Return the class of QtCompat.AsyncioEventLoop"""
+    import math
+    import asyncio
+    import selectors
+
+    QtCore = Qt._QtCore
+    kinds = (
+        (selectors.EVENT_READ, QtCore.QSocketNotifier.Type.Read),
+        (selectors.EVENT_WRITE, QtCore.QSocketNotifier.Type.Write),
+    )
+    # Longest interval of a QTimer, which is an int of milliseconds
+    longest = 2**31 - 1
+
+    class Selector(selectors.BaseSelector):
+        """Report the file descriptors QSocketNotifiers found ready
+
+        Qt waits for the file descriptors, so select() never blocks and only
+        returns the events since the last call. Each notifier is disabled from
+        the time it is activated until select() returned its event, such that
+        Qt doesn't activate it again for data the loop didn't read yet.
+
+        """
+
+        def __init__(self, wakeup):
+            self._wakeup = wakeup
+            self._keys = {}
+            self._notifiers = {}
+            self._events = {}
+
+        def _fd(self, fileobj):
+            if isinstance(fileobj, int):
+                return fileobj
+            for key in self._keys.values():
+                # Closed files no longer have a file descriptor
+                if key.fileobj is fileobj:
+                    return key.fd
+            return fileobj.fileno()
+
+        def register(self, fileobj, events, data=None):
+            if not events or events & ~(selectors.EVENT_READ | selectors.EVENT_WRITE):
+                raise ValueError("Invalid events: %r" % events)
+            fd = self._fd(fileobj)
+            if fd in self._keys:
+                raise KeyError("%r is already registered" % fileobj)
+
+            key = self._keys[fd] = selectors.SelectorKey(fileobj, fd, events, data)
+            notifiers = self._notifiers[fd] = []
+            for event, kind in kinds:
+                if events & event:
+                    notifiers.append(self._notifier(fd, event, kind))
+            return key
+
+        def _notifier(self, fd, event, kind):
+            notifier = QtCore.QSocketNotifier(fd, kind)
+            notifier.activated.connect(
+                lambda *args: self._activated(fd, event, notifier)
+            )
+            return notifier
+
+        def _activated(self, fd, event, notifier):
+            notifier.setEnabled(False)
+            self._events[fd] = self._events.get(fd, 0) | event
+            self._wakeup()
+
+        def unregister(self, fileobj):
+            fd = self._fd(fileobj)
+            key = self._keys.pop(fd)
+            for notifier in self._notifiers.pop(fd):
+                # Deleted with the application when the loop wasn't closed
+                if _isvalid(notifier):
+                    notifier.setEnabled(False)
+                    notifier.deleteLater()
+            self._events.pop(fd, None)
+            return key
+
+        def select(self, timeout=None):
+            events, self._events = self._events, {}
+            ready = []
+            for fd, event in events.items():
+                key = self._keys.get(fd)
+                if key is None:
+                    continue
+                for notifier in self._notifiers[fd]:
+                    notifier.setEnabled(True)
+                ready.append((key, event & key.events))
+            return ready
+
+        def get_map(self):
+            return types.MappingProxyType(self._keys)
+
+        def close(self):
+            for fd in list(self._keys):
+                self.unregister(fd)
+
+    class AsyncioEventLoop(asyncio.SelectorEventLoop):
+        """asyncio event loop running in the Qt event loop
+
+        `run_forever()` and `run_until_complete()` process the events of Qt
+        as usual, also once the application exited its event loops. Callbacks and coroutines of
+        asyncio run from a single-shot timer, started when there is work due
+        and not on every pass of the Qt event loop, and readers and writers of
+        file descriptors are waited for by QSocketNotifiers.
+
+        Usage:
+            >> app = QtWidgets.QApplication(sys.argv)
+            >> loop = QtCompat.AsyncioEventLoop()
+            >> asyncio.set_event_loop(loop)
+            >> loop.run_until_complete(main())
+
+        Callbacks run while the timer is ignored when Qt runs a nested event
+        loop, such as the one of a modal QDialog, and resume when it returns.
+
+        """
+
+        def __init__(self):
+            if QtCore.QCoreApplication.instance() is None:
+                raise RuntimeError("AsyncioEventLoop requires a QCoreApplication")
+            self._processing = False
+            self._iterating = False
+            self._error = None
+            self._timer = QtCore.QTimer()
+            self._timer.setSingleShot(True)
+            self._timer.setTimerType(QtCore.Qt.TimerType.PreciseTimer)
+            self._timer.timeout.connect(self._iterate)
+            super(AsyncioEventLoop, self).__init__(Selector(self._wakeup))
+
+        def _wakeup(self):
+            # The end of the current iteration schedules the next one
+            if self._processing and not self._iterating:
+                self._timer.start(0)
+
+        def _iterate(self):
+            if self._iterating:
+                return
+            self._iterating = True
+            try:
+                super(AsyncioEventLoop, self)._run_once()
+            except BaseException as error:
+                # Raised by run_forever(), rather than into the binding
+                self._error = error
+                self._processing = False
+                return
+            finally:
+                self._iterating = False
+
+            if self._stopping:
+                self._processing = False
+            elif self._ready:
+                self._timer.start(0)
+            elif self._scheduled:
+                delay = (self._scheduled[0].when() - self.time()) * 1000
+                self._timer.start(min(max(math.ceil(delay), 0), longest))
+
+        def call_soon(self, callback, *args, context=None):
+            handle = super(AsyncioEventLoop, self).call_soon(
+                callback, *args, context=context
+            )
+            self._wakeup()
+            return handle
+
+        def call_at(self, when, callback, *args, context=None):
+            handle = super(AsyncioEventLoop, self).call_at(
+                when, callback, *args, context=context
+            )
+            self._wakeup()
+            return handle
+
+        def stop(self):
+            super(AsyncioEventLoop, self).stop()
+            self._wakeup()
+
+        def _run_once(self):
+            # Called until stop() by asyncio.BaseEventLoop.run_forever(), which
+            # prepares the loop as in every version of Python. Processes the
+            # events of Qt instead, whose timer runs the iterations of asyncio.
+            # Not a QEventLoop, which returns at once after app.exit().
+            wait = QtCore.QEventLoop.ProcessEventsFlag.WaitForMoreEvents
+            self._processing = True
+            try:
+                self._timer.start(0)
+                while self._processing:
+                    QtCore.QCoreApplication.processEvents(wait)
+            finally:
+                self._timer.stop()
+                self._processing = False
+
+            error, self._error = self._error, None
+            if error is not None:
+                raise error
+
+        def close(self):
+            if self.is_running():
+                raise RuntimeError("Cannot close a running event loop")
+            # Also called by __del__, once the application deleted the timer
+            if _isvalid(self._timer):
+                self._timer.stop()
+            super(AsyncioEventLoop, self).close()
+
+    return AsyncioEventLoop
+
+
+def _stall_watchdog():
+    """Return the class of QtCompat.StallWatchdog"""
+    import time
+    import bisect
+    import weakref
+    import threading
+    import traceback
+    import collections
+
+    QtCore = Qt._QtCore
+    # Upper bounds of the buckets of the histogram of latencies, in ms
+    bounds = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, float("inf"))
+
+    class Monitor(threading.Thread):
+        """Capture the stack of a thread whose heartbeat is late
+
+        Holds no reference to the watchdog, for it to be garbage collected.
+
+        """
+
+        def __init__(self, thread, interval, threshold, dumpInterval, stalls, path):
+            super(Monitor, self).__init__(name="Qt.py stall watchdog", daemon=True)
+            # Identifier of the watched thread
+            self.thread = thread
+            self.interval = interval
+            self.threshold = threshold
+            self.dumpInterval = dumpInterval
+            self.stalls = stalls
+            self.path = path
+            self.beat = time.monotonic()
+            # The stall captured last, until its heartbeat completes it
+            self.pending = None
+            self.skipped = 0
+            self._captured = None
+            self._dumped = None
+            self._stopped = threading.Event()
+
+        def stop(self):
+            self._stopped.set()
+
+        def run(self):
+            # Stalls are captured up to a quarter of the threshold late
+            poll = max(self.threshold / 4, 0.01)
+            while not self._stopped.wait(poll):
+                beat = self.beat
+                now = time.monotonic()
+                if now - beat - self.interval < self.threshold:
+                    continue
+                if beat == self._captured:
+                    # Still the same stall
+                    continue
+                self._captured = beat
+                if self._dumped is not None and now - self._dumped < self.dumpInterval:
+                    self.skipped += 1
+                    continue
+                self._dumped = now
+                self.capture(now - beat - self.interval)
+
+        def capture(self, blocked):
+            frame = sys._current_frames().get(self.thread)
+            stack = "".join(traceback.format_stack(frame)) if frame else ""
+            del frame
+            stall = {
+                "time": time.time(),
+                "blocked": blocked * 1000,
+                "duration": None,
+                "stack": stack,
+            }
+            self.stalls.append(stall)
+            self.pending = stall
+
+            if self.path:
+                moment = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
+                try:
+                    with open(self.path, "a") as f:
+                        f.write(
+                            "--- %s: Event loop blocked for %.0f ms at\n%s\n"
+                            % (moment, stall["blocked"], stack)
+                        )
+                except OSError as error:
+                    _warn("Could not write stall to %s: %s" % (self.path, error))
+
+    class StallWatchdog(QtCore.QObject):
+        """Measure the latency of the event loop and capture what blocks it
+
+        A timer of the thread of the watchdog, usually the GUI thread, beats
+        every `interval` ms and records how late it was in a histogram. When it
+        is more than `threshold` ms late a monitor thread captures the Python
+        stack of the blocked thread, at most once every `dumpInterval` ms,
+        into a ring buffer of the last `maxStalls` stalls and optionally
+        appended to the log file at `path`.
+
+        Usage:
+            >> watchdog = QtCompat.StallWatchdog(threshold=500, path="stalls.log")
+            >> watchdog.stalled.connect(lambda ms: print("Blocked for", ms))
+            >> watchdog.start()
+            >> watchdog.stalls()[-1]["stack"]
+
+        The monitor thread needs the GIL to capture a stack, so stalls in
+        C++ calls that hold the GIL are captured after they return, if at all.
+        Their duration is recorded by the heartbeat either way.
+
+        """
+
+        # Emitted with the duration in ms once the event loop recovered
+        stalled = _signal(float)
+
+        def __init__(
+            self,
+            threshold=500,
+            interval=50,
+            path=None,
+            maxStalls=100,
+            dumpInterval=10000,
+            parent=None,
+        ):
+            super(StallWatchdog, self).__init__(parent)
+            self._threshold = threshold
+            self._interval = interval
+            self._path = path
+            self._dumpInterval = dumpInterval
+            self._stalls = collections.deque(maxlen=maxStalls)
+            self._counts = [0] * len(bounds)
+            self._skipped = 0
+            self._monitor = None
+            self._stop = None
+            self._timer = QtCore.QTimer(self)
+            self._timer.setTimerType(QtCore.Qt.TimerType.PreciseTimer)
+            self._timer.timeout.connect(self._heartbeat)
+
+        def start(self):
+            """Start watching the event loop of the thread of the watchdog"""
+            if self._monitor is not None:
+                return
+            self._monitor = Monitor(
+                threading.get_ident(),
+                self._interval / 1000.0,
+                self._threshold / 1000.0,
+                self._dumpInterval / 1000.0,
+                self._stalls,
+                self._path,
+            )
+            # Stop the thread with the watchdog, unless stopped before
+            self._stop = weakref.finalize(self, self._monitor.stop)
+            self._monitor.start()
+            self._timer.start(self._interval)
+
+        def stop(self):
+            if self._monitor is None:
+                return
+            self._timer.stop()
+            self._stop()
+            self._skipped += self._monitor.skipped
+            self._monitor = self._stop = None
+
+        def isActive(self):
+            return self._monitor is not None
+
+        def _heartbeat(self):
+            monitor = self._monitor
+            now = time.monotonic()
+            late = max(now - monitor.beat - monitor.interval, 0.0) * 1000
+            monitor.beat = now
+            self._counts[bisect.bisect_left(bounds, late)] += 1
+            if late >= self._threshold:
+                stall, monitor.pending = monitor.pending, None
+                if stall is not None:
+                    stall["duration"] = late
+                self.stalled.emit(late)
+
+        def histogram(self):
+            """Return a (upper bound in ms, count) tuple per bucket of latency"""
+            return list(zip(bounds, self._counts))
+
+        def stalls(self):
+            """Return the stalls captured last, oldest first
+
+            Each is a dict of the "time" it was captured at, the ms it was
+            "blocked" for by then, its total "duration" in ms once it
+            recovered and the "stack" of the blocked thread.
+
+            """
+            return list(self._stalls)
+
+        def skippedStalls(self):
+            """Return the number of stalls not captured because of dumpInterval"""
+            return self._skipped + (self._monitor.skipped if self._monitor else 0)
+
+        def clear(self):
+            self._stalls.clear()
+            self._counts = [0] * len(bounds)
+            self._skipped = 0
+            if self._monitor is not None:
+                self._monitor.skipped = 0
+
+    return StallWatchdog
+
+
+def _signal_profiler():
+    """Return the class of QtCompat.SignalProfiler"""
+    import time
+    import json
+    import marshal
+    import inspect
+    import weakref
+    import functools
+
+    QtCore = Qt._QtCore
+    BoundSignal = getattr(QtCore, "SignalInstance", None) or QtCore.pyqtBoundSignal
+    # PySide calls functions in the thread of the sender, rather than in the
+    # thread connecting them as PyQt does
+    pyside = hasattr(QtCore, "SignalInstance")
+    unique = QtCore.Qt.ConnectionType.UniqueConnection
+    direct = QtCore.Qt.ConnectionType.DirectConnection
+    # The methods of BoundSignal replaced while a profiler is installed
+    installed = {}
+    # The relays connected to each signal in place of a slot, by signal
+    relays = {}
+
+    def describe(slot):
+        """Return the (filename, line, name) of `slot`, as used by pstats"""
+        func = slot
+        while isinstance(func, functools.partial):
+            func = func.func
+        func = getattr(func, "__func__", func)
+        name = getattr(func, "__qualname__", None)
+        if name is None:
+            name = type(func).__qualname__ + ".__call__"
+            func = getattr(type(func).__call__, "__func__", type(func).__call__)
+        code = getattr(func, "__code__", None)
+        if code is None:
+            return ("~", 0, name)
+        return (code.co_filename, code.co_firstlineno, name)
+
+    def positional(slot):
+        """Return the number of arguments `slot` takes, None for any number
+
+        Both bindings call slots with no more arguments than they take.
+
+        """
+        try:
+            parameters = inspect.signature(slot).parameters.values()
+        except (TypeError, ValueError):
+            return None
+        count = 0
+        for parameter in parameters:
+            if parameter.kind == parameter.VAR_POSITIONAL:
+                return None
+            if parameter.kind in (
+                parameter.POSITIONAL_ONLY,
+                parameter.POSITIONAL_OR_KEYWORD,
+            ):
+                count += 1
+        return count
+
+    def timeable(slot):
+        """Return whether `slot` is called the same through a relay
+
+        Slots of Qt and those decorated with @Slot are called as slots of
+        their object. On PySide, sender() returns None in a slot called
+        by a relay, so slots calling it are connected as they are too.
+
+        """
+        if isinstance(slot, BoundSignal) or not callable(slot):
+            return False
+        owner = getattr(slot, "__self__", None)
+        if isinstance(owner, QtCore.QObject) and not inspect.ismethod(slot):
+            return False
+        if inspect.ismethod(slot):
+            try:
+                weakref.ref(owner)
+            except TypeError:
+                return False
+        func = getattr(slot, "__func__", slot)
+        if hasattr(func, "_slots") or hasattr(func, "__pyqtSignature__"):
+            return False
+        names = getattr(getattr(func, "__code__", None), "co_names", ())
+        return not (pyside and ("sender" in names or "senderSignalIndex" in names))
+
+    def release(signal, reference):
+        """Forget the relay of `reference`, no longer connected to `signal`"""
+        remaining = [
+            relay for relay in relays.get(signal, []) if relay is not reference()
+        ]
+        if remaining:
+            relays[signal] = remaining
+        else:
+            relays.pop(signal, None)
+
+    def find(signal, slot):
+        """Return the relay connected to `signal` in place of `slot`, if any"""
+        method = inspect.ismethod(slot)
+        func = slot.__func__ if method else slot
+        for relay in relays.get(signal, []):
+            owner = relay.owner() if relay.owner is not None else None
+            if relay.func == func and owner is (slot.__self__ if method else None):
+                return relay
+        return None
+
+    class Relay(QtCore.QObject):
+        """Receive a signal in place of a slot, and call the slot timing it
+
+        The sender class and signal are told by sender() and
+        senderSignalIndex() of the relay the first time it is timed, or by
+        the signature of the bound signal on PyQt, which calls relays
+        through a proxy of its own.
+
+        """
+
+        def __init__(self, profiler, signal, slot):
+            super(Relay, self).__init__()
+            method = inspect.ismethod(slot)
+            self.profiler = profiler
+            self.signal = signal
+            self.func = slot.__func__ if method else slot
+            # Connections don't keep the object of a method alive
+            self.owner = weakref.ref(slot.__self__) if method else None
+            self.count = positional(slot)
+            self.site = describe(slot)
+            # The record and the calls to skip until the next sample
+            self.record = None
+            self.skip = 0
+
+        def key(self):
+            """Return the (sender class, signal) calling the relay"""
+            sender = self.sender()
+            if sender is None:
+                return ("", "")
+            index = self.senderSignalIndex()
+            if index >= 0:
+                name = sender.metaObject().method(index).name().data().decode()
+            else:
+                # Such as "2clicked(bool)"
+                name = getattr(self.signal, "signal", "")[1:].partition("(")[0]
+
+            # Forgotten along with the sender
+            connect = installed.get("connect", BoundSignal.connect)
+            connect(
+                sender.destroyed,
+                functools.partial(release, self.signal, weakref.ref(self)),
+            )
+            return (type(sender).__name__, name)
+
+        def relay(self, *args):
+            if self.count is not None:
+                args = args[: self.count]
+            if self.owner is not None:
+                owner = self.owner()
+                if owner is None:
+                    return None
+                args = (owner,) + args
+            profiler = self.profiler
+            if not profiler._enabled:
+                return self.func(*args)
+            record = self.record
+            if record is None:
+                record = self.record = profiler._record(self.key(), self.site)
+            record[0] += 1
+            if self.skip:
+                self.skip -= 1
+                return self.func(*args)
+
+            self.skip = profiler._sampleEvery - 1
+            start = time.perf_counter()
+            try:
+                return self.func(*args)
+            finally:
+                elapsed = time.perf_counter() - start
+                record[1] += 1
+                record[2] += elapsed
+                if elapsed > record[3]:
+                    record[3] = elapsed
+
+    def profiled_disconnect(signal, *args, **kwargs):
+        """Disconnect the relays of slots connected while profiling too"""
+        disconnect = installed["disconnect"]
+        if not args and not kwargs:
+            relays.pop(signal, None)
+        elif len(args) == 1 and not kwargs and callable(args[0]):
+            relay = find(signal, args[0])
+            if relay is not None:
+                release(signal, weakref.ref(relay))
+                return disconnect(signal, relay.relay)
+        return disconnect(signal, *args, **kwargs)
+
+    class SignalProfiler(object):
+        """Time the slots called by signals
+
+        While installed, slots connected to signals are called through a
+        relay timing each call, or every `sampleEvery` calls, per sender
+        class, signal and slot. Connections made before are not timed, nor
+        slots of Qt and those decorated with @Slot, which are connected as
+        they are. On PySide, sender() returns None in the slots called by
+        a relay, so slots calling sender() are connected as they are too,
+        but not the functions they call.
+
+        Usage:
+            >> profiler = QtCompat.SignalProfiler()
+            >> profiler.install()
+            >> window = Window()  # Connects its signals
+            >> profiler.setEnabled(False)  # Until the interesting part
+            >> profiler.dumpStats("slots.prof")
+            >> pstats.Stats("slots.prof").sort_stats("tottime").print_stats(10)
+
+        """
+
+        # The profiler whose connect() and disconnect() are installed
+        _installed = None
+
+        def __init__(self, sampleEvery=1):
+            self._enabled = True
+            self._sampleEvery = max(int(sampleEvery), 1)
+            # (sender class, signal, site): [calls, sampled, seconds, max]
+            self._records = {}
+
+        def install(self):
+            """Time the slots connected from now on"""
+            if SignalProfiler._installed is self:
+                return
+            if SignalProfiler._installed is not None:
+                raise RuntimeError("Another SignalProfiler is installed")
+
+            def profiled_connect(signal, slot, *args, **kwargs):
+                return self._connect(signal, slot, *args, **kwargs)
+
+            for name, method in (
+                ("connect", profiled_connect),
+                ("disconnect", profiled_disconnect),
+            ):
+                installed[name] = getattr(BoundSignal, name)
+                setattr(BoundSignal, name, method)
+            SignalProfiler._installed = self
+
+        def uninstall(self):
+            """Restore connect() and disconnect() of the binding
+
+            Slots connected while installed are still timed. Disconnect
+            them before, with the connection connect() returned, or along
+            with all slots of their signal with disconnect().
+
+            """
+            if SignalProfiler._installed is not self:
+                return
+            for name, method in installed.items():
+                setattr(BoundSignal, name, method)
+            installed.clear()
+            SignalProfiler._installed = None
+
+        def isInstalled(self):
+            return SignalProfiler._installed is self
+
+        def setEnabled(self, enabled):
+            """Toggle timing of the connections made while installed"""
+            self._enabled = bool(enabled)
+
+        def isEnabled(self):
+            return self._enabled
+
+        def setSampleEvery(self, sampleEvery):
+            """Time one call every `sampleEvery` calls of each connection"""
+            self._sampleEvery = max(int(sampleEvery), 1)
+
+        def sampleEvery(self):
+            return self._sampleEvery
+
+        def _connect(self, signal, slot, *args, **kwargs):
+            connect = installed["connect"]
+            if not timeable(slot):
+                return connect(signal, slot, *args, **kwargs)
+
+            kind = args[0] if args else kwargs.get("type")
+            value = _role_value(kind) if kind is not None else 0
+            if value & _role_value(unique) and find(signal, slot) is not None:
+                # Like the bindings, for slots connected already
+                if pyside:
+                    return QtCore.QMetaObject.Connection()
+                raise TypeError("connection is not unique")
+
+            relay = Relay(self, signal, slot)
+            owner = getattr(slot, "__self__", None)
+            value &= ~_role_value(unique)
+            if isinstance(owner, QtCore.QObject):
+                # Called in the thread of the object, as its methods are
+                relay.moveToThread(owner.thread())
+            elif pyside and not value:
+                value = _role_value(direct)
+            connection = connect(signal, relay.relay, QtCore.Qt.ConnectionType(value))
+            if pyside and not connection:
+                return connection
+
+            relays.setdefault(signal, []).append(relay)
+            if relay.owner is not None:
+                weakref.finalize(owner, release, signal, weakref.ref(relay))
+            return connection
+
+        def _record(self, key, site):
+            record = self._records.get(key + (site,))
+            if record is None:
+                record = self._records[key + (site,)] = [0, 0, 0.0, 0.0]
+            return record
+
+        def clear(self):
+            for record in self._records.values():
+                record[:] = [0, 0, 0.0, 0.0]
+
+        def report(self):
+            """Return the timings of each slot, slowest in total first
+
+            Each is a dict of the "sender" class, "signal", "slot", its
+            "filename" and "line", the number of "calls", how many of those
+            were timed ("sampled"), and the "total" and "max" seconds, where
+            "total" is estimated from the sampled calls.
+
+            """
+            results = []
+            for (sender, signal, site), record in self._records.items():
+                calls, sampled, seconds, longest = record
+                if not calls:
+                    continue
+                results.append(
+                    {
+                        "sender": sender,
+                        "signal": signal,
+                        "slot": site[2],
+                        "filename": site[0],
+                        "line": site[1],
+                        "calls": calls,
+                        "sampled": sampled,
+                        "total": seconds * calls / sampled if sampled else 0.0,
+                        "max": longest,
+                    }
+                )
+            results.sort(key=lambda result: result["total"], reverse=True)
+            return results
+
+        def toJson(self, path=None):
+            """Return the report as JSON, and write it to `path` if given"""
+            text = json.dumps(self.report(), indent=4)
+            if path:
+                with open(path, "w") as f:
+                    f.write(text)
+            return text
+
+        def dumpStats(self, path):
+            """Write the report to `path` in the format of pstats.Stats
+
+            Each slot is called by its sender class and signal, for
+            `print_callers()` to list the signals calling a slot.
+
+            """
+            stats = {}
+            for result in self.report():
+                site = (result["filename"], result["line"], result["slot"])
+                caller = ("~", 0, "%s.%s" % (result["sender"], result["signal"]))
+                timing = (result["calls"], result["calls"], result["total"])
+                timing += (result["total"],)
+                calls, _, total, _, callers = stats.get(site, (0, 0, 0.0, 0.0, {}))
+                callers[caller] = timing
+                calls += result["calls"]
+                total += result["total"]
+                stats[site] = (calls, calls, total, total, callers)
+            with open(path, "wb") as f:
+                marshal.dump(stats, f)
+
+    return SignalProfiler
+
+
+def _widget_label(widget):
+    """Return "ClassName#objectName" of `widget`, or its class without a name"""
+    name = widget.objectName()
+    return type(widget).__name__ + ("#" + name if name else "")
+
+
+def _memory_report(widget=None):
+    """Estimate the memory used by widgets, per subtree and per widget
+
+    Counts the bytes of the pixmaps of labels, the icons of buttons and
+    windows, QPixmap, QImage and QIcon attributes of widgets, style sheets
+    and Python wrappers. Implicitly shared pixmaps, images and icons are
+    counted once, by the first widget found using them. Item models of
+    views and combo boxes are counted by their number of top-level cells.
+
+    Usage:
+        >> report = QtCompat.memoryReport(window)
+        >> report["total"]["bytes"]
+        >> sorted(report["byName"].items(), key=lambda i: -i[1]["bytes"])[:10]
+
+    Arguments:
+        widget (QWidget, optional): Widget to report on, defaults to all
+            top-level widgets.
+
+    Returns:
+        dict: The "tree" of nodes of each widget, with its "name", the
+            estimates of the widget itself as "self", of its subtree as
+            "total" and its "children", or a list of the trees of each
+            top-level widget. Along with the sum of the "self" of the widgets
+            of each "ClassName#objectName" in "byName", and the "total" of
+            all widgets.
+
+    """
+    QtGui = Qt._QtGui
+    QtWidgets = Qt._QtWidgets
+    keys = ("bytes", "imageBytes", "iconBytes", "styleSheetBytes", "wrapperBytes")
+    keys += ("modelCells", "widgets")
+    # Pixmaps, images, icons and models counted already
+    counted = set()
+
+    def image_bytes(image):
+        key = (type(image).__name__, image.cacheKey())
+        if image.isNull() or key in counted:
+            return 0
+        counted.add(key)
+        if isinstance(image, QtGui.QImage):
+            return image.sizeInBytes()
+        return image.width() * image.height() * image.depth() // 8
+
+    def icon_bytes(icon):
+        key = ("QIcon", icon.cacheKey())
+        if icon.isNull() or key in counted:
+            return 0
+        counted.add(key)
+        # Of the pixmaps the icon was made of, as 32-bit pixels
+        return sum(size.width() * size.height() * 4 for size in icon.availableSizes())
+
+    def attribute_bytes(value, stats):
+        if isinstance(value, (QtGui.QPixmap, QtGui.QImage)):
+            stats["imageBytes"] += image_bytes(value)
+        elif isinstance(value, QtGui.QIcon):
+            stats["iconBytes"] += icon_bytes(value)
+
+    def measure(widget):
+        stats = dict.fromkeys(keys, 0)
+        stats["widgets"] = 1
+        if isinstance(widget, QtWidgets.QLabel):
+            pixmap = widget.pixmap()
+            # A null QPixmap in Qt 6, None or a null QPixmap in Qt 5
+            if pixmap is not None:
+                stats["imageBytes"] += image_bytes(pixmap)
+        if isinstance(widget, QtWidgets.QAbstractButton):
+            stats["iconBytes"] += icon_bytes(widget.icon())
+        if widget.isWindow():
+            stats["iconBytes"] += icon_bytes(widget.windowIcon())
+        if isinstance(widget, (QtWidgets.QAbstractItemView, QtWidgets.QComboBox)):
+            model = widget.model()
+            if model is not None and ("model", _getcpppointer(model)) not in counted:
+                counted.add(("model", _getcpppointer(model)))
+                stats["modelCells"] += model.rowCount() * _column_count(model)
+
+        # QString stores UTF-16
+        stats["styleSheetBytes"] = len(widget.styleSheet()) * 2
+        stats["wrapperBytes"] = sys.getsizeof(widget)
+        attributes = getattr(widget, "__dict__", None) or {}
+        if attributes:
+            stats["wrapperBytes"] += sys.getsizeof(attributes)
+        for value in attributes.values():
+            if isinstance(value, (list, tuple, set)):
+                for item in value:
+                    attribute_bytes(item, stats)
+            elif isinstance(value, dict):
+                for item in value.values():
+                    attribute_bytes(item, stats)
+            else:
+                attribute_bytes(value, stats)
+        stats["bytes"] = sum(stats[key] for key in keys if key.endswith("Bytes"))
+        return stats
+
+    by_name = {}
+
+    def walk(widget):
+        own = measure(widget)
+        name = _widget_label(widget)
+        totals = by_name.setdefault(name, dict.fromkeys(keys, 0))
+        for key in keys:
+            totals[key] += own[key]
+
+        children = [walk(c) for c in widget.children() if c.isWidgetType()]
+        children.sort(key=lambda child: child["total"]["bytes"], reverse=True)
+        total = dict(own)
+        for child in children:
+            for key in keys:
+                total[key] += child["total"][key]
+        return {"name": name, "self": own, "total": total, "children": children}
+
+    if widget is None:
+        widgets = QtWidgets.QApplication.topLevelWidgets()
+        roots = [walk(w) for w in widgets if w.parent() is None]
+    else:
+        roots = [walk(widget)]
+
+    total = dict.fromkeys(keys, 0)
+    for root in roots:
+        for key in keys:
+            total[key] += root["total"][key]
+    tree = roots[0] if widget is not None else roots
+    return {"tree": tree, "byName": by_name, "total": total}
+
+
+def _widget_profiler():
+    """Return the class of QtCompat.WidgetProfiler"""
+    import time
+
+    QtCore = Qt._QtCore
+    Type = QtCore.QEvent.Type
+    names = {
+        Type.Paint: "Paint",
+        Type.LayoutRequest: "LayoutRequest",
+        Type.Resize: "Resize",
+        Type.Polish: "Polish",
+    }
+
+    class Filter(QtCore.QObject):
+        """Time the events of a widget and its descendants
+
+        Installed on the application, it sees each event before it is
+        delivered and lets it through, such that other filters and widgets
+        get it as they would otherwise. Qt doesn't tell when an event was
+        handled, so a profile function waits for the Python code which sent
+        the event, such as a call to resize(), to run again after the call
+        that sent it, and the event loop to wait or send another event.
+
+        Events sent while delivering another one, from Python code or the
+        descendants of its widget by Qt, such as the children resized by a
+        layout, are nested in it.
+
+        """
+
+        def __init__(self, profiler, widget):
+            super(Filter, self).__init__()
+            self._profiler = profiler
+            self._widget = widget
+            # [widget, path, event, start, self time, frame which sent it and
+            # its last instruction] of the events timed, innermost last
+            self._stack = []
+            # Start of the time counted to the innermost event
+            self._last = 0.0
+            self._profile = self._returned
+            self._dispatcher = QtCore.QAbstractEventDispatcher.instance()
+            self._dispatcher.aboutToBlock.connect(self.finish)
+            QtCore.QCoreApplication.instance().installEventFilter(self)
+
+        def remove(self):
+            QtCore.QCoreApplication.instance().removeEventFilter(self)
+            self._dispatcher.aboutToBlock.disconnect(self.finish)
+            self.finish()
+
+        def _count(self):
+            now = time.perf_counter()
+            if self._stack:
+                self._stack[-1][4] += now - self._last
+            self._last = now
+            return now
+
+        def _pop(self, now):
+            _, path, name, start, own, _, _ = self._stack.pop()
+            self._profiler._add(path, name, now - start, own)
+
+        def _unwatch(self):
+            # Not from the profile function, which Python restores after it
+            if not self._stack and sys.getprofile() == self._profile:
+                sys.setprofile(None)
+
+        def _returned(self, frame, event, arg):
+            # Called for each call and return of Python and C functions in
+            # the thread of the widgets. The code which sent the innermost
+            # event runs again once it calls or returns, or moved on, unlike
+            # from the handlers called meanwhile.
+            stack = self._stack
+            if not stack:
+                return
+            caller = stack[-1][5]
+            if caller is None or (
+                frame is not caller and caller.f_lasti == stack[-1][6]
+            ):
+                return
+            now = self._count()
+            while stack and stack[-1][5] is caller:
+                self._pop(now)
+
+        def finish(self):
+            """End the events timed, once the event loop waits"""
+            now = self._count()
+            while self._stack:
+                self._pop(now)
+            self._unwatch()
+
+        def eventFilter(self, obj, event):
+            widget = obj if obj.isWidgetType() else None
+            # Python code which sent the event, if any
+            caller = sys._getframe().f_back
+            now = self._count()
+            # Another profiler such as cProfile hides when the code returned,
+            # and events end once the next event starts instead
+            watching = sys.getprofile() == self._profile
+            stack = self._stack
+            while stack and (stack[-1][5] is caller or not watching):
+                parent = stack[-1][0]
+                if (
+                    widget is not None
+                    and widget is not parent
+                    and _isvalid(parent)
+                    and parent.isAncestorOf(widget)
+                ):
+                    break
+                self._pop(now)
+
+            name = names.get(event.type())
+            if name is not None and widget is not None:
+                root = self._widget
+                if widget is root or root.isAncestorOf(widget):
+                    path = self._profiler._path(widget)
+                    lasti = caller.f_lasti if caller is not None else None
+                    stack.append([widget, path, name, now, 0.0, caller, lasti])
+                    if sys.getprofile() is None:
+                        sys.setprofile(self._profile)
+            self._unwatch()
+            return False
+
+    class WidgetProfiler(object):
+        """Time the paint, layout, resize and polish events of widgets
+
+        Events of `widget` and its descendants are timed per widget, with
+        the time spent in the events of other widgets sent while handling
+        them, such as resizing the children of a layout, counted separately.
+        Stopped, no event filter is installed, and there is no overhead.
+
+        Usage:
+            >> profiler = QtCompat.WidgetProfiler(panel)
+            >> profiler.start()
+            >> panel.resize(1200, 800)
+            >> panel.grab()
+            >> profiler.stop()
+            >> profiler.writeFoldedStacks("panel.folded")
+
+        """
+
+        def __init__(self, widget):
+            self._widget = widget
+            self._filter = None
+            # Path of labels from the widget, event: [count, total, self, max]
+            self._records = {}
+
+        def start(self):
+            if self._filter is None:
+                self._filter = Filter(self, self._widget)
+
+        def stop(self):
+            if self._filter is not None:
+                self._filter.remove()
+                Qt.QtCompat.delete(self._filter)
+                self._filter = None
+
+        def isActive(self):
+            return self._filter is not None
+
+        def clear(self):
+            self._records.clear()
+
+        def _path(self, widget):
+            path = []
+            while widget is not None:
+                path.append(_widget_label(widget))
+                if widget is self._widget:
+                    break
+                widget = widget.parentWidget()
+            return tuple(reversed(path))
+
+        def _add(self, path, name, total, own):
+            key = (path, name)
+            record = self._records.get(key)
+            if record is None:
+                record = self._records[key] = [0, 0.0, 0.0, 0.0]
+            record[0] += 1
+            record[1] += total
+            record[2] += own
+            if total > record[3]:
+                record[3] = total
+
+        def report(self):
+            """Return the timings per widget and event, slowest first
+
+            Each is a dict of the "path" of labels, "ClassName#objectName",
+            from the profiled widget to the widget, the "event", its "count"
+            and the "total", "self" and "max" seconds, where "self" excludes
+            the events of other widgets sent meanwhile.
+
+            """
+            results = [
+                {
+                    "path": list(path),
+                    "event": name,
+                    "count": record[0],
+                    "total": record[1],
+                    "self": record[2],
+                    "max": record[3],
+                }
+                for (path, name), record in self._records.items()
+            ]
+            results.sort(key=lambda result: result["self"], reverse=True)
+            return results
+
+        def tree(self):
+            """Return the timings as a tree of the profiled widgets
+
+            Each node is a dict of the "name" of its widget, the timings of
+            its "events" by event name as in report(), the "self" seconds of
+            all events of its widget, the "total" seconds of its subtree and
+            its "children".
+
+            """
+            root = {"name": None, "events": {}, "children": {}}
+            for (path, name), record in self._records.items():
+                node = root
+                for part in path:
+                    children = node["children"]
+                    if part not in children:
+                        children[part] = {"name": part, "events": {}, "children": {}}
+                    node = children[part]
+                node["events"][name] = {
+                    "count": record[0],
+                    "total": record[1],
+                    "self": record[2],
+                    "max": record[3],
+                }
+
+            def finish(node):
+                children = [finish(child) for child in node["children"].values()]
+                children.sort(key=lambda child: child["total"], reverse=True)
+                node["children"] = children
+                node["self"] = sum(e["self"] for e in node["events"].values())
+                node["total"] = node["self"] + sum(c["total"] for c in children)
+                return node
+
+            nodes = finish(root)["children"]
+            return nodes[0] if nodes else None
+
+        def writeFoldedStacks(self, path):
+            """Write the self time of each widget and event to `path`
+
+            In microseconds, as the "folded" stacks of flamegraph.pl,
+            speedscope and inferno, one "Root;Child;Event count" per line.
+
+            """
+            with open(path, "w") as f:
+                for (parts, name), record in sorted(self._records.items()):
+                    microseconds = int(round(record[2] * 1e6))
+                    if microseconds > 0:
+                        stack = ";".join(parts + (name,))
+                        f.write("%s %d\n" % (stack, microseconds))
+
+    return WidgetProfiler
+
+
+def _leak_tracker():
+    """Return the class of QtCompat.LeakTracker"""
+    import gc
+    import time
+    import collections
+
+    QtCore = Qt._QtCore
+
+    def class_name(obj):
+        # The C++ class, or the Python class deriving from it, which PySide
+        # names after its __qualname__
+        name = obj.metaObject().className()
+        return name.rsplit(".", 1)[-1]
+
+    def owner_name(owner):
+        if isinstance(owner, types.ModuleType):
+            return owner.__name__
+        return type(owner).__name__
+
+    class LeakTracker(QtCore.QObject):
+        """Count live QObjects by class and find wrappers of deleted objects
+
+        A snapshot walks the children of the application and of each top-level
+        widget. Periodic snapshots are taken `budget` ms at a time, for
+        production sessions to spot classes of objects that keep growing.
+
+        Usage:
+            >> tracker = QtCompat.LeakTracker()
+            >> before = tracker.snapshot()
+            >> open_and_close_tool()
+            >> QtCompat.LeakTracker.diff(before, tracker.snapshot())
+            {'ToolWindow': 1, 'QPushButton': 12}
+            >> tracker.snapshotTaken.connect(log_growth)
+            >> tracker.start(interval=60000)
+
+        Walking creates Python wrappers of the objects created by C++, which
+        bindings keep until the objects are deleted.
+
+        """
+
+        # Emitted with the counts by class of each periodic snapshot
+        snapshotTaken = _signal(object)  # noqa: N815
+
+        def __init__(self, budget=2, maxSnapshots=10, parent=None):
+            super(LeakTracker, self).__init__(parent)
+            self._budget = budget
+            self._snapshots = collections.deque(maxlen=maxSnapshots)
+            self._walk = None
+            self._interval = QtCore.QTimer(self)
+            self._interval.timeout.connect(self._begin)
+            self._step = QtCore.QTimer(self)
+            self._step.setSingleShot(True)
+            self._step.timeout.connect(self._continue)
+
+        @staticmethod
+        def _roots():
+            app = QtCore.QCoreApplication.instance()
+            if app is None:
+                return []
+            roots = [app]
+            # The instance may be wrapped as a QCoreApplication
+            if app.inherits("QApplication"):
+                widgets = Qt._QtWidgets.QApplication.topLevelWidgets()
+                roots.extend(w for w in widgets if w.parent() is None)
+            return roots
+
+        @staticmethod
+        def _visit(walk, deadline=None):
+            """Count objects of `walk` until it is done or past `deadline`
+
+            Returns whether the walk is done.
+
+            """
+            stack, seen, counts = walk
+            visited = 0
+            while stack:
+                obj = stack.pop()
+                visited += 1
+                if deadline is not None and not visited % 64:
+                    if time.perf_counter() > deadline:
+                        stack.append(obj)
+                        return False
+                # Deleted since the previous step, or reached twice when
+                # reparented meanwhile
+                if not _isvalid(obj):
+                    continue
+                address = _getcpppointer(obj)
+                if address in seen:
+                    continue
+                seen.add(address)
+                counts[class_name(obj)] += 1
+                stack.extend(obj.children())
+            return True
+
+        def snapshot(self):
+            """Return the number of live QObjects by class, in one walk"""
+            walk = (self._roots(), set(), collections.Counter())
+            self._visit(walk)
+            return dict(walk[2])
+
+        def start(self, interval=60000):
+            """Take a snapshot every `interval` ms, `budget` ms at a time"""
+            self._interval.start(interval)
+            self._begin()
+
+        def stop(self):
+            self._interval.stop()
+            self._step.stop()
+            self._walk = None
+
+        def isActive(self):
+            return self._interval.isActive()
+
+        def _begin(self):
+            if self._walk is None:
+                self._walk = (self._roots(), set(), collections.Counter())
+                self._continue()
+
+        def _continue(self):
+            walk = self._walk
+            if walk is None:
+                return
+            if not self._visit(walk, time.perf_counter() + self._budget / 1000.0):
+                # Let the event loop run before the next step
+                self._step.start(0)
+                return
+            self._walk = None
+            counts = dict(walk[2])
+            self._snapshots.append(counts)
+            self.snapshotTaken.emit(counts)
+
+        def snapshots(self):
+            """Return the periodic snapshots taken last, oldest first"""
+            return list(self._snapshots)
+
+        @staticmethod
+        def diff(old, new):
+            """Return the change of the count of each class from `old` to `new`
+
+            Classes with the same count are left out, the others are sorted by
+            how much they grew.
+
+            """
+            changes = {}
+            for name in set(old) | set(new):
+                change = new.get(name, 0) - old.get(name, 0)
+                if change:
+                    changes[name] = change
+            return dict(sorted(changes.items(), key=lambda item: -item[1]))
+
+        @staticmethod
+        def findDeleted():
+            """Return the Python wrappers of QObjects deleted by C++
+
+            Calling any method of these raises a RuntimeError. They are kept
+            alive by a Python reference, see referrers().
+
+            """
+            gc.collect()
+            return [
+                obj
+                for obj in gc.get_objects()
+                if isinstance(obj, QtCore.QObject) and not _isvalid(obj)
+            ]
+
+        @staticmethod
+        def referrers(obj):
+            """Describe what references `obj`, such as "ClassName.attribute"
+
+            Referrers of the caller's frame are left out.
+
+            """
+            frame = sys._getframe(1)
+            descriptions = []
+            for referrer in gc.get_referrers(obj):
+                if referrer is frame:
+                    continue
+                attributes = getattr(referrer, "__dict__", None)
+                if isinstance(attributes, dict):
+                    # Instances whose attributes aren't stored in a dict yet
+                    descriptions.extend(
+                        "%s.%s" % (owner_name(referrer), key)
+                        for key, value in attributes.items()
+                        if value is obj
+                    )
+                elif isinstance(referrer, dict):
+                    # The object this is the __dict__ of, if any
+                    owners = [
+                        owner
+                        for owner in gc.get_referrers(referrer)
+                        if getattr(owner, "__dict__", None) is referrer
+                    ]
+                    descriptions.extend(
+                        "%s.%s" % (owner_name(owners[0]), key)
+                        if owners
+                        else "dict[%r]" % (key,)
+                        for key, value in referrer.items()
+                        if value is obj
+                    )
+                else:
+                    descriptions.append(type(referrer).__name__)
+            return descriptions
+
+    return LeakTracker
+
+
+def _thumbnail_loader():
+    """Return the class of QtCompat.ThumbnailLoader"""
+    import hashlib
+    import threading
+    import collections
+
+    QtCore = Qt._QtCore
+
+    def stat_key(path, width, height):
+        """Return a key of `path` which changes when the file is modified"""
+        stat = os.stat(path)
+        return "%s|%d|%d|%dx%d" % (path, stat.st_mtime_ns, stat.st_size, width, height)
+
+    def decode(path, width, height, cacheDir, cacheFormat):
+        """Return the stat key of `path` and its thumbnail, in a worker thread"""
+        QtGui = Qt._QtGui
+        key = stat_key(path, width, height)
+        cached = None
+        if cacheDir:
+            name = hashlib.sha1(key.encode("utf-8")).hexdigest()
+            cached = os.path.join(cacheDir, name + "." + cacheFormat)
+            if os.path.exists(cached):
+                image = QtGui.QImage(cached)
+                if not image.isNull():
+                    return key, image
+
+        reader = QtGui.QImageReader(path)
+        reader.setAutoTransform(True)
+        size = reader.size()
+        scaled = size.scaled(width, height, QtCore.Qt.AspectRatioMode.KeepAspectRatio)
+        # Formats that can't tell their size are scaled once read
+        if size.isValid() and scaled.width() < size.width():
+            reader.setScaledSize(scaled)
+        image = reader.read()
+        if image.isNull():
+            raise IOError("Could not read %s: %s" % (path, reader.errorString()))
+        if image.width() > width or image.height() > height:
+            image = image.scaled(
+                width,
+                height,
+                QtCore.Qt.AspectRatioMode.KeepAspectRatio,
+                QtCore.Qt.TransformationMode.SmoothTransformation,
+            )
+
+        if cached:
+            # Written under another name first, for readers to never see
+            # half of a file
+            temporary = "%s.%d.tmp" % (cached, threading.get_ident())
+            if image.save(temporary, cacheFormat):
+                os.replace(temporary, cached)
+        return key, image
+
+    class ThumbnailLoader(QtCore.QObject):
+        """Decode thumbnails of images in a thread pool
+
+        Images are read at the size of their thumbnail with QImageReader
+        where the format allows, and kept in a cache of up to `cacheSize`
+        bytes. Thumbnails loaded while control was away from the event loop
+        are delivered together, with one `thumbnailsReady` signal.
+
+        Each request of a cached thumbnail compares the modification time
+        and size of the file with those at loading, and loads the thumbnail
+        again if they changed. Without `checkFiles`, cached thumbnails are
+        served without touching the disk, and images modified after their
+        thumbnail was loaded keep it until `invalidate()` is called.
+        Thumbnails in `cacheDir` are always keyed by both.
+
+        Usage:
+            >> loader = QtCompat.ThumbnailLoader(QtCore.QSize(128, 128))
+            >> loader.thumbnailsReady.connect(on_thumbnails)
+            >> image = loader.request(path)  # If cached, None otherwise
+            >> loader.cancel(path)  # When scrolled out of view
+
+        Arguments:
+            size (QSize, optional): Size thumbnails fit in, 256x256 by
+                default.
+            cacheSize (int, optional): Bytes of thumbnails kept in memory.
+            cacheDir (str, optional): Directory to keep the thumbnails in too,
+                encoded in `cacheFormat`, for them to be read again instead of
+                decoding the images.
+            checkFiles (bool, optional): Stat the file of each cached
+                thumbnail requested, to load it again once modified, True by
+                default.
+            threadPool (QThreadPool, optional): Pool to decode images in,
+                defaults to QThreadPool.globalInstance().
+            parent (QObject, optional): Parent of the loader.
+
+        """
+
+        # Emitted with a list of (path, size, QImage) of the thumbnails loaded
+        thumbnailsReady = _signal(object)  # noqa: N815
+        # Emitted with the path and message of each image that failed to load
+        thumbnailFailed = _signal(str, str)  # noqa: N815
+
+        def __init__(
+            self,
+            size=None,
+            cacheSize=64 * 1024 * 1024,
+            cacheDir=None,
+            cacheFormat="png",
+            checkFiles=True,
+            threadPool=None,
+            parent=None,
+        ):
+            super(ThumbnailLoader, self).__init__(parent)
+            self._checkFiles = checkFiles
+            self._size = size if size is not None else QtCore.QSize(256, 256)
+            self._cacheSize = cacheSize
+            self._cacheDir = cacheDir
+            self._cacheFormat = cacheFormat
+            if cacheDir and not os.path.isdir(cacheDir):
+                os.makedirs(cacheDir)
+            # (path, width, height): (stat key, image, bytes), oldest first
+            self._cache = collections.OrderedDict()
+            self._cachedBytes = 0
+            self._pending = {}
+            self._executor = Qt.QtCompat.ThreadPoolExecutor(threadPool, self)
+            self._executor.finished.connect(self._finished)
+
+        def _key(self, path, size):
+            size = size if size is not None else self._size
+            return (path, size.width(), size.height())
+
+        def request(self, path, size=None, priority=0):
+            """Return the thumbnail of `path` if cached, or start loading it
+
+            Requests of a thumbnail already loading are ignored. Loading starts
+            before the requests of a lower `priority`. Unless `checkFiles` is
+            False, a thumbnail whose file was modified since is loaded again.
+
+            Returns:
+                QImage: The cached thumbnail, or None.
+
+            """
+            key = self._key(path, size)
+            entry = self._cache.get(key)
+            if entry is not None and self._checkFiles:
+                try:
+                    changed = stat_key(*key) != entry[0]
+                except OSError:
+                    changed = True
+                if changed:
+                    self._cachedBytes -= self._cache.pop(key)[2]
+                    entry = None
+            if entry is not None:
+                self._cache.move_to_end(key)
+                return entry[1]
+            if key not in self._pending:
+                self._pending[key] = self._executor.submitWithPriority(
+                    priority, decode, *key, self._cacheDir, self._cacheFormat
+                )
+            return None
+
+        def cached(self, path, size=None):
+            """Return the thumbnail of `path` if cached, None otherwise"""
+            entry = self._cache.get(self._key(path, size))
+            return entry[1] if entry is not None else None
+
+        def isLoading(self, path, size=None):
+            return self._key(path, size) in self._pending
+
+        def cancel(self, path, size=None):
+            """Cancel loading the thumbnail of `path`, unless it started
+
+            Thumbnails of all sizes are cancelled when no `size` is given.
+
+            """
+            for key in list(self._pending):
+                if key[0] == path and (size is None or key == self._key(path, size)):
+                    if self._pending[key].cancel():
+                        del self._pending[key]
+
+        def cancelAll(self):
+            for key, future in list(self._pending.items()):
+                if future.cancel():
+                    del self._pending[key]
+
+        def invalidate(self, path=None):
+            """Forget the cached thumbnails of `path`, or of all images
+
+            The next request reads the file again, or its thumbnail from
+            `cacheDir` if the file didn't change.
+
+            """
+            for key in list(self._cache):
+                if path is None or key[0] == path:
+                    self._cachedBytes -= self._cache.pop(key)[2]
+
+        def _finished(self, futures):
+            pending = {future: key for key, future in self._pending.items()}
+            thumbnails = []
+            for future in futures:
+                key = pending.get(future)
+                if key is None or future.cancelled():
+                    continue
+                del self._pending[key]
+                path, width, height = key
+                error = future.exception()
+                if error is not None:
+                    self.thumbnailFailed.emit(path, str(error))
+                    continue
+
+                stat_key, image = future.result()
+                self._store(key, stat_key, image)
+                thumbnails.append((path, QtCore.QSize(width, height), image))
+            if thumbnails:
+                self.thumbnailsReady.emit(thumbnails)
+
+        def _store(self, key, stat_key, image):
+            size = image.sizeInBytes()
+            previous = self._cache.pop(key, None)
+            if previous is not None:
+                self._cachedBytes -= previous[2]
+            self._cache[key] = (stat_key, image, size)
+            self._cachedBytes += size
+            while self._cachedBytes > self._cacheSize and len(self._cache) > 1:
+                self._cachedBytes -= self._cache.popitem(last=False)[1][2]
+
+        def cachedBytes(self):
+            return self._cachedBytes
+
+    return ThumbnailLoader
+
+
+def _pixmap_cache():
+    """Return the class of QtCompat.PixmapCache"""
+    import collections
+
+    # Bindings return the pixmap from find(key), or fill one passed to
+    # find(key, pixmap) and return whether it was found
+    find_returns = []
+
+    def find(key):
+        QtGui = Qt._QtGui
+        if not find_returns:
+            try:
+                result = QtGui.QPixmapCache.find(key)
+                find_returns.append(not isinstance(result, bool))
+            except TypeError:
+                find_returns.append(False)
+        if find_returns[0]:
+            pixmap = QtGui.QPixmapCache.find(key)
+        else:
+            pixmap = QtGui.QPixmap()
+            if not QtGui.QPixmapCache.find(key, pixmap):
+                return None
+        return pixmap if pixmap is not None and not pixmap.isNull() else None
+
+    class Namespace(object):
+        def __init__(self):
+            self.budget = None
+            # Key in QPixmapCache: bytes, least recently used first
+            self.keys = collections.OrderedDict()
+            self.bytes = 0
+            self.stats = dict.fromkeys(("hits", "misses", "inserts", "evictions"), 0)
+
+        def forget(self, key):
+            self.bytes -= self.keys.pop(key, 0)
+
+    class PixmapCache(object):
+        """Reuse rendered pixmaps with the same API on all bindings
+
+        Pixmaps are stored in the global QPixmapCache, under keys prefixed
+        with the `namespace` of the cache. Caches of the same namespace share
+        their pixmaps, statistics and budget.
+
+        Usage:
+            >> cache = QtCompat.PixmapCache("swatches", budget=4 * 1024 * 1024)
+            >> pixmap = cache.find(("red", 16))
+            >> if pixmap is None:
+            ..     pixmap = render_swatch("red", 16)
+            ..     cache.insert(("red", 16), pixmap)
+
+        Arguments:
+            namespace (str): Name of the pixmaps of this cache.
+            budget (int, optional): Bytes of pixmaps kept in this namespace,
+                least recently used pixmaps are removed first. Limited only by
+                the QPixmapCache.cacheLimit() of all namespaces by default.
+
+        """
+
+        _namespaces = {}
+
+        def __init__(self, namespace, budget=None):
+            self._name = namespace
+            self._namespace = self._namespaces.setdefault(namespace, Namespace())
+            if budget is not None:
+                self.setBudget(budget)
+
+        def namespace(self):
+            return self._name
+
+        def _key(self, key):
+            """Return the key of QPixmapCache of `key`, a string or tuple"""
+            if not isinstance(key, (str, tuple)):
+                raise TypeError("Expected a str or tuple key, got %r" % (key,))
+            return "%s\x00%r" % (self._name, key)
+
+        def find(self, key):
+            """Return the pixmap cached for `key`, or None"""
+            cache_key = self._key(key)
+            namespace = self._namespace
+            pixmap = find(cache_key) if cache_key in namespace.keys else None
+            if pixmap is None:
+                # Including pixmaps Qt removed to stay within its cache limit
+                namespace.forget(cache_key)
+                namespace.stats["misses"] += 1
+                return None
+            namespace.keys.move_to_end(cache_key)
+            namespace.stats["hits"] += 1
+            return pixmap
+
+        def insert(self, key, pixmap):
+            """Cache `pixmap` for `key`, return whether it fits in the cache"""
+            QtGui = Qt._QtGui
+            cache_key = self._key(key)
+            namespace = self._namespace
+            size = pixmap.width() * pixmap.height() * pixmap.depth() // 8
+            namespace.forget(cache_key)
+            if namespace.budget is not None and size > namespace.budget:
+                QtGui.QPixmapCache.remove(cache_key)
+                return False
+            if not QtGui.QPixmapCache.insert(cache_key, pixmap):
+                return False
+            namespace.keys[cache_key] = size
+            namespace.bytes += size
+            namespace.stats["inserts"] += 1
+            self._evict()
+            return True
+
+        def remove(self, key):
+            cache_key = self._key(key)
+            self._namespace.forget(cache_key)
+            Qt._QtGui.QPixmapCache.remove(cache_key)
+
+        def invalidate(self):
+            """Remove all pixmaps of this namespace"""
+            namespace = self._namespace
+            for cache_key in namespace.keys:
+                Qt._QtGui.QPixmapCache.remove(cache_key)
+            namespace.keys.clear()
+            namespace.bytes = 0
+
+        def _evict(self):
+            namespace = self._namespace
+            budget = namespace.budget
+            while budget is not None and namespace.bytes > budget:
+                cache_key, size = namespace.keys.popitem(last=False)
+                namespace.bytes -= size
+                namespace.stats["evictions"] += 1
+                Qt._QtGui.QPixmapCache.remove(cache_key)
+
+        def setBudget(self, budget):
+            self._namespace.budget = budget
+            self._evict()
+
+        def budget(self):
+            return self._namespace.budget
+
+        def stats(self):
+            """Return the hits, misses, inserts, evictions, count and bytes"""
+            namespace = self._namespace
+            stats = dict(namespace.stats)
+            stats["count"] = len(namespace.keys)
+            stats["bytes"] = namespace.bytes
+            return stats
+
+        def resetStats(self):
+            self._namespace.stats = dict.fromkeys(self._namespace.stats, 0)
+
+        @staticmethod
+        def setCacheLimit(budget):
+            """Set the bytes of pixmaps kept by QPixmapCache, of all namespaces"""
+            Qt._QtGui.QPixmapCache.setCacheLimit(max(1, budget // 1024))
+
+        @staticmethod
+        def cacheLimit():
+            return Qt._QtGui.QPixmapCache.cacheLimit() * 1024
+
+    return PixmapCache
+
+
+def _qt_hash(name):
+    """Return the hash QResource looks up `name` with"""
+    import struct
+
+    value = 0
+    encoded = name.encode("utf-16-be")
+    for unit in struct.unpack(">%dH" % (len(encoded) // 2), encoded):
+        value = (value << 4) + unit
+        value ^= (value & 0xF0000000) >> 23
+        value &= 0x0FFFFFFF
+    return value
+
+
+def _qrc_files(qrc):
+    """Return the resource path of each file listed in the .qrc file `qrc`"""
+    from xml.etree import ElementTree
+
+    base = os.path.dirname(os.path.abspath(qrc))
+    files = {}
+    for resource in ElementTree.parse(qrc).getroot().iter("qresource"):
+        if resource.get("lang"):
+            raise ValueError("%s: Resources with a lang are not supported" % qrc)
+        prefix = resource.get("prefix", "").strip("/")
+        for element in resource.iter("file"):
+            source = os.path.join(base, element.text.strip())
+            alias = element.get("alias") or element.text.strip()
+            target = "/".join(part for part in (prefix, alias.strip("/")) if part)
+            if not os.path.isdir(source):
+                files[target] = source
+                continue
+            for directory, _, filenames in os.walk(source):
+                for filename in filenames:
+                    path = os.path.join(directory, filename)
+                    relative = os.path.relpath(path, source).replace(os.sep, "/")
+                    files[target + "/" + relative] = path
+    return files
+
+
+def _write_rcc(files, rcc):
+    """Write `files` to `rcc` in the binary format of rcc, uncompressed
+
+    Format version 1 is read by all versions of Qt, and uncompressed data
+    is read straight from the memory QResource maps the file to.
+
+    """
+    import struct
+
+    root = {}
+    for target, source in files.items():
+        directory = root
+        parts = target.split("/")
+        for part in parts[:-1]:
+            directory = directory.setdefault(part, {})
+        directory[parts[-1]] = source
+
+    def children(directory):
+        return sorted(directory.items(), key=lambda item: _qt_hash(item[0]))
+
+    # The children of each directory are consecutive and sorted by hash,
+    # in the order rcc writes them
+    entries = [("", root)]
+    first_child = {}
+    pending = [0]
+    while pending:
+        index = pending.pop()
+        first_child[index] = len(entries)
+        for name, value in children(entries[index][1]):
+            if isinstance(value, dict):
+                pending.append(len(entries))
+            entries.append((name, value))
+
+    data = bytearray()
+    data_offsets = {}
+    names = bytearray()
+    name_offsets = {}
+    for name, value in entries[1:]:
+        # Files listed more than once are stored once
+        if not isinstance(value, dict) and value not in data_offsets:
+            with open(value, "rb") as f:
+                content = f.read()
+            data_offsets[value] = len(data)
+            data += struct.pack(">I", len(content)) + content
+        if name not in name_offsets:
+            name_offsets[name] = len(names)
+            encoded = name.encode("utf-16-be")
+            names += struct.pack(">HI", len(encoded) // 2, _qt_hash(name))
+            names += encoded
+
+    tree = bytearray()
+    for index, (name, value) in enumerate(entries):
+        offset = name_offsets.get(name, 0)
+        if isinstance(value, dict):
+            tree += struct.pack(">IHII", offset, 2, len(value), first_child[index])
+        else:
+            # Any territory and the C language
+            tree += struct.pack(">IHHHI", offset, 0, 0, 1, data_offsets[value])
+
+    header_size = 20
+    header = b"qres" + struct.pack(
+        ">IIII",
+        1,
+        header_size + len(data) + len(names),
+        header_size,
+        header_size + len(data),
+    )
+    temporary = "%s.%d.tmp" % (rcc, os.getpid())
+    with open(temporary, "wb") as f:
+        f.write(header + data + names + tree)
+    os.replace(temporary, rcc)
+
+
+def _compiled_resource(qrc, cacheDir=None):
+    """Return the path of the .rcc file `qrc` is compiled to"""
+    import hashlib
+
+    name = os.path.splitext(os.path.basename(qrc))[0]
+    if cacheDir is None:
+        return os.path.join(os.path.dirname(os.path.abspath(qrc)), name + ".rcc")
+    path = os.path.abspath(qrc).encode("utf-8")
+    digest = hashlib.sha1(path).hexdigest()[:12]
+    return os.path.join(cacheDir, "%s-%s.rcc" % (name, digest))
+
+
+def _compile_resource(qrc, cacheDir=None):
+    """Compile the .qrc file `qrc` to a binary .rcc file, unless up to date
+
+    Arguments:
+        qrc (str): Path to the .qrc file.
+        cacheDir (str, optional): Directory to write the .rcc file to,
+            next to the .qrc file by default.
+
+    Returns:
+        str: Path to the .rcc file.
+
+    """
+    import hashlib
+
+    rcc = _compiled_resource(qrc, cacheDir)
+    files = _qrc_files(qrc)
+    try:
+        compiled = os.stat(rcc).st_mtime_ns
+    except OSError:
+        compiled = None
+
+    # The files found in the directories listed are kept as a digest next
+    # to the .rcc file, for files added, removed or renamed to be noticed
+    listing = "".join("%s\0%s\n" % item for item in sorted(files.items()))
+    digest = hashlib.sha1(listing.encode("utf-8")).hexdigest()
+    try:
+        with open(rcc + ".sha1") as f:
+            compiled_digest = f.read().strip()
+    except (IOError, OSError):
+        compiled_digest = None
+
+    sources = [qrc] + list(files.values())
+    if (
+        compiled is None
+        or compiled_digest != digest
+        or any(os.stat(p).st_mtime_ns > compiled for p in sources)
+    ):
+        if cacheDir and not os.path.isdir(cacheDir):
+            os.makedirs(cacheDir)
+        _write_rcc(files, rcc)
+        with open(rcc + ".sha1", "w") as f:
+            f.write(digest)
+    return rcc
+
+
+def _register_resource(path, root="", cacheDir=None):
+    """Register the resources of a .qrc or .rcc file
+
+    A .qrc file is compiled to a binary .rcc file the first time, and
+    whenever the .qrc file or the files it lists change, or files are
+    added to or removed from the directories it lists. QResource maps the
+    .rcc file to memory rather than reading it, unlike modules generated by
+    the resource compiler of each binding.
+
+    Usage:
+        >> QtCompat.registerResource("icons.qrc")
+        >> icon = QtGui.QIcon(":/icons/open.png")
+
+    Arguments:
+        path (str): Path to a .qrc or .rcc file.
+        root (str, optional): Directory of the resources, e.g. "/tool" for
+            ":/tool/icons/open.png".
+        cacheDir (str, optional): Directory to compile .qrc files to, next to
+            the .qrc file by default.
+
+    Returns:
+        str: Path to the registered .rcc file.
+
+    """
+    rcc = path if path.endswith(".rcc") else _compile_resource(path, cacheDir)
+    if not Qt._QtCore.QResource.registerResource(rcc, root):
+        raise IOError("Could not register resources of %s" % rcc)
+    return rcc
+
+
+def _unregister_resource(path, root="", cacheDir=None):
+    """Unregister the resources of a .qrc or .rcc file registered before"""
+    rcc = path if path.endswith(".rcc") else _compiled_resource(path, cacheDir)
+    return Qt._QtCore.QResource.unregisterResource(rcc, root)
+
+
+# Font files added by _prewarm_fonts(): their id in the font database
+_prewarmed_fonts = {}
+# Whether _prewarm_fonts() loaded the font database
+_prewarmed = []
+
+
+def _prewarm_fonts(fonts=None):
+    """Add the font files `fonts` and load the font database, once"""
+    QtGui = Qt._QtGui
+    added = False
+    for path in fonts or []:
+        path = os.path.abspath(path)
+        if path in _prewarmed_fonts:
+            continue
+        font_id = QtGui.QFontDatabase.addApplicationFont(path)
+        if font_id < 0:
+            _warn("Could not add font %s" % path)
+            continue
+        _prewarmed_fonts[path] = font_id
+        added = True
+
+    # Loaded again only once fonts were added, which resets the database
+    if added or not _prewarmed:
+        _prewarmed[:] = [True]
+        try:
+            QtGui.QFontDatabase.families()
+        except TypeError:
+            # Not static before Qt 6
+            QtGui.QFontDatabase().families()
+
+
+# Applications created by _headless_application()
+_headless_applications = []
+
+
+def _headless_application(level="gui", argv=None, platform="offscreen", fonts=None):
+    """Return an application for rendering without a display
+
+    The application of `level` is created on the offscreen platform, or
+    the existing application is returned. For jobs to start faster, limit
+    the modules Qt.py imports with QT_MODULES, e.g. "QtCore:QtGui".
+
+    The font database is loaded once the application is created, rather
+    than by the first text drawn. Later calls only add the fonts that
+    weren't added before, and load the database again if any were.
+
+    Usage:
+        >> app = QtCompat.headlessApplication("gui")
+        >> image = QtGui.QImage(256, 256, QtGui.QImage.Format.Format_ARGB32)
+
+    Arguments:
+        level (str, optional): "core", "gui" or "widgets" for a
+            QCoreApplication, QGuiApplication or QApplication.
+        argv (list, optional): Arguments of the application, sys.argv by
+            default.
+        platform (str, optional): Platform plug-in of gui and widgets
+            applications, unless `argv` includes one with -platform.
+        fonts (list, optional): Font files to add to the font database.
+
+    Returns:
+        QCoreApplication: The application, kept until the end of the process.
+
+    """
+    classes = {
+        "core": ("QtCore", "QCoreApplication"),
+        "gui": ("QtGui", "QGuiApplication"),
+        "widgets": ("QtWidgets", "QApplication"),
+    }
+    if level not in classes:
+        raise ValueError("Expected level 'core', 'gui' or 'widgets', got %r" % (level,))
+    module_name, class_name = classes[level]
+    module = getattr(Qt, "_" + module_name, None)
+    if module is None:
+        raise ImportError(
+            "%s applications need %s, which Qt.py didn't import, "
+            "see QT_MODULES" % (level, module_name)
+        )
+
+    app = Qt._QtCore.QCoreApplication.instance()
+    if app is None:
+        argv = list(sys.argv if argv is None else argv) or ["python"]
+        if level != "core" and "-platform" not in argv:
+            argv[1:1] = ["-platform", platform]
+        app = getattr(module, class_name)(argv)
+        # Kept for callers to not lose it, which deletes the application
+        _headless_applications.append(app)
+    elif not app.inherits(class_name):
+        raise RuntimeError(
+            "A %s exists, which can't be replaced by a %s"
+            % (app.metaObject().className(), class_name)
+        )
+
+    if level != "core":
+        _prewarm_fonts(fonts)
+    return app
+
+
 def _translate(context, sourceText, *args):
     # TODO: Can this be removed by dropping Qt4?
     # In Qt4 bindings, translate can be passed 2 or 3 arguments
@@ -1365,7 +5315,10 @@ _misplaced_members = {
         "__extras__": ["QtSvgWidgets", "QtUiTools"],
         "QtCore.Property": "QtCore.Property",
         "QtCore.QAbstractProxyModel": "QtCore.QAbstractProxyModel",
+        "QtCore.QByteArray": ["QtCompat.byteArrayFromBuffer", _qbytearray_from_buffer],
+        "QtCore.QByteArray.data": ["QtCompat.byteArrayView", _qbytearray_view],
         "QtCore.QCoreApplication.translate": ["QtCompat.translate", _translate],
+        "QtCore.QLineF": ["QtCompat.linesFromBuffer", _linesf_from_buffer],
         "QtCore.qInstallMessageHandler": [
             "QtCompat.qInstallMessageHandler",
             _qInstallMessageHandler,
@@ -1376,6 +5329,13 @@ _misplaced_members = {
         "QtCore.QRegularExpression": "QtCore.QRegExp",
         "QtCore.QSortFilterProxyModel": "QtCore.QSortFilterProxyModel",
         "QtCore.QStringListModel": "QtCore.QStringListModel",
+        "QtGui.QImage": ["QtCompat.imageFromBuffer", _qimage_from_buffer],
+        "QtGui.QImage.bits": ["QtCompat.imageBits", _qimage_bits],
+        "QtGui.QPainterPath": [
+            "QtCompat.painterPathFromBuffer",
+            _painterpath_from_buffer,
+        ],
+        "QtGui.QPolygonF": ["QtCompat.polygonFromBuffer", _polygonf_from_buffer],
         "QtCore.Signal": "QtCore.Signal",
         "QtCore.Slot": "QtCore.Slot",
         # Preserve backwards compatibility while also supporting the Qt6 member locations
@@ -1410,7 +5370,10 @@ _misplaced_members = {
         "QtCore.pyqtSignal": "QtCore.Signal",
         "QtCore.pyqtSlot": "QtCore.Slot",
         "QtCore.QAbstractProxyModel": "QtCore.QAbstractProxyModel",
+        "QtCore.QByteArray": ["QtCompat.byteArrayFromBuffer", _qbytearray_from_buffer],
+        "QtCore.QByteArray.data": ["QtCompat.byteArrayView", _qbytearray_view],
         "QtCore.QCoreApplication.translate": ["QtCompat.translate", _translate],
+        "QtCore.QLineF": ["QtCompat.linesFromBuffer", _linesf_from_buffer],
         "QtCore.qInstallMessageHandler": [
             "QtCompat.qInstallMessageHandler",
             _qInstallMessageHandler,
@@ -1421,6 +5384,13 @@ _misplaced_members = {
         "QtCore.QRegularExpression": "QtCore.QRegExp",
         "QtCore.QSortFilterProxyModel": "QtCore.QSortFilterProxyModel",
         "QtCore.QStringListModel": "QtCore.QStringListModel",
+        "QtGui.QImage": ["QtCompat.imageFromBuffer", _qimage_from_buffer],
+        "QtGui.QImage.bits": ["QtCompat.imageBits", _qimage_bits],
+        "QtGui.QPainterPath": [
+            "QtCompat.painterPathFromBuffer",
+            _painterpath_from_buffer,
+        ],
+        "QtGui.QPolygonF": ["QtCompat.polygonFromBuffer", _polygonf_from_buffer],
         # Preserve backwards compatibility while also supporting the Qt6 member locations
         "QtGui.QAction": [True, "QtGui.QAction", "QtWidgets.QAction"],
         "QtGui.QActionGroup": [True, "QtGui.QActionGroup", "QtWidgets.QActionGroup"],
@@ -1451,7 +5421,10 @@ _misplaced_members = {
         "__extras__": ["QtOpenGLFunctions", "QtUiTools"],
         "QtCore.Property": "QtCore.Property",
         "QtCore.QAbstractProxyModel": "QtCore.QAbstractProxyModel",
+        "QtCore.QByteArray": ["QtCompat.byteArrayFromBuffer", _qbytearray_from_buffer],
+        "QtCore.QByteArray.data": ["QtCompat.byteArrayView", _qbytearray_view],
         "QtCore.QCoreApplication.translate": ["QtCompat.translate", _translate],
+        "QtCore.QLineF": ["QtCompat.linesFromBuffer", _linesf_from_buffer],
         "QtCore.qInstallMessageHandler": [
             "QtCompat.qInstallMessageHandler",
             _qInstallMessageHandler,
@@ -1462,6 +5435,13 @@ _misplaced_members = {
         "QtCore.QRegExp": "QtCore.QRegExp",
         "QtCore.QSortFilterProxyModel": "QtCore.QSortFilterProxyModel",
         "QtCore.QStringListModel": "QtCore.QStringListModel",
+        "QtGui.QImage": ["QtCompat.imageFromBuffer", _qimage_from_buffer],
+        "QtGui.QImage.bits": ["QtCompat.imageBits", _qimage_bits],
+        "QtGui.QPainterPath": [
+            "QtCompat.painterPathFromBuffer",
+            _painterpath_from_buffer,
+        ],
+        "QtGui.QPolygonF": ["QtCompat.polygonFromBuffer", _polygonf_from_buffer],
         "QtCore.Signal": "QtCore.Signal",
         "QtCore.Slot": "QtCore.Slot",
         "QtGui.QAbstractOpenGLFunctions": "QtOpenGL.QAbstractOpenGLFunctions",
@@ -1512,7 +5492,10 @@ _misplaced_members = {
         "QtCore.pyqtSignal": "QtCore.Signal",
         "QtCore.pyqtSlot": "QtCore.Slot",
         "QtCore.QAbstractProxyModel": "QtCore.QAbstractProxyModel",
+        "QtCore.QByteArray": ["QtCompat.byteArrayFromBuffer", _qbytearray_from_buffer],
+        "QtCore.QByteArray.data": ["QtCompat.byteArrayView", _qbytearray_view],
         "QtCore.QCoreApplication.translate": ["QtCompat.translate", _translate],
+        "QtCore.QLineF": ["QtCompat.linesFromBuffer", _linesf_from_buffer],
         "QtCore.qInstallMessageHandler": [
             "QtCompat.qInstallMessageHandler",
             _qInstallMessageHandler,
@@ -1523,6 +5506,13 @@ _misplaced_members = {
         "QtCore.QRegExp": "QtCore.QRegExp",
         "QtCore.QSortFilterProxyModel": "QtCore.QSortFilterProxyModel",
         "QtCore.QStringListModel": "QtCore.QStringListModel",
+        "QtGui.QImage": ["QtCompat.imageFromBuffer", _qimage_from_buffer],
+        "QtGui.QImage.bits": ["QtCompat.imageBits", _qimage_bits],
+        "QtGui.QPainterPath": [
+            "QtCompat.painterPathFromBuffer",
+            _painterpath_from_buffer,
+        ],
+        "QtGui.QPolygonF": ["QtCompat.polygonFromBuffer", _polygonf_from_buffer],
         "QtGui.QAbstractOpenGLFunctions": "QtOpenGL.QAbstractOpenGLFunctions",
         "QtWidgets.QFileSystemModel": "QtWidgets.QFileSystemModel",
         "QtGui.QOpenGLBuffer": "QtOpenGL.QOpenGLBuffer",
@@ -1553,6 +5543,18 @@ _misplaced_members = {
     },
 }
 
+# Modules of Qt.py that __extras__ are imported for, when not all of them are
+# imported, see QT_MODULES. Other extras such as sip are always imported.
+_extras_modules = {
+    "QtSvgWidgets": "QtSvg",
+    "QtOpenGLFunctions": "QtOpenGL",
+    "_QOpenGLFunctions_2_0": "QtOpenGL",
+    "_QOpenGLFunctions_2_1": "QtOpenGL",
+    "_QOpenGLFunctions_4_1_Core": "QtOpenGL",
+    "QtUiTools": "QtWidgets",
+    "uic": "QtWidgets",
+}
+
 """ Compatibility Members
 
 This dictionary is used to build Qt.QtCompat objects that provide a consistent
@@ -1876,10 +5878,15 @@ def _setup(module, extras):
             return
         _warn("ImportError(%s): %s" % (module, msg))
 
-    # Process the __extras__ modules as if they were common
+    # Process the __extras__ modules as if they were common, unless the
+    # module of Qt.py they are needed by was left out, see QT_MODULES
     _extras = _misplaced_members.get(Qt.__binding__, {})
     _extras = _extras.get("__extras__", [])
-    extras = extras + _extras
+    extras = extras + [
+        name
+        for name in _extras
+        if _extras_modules.get(name, "QtCore") in _common_members
+    ]
 
     for name in list(_common_members) + extras:
         try:
@@ -1903,6 +5910,26 @@ def _setup(module, extras):
             setattr(Qt, name, _new_module(name))
 
 
+def _misplaced_destinations(dsts):
+    """Normalize dsts of _misplaced_members to a list of destinations
+
+    Each destination is either a "dest_module.dest_class" string or a
+    ["dest_module.dest_class", _function] list.
+
+    """
+    if isinstance(dsts, str):
+        # A single string is treated as a single item lists
+        return [dsts]
+    elif isinstance(dsts, (list, tuple)) and dsts:
+        if dsts[0] is True:
+            # This is a multi-destination list, remove the tag and process
+            # each item in the list. The items can be str or lists
+            return list(dsts[1:])
+        # This is a single item list, process it as a single item
+        return [dsts]
+    return dsts
+
+
 def _reassign_misplaced_members(binding):
     """Apply misplaced members from `binding` to Qt.py
 
@@ -1915,21 +5942,9 @@ def _reassign_misplaced_members(binding):
         if src == "__extras__":
             # Don't process this key here.
             continue
-        # Normalize dsts to a list of potentially multiple misplaced members
-        if isinstance(dsts, str):
-            # A single string is treated as a single item lists
-            dsts = [dsts]
-        elif isinstance(dsts, (list, tuple)) and dsts:
-            if dsts[0] is True:
-                # This is a multi-destination list, remove the tag and process
-                # each item in the list. The items can be str or lists
-                dsts = dsts[1:]
-            else:
-                # This is a single item list, process it as a single item
-                dsts = [dsts]
 
         # process each misplaced member defined for this source
-        for dst in dsts:
+        for dst in _misplaced_destinations(dsts):
             dst_value = None
 
             src_parts = src.split(".")
@@ -1938,6 +5953,12 @@ def _reassign_misplaced_members(binding):
             if len(src_parts) > 1:
                 src_member = src_parts[1:]
 
+            if not hasattr(Qt, "_" + src_module):
+                # Also for members replaced by a function, such as loadUi
+                # once uic was left out by QT_MODULES
+                _log("Misplaced member has no source module: {0}".format(src))
+                continue
+
             if isinstance(dst, (list, tuple)):
                 dst, dst_value = dst
 
@@ -2050,6 +6071,52 @@ def _build_compatibility_members(binding, decorators=None):
         setattr(Qt.QtCompat, classname, compat_class)
 
 
+# Classes of QtCompat built by their factory on first access, for
+# importing Qt.py to not import the modules they use, such as asyncio
+_lazy_compat_classes = {
+    "ColumnarTableModel": _columnar_table_model,
+    "DataChangedCoalescer": _data_changed_coalescer,
+    "FilterProxyModel": _filter_proxy_model,
+    "LazyTreeModel": _lazy_tree_model,
+    "ThreadPoolExecutor": _thread_pool_executor,
+    "AsyncioEventLoop": _asyncio_event_loop,
+    "StallWatchdog": _stall_watchdog,
+    "SignalProfiler": _signal_profiler,
+    "WidgetProfiler": _widget_profiler,
+    "LeakTracker": _leak_tracker,
+    "ThumbnailLoader": _thumbnail_loader,
+    "PixmapCache": _pixmap_cache,
+}
+
+
+def _compat_getattr(name):
+    """Build the lazy class `name` of QtCompat, see PEP 562"""
+    factory = _lazy_compat_classes.get(name)
+    if factory is None:
+        raise AttributeError("module 'QtCompat' has no attribute %r" % name)
+    cls = factory()
+    setattr(Qt.QtCompat, name, cls)
+    return cls
+
+
+def _compat_dir():
+    return sorted(set(vars(Qt.QtCompat)) | set(_lazy_compat_classes))
+
+
+def _setup_qtcore_compat():
+    """Add the members of QtCompat which only need QtCore, for any binding"""
+    Qt.QtCompat.dataChanged = _data_changed
+    Qt.QtCompat.dataChangedLater = _data_changed_later
+    Qt.QtCompat.updateRows = _update_rows
+    Qt.QtCompat.memoryReport = _memory_report
+    Qt.QtCompat.compileResource = _compile_resource
+    Qt.QtCompat.registerResource = _register_resource
+    Qt.QtCompat.unregisterResource = _unregister_resource
+    Qt.QtCompat.headlessApplication = _headless_application
+    Qt.QtCompat.__getattr__ = _compat_getattr
+    Qt.QtCompat.__dir__ = _compat_dir
+
+
 def _pyside6():
     """Initialise PySide6
 
@@ -2084,9 +6151,7 @@ def _pyside6():
 
     if hasattr(Qt, "_QtCore"):
         Qt.__qt_version__ = Qt._QtCore.qVersion()
-        Qt.QtCompat.dataChanged = lambda self, topleft, bottomright, roles=None: (
-            self.dataChanged.emit(topleft, bottomright, roles or [])
-        )
+        _setup_qtcore_compat()
 
     if hasattr(Qt, "_QtWidgets"):
         Qt.QtCompat.setSectionResizeMode = (
@@ -2152,9 +6217,7 @@ def _pyside2():
 
     if hasattr(Qt, "_QtCore"):
         Qt.__qt_version__ = Qt._QtCore.qVersion()
-        Qt.QtCompat.dataChanged = lambda self, topleft, bottomright, roles=None: (
-            self.dataChanged.emit(topleft, bottomright, roles or [])
-        )
+        _setup_qtcore_compat()
 
     if hasattr(Qt, "_QtWidgets"):
         Qt.QtCompat.setSectionResizeMode = (
@@ -2191,9 +6254,7 @@ def _pyqt6():
     if hasattr(Qt, "_QtCore"):
         Qt.__binding_version__ = Qt._QtCore.PYQT_VERSION_STR
         Qt.__qt_version__ = Qt._QtCore.QT_VERSION_STR
-        Qt.QtCompat.dataChanged = lambda self, topleft, bottomright, roles=None: (
-            self.dataChanged.emit(topleft, bottomright, roles or [])
-        )
+        _setup_qtcore_compat()
 
     if hasattr(Qt, "_QtWidgets"):
         Qt.QtCompat.setSectionResizeMode = (
@@ -2224,9 +6285,7 @@ def _pyqt5():
     if hasattr(Qt, "_QtCore"):
         Qt.__binding_version__ = Qt._QtCore.PYQT_VERSION_STR
         Qt.__qt_version__ = Qt._QtCore.QT_VERSION_STR
-        Qt.QtCompat.dataChanged = lambda self, topleft, bottomright, roles=None: (
-            self.dataChanged.emit(topleft, bottomright, roles or [])
-        )
+        _setup_qtcore_compat()
 
     if hasattr(Qt, "_QtWidgets"):
         Qt.QtCompat.setSectionResizeMode = (
@@ -2314,6 +6373,329 @@ def _convert(lines):
     return parsed
 
 
+def _lint_members():
+    """Return the names Qt.py provides for all bindings
+
+    Used by --lint. This includes the _common_members, the destinations of
+    _misplaced_members that are shared by all bindings and QtCompat.
+
+    """
+    names = {
+        "MissingMember",
+        "QtCompat",
+        "IsPySide",
+        "IsPySide2",
+        "IsPySide6",
+        "IsPyQt4",
+        "IsPyQt5",
+        "IsPyQt6",
+        "__binding__",
+        "__binding_version__",
+        "__qt_version__",
+        "__version__",
+    }
+
+    for module, members in _common_members.items():
+        names.add(module)
+        names.update(module + "." + member for member in members)
+
+    # Misplaced and compatibility members must exist for every binding
+    misplaced = None
+    for members in _misplaced_members.values():
+        found = set()
+        for src, dsts in members.items():
+            if src == "__extras__":
+                continue
+            for dst in _misplaced_destinations(dsts):
+                if isinstance(dst, (list, tuple)):
+                    dst = dst[0]
+                found.add(".".join(dst.split(".")[:2]))
+        misplaced = found if misplaced is None else misplaced & found
+    names.update(misplaced or [])
+
+    compatibility = None
+    for classes in _compatibility_members.values():
+        found = set()
+        for classname, targets in classes.items():
+            found.add("QtCompat." + classname)
+            found.update("QtCompat.%s.%s" % (classname, t) for t in targets)
+        compatibility = found if compatibility is None else compatibility & found
+    names.update(compatibility or [])
+
+    names.update(
+        "QtCompat." + name for name in dir(Qt.QtCompat) if not name.startswith("_")
+    )
+
+    return names
+
+
+def _lint_qt_path(module, vendors=()):
+    """Return the path relative to Qt.py of an imported `module`
+
+    Returns None if `module` isn't Qt.py or one of its submodules. Copies of
+    Qt.py vendored in one of the packages `vendors`, such as "mypackage.vendor"
+    for "mypackage.vendor.Qt", are supported.
+
+    """
+    for package in ("",) + tuple(vendors):
+        prefix = package + ".Qt" if package else "Qt"
+        if module == prefix:
+            return ""
+        if module.startswith(prefix + "."):
+            return module[len(prefix) + 1 :]
+    return None
+
+
+def _lint_check(path, names):
+    """Return an error message if `path` is not provided by Qt.py on all bindings"""
+    parts = path.split(".")
+    if not path or parts[0] not in names:
+        return "Qt.%s is not a common member of Qt.py" % parts[0]
+
+    if parts[0] == "QtCompat":
+        compat_class = "QtCompat." + parts[1] if len(parts) > 1 else ""
+        if compat_class and compat_class not in names:
+            return "%s is not a member of Qt.py" % compat_class
+        compat_classes = set()
+        for classes in _compatibility_members.values():
+            compat_classes.update(classes)
+        if len(parts) > 2 and parts[1] in compat_classes:
+            if ".".join(parts[:3]) not in names:
+                return "%s is not a member of Qt.py" % ".".join(parts[:3])
+        return None
+
+    if len(parts) < 2:
+        return None
+
+    member = ".".join(parts[:2])
+    if member not in names:
+        details = _missing_members.get(parts[0], {}).get(parts[1])
+        msg = "%s is not a common member of Qt.py" % member
+        return "%s: %s" % (msg, details) if details else msg
+
+    if len(parts) > 2 and parts[1] in _common_members.get(parts[0], []):
+        if _is_common_member(".".join(parts[:3])) is False:
+            return "%s is not common to all bindings" % ".".join(parts[:3])
+
+    return None
+
+
+def _lint_source(source, filename, names, vendors=()):
+    """Return the (line, column, message) of each non-common usage of Qt.py
+
+    Arguments:
+        source (str or bytes): Python code to check.
+        filename (str): Name of the file used in syntax errors.
+        names (set): Names returned by _lint_members.
+        vendors (tuple, optional): Packages Qt.py is vendored in.
+
+    """
+    import ast
+
+    try:
+        tree = ast.parse(source, filename)
+    except (SyntaxError, ValueError) as e:
+        return [(getattr(e, "lineno", 0) or 0, 0, "SyntaxError: %s" % e)]
+
+    issues = []
+    # Local names bound to Qt.py or its members, e.g. {"QtCore": "QtCore"}
+    aliases = {}
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                path = _lint_qt_path(alias.name, vendors)
+                if path is None:
+                    continue
+                if alias.asname:
+                    aliases[alias.asname] = path
+                elif alias.name == "Qt" or alias.name.startswith("Qt."):
+                    aliases["Qt"] = ""
+                if path:
+                    issues.append((node, path))
+
+        elif isinstance(node, ast.ImportFrom):
+            path = _lint_qt_path(node.module, vendors) if node.module else None
+            for alias in node.names:
+                if path is None:
+                    # Support `from mypackage.vendor import Qt`, but not the
+                    # Qt namespace of bindings, e.g. `from PySide6.QtCore`
+                    if alias.name == "Qt" and node.module in vendors:
+                        aliases[alias.asname or "Qt"] = ""
+                    continue
+                if alias.name == "*":
+                    continue
+                full = path + "." + alias.name if path else alias.name
+                aliases[alias.asname or alias.name] = full
+                issues.append((node, full))
+
+    # Only check the outermost attribute of chains like QtCore.Qt.AlignLeft
+    inner = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Attribute):
+            inner.add(id(node.value))
+
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Attribute) or id(node) in inner:
+            continue
+        attrs = []
+        value = node
+        while isinstance(value, ast.Attribute):
+            attrs.append(value.attr)
+            value = value.value
+        if not isinstance(value, ast.Name) or value.id not in aliases:
+            continue
+        attrs.append(aliases[value.id])
+        issues.append((node, ".".join(a for a in reversed(attrs) if a)))
+
+    results = set()
+    for node, path in issues:
+        message = _lint_check(path, names)
+        if message:
+            results.add((node.lineno, node.col_offset, message))
+
+    return sorted(results)
+
+
+def _lint_init(names, vendors=()):
+    """Initialize a --lint worker process"""
+    Qt._lint_names = names
+    Qt._lint_vendors = vendors
+
+
+def _lint_file(path, digest=None):
+    """Lint a single file in a --lint worker process
+
+    Arguments:
+        path (str): The file to check.
+        digest (str, optional): The sha1 of the file when it was last
+            checked. The file is not parsed if it didn't change.
+
+    Returns:
+        tuple: The path, the sha1 of its content and the issues found or None
+            if `digest` is still valid.
+
+    """
+    import hashlib
+
+    with open(path, "rb") as f:
+        source = f.read()
+
+    new_digest = hashlib.sha1(source).hexdigest()
+    if new_digest == digest:
+        return path, new_digest, None
+    return (
+        path,
+        new_digest,
+        _lint_source(source, path, Qt._lint_names, Qt._lint_vendors),
+    )
+
+
+def _lint(paths, jobs=None, cache=None, vendors=()):
+    """Report usage of members that are not common to all bindings
+
+    Checks every Python file in `paths` for members of Qt.py used through
+    `from Qt import QtWidgets`, `import Qt` or `from Qt.QtWidgets import ...`
+    that are missing from _common_members, misplaced for some bindings or
+    missing from QtCompat. If the member index is installed, methods and
+    enums of common classes are checked too.
+
+    Arguments:
+        paths (list): Files and directories to check.
+        jobs (int, optional): Number of processes to check files with.
+            Defaults to the number of processors.
+        cache (str, optional): JSON file that stores the results of each file
+            so unchanged files are not checked again.
+        vendors (list, optional): Packages Qt.py is vendored in, such as
+            "mypackage.vendor" for `from mypackage.vendor import Qt`.
+
+    Returns:
+        list: (path, line, column, message) for each issue found.
+
+    """
+    import hashlib
+    from concurrent.futures import ProcessPoolExecutor
+
+    vendors = tuple(vendors or ())
+    files = []
+    for path in paths:
+        if os.path.isfile(path):
+            files.append(os.path.abspath(path))
+            continue
+        for root, dirs, filenames in os.walk(path):
+            dirs[:] = sorted(
+                d for d in dirs if not d.startswith(".") and d != "__pycache__"
+            )
+            files.extend(
+                os.path.abspath(os.path.join(root, f))
+                for f in sorted(filenames)
+                if f.endswith(".py")
+            )
+
+    names = _lint_members()
+
+    # Results of unchanged files are reused as long as Qt.py's members are the
+    # same as when they were checked.
+    fingerprint = hashlib.sha1(
+        "\n".join(
+            [__version__, str(_load_member_index() is not None)]
+            + sorted(vendors)
+            + sorted(names)
+        ).encode("utf-8")
+    ).hexdigest()
+    entries = {}
+    if cache and os.path.exists(cache):
+        try:
+            with open(cache) as f:
+                data = json.load(f)
+        except ValueError:
+            data = {}
+        if data.get("fingerprint") == fingerprint:
+            entries = data.get("files", {})
+
+    results = {}
+    todo = []
+    for path in files:
+        stat = os.stat(path)
+        entry = entries.get(path)
+        if (
+            entry
+            and entry["mtime"] == stat.st_mtime_ns
+            and entry["size"] == stat.st_size
+        ):
+            results[path] = entry
+        else:
+            todo.append((path, entry["sha1"] if entry else None))
+            results[path] = {"mtime": stat.st_mtime_ns, "size": stat.st_size}
+
+    def store(path, digest, issues):
+        results[path]["sha1"] = digest
+        if issues is None:
+            issues = entries[path]["issues"]
+        results[path]["issues"] = [list(issue) for issue in issues]
+
+    if jobs == 1 or len(todo) < 2:
+        _lint_init(names, vendors)
+        for path, digest in todo:
+            store(*_lint_file(path, digest))
+    else:
+        with ProcessPoolExecutor(
+            jobs, initializer=_lint_init, initargs=(names, vendors)
+        ) as pool:
+            for result in pool.map(_lint_file, *zip(*todo), chunksize=16):
+                store(*result)
+
+    if cache:
+        with open(cache, "w") as f:
+            json.dump({"fingerprint": fingerprint, "files": results}, f)
+
+    return [
+        (path, line, column, message)
+        for path in files
+        for line, column, message in results[path]["issues"]
+    ]
+
+
 def _cli(args):
     """Qt.py command-line interface"""
     import argparse
@@ -2332,6 +6714,28 @@ def _cli(args):
     parser.add_argument(
         "--stdin", help="Read from stdin instead of file", action="store_true"
     )
+    parser.add_argument(
+        "--lint",
+        nargs="+",
+        metavar="PATH",
+        help="Report members used by Python files that are not common to all "
+        "bindings, e.g. --lint src tests.py",
+    )
+    parser.add_argument("--jobs", type=int, help="Number of processes used by --lint")
+    parser.add_argument(
+        "--lint-cache",
+        default=".qtpy_lint_cache.json",
+        help="File storing --lint results of unchanged files. "
+        "Pass an empty string to disable it.",
+    )
+    parser.add_argument(
+        "--lint-vendor",
+        action="append",
+        default=[],
+        metavar="PACKAGE",
+        help="Package Qt.py is vendored in, checked by --lint too, "
+        "e.g. --lint-vendor mypackage.vendor",
+    )
 
     args = parser.parse_args(args)
 
@@ -2344,6 +6748,12 @@ def _cli(args):
     if args.compile:
         raise NotImplementedError("--compile")
 
+    if args.lint:
+        issues = _lint(args.lint, args.jobs, args.lint_cache, args.lint_vendor)
+        for path, line, column, message in issues:
+            sys.stdout.write("%s:%d:%d: %s\n" % (path, line, column + 1, message))
+        return 1 if issues else 0
+
     if args.convert:
         sys.stdout.write(
             "#\n"
@@ -2452,6 +6862,14 @@ def _install():
     # Allow site-level customization of the available modules.
     _apply_site_config()
 
+    # Allow limiting the modules imported per process, e.g. by jobs that
+    # don't show any widgets.
+    modules = [m for m in QT_MODULES.split(os.pathsep) if m]
+    if modules:
+        for name in list(_common_members):
+            if name not in modules:
+                _common_members.pop(name)
+
     found_binding = False
     for name in order:
         _log("Trying %s" % name)
@@ -2499,7 +6917,11 @@ def _install():
 
     # Install missing member placeholders
     for name, members in _missing_members.items():
-        our_submodule = getattr(Qt, name)
+        try:
+            our_submodule = getattr(Qt, name)
+        except AttributeError:
+            # The module was not set up, e.g. removed by QtSiteConfig
+            continue
 
         for member in members:
             # If the submodule already has this member installed,
@@ -2543,10 +6965,11 @@ such as `QHeaderView.setSectionResizeMode`.
 
 Qt.QtCompat._cli = _cli
 Qt.QtCompat._convert = _convert
+Qt.QtCompat.isCommonMember = _is_common_member
 
 # Enable command-line interface
 if __name__ == "__main__":
-    _cli(sys.argv[1:])
+    sys.exit(_cli(sys.argv[1:]))
 
 
 # The MIT License (MIT)
@@ -0,0 +1,1685 @@
+"""Method and enum level members common to all Qt bindings
+
+Generated by `python membership.py --generate-common-members` from:
+    PyQt6-6.11.0_py-3.11.7
+    PySide6-6.12.0_py-3.11.7
+
+`members` is zlib compressed and base85 encoded text, with a line for each
+class common to all bindings, such as
+"QtWidgets.QHeaderView<QtWidgets.QAbstractItemView setSectionResizeMode ...".
+Each line holds the class, the base class it inherits the rest of its common
+members from after a "<", if any, and its own common methods and enums,
+separated by spaces.
+
+"""
+
+members = b"""
+c-ri}S#ujXvM~C7eg%I4qwVhLnG<ndwAyNGvq;&~^U?vaAhKG;0=pJT^soPN1CT&fQJQn--iR;aM%W^
+90SY@3iA3UScU<+hbFSOWzlPxKsOyeaE8Dgwu5P==lyx_Tn<K98Hn#4{mFY@X-`T(Vva!V>Zr7AQ-o<
+=YubTZX;au2N-;~`x1m@}YQ+)VRM8`BEjso_-zK+(#QBgFIv)QV$rkR!PbzfDp&Mms8tk)2@zo@%kf0
+>AUYM;xMJuTand$!H~Xbn02pRe7CYwY~%&BLE|)y)F+%0iBd9G;(4rftjB1ohIroYl5j``Bkq;~M@uz
+o>V8chh(9H$^|2sw`9q&91YJX1R1+oeSGw0hWDJ+v4W&QS)4tkga-sYnv^Gpyf36+G*(4z1U`u!hQWz
+yO%mewf%1An$8w^y$l#`E7Lu?X3Ozcre4_!x=4}Kc|hFn3ezDJ2;4aB%u;;%d$WR`fN=<tHhwJYvfTi
+(Y>!r5`D|yEuk?_|Wx2Jk?`Ey-E~kl|Y4ESx&8AA(9_&aL^`o0%=YetZSg!kqJNE!HKQ^tsgW|r2H{^
+H7d|ukB;J@=LQ}>T%)xk(<PEBV7eYaR#NKiTp5wFajuHj5m{~aJ;d={nqRu<MVcF1w!w$O8JGe!SwP3
+3E5NWIvaHMHIo8G0{tm&(-8GVK)8we4P9^E5?<u3zppwlUQt$Hvuminw(9Dbjrn<Ik>f{__2F$n+g1B
+=b;(^vl{cu~wzpN09Rqvt7BSu+0>iQRCE4W~-`ojN`MZi}t*+_8^lr#SUv{B9EWT^OA6f61jAJ(eA8y
+nkvdwxoRAJW}JQtV-TzG%`Yu%w{*K>_c~5a+H2Ue$D({&P2`z_W()o55CaTUn8fN8&QQ~AFum+5vp=e
+fH|vUmSFSEQH^JdM9JU=ybh>nYtg2p@pysExeS(S4Bga^<-)vwa0cg8`K=m%>13Z_ot{wg)PFc1&#F4
+b@Ax2+0DG$$4s#X+2Ca~kmx#AXO447Jz`XBP*+$v2v#qz1@SFW|NoY=`^Zu_dWH?OcP9bj5?7V56A53
+np@^4q$DseHHPdebddrm{npq;k{g99d-wSGA`xG{ajxP=?f`u7>1WSl>h5hh)fgU5}EJjAttiGAFBx%
+Ks3bCY8`RimX8@5smRn)Hz6{vi?ppT{=^o!xHYAbChD<!{_?uJ$yIyyOLX!ukT@7Zea0v7vqbYX1jJt
+g~Y{LRb__6rLVYy+081-IOl1(E<0$lW{HEody5@bO}jJ2TWr6%eG6Ner?>dN*!_cpyuO$3dkKTyL1z#
+B^sSix9`~KyI+Ql+u5r~{%nMt$?@l=x9s_1v*>!UUczy!IsILs8hE%uRy85CmYTkEFaWzFXNnLC~nja
+^nnI2{Nj@#KQSJ>@M^UXm;e1aG+X0NzGK2&A%5Q>db(UqT@H0>1dLoD{cA@<HaxNeC4W;f-k%K4K*0h
+Y;O*^4<%P-(O=ku_!a&?kg!dx+(;tzhXn#POS1Jssw_g=xMy#PGc-+wQyRR-2hjCtOku@LtBxHVNefM
+35eLk)u@H&ox`U(@yC!lTAfu1;Vm1bqliKD9f#DOH6($i91`vWH&`!!iE~9=e?&IuMEkziml&e_a*L=
+Pt1xp%->McFx%$4!EL^o)QF1$7_dcjj2b&|)3zmSv11OQgS2YbDPc@Nf|wr!I>`}+hItRdEM*^{!Dbh
+5*O&wNz2i)Di{!%|qz_JP;y=5#qb<Cz##)l}IwtwbM08Zj$WAlYA^orQGN#1FpH#|Vj&YI-fjI`C_G<
+Vl4v&=Jl^KUAm*uwXKy0c}r?*e}qM~RfdGo(Pp$9XnAzh#+WZ-?hV}!3|Q&nEov*Mgb-4FNL6OY!)Ba
+ccILmOWsKCtLe&$2P~T6K78*d1r++^dfS#t0zX?XaXb^{laf^%e>)rG+lwD`cV@@Sf#R517#V{XbXON
+gqF|8jz9pcXkbPBeK0;sdwAB&aGS}I=c#XDx><hjcIRTYC?gV8-m7Z*<RuoaW<P(6oQH4b%e3DFA)Uj
+wHq)&O|$y<yfSN^FKiPBB0{Jgkl=E^vpg}3eU65|O6@?){Tu3F>}3fwM=3vGG8(L5<<=<je?}AhAJ*~
+)EiJ3lqcT?N=6|D&ZAkdkO_%C_an8<II-I7@%L+GtN-Nt3?BN!qN&KjT3_ZYB|Dw?0IedkdTvPeZern
+ql2(GYU!S0(dhm?W$u|&aWnzeB+t^L%vem9_<R3&t!vsdVZG%epZRYE^?t9}a{wBF^!i`5W!3G-PGvJ
+onh6@Ktx*g=CByw~g*{mm-ylghIxEAvoRc)Bw}r}Z9J_7R#-9f$P@Icp%*h^U!gx=ZXuBOH+V=MvSVB
+eXk<Dpb@$Rd$+Ai^I%ULI}(+Kd#Jfh`xJV!Nz2Wmmw4g#(yt{Xl?6E86+{3!rXQTds7U?xjL*-yFt?g
+l$7DBueuUac!erxBmpl8;-GtuT|=fxTnB4g`9YYpsg~QkST<-qL5ZxDwt^DrNN7^u_PWR@hh?Ac7GvM
+?STEWw24B=--K=%Eod~Va*IA`ZO&Sy}%<~sFl3B*{yr{w?2VJ}F-1T)aq)tu9nn(5xBLp|~(VLxRX?R
+HD$&&;>T(3v+<g0Nq)6#*bK0YZRFcXg=6`mjCXNG9ZpGa64!Ao<Kq|s<W+8C0g$d}GN^}8V%cD?B*%>
+xP(f?S5pViYrrAakBKZtLlVmP8AeohOejmKAOj{8C2%b#DrhM6<I|(7`Z~F~HQu!e)|I<WxR_jz2}=l
+B<a%;J6tB$aT>U*a^Wh7IP?}dSX=Jhzw(jh9~ehuxGQlV=q^f+7LBAvW<HvSD!)r=<ta25``AplDvoe
+ez$v@8}*m%##O~A&w4ytm2F^?N}7`W#pyd(j!Te6+ows+OZyBn@e~!tYWXNe6JBqJD!<7HvTYe7*XG}
+=(*ge*wd(l~*XwR)8W3^5mvwOp`#%=)-(Xxox1UN46+j@Yj!}<IgQp%%x$@^WOGvR8XYByqPc}w!`g3
+j#svO?ryRrs<P@)^<b;Tane$o9LN;TztN4luI1tCuCL&mvW=k?CC@3^x#wZFy6yOYDbSFUgE8)=>_P7
+V|psBaYV1ZUB@L&<QIykAwg{9+G(YusqwLwQncZ)HxgezSN4GRAefSi&9*Cf!k@fgJ*f={&n$)T`;Q0
+js@vJT9AVGffVI@(9&&?V+@$>h#p?-yq*Sez$gXs*9@#NVR=X#EfzVQE!y`GTDx2m3^M<?q^#NH2rcq
+Mt=na7VYETejTHqo9?)8>UYkaIrrh2^So@fFEH8NLD5lElr8i)XWLEH4W1VM%hfjK5kELu+E1iU9;NW
+P^nq~@POc9Qfgu+TL;E_;+_xPc6^>CqU!1-*gn>mV=|?$W?s{Jxhw6Ltqn`1~ydI_>t}5W`E}%Uo62X
+J{QA)WxDVtTlWdoDZw))&}%L2DnBeaXNv$GE$e){{*AAkDwrw_36>?;E;us;DQBFG##4UsBfECD=}-`
+b+Yy6PVv{j&EK@6v8*7c<4$GzR!4N_2VsR<m4QALzVZ12RsV9$Tc;$LZmXZsu3qqXR<Am08yofK!XB#
+AH&Q?Y!z=Pw_0a+kZTLC*#i(jPbYx3pzapphuV6ev8_X?H1>XB6Q|a_SnIxp`XpD5QPfR>bl=P*k=0E
+*XFrgPgcsceIYS-j24fb!xkuNe{X@EEMVHVqL$BQMSG@E#`<<#>c7QvUKG(+PzlXs{{2DU*WOeU<MPl
+j^4o4wI*-ur4oX#bZ%S2nrmP=LHQIXE8GLOXSV&o;7VN|i4%Is=bJsgY*0d<elq<6vC$^|GIM{vffZ=
+U1k+~MO>n3{c;^eI)&{D|{5Zu?emnkl&8I;#X$#07G3joZU1I;UJr$w=ad+gq~W-hP=Fm&!3*<BB}gQ
+MML;WbKrWc!`-LFW4!kG9_C-?yFJjt|&3Rv|@xW6UVdDP;y(O1)Dw!=Z45N+OtrrsxaTH{;7AQrU$5t
+-csJS=%$gf+k6@QJErRp+;#<Z{OVFd#1^ia{1!kTWhbh*_zzH-+!BwuvA}~R-W9qZ%+`&Gx?QoHy<a&
+#P0^eZ%T6CC*?q<ywOROedmD%0vqFGQ^Nco_iNOrQ*fR}JzB3D3rjW*ewe=xGoQV7Bu~IfwnIVFwukv
+~HS{N9?@1pUL7yJv%ya^mMoBMIWD(Bl=dy7%oyt{W68CRM(2esB_GMG9)l!qkfEsLSQ}MDFme8E-4f4
+Vt1iiN+<ZR$@$DkvtJ6ur0sTk>eHGo&fGQ{($+vTVtM;+HT!<=k$p7R`m+rE|Cc~d-p@HNVVd!2&}S{
+a*hltupGF3-wE2GikUin;>Kp`0RpGM6_GF!LlBKBr7^i#(&t)d0~RbpzCKnHBlIC{J!HGel>}-S6rQ^
+S#|A_G{Eba>V@T+aHO!>f0R3-11G{rD@i-8{sRSap%dGLr!5-(AgzlL(Exo{rs419&?i2VOc*-k$5>D
+5RXk;uE@lFf<}h%I7N(*NuNELr9@9XLQWOVV+?fx+eye8O=?4Ww1Q9vNCP%(jk4}t-+Fx!U#u7{lT!I
+kmP>11C#fWFzz+Sy6f`vs_~JD_zabg2fP~%eqUGlp2Z}z^O_b8ZM9ua^?PLk%t_1Ax2c)sJWXSdDdJM
+N%jAMD77@^r3R*e<!^QOt+@PCqnuCPr}&&$es!`VruLyaIT!9sR~gAG*2>QnmUkns8Bj@oUMg4?$d!s
++cOa(r4q!o;LN*Y+Oq=EXFLDpf4i$Jk^|L=z+s6DqTs7{zjfY?5&FX_EALF-ppABaN}hK7B~)x3YVFG
+%IhK{w}V`u_RZ5j{45wIA0w#s|^|%O)=(!^Z;YKbEIM);Se<_>#>IP=IUgzuUFF)ycGd0J!H5%y5{kC
+Po^igBR%dCy4$528?j1rsZ?+SwyWEP*uag_Cad}ivIVP!+~b%`L32$_J;IbPy<@D`M<aD`ZC^Xs(z4=
+XGQ&5=Xa77r{h+|b9pScbH$(dE(e?cZ7H^KI-R5Kli1ER>r>QwMW4Jvzdz)u5##7%OT<ZK1CA;Gxy??
+06m0IzKEMeeGFNcXPP!tnWRRg>g+1lJ+j1c>}e$OJmxVW0CS)9U^!gxq01smDnjL{O~pQ)~iBY6X>wY
+a_*TYp5UF(l9?7cVpnDE>C_0lAe}#+Mx?O)Nb6is&lU9e6hzMcfT~)E4cX`|YCqVT0XbAZlB~W$LTr!
+><zf`D1EX6#O87sE!H*x}%155$`UrHDLzNGnga;Q@zC|w;<kPyGA`&k>#MQS5;qFrI{+(lKU#TMx(61
+-neixYs`zjLBm&KvabT_V(?*dc;UY?adYM_B;Exx@Ak#)-mZT&R^()WOt0BS`_{qiuup*b#kzKl{k|z
+tr`L8V5qfu^oa6m%Z~1qSjcx(ImkH;Em@J*9kaa$k=>k?(AHF7|t6HO2g<s4bb=kIjTo%s0q|-+jKS1
+pw2y6kt#Y(`sp1pW*qSjN5&Ftjl<P<sp-Q>aWS&c!+pjT5wWUjqH_1m75I2yp6n<-X?PEArurn=jwRQ
+YC>8hte5#GAV*=6h4-5eaqeSdePRh>LPv(+!2UG<tDXQo%O61QgYgc)MWsj8-b|Y62QErYKGie?__oS
+-)J`dfjb&FVQHK4OB`;KTC4?Ev8F`o`IR}P7L_H2{wHp1msiL^{^U~IM@SY`DZT~!&HTgow8QY7wUJ6
+4K*xSafnlu#KoDY-{D+@$4|jO&j@OInu=PX{0dK`$O%Xa&(#Ds&XCwK4~VH@@dSA?db}8Om_C`nz_eL
+k_EAMk(ApW7Cd3y0&)!SY2JmB7mBww_g$C(ir+@QS8=*KQ-VZW4xokx9-~c0{tv~G^(xJx|ZX4(hW?}
+p@KOrN4Dk7qR0pVc2$V|(Z-V05%Bag@J-YM1!CIuLfoVY;hvOOatVd><ly}EoOHCLCO6xMu?*oP~TZ(
+a6EY}vP6kN^F-GR|Xk7dO5C)eLICQ7uF>7b8ewk=vIiS&hsZtjtC_!swl{C?^fuo350pp)g|AP8ZG;%
+fuw3CjVqv>F_geE+{cJEhcyk$P~1s`^3r?=W0TYtP9AlM%d`oPjh|3^uL?yrI-Atu0t-K${pn~GRPO?
+W{Co_lfF3i4=_=&N4R2@Pb3o=rjqb8Rf5d#=V)3oISECsq$t48s@djOZo1$=8>MjX&NiQFqfH%Nh3B$
+I$iE|IMs!`!lc)x$VM8bp!7?nG3<SAtgyzsLT*&E0G6Ve>Tn*YiLt)Z*%Q(d*ckOg@E6~UEbKa?i2-W
+!Y)-tUz5z*2DAS$_FGq@+mBXc;>&{V;LFinzhG0nr{QfmbUO|HVy!c*i0+Ikhp04r6NAHd{&C$INGP5
+F5Y{W@g4al0DXTYt;QPh>b(g}L;<{M>W&fRoj#JHji~IOqnmlC3O>rMyi`!8w7jJ+$=#Cixw1@>7N{*
+6tE=FlGs%`LS6&y_iN3=djNtjErp>p0}oNt)RSyN+6&5ijTK0o!jYf7z7bT7WgZ50ip;Q3n3q^@VlUJ
+A$v_Kx(bs<w_&p#W(_)S+p}sw->e|@LKAM{bA~7u?mxIp{$lp%(mCr~XR1@5iJnc9)E5{NKhj5&q(M8
+MJwq%!|3W`6LwO$4YuIte1I#f?cMNjL)6Be>CrdsIP*VgGu<YHh4PHy9G@-*n&Z|nH<kmS6P<==q$eM
+nKH}4#34T-A_7jEg}0kQ?bB<8>bgf<=J*5Ae*eub(KnC^G#wkoHX!R-u7bH5wZ%|&OoWM4bj<!tQgiO
+iC2c4CN?BIc(KcIo%6y`}qBLpp^oWCRbW9P6T$Wove6_E7oU2R`E&S&o>0#w~`UGfLNV<2={y?R37OP
+_|O3JU~s=7qF}}Pz6=Lg^6FG?%a#OSI`Iv10o{%j#?>UV3cMN4Nf(C=!;^H4iipcJAMUiL{l)p=N5YD
+6*L7-kC0~&zFNAdD#re!SW*P7LLIaJ1#DYRmGZ;`ki+efbal&xq-{e=z`_l&T%v%_V<(XUFYPZlV+H1
+?5L*<QXkf`GxbTIp3E0ScyseA0bpnEF79ia+0(w%~DghD6p+z1;#Xr)`*Nth>s14-)8pE9b4Y`k_Y{g
+*k4?`@a%4-6&0>QUq2#~&+D(b1Bs(q@J>cFTFLT6Q5UriXmHLoRQVWrv$4`2!BgT5AKx<aHbW}!~D=o
+NsH-i>szM%88lv;tvTO{`(G!ec#64bwTM+F0Ba(GCp78(?uS+%xeYXxJ?iEO)O2<vST7lSq-*v*4;Ei
+t5j?88L&t1={kVq75CnhS?cdy!r>ceH9%#H)eh0{lY{fZ1xyAm|(Hm(g}7j^$y|;XZkwF4C352?sfmh
+hoJN9==wPy)c~}x6)&I@=%tIu5T^Uy7~(|R@o>D~o#uu-D!#i$yog2zg#R-s!J%}i03SN)Vpyg>_VZ2
+)(PNCk!!g3*|02L0teyc1xg%pLUT;g~u|_)rCkd1Uj93%LWp~sx283i-d(beMGev)a2Gb|z^bzf8AE8
+-}k)>?UwmUo<Vh{B&uJB|GS^^_*m_B7&!uT^V2&~tYB~;UsufCX#;G8CG?`LQu(AT2v=i4GVW-h0nBL
+vZRpfW0>v6Hp|Hs+;&d{mNIaH8=*cwRNIunfvTj<NTh<r+l~HNXCHifc+dc^*T~FRIF}O%=8k2f64{v
+M9h0@!di<#Q9^C=jKW9B2Z~yeuNGrZt655ZTZ`jk%9ZBI;)u}CEvhowQOK7iqZe-4eUvAXfqG21TeeL
+4D1`~VutSytZVFqE3-2zJOf;9a1*hSjRp5gx5W$faZk*>vyg?k#htnIRlH=%J(j+vf+4Sn`V4C%{zA9
+IOHY9&gHpz#>hW}E*7y9frAx7XYk1#1{sUG>_%QytkR&Sm*wLTg`W8>Ga21uq6Z1-E%JBOK4Vx|M+#u
+m44uTptBMF2=ybpt`A?B8v2EDyCmMU@Ax0^p6U^B-dC|B)Q$>2ms0(1#i!gyzJhDp#T8aAe))v}?8l(
+mLT_vvpe2Rae#w=m?lyGk%L`YUpfgMR@7B$yTc>aG1D(-F55&k;`Ar*o&SN8MoO&MRkd*1)#u984YX_
+tMd+I{t(pHbm$0mh0SNgDWP_I`|_I?p5Ubz(eiVH6>a!jZ8~^FkkU@jr+w#4I56hO|5wgNx=~3#6a^F
+&|CTDj{M9&HRPET?dlkD(N<<#u1?D5vhuj!Oa&b&Kz*h7ugc2QPY$M{*?rya?22prcNiE~(9oMxoW$7
+`QDuE5S{xh}N8K$}JVES<%9}fc8}ASTp@ou?FeZ)CCjS1*HV*nZUY_^r+*l$Q7S`;3=T}QE``Z7O3s+
+J27DcQbYF^5gaU?q8DL~)smku)k-}DD<rz$IgBEaWK&fgL?{LA(Snp3<ZLec5yK=$`gGnK3DRfrRDm=
+j2surDz@XkE2V@ft)6R1DGy@l9Rra~z)&n-~Xe5Cf#XgU-g|S0Vu>XI8(S@RG=j9d7V%VIZHOZxF=cq
+O^3d1#Q;C1*DrtGzVkwlW88%PAx`}g@Z5MC8!0CaJd?$&<c@z{S)l7pBMeTJ49deeMZRLskJ-7ITi1|
+wy!%n**S*o+LK2r)w9OLTqx&Gg!FIcB$fAt;^3xArXK$3n`(Akt{-XgIk{P!{UPu7B*0G$U71w~2nzM
+cG4x^P-AqWqVXj7>i8Gp~Y=Ie>o%upS20r|nfRL>e#O&dIR161a*LYhA1U$$xEDAHelN&(33Ew~xcu+
+(pR6yW6Q}=cGiW&Q(o1rVdd##PcY^k<Bhb7zoF{8B(FS`8!kqi4+);5dMK{IXHoB50j%*#7<(Hy}YQR
+-z#<fDZg4FU^giCyN9e8r|7`_5M}JJ;Y<gq=xHTZ-$1>QRAS(IXedcQd(|&2@@<MD*3n8s%6Wd`r*Bm
+zMUm(_e<pM@I=hHri8=!b3zC5?N3?zk}&YG@s%-Mcn9F+?$?wMx1%k%oAmKDsR~yJBLC?6fw&-vcu%e
+WiMN5H~gg%%P;h>vh|rOgRTqbZj?r7SOA2z0pd+o6+z%p)d2t(zihEm;4gF$l!<&Fp>SF$UWtwZ61Oz
+e&a;iB5YY(zsLt4VQlQBRE8cUgVigENvLcY0aR^fvM<i#$COwT93FGWpLTPM8NcbS%tc|vvau^7r4mO
+_>bbO`2G!<(VWRk4T@X%mnxY0t=1Ob|UsF64rTOstWg0qfFDQINn%8<^GiAKRI6Lqtsb)vm~*buS08M
+-$eYXNz-a~135S)f#tgR96P2T1j;rQ00PsYtjNNgncOXox2uYD2$R=-y;vcMC#U*Yn<&PU%rB-r|)Az
+kZ%%siPWY5Y?LxS`k}g0`fI6z)5rNv*I(HF_9JfB~-KQqsZq1{=w^Xg(X$SXIt$U$C+Z*_UI9tkMJao
+GJ4VNt56SgsvJ-L=m><=fi-EXs0AZq4kz|jQUk${9&xbjgL3$@2gk~Gi~YHo$<jl;RE1^6));MytxM}
+YN0{oUS(BGo7J=TuGp9@(wZi)EL>VE&a#*h`durOvch?l07-eOO;1i>sN(M=>&Du9(;kLu`!oa~EAsq
+&wJVY$ROe6LiszF`tW9(pWB|dIcGt+`IR%kj3#${`^feb8pZCSu1<tQSnKzZ`ojYOA2BNAB0zYLW3G&
+kz(rs}`lxEC5Q81Ppq>f-DbH<5sn8kqGg``xIVvkeISZB;j>9UX3;N!i!FOE-zOO-hqEP*n!?BTsk}8
+ptFU9ekkue|^^ge^uM$=V)@K__Z&oH(izwjcN9<f!!p1scdo-?iz9&O&$uqEej3$hBBf5(2<a;0ezfl
+(__(@eYGq2Q@(YqSygnmg%_E4(Ai=UVYYu_v*CjKIY_!78@LzLz{H}%Y{~|{u2~y@mEqLknP-Ax-=(h
+QBi!r=^)IYaQKzU{ojNRKJd6*RNWvj3qEu<TxBggREv(%9aSSD~(=q8S<d25Uk$W@F&ZB9S)OCYHdRQ
++R)_*Urb+W?O)vgYSQ9B%S(n+~hSH|s@TQ_F6DOaCiqL>|3sBY*s+ZdW3SLVrneE8$TuRo1o(GT7b`}
+0438NvST!^Z)({o}*Oe~e*AzSjQn@#8OJ*dz~M>}qA6GFFcq<4iLv$TY84#V-l;Hw7&==0ggmpGHLTS
+wN(p1O$H0?`BMBgblU{{t;a?%exJ$b@}I8X<z)wR2!Qwk)beE7H9_=cXIKLBKHlwAQ?h)*yX|=5;ac|
+cUg8_Wd%(e9=bza*62)lMV8hRXxTHq$;N9|Wb=2)f<|3JY{gE77HrBC(OyF%DAfMa<(#wEm9>Qp1e)&
+8O^JiZk6ihkf9?MG@W)RY{Fs9uH28B${W+)ptifMW=3oB!n1UJeFDdx96#P|#e@j#TTbd03KW6aHDV&
+jiNx|e(zowu1^^XrZ{2_(2*neji+B6p%Ht8|cY!9I?;-ONRaL6v}alGfz<`K7leizA>cd`}4An(;N#5
+czz^z%m_`t=td`UeHRs_mzQ<yaixZw3{!4EQ@y`Ia?)=RSVuK7Q$5KGj<9R0wVJ@q9s-8&ASQwIuHGC
+kA0m4!0qGS$ZmW;qDeL63Hi+{aJX)n2;)yLsXk=VaU}<VXjXKazT9%3hIMUP#^pUhkT`KfNGTyzFG<L
+`6WQdyH_8)S6{qWpQOswlc41(c2CkjYr8RoTI|-Vi--;N<cZe)=8;t06Z(4$E*)<AZyxc808hL4V8KI
+@^|j^n6J@?=edPWRrQHf2H4~@VxtL;juN<}KqDtOFVo6!al8l<T<Tuw_SMgQPG31<mA@YX#0K>6;M2n
+dN9FW0^Zh)F+(%VgQF6cy{DaLv3EL-c1(<+kpmhM1?Ba>tr>znTmg%EqnRWKdY>0Yw1tE{_t%%Iz7dr
+J@BcPo#gq+o$t*|VKn1^r}(Eu{Zphr*td$D-aeg7RuYU;UJsymPe>5z=*}62<KnW>1iz&)GpvQ54Ohb
+VC+z2}&CIon84b`F;zA5%lNI?v%eSLQ#y)v-`l&!$Sj;ov^v!UKPT5COenr5e7-l5N-~KEOL-P>F$>&
+aRkBST$QzDYmakBW=wSL0q3R+o(qh<;+ndLv@NVyoJ<HX8AQ6X*Imi)xA@2d8_)=GESmWxJ$}Ferh7Y
+rx=T{xJ1r@Kip93m!D3~pb)c|8l^e41Ge5%H8PMSc)cQc{k(%MO0YZS{V@4i>``tihO`eBfzs(1)0$;
+mR*Cjv#FZNsXR}m5m*J1>gLt=r#4H;BBk}lB)DEmAiBq*8_0)`cgSp0}%rRNbk!Hmc|Y*n)6_87862o
+SYJgs?Hp1I=DG>H-A80M0$8S#1bfncAUoO~p_F|6t39im940Z2u%3QGSV1l>A6Y!7YT>#P+C8q(zt@4
+!y$P7HvKF^K1@HvkmXI7pR3dbj@_*wwC@7XW1S}zEw~t-pE7UUGfvP3JUX`gLcNJ;lih8TeQsbsf%&s
+6O;)4?l2OnZMmge9X^k9<c_rl>^QZN4~7~~Y&q`mX_OYo6`n@$qm^6yShM9+Fn{=mqPC%NaIE?aM^kw
+c*u;{XpN8}qWfO-D&#O8SQqy}2Mfzo{uPy(fNS(`@LyzK%&T>9{fV#W}VD>`Q0gR%GMo~gr^bdSj0QQ
+xZI|G@{V}LqQ=pOzkt@eM;Jug;O%+kI_lMH`Po2>@N4nO3Mb7~rJX2`K(k5)7ByztomC_$Xq(KN{Z8&
+U0LBj5a_Z#%d3CzE&^BZOg`tgMI7!Da~e52XS^S{L;ho~=b1%;nC9Z~9KBj$rZuK<IBEs6PX6mN;V4^
+uP9|NWrE{U^H@%@FLX8MXjSI@sda}1|CfqIi*cXmX#|hRaz#3Lfz%%OG*cTZW{*Eujm$HF!@r}G>l2p
+k5%A7Ukd_<iXb@FMN;!=y{EOF)cGRqhs%>=>8E&O3iB?V*RK5m1hRMtjlR0RK(P}0FLimmf7Whr=7I5
+1I(|JZFw%4rcu{f->@7cR&N0;D?<gOVExJBM3Vx7FV3e-Wx*?9g%IsRXwK6-wdoyeq;zRQ*v)cISnO^
+{jBv-o*mn=dl0%VHLvTA&~wZ{W`MdZahOKMrJo;>R+<ic|166uOh;Cas#GLQ<yBqBx!s9s2}@mI==J9
+IYk6<Ha9|4Qd8Wjf(~pW8wsyhXo4c}w+x;)h9?bLO8e^7>_A7!p7PoFbjOx|>LjFUp*zH^By6w;<Sb{
+<7A9s-DXo(AaZ1K1Zn;=&)PW4Z*kma66)ssv!)gmq%r6%3YN^dW6V>=$tPGy}NR<r@A%hAXV0k8ZSS9
+46;h9Odce;vUTs*k_MJz&2lR52=G<GnR=k+wtThK9o9#}-<b6o_1*wpqK!rb@iv2poY>BcE}b)R4@{>
+4DJrB-!S5T>waZP(XItW_Wf!UjSL>S{$lwe)m~iCIg-(?47n%tsI}fEj?Gp?cw1v_D&P7e>KmVyQ5B|
+NVh@n@Z0*EIQ?P6tXJ7|W4n$_rlrmA;9i*=ome8nedIyoId<Fq`L10qgkfrt}%n2JM{#Hu*x?S8==vP
+>jPG;-@YMFc_Insz+yXp(nq!#pH>-&jAwK8L2q(9+3GLdInEmseR<OE|4y+eHY^+I9b<;eBPhjVlI-u
+RVGYAS`r1RS^IsCHLJ^Un-m>FT|v{$r+VNcYNL`s8~1(jto%VSL$?NeZ^g5ih4yyZvxoPoZ!nG{v{RK
+NGI&ryvKb9E8*!wrFxGds2Wk&q-L`2Mc}dl*$w6M<a3^dcPYuVfR3}sFVj(D&1A-=xKu8uSduIcnN;R
+nZT}GQ?I~%do2K-NDqXHy6Xd;-C6asg$OOuSAx0LrsR&F?@UU-1sYxwh9<}Jnsp-r=I0H+o4kx9fkq~
+;G$CX0$rV{$Y5`AhF)$_o@JX)%2)2z$7)u}92c+jE4w`A1k$!Phr@=J?{(&YoNFENzPCip(-(aHlIJ-
+)TtfP70fy44W>y)kqNCJ_2|S?)ZzPX{4cxpXvHp{Wa=F77pjhVv*Tb~uJr7iL7#VHq_xs_>-{lMHJX$
+vNm;b!-v=1yP|q0;KeQwK>Ks%L+cB*WDEY&*vf}zIDVfcRg6l8K;(Wj(|?P8jVQ$W1PvdP8mR&7<@~q
+#RY~43F4vI0dbL3k&LlKRAwA`00?OkDwnCprCG)fq+mub%dQ$h-`5ZNbN`}aJz+!ZqaEH_M2$3?X3{-
+F#FDa@hMPDeXzA1sR!srr@Ennh@-6`g^83M%7`j&JVBkUnrS`AHjxHQ>+ooG>k3)K-0S07Ba?-&M1hX
+$e)NoBQ@@pu*P-BeWO^H4k@us%$D9feRJINTa70O&7poIHB8VH`Wc6+&&P8uz~iOxY*fudfFZcHy748
+~R|32U*+Irr)?Z;5fGxLejw^IHP{HO#^A8YI%#<THf$#$b*-fxPFqbJLkBNBX-T5re{hjvM%2QzS7o%
+<<7LlEz{646#^SLoBWrBUrNW%kenN-SmTMP?xoGl5)$0Nc4SPSvDa~Ky+&7Xn)8!B9q#|2WX4L27yC7
+J*zrIqc|45AB@mRK;!)~QLmutn*Ej8Q5F*jFHz95bDg(@R(5MKh(|5#UOC0xbZC2);a=(ij%Hwm!Ui6
+sM}k3~AR+S<5t%1RZ8Aucu!BSyo2N=xN|rq^CF*FZ$j7QD+bL?xt=XZnEI2ib*QrA*vvMqO^fkum>sB
+5;Pll~Hk6|qro|GLvx54*$DRU2@lRWg8FG8+J09nWLoRCO%!sGD%LPr)`98nO9{_(MV#Zw)9WRoiAL$
+$D1ANqSyWCt}>Y4GCtG35=9l1nsCP$zd~OIO><R*vh+_BS;CrwjG%wLZAvW}H0bL2V?gS6;}2AWxATd
+O){I0*2GNKjlmEA`5DH!!aQO<ghC}92$;2NBxNYLh0!UCw7ahhnT`=%AXa{EeLKb={a&27nXmR_^B00
+qdGm|v!ew!@JR$aHc!Ikt!qpKTMCgOX+lU7CN=5zagRr6>n;a~e6XaCbbNU4^^@3FblBU?s^c+AC4Ap
+M(IHmIIsVSVhOZt_{bHAA7S|=*0n-GifjM6oN^xh{<Do^!pgW;l+m|6S*nTHiGSg2na!WbIg5*XH32c
+@Lo}(~XvHoV2V>D=MkNl-!2A7VF%?Suz>F_y6L$^W5=?`qFjuSfLkY~@%?dU5*GdVfyy^|dRZp{SsUH
+rxoPJ8BDv%@tUxjP!zYTzzVKCipdpdkrX6_z_1eXB1oP%Ul~H<S*Ob5dC_!t4{;ch7b`e-DS5zfk7=<
+YDH-Lrg>jAERW_=S}UXu6!WDUeui<fU8OjXGd-8AWQL#R##fYCiUi*gy5XM^PPdtRk8}=8R7}{UifF+
+_^z*g{lBoRo3y*&V!M-ZTkruGtBdXPw4;o~%J=`~ffY+sU{~z+2d<bzk}UsxbtF1&Y7@Lx?a`6@=ZQ!
+eDTx>J2eWYSrsFRTCf8Hj;O_+uO~~1SZF46W<lzD~^lMA|j^KVmTujhl5oZ&Ac_1GU<hQ09&&{aYx9A
+XvEMYV>KcQ@AIPw0JVa329#hzNpTZ$$}Q7LLM#<wI_HriQ^d`7uEi&f1&$jJ3n%MW7(3dhPEByvGAq@
+*lUfmgT{GYd0pNYEoUMtuZt31fncp*axZD<}lFeBDX8ObWBp%UJfq^3U;o19<pCI*^B{cH1nr%5|L7x
+Uk+G+IXK~bIAwSq45O&+>w`((3v;<;Arf}QUW@B^`%jEKXNx29ky^y@C{^fej*3b^#2lhUdlolkNno+
+^_Ugk)k8p@`i#N3TprXYENG1xGIalztaDqu=LrFCZ5%IvCw`Y;J>+rX_y_eTe2EukeL-=SDaFo7dP$D
+yf+BB0M}u>8(I5^R610>wxR_A1#IuCLi`R&=c4g2#E3VutJHjAV!$ZRT^4#CD9uoNutip@mc6uc~SUe
+5sUVk(oP=cc|y~0AFypta2m&f~I0q(K8i5DMkqzU3MH<~JiSDt+{2N&3+ToL2m63}XX;3t9oJJ5N8cp
++uYvi5D@FO$E~LB&Hs@I;VyROK-srYL=sQy9G@pInufzAPy!yIG%^L|ypB;v0|;(lV53hT+3cc8~u_D
+=gbJ*wJ*(GlWFsLR`K)T{=^+S5FDhSUHB-CdJ}OcGLMMZ+Q>drYsnchuf|!_MMb`+tB^U`??x@l5EOp
+)zt}W@i}a`%T@|PZmbNNDqwmupD3vwFtJo=7{f<(p{@~LhG;$IE3Yn6MCi+qDm=%+qWm%-K=m2i`V9!
+9+<q1kYmkh3_KG%2BWbb6#UY-<V_%nW)He)SZmS*-l7@KLqL;4&w7iTw<X^&MJA#!9lBfU>J;teh=-0
+<RI$%J31uRtsL##WX&9vN^QEh`8IC3;HD_&<sSWI>wX1kAk`%}!dKhR&ok=h=I1`^NXWz85WX0IP+uO
+Dao53~Kp<ZI`%AUL3g1ZSljF-JSPf*oFX{E+F|9j1evK9Y>VV+a1bbZN=S?;AU)(!u~$hj&AQi*)skb
+P!TSJFJT%UTrCDth4YO&6~A1UU_|8cJh_cdSt&9w3CA2E5Gxj$2AB}C7St1Tm{<zbS+jFtwKHkpHc7{
+Uw?}*Im0mZ!fc(w)`f#fS;1?lEe%3%OAxSkT%kK-jVjl@fs~FxCg=-A0hs|`(bE_h$vRU_|Dd3Dg$Dh
+u=CVb6j~lB>$3u*Ue^?Ml%0E>l9h;5WnpVU3V1$C9WnqeFHwp!b6i&sl&~y3(UYGq=!??SSV68s@E4r
+?Y<4vy{@z_=6vns-|>tL0vHKKpET~-yxjrmbl3M{*_-CWR(*qfC#^%760QJa?Yd@Jz`JnuEfupPE#1p
+8`jbj2R`_+YI$H?7k+7=tm=iGf9_P?5;5nRB&5)TS^A2x~`{l@kycVd*KX!tC*p)SQo>l{tE(?tEu=^
+!AM+Lp4KZyn?pTJs0*Lg#yaTYN*zX=<*-BPFD43)rWR(gYJ3aR<0f7(p4y8sAS#NHBK|Qr(q-*=XZK=
+oiupAQo(w>oa}eHcb?jMYnrDBmv-$yPG70`r+=2HA&iZ8>d?`i`l3e+YxZo_!{}%tye7|S9;z0mdQKV
+s>QSmLP4%fqJMKt;F4<_fMYC81cbn4fG@?hF!wfX_eO;<vc5bStv6=DQG|mo?<)5Vj>ZC=_8*(ubLD<
+A>pbUC=G7{F7eQnz^$1k9gHy{i8;fRWE&+*ATs9b+CNjLdq9gI^AqhWF!&7U?p6Q59es9;Ktn8sR_bp
++G0eZoUyH5flZquR>#s(Jyn)c|bBO{HT%!CI^Gl(sH|$FRXNy+ZDF#y^`<bwYei89j1ctxnOC%%BB7y
+BgnzND%8Uj(iOYqOaFRO?nqAo0OVnNDaBP)h-$}H3RUM0<x6a%HBL)Y4)};HqOZxovBntp7CVEp*qc@
+euH&MkGS8=PNnu6N+~h^Z>}j6^^5soo;Haz@Ws~qnAn%HDIbig+b^zl&vEkp(xW;zg8OE@|B<A3Y1Ax
+rX*#_~UD^jc6I5{Px=l<Sq}fF10C=w<yV`WH#CKM$lb2<;=@ZfAvVVmQlIxq;zE@^ti)4<tf=;|P?Mn
+6iE9j*!WdiQoBuZ7#jWdNv*gMVJv>Q`Zc~`t5=O*P}y;Z0lPaD$AA*$?kyuIr>70JGqt5|VY<*LcL<d
+v%m_pIUC=ok(~wS*td$L+dFc)Av5Ak!&S<5o#BKX3v{$^#>HtEv^Yg{7XNuI<iL3c`slt)y%Ff<9E!1
+_R{3tVzbwH4KBsfbgg=YuludPNG!Vymrl_tDdsO7_c<)UXiB2<jr@DZ{Ebwb+c6+|EBM%Jt~V(j#6K}
+HBYJheG8@NHAJej(u~gbw~&jiPHfj3sETaPyybd`IlHxu`UHq8Abda!m2TOsOxdVhxuhcS)#rY#8tS%
+3;pI;Ey01nr9e1`**3&z;P3qz91+U8oaDfJ>ATmRBS9ZHk@t*-#XS`p^u50nxcKckmDe1D;LJFaHpry
+Fm5^p)+LV+E&a+<7nH48)SUps|yOGnxbeA#<ds?}~``l39-XNgq;IFMA`Ens_*koPMnb)}kPfmt(`7V
+YLD4i=>yn$Rf>6buh3Rn{vQ<xe_wKqR}Q1<I0cAP6s@eX4{FWDXXKQ{1B0OUPoUw?T`hyfpQbijgwIJ
+VrKV0r6rBo%xrt`@zFM;FhL*QAsS#pJg_HmZtuZbgktEkEeASZtWBR^%x<@QCW}&&!u}Xny;bHoSKuq
+-lz!Bt@XsZgguQ~VG+b#X_`Yow)84{IU?NOual8*|AafsSVth1k_y;7oNY^(d{sAL(ii9$h1+IWvf^w
+<k>i`U`=(FkjQbxCHmm7xrUv;f&LrQUWB-7m6Epv<v|X*_z3&z+HtU7KhYBLrHC1e#-|bfQfq$hE?7z
+zGgL!y?>Y!tu)t;4>a#AveoO>ktD67OV_d&*s*0E>oLrjdEk@G3orb`CId*<@RotEpe!;@+9gEH>PCb
+;~ZCe9Ng*%YBQF@KI-EQjD6okU7T6!zLQje8m5DKSC&`yL@MKYDoDm>=j0E218uBnoQECu8bXq1GF_R
+p3(+`{~IPX?jl%O*|sZN+!+W)k@{M9?9YsdJ$|PBLe1L^yH6Q$21)#;C|&vW6M%Q`;kxJ%)LtBHA+$`
+3rgG?L24-ddDyIM(@1ztB;)B7&_M(RK4;~8wloeSV!y@l6ycz;QUyFVkEPKd-iXzi0!+W!Br#yHHA$R
+pUu&>63ANokl}&;`(NDphdBSN`p+FW-z*<8a_va4kNnuKS^FXseAr#~ar=d1&hvUX}PQ$2gPpd#wR0&
+g)w%v&en!3xn!wK3a>-Z=30X85`BS^*crEdznyAtsm^Q4Og@Ycc5)fm{~*g8Qp?#b%UZ_3pZG|NkZS|
+`b7Wj@*T%__-9|7?<sfrPM5Yx2a=TMP<r>a;MfX>sH#Oq1l3RZp7!!|Gg|nl!;v*jwqodFs}>W1RM=L
+{MO-6Fb{JsL^#+ud5{Ov*yQMMLuis{aQ4!QYg|PsqCJ;SPi&Z_dHSx={iP*kdA$hB6q2K#d%q$1!h%`
+hD(0UBVzi>D27i)hi#?X=MxO}RTB9V2^kTz_J@W@Po&vNQ>0+nnI|7er`AtB%o}?0`PBc3r{D>u)zdH
+OZ1fjCn+CRu&k0N48V$afGL2#%8vCN*#_I9&xkSyf0-N&6b*g8uq9;jHbUnJP7rLo0)(;xOvq#u2lo}
+=KAe|`u>b9l>Cw%0nH)BYvk^NIwc73N%P10{rLzH}sG(bsj{LMV)m_Jo5{04iyb64+GA-<T0{@FITe)
+kC$eT^#^_ayaNW1gIbVBhwqp0K}|WcvRCfhPHEP3lCA=u?KqK&m_Qq;c&AB;$k&^;!x>rB;&766RG6K
+J|ND&Jy^WmvqE@ak`aJU+5C>De3=TV56oR1>l5z-x!#f%QOlgAAk?`iwS;*n?nWX3(1#WkD4zp2E@q-
+UxE}?Yw*c+M#J^G)L;^|OQWLtP9yA(^(MuX>rBqM1OdK>$wg=Q61$C_zAy1%0)s}|*;*CUc{)Y+=R*p
+=<g*n$^|Wxf&DPld0Xh!|QhIs3>?@lN;LBcDLC_wiCFu8Bwh9WxI>Bvl>!A=(7+421=4sQvm@8{Lz4!
+ncmX{=Eh1$t|ipfFvzfDkGQk7RYt0kQlFl8!k0p?XhE+y{zWY}Ec48KV@Sk0Mzw>1e5Y}N~#t`=7|Ei
+bC86r}s>mD`w?Ck;QrH#N+fOx+StjCQZ(sH+}^ww@5K`gY~kT41?O#LjEeH~nzCa9y~hGm$d0)bNYZR
+d~HFu{UX%^m^@*De-z^Eu^VeDN$Uazx1^pkJoyxB~|5hVIQoXE4%^|go$)T@`THz{XI4v5CKctd5wOt
+C^a0rCw!=ANVwkDAQq~|y6&yoE?n>Nc`}{d8`xs2FWjtFWwP(N`Lld@QI&O571?SC82G&Ie}JLqhLd#
+Kq#1A8)+XZZt=UvYPpYJ()hXO2?R;x?r9rbIr*Z8jf%8n<ZXE0zQz`AXOqNTz?yg`|!}iJex^4P4OSr
+H9gl%j@eC<Kh)}qFp`O~!BCK-cw4(|eKxmZ-Tb%N2-&t3lIJKZ=7qkGE&=DLK4%R-+ZoK9+ClDP`Ogu
+8B^nzBnUUD75C1IuKZ{e{7EzfGsNxQk>5%Boo%WrGrnUaJ-xm&7QsYU|(21XZRp(4s7$cp9!U32_0U>
+Ly8}-lU&}k<z8(l6Ac)oM|E!PESv)<JE9KGH3YH=7F5y30W>YHk}<7yKF<}{p0ePk*Sw3!TumK>BvIU
+a?-mOFD6|x0kPff)6FH|x`f4M8Gk9;HkT0=dze$zm|q&y!f$k+TEe%}P0G@gr+SqIST9bboz~#CtTYI
+lcc)?4x0}B-qSG3;rLB71>6f<Eu{U~IU6v0vnJSm%y0IyUQmw+cr(0MQ>I4IOpOIw_2<2_k>q&{8L<M
+nKH`B6BSH>lqBSjcZfpi;*;#?!pZ`(*__GTBMd)&Vzb2sbHlUAcQI|t(6eN(8)C3SZMzv;^TW|N%&s=
+d>0A!_fW=YE4-)vnh`!nCZ~?>h)ei6rnH-(YJr+*G?{U-R8oy2?bkerzh2sPVqTBKjD?e{P)KM*j|h2
+VK#>mqj{Ues^R@7vO)HM$1C~!ud|gPXFqwSdXYkCpC4Bm|rYze*O8s@lnwahln4K4^o$hs6P*hmv(Jd
+dySr5S=06n9y)a5OLu^oUu@AEp{ee_OtOGj+LS9Hv;Ds4_cZ_;cybKkUp2;8Q7u1qgkFCWR($=K?vck
+U1Oxh|#qAs=!@eMEygZVyv8(Yz2{FgJlbXo;*WPs|zCf0O^P`Ha*E<{VIfq{mBEy2-g_587Q2`s847G
+7N20lUJ{^t^Mx32cPO`CJ<GX&}Qa~$jNGc4=fQ>53U=h$t(%~5S@zL`yq?aWh#f|>lO?VrjF?RIYK9$
+kiQ%w}5-a3$=zGNdTGbL^%pQWV)!LfO$JM+tFEmD8I+&77EiWl)0gXE+&|RNDjGHpj3wJHwKyIm4k{D
+LI2m(feIfx-LgHP#Jj&czdt0U5<Q)vf~Pp;rm_X_IaWFG1FvEJA=At2eH`tFw4$4$f2+#B{;8y&9Jcb
+hYmid5?07&IMiZqOpdfR>u_E<n`4`8|Fp@lpYsd>0$<}E@137<qOAtF@^P4IU%NqMG;q&wq~gtRWdn^
+?XXW%$ww%vp#5%k=hYl!ccXyBjcD#e8_zh(E9K)*C9Q!<i{X*)W97p=j90@bTpm<-*-fS-O_!|%@VM8
+-WceBlV*O!g^^J&1=7a)NaIhu5rDee+;nxkBf=*m2r-L3KtNgBZ%g^rnz#*oJua=#k1%jLcp;I7QZ;B
+jb<6+KywhK0xulYrg%W(?opsa%G%WoOGPv(Lxc6-*X5dQaH(`ZzJey1Ye#QY%9@SqohCRW~d&Ti~V0Y
+x4lzY*4mq`vO~<%ia#qStDLQWuLxT59arq>SR;qeeR|z!l}!ELT4GP0h$z0Y*aOjLw;^nW9W8_o$Z=N
+(`uezYoFmzQIw<5ggUDZm{QEk=JOWXDJN9heFGbY9NnLk^=FffgWHY4`&~KG>xnWvJ~-PHK*sGzRs**
+!>VKQjsScz%ljrlUuk$2en{UVzHAj0TN`^-hpJIr79%Ot08;(I|L6Z-3kWl71qnD1!GtTE>LZl?gkPd
+R@U@;gZ<h2VKdSAJ&yf*7x3Sb36id(|MQ@Qm32|`dlLU0_}0Sb4DIr1t0GU*L+6fCTHOwtczxQ!Vs9j
+GbDFsv=ek&ht!tv5Ng!K+3Y5?WdwY8^C+-;t--Z+RBJ;eqk`ON$zol=8cWp<d$#Mgwzv1~$du?ck<ep
+?Rd)lB14?)$W(Svumjty1-jHe;baWpjlv0zR5tm_q3u{o!KRWk4?WzwiyeM+?`#)(%Jbt;I^QrM^>o`
+8G4BnGps`1RSF<ms}*)tZb1rhbTe0WX6Uhoylk9?r@Z*hWcZA?N@G`8vC=AEMjwz|M^Lg&PmkcsWpr<
+_ooxquWO~Yra#!;o^nN8ZdL1#oRuw8#CgbFtcpUHeDtFjyw&<~HMQ>$r1M-W)!uc0$68)2DEU3wkl*j
+|ojg6S*$=luPGcD~q(I@4p)OW;Og;I*^D=K>zx<d%bXBF(Pl|$Bp&t!UvNE#O(CXjyMFQC&4Rs18*K!
+r=}{1~0T%#MbB@)LqD{0=-C_2rL2;p<Nv@m|>PRn&VQhty)TzVvO@(hF?(TG#9c2qt9FnA|9(JJZR7#
+IO{s_91|-cgRmHmMb9T8K;?ejVdejBCCP<QT2i!O>o~q#JZ^OTk;~xpD{WC_Wj8O3@e(>^AkBXqbFv`
+1wshTiAWD-<`nO&A!1^obILuxDt#9HE5z&bYkEKaiLSNd1$y$5O0Px8BhVo2*pNql<&Y8V!!LpG9V3j
+2SLatxs)*|~deem(U(<Xg0hvc=2n1r;p3u~6s_5{F?u17$hA`U^`feI@Osd}LRY89E=dQ1m>mc!x?7g
+joThfogIg0I$nMU`a9|?2kNlWsYB8i-%1C>1G^Z!WFY0C0?I38%!oj9_jaqb_p-LSt@^=>T$zu0~HLa
+n3&Z6j{}#k4p)Ug=wj`pWFlyB$Qu(nunBiDe}X2W<-NHG4#>!&!+v>xElJ#p}#TWm;-Lo~-Esl!W07X
+5N{FKjP=%*I$mw|19}UD%-`%?Woz=zm534V82`tSUUC?0>RdY(LW(6e%XmECZOL}UplO%7;Ka5h+}(p
+M=C#a@eUe6SOLfrk4Nx@QjSZXj=?!SX4mv|L0+NdLkc4<v^56gL3ubGUtDodmi!^r=-<k}v_jnMa)`r
+}47q~e#{5uK;93kgd|wZ%FMwCR!UBdLr4L|AMCdw64>4_c^6N@vsUaVQ;R6gx@R{FK?Vz1INit~)aa9
+84t-Z%7e1%=$qh{UCR-t!=5SJ~0{B|M3;@y*?W7W3Ddyfh&q{5sMc1?NdD+Y6te1)7f-8{xV?-A+)f;
+x-I3Pw7FK>jfj4@>9p5OxgMa#$FPzH3PQ(EGOmh9Ax_hb6PMeYx<D&a<xw5ZhGmi8yY4pCKQRP9%^d+
+V%iZ`DcAgUfhYAv}-7us#<*Hj9#*ra-t8gt~l9&1c`ke9n*-{#PC)mE*LFxGaf6HGK$Vrsj6rS5mfMS
+pSe!`tCz<j?{Fsd-dI@z_W<ONSja7|A9p3*UFmxIPH@VY&OEg)kOp{Y_?q(rg}f=sD}5P>CwV_!-~$&
+$7&27P^igtCnACLeqm+A4BA<vM^x@YS{`uq3#}Z3`^45ocWW#y?N<p6EHx6L-R!*A`M2EiuG`)W^;VZ
+ggOc*^(8x_W#Jh(>lAbb^4Lx{HIHWrbP(TNnmp`>5Ym^=wDcHuRLul)9q0H?t_y?XJN!2F%O`B(H@?}
+J<8J<^jiE1mVk!&*dXr&XB)EOG!9JdH8tGCY4K{%Iu4K2{jGG9ZAz{_^^ZhtV4x_asK}H_@l4Amp755
+Bax>zLMgq#kZRVY222tu~~U{sKVy~sP^knJpy^+SG<7V(9KLn+{K!};CTqIHP5=QOmp^%@7%T#zX)$*
+Q1D!Z(Q;|!n?XAU(@$hG0ylfIM~Vn>kRyoL709a*?t2BkZz><^OL>DJJi47gpG_DAf>C)8Ozh@@xHYA
+3FZQ<c@iYN{PQhOUT*Lvun=SS?6tVYVNZ-d%e4h^LdmWXx8F9$PmnFVAUv3PA4n~rk56mw_fKdp)7W(
+ECw7kNgQD3)Js479-*SHA4)@dw}Yio-(tiEHU-TnX>7MKYNK0`1bQF6U>U)9(aSFRQATydq~M`<g__{
+}5wCx)b+(M>4?zm@i7_6Yo~ya<aAz?$|>o}3U33%VKE-t4S@CN^O}xjf~V(TbIpmRC2?O$^Zqh#pUHK
+TA#^8(A3BI$#{VxgiUx&reu0`JGq6^RpQ+KA{HC^;JW6)RVW8$$7vImCA9~tB70jBAa`*^FCo=ey4pB
+dMX$76x9>20uYda4x!K8mLv|Izac<MANYkK4RMfKB1s$}<AzxxH)wfbpP7OlK*MMG)o=Qx<l*-sq#^E
+%@s~b98?zolgVLdk``Hz$#K;eF2+b)ZFYD!KuW!oG=*5rRP@z|J`~ZvXTM3;@&J|4BfD9IAdO0igQw8
+H}=)qP+6@Tsula$#H3@CPs**t=^uca=I?zk<v_r)E4aIa0C&~XiBJxAppZcz`}z<#>)*eEFb?w)o@_L
+LfH1lAUQc2Hgb;4Gsr*ko%R*F^S_D_xC-F3kZb>J=gAr?aqgOT4tY7Z?l=6=@9l_efmnM)=OXq+h>t6
+?Z7=^s&1)j<q<6&*~%w+C<JC=v^X;fj*GMZyb)v7^#Q8$(o`GwGVNSMyZ)?iMz4Y2p>OVaIstA?%Q8h
+=Du>%Dj^l$LwN-mz3ReJ%X;5$`mG<H9D_&B+zBpPS`EIzI$%<f;49Gz&~LVS^`)MOWNM-3g;<1#{)mr
+c@^e5GY|xWD?=5*JBTvgROF<7<@)J!3&aG|_6Jt@f5=8|icF}Kl{9W2fMsSG+r$zc?CGXeC(I)?u=dd
+54vgkF>7{Yw2og=FDsxuX(#6^}Lu*8}BYhSLO&~>qFq`3I92WNd;S*)cB5ugW}5O^x9iXYF~#?8Du_C
+v31iSJ(;qA}?GDa*hJ+s?+WY>6%*Wd_!HZt>EF|IvG_;7!=O1C_VTFys?%xk3F?RqRBb@{R9Llq;o*=
+s4flGv#rpE<RwwYb_oca(86~+y5LUlLL8}P8$%IKKv9yA42G33|)rc&pz~<t*ZSoUhm2ge_Y*t7(<5i
+zLeb;SiuCkbX8UE+%AW8GIXbAi?*UK9(C>dbxedI9p$F6PKPz^w#4;pb+b4w*NeX4Fx_EBuXO}{F4r4
+&K*I2q`xBpblrYYwFn$TrT;HH!dH`+~)DQV*E?@QF#m&M8DUt`4&oL~bt_SH6kVy3t(aqwYXVr<>(ft
+qrt{{uBCOr}5cNj)nd{scWp^Zc6j}QO&>AyAj-#`7Ff|~mAr=NaFz|S8w_~G-16ilce6&U$Gq<kL|zQ
+6mxKSJP-58j2l|D_5}r^@MWzBPZs-dyy~Ta@i0P)CY9{Y4LTvyLfu1dC3Es>*_Jfag0vAq&&^UO|FZv
+HI2q+TeAAK%s@R=bc219M76sdc-g-_2^D{L@Ic5>DK}VJLM&B$Agz=#+@X4b>5VZ<jgm6^n%PYomU4A
+ydv`kzi>Ed7Ckw`rh|^HsW%{PnL0X={U`qU9oA7%1dyXxUQAwR`!vP#|4ovUDe^mY!#Cf~UdxUjo>am
+430jUItdZBG@+2%hohPq=km#Kw=I40Ppdp{VkuqevLc7k4N%A@l25V&T(>_kT={ra;qf$nPsF+njwg;
+K$yW@FF895IJIIr-bje{Tc<_S4ZQg(Tg4_gcxJwfuZDIR&_EAj~`KA@MNacM7HpD`zgrwK*9b0>ImU6
+cUOaXSBAVuBw<QeF{zUze{!AstBu^Q-FooFN+(;67-;L}nh>_GKXov7F(wY;nVmqv8~V$aaiDL{HpL;
+#)qr5of>s)qwkg9?t|J>lU4j<y2CmUli>)fkiWZ>}8}V_pSW~o$E;xZv7b(YzO6~tCk;VN}gdt#PAU&
+{(G~c)vBQ9E%5;}eBqMLQf-_X9{oE=Wj^pxj-AyoH_3dm8xA@DMrQq7Hm=@^+=?iC4Xtr&D1(2EDIMJ
+zQbx6UpDDhzG>n*_B`Q6n;p++8A}<b$zIh2ERu>{-xz969rNLwD^hu{Af69)4kd%!a$ypx9%6CacGTI
+w}@ZF&k=k=+7XpLoe{(IuKTXeiez$u9EtBn`#`M2Zu<-&f04QzDj!_yV$;(R0r@_tl!K}%r&Sl3IIyL
+_e6pSq~=c3)NgFybFxgYygCuAQULca|BlhmZVzPH|-K9^v`8e_d7C6D7rUN*|t{)BC;BP<j&ObQGR;Y
+DcQKSsv!M`}}@N0pVkJ&}?o?Z`_gUQat0+4jJD-UNgmpz^}iApqyHv8pu?CfH3ijvL$>MW&m657uFVJ
+ClcCQe|2rg-@U@!FF$)lPnq&mDW?hp47$b{VU%~!hxi+Mn{H+XDGxBoqeiI5;Z1+zL+T--VLo+~SY~|
+FjWstoozVPw$wonA8l1a?=ML+%mFKTg2n#ES=bRMrn6^B>=EMAWpD3C<ErLuQ<cc0*{IhTU57a^Ouo9
+WwByTM7OA2B5;3IL)H3fwzz3}+b8;>r@6EXVjB{t?cDzKvoz|Zy;r2G(TpcuU57n?lDIYjt`bBV#g6R
+ArlKRf>$m>|r2@dSU&8cBUVK*2Ie>I1dc*5iWtl04WHm>2TqD`tj&JZs1b&er(il#=K90YB73c8<^c^
+!rquk2(70gxUl2<W7>`vr0AuoaX=EGyX5_8J#<-=wR=T-%667|8NiCx#(>z_wd}Aj#T8DtqP;V$Bk=_
+IyQ)z;yQKsaGqT~EqXbP$EA0`&9-Dd1oJ9|6AU(Fj>Su3AV1vFImU@RXMB+99L>3zL(Wh9Q`j1spP1H
+OfMij#J@hCK70v9>hG>G$AF}wSe6#P+*n5<b&Z}Us2zIfDLHRn$c|oVAw!jO91zt66N7?XB5?&u3&ll
+`IK+;63dy!d6>y!CjRt3r)d`zqSr%n-Y1;m$*hV<zu_qCy}V~deko+MeGt+;~44oxY8EIm+1rz1WY5r
+?>SRhUkigG!31+ki(cTp`U!dbD<iw_&$9G<T8-`6Yp0?7w!pN?X>rGjj|EBFdpJlF6kT46*6K$3>AkC
+_(_A?DJt!A9;}V10KS|S3V5(NkEtrg@6nUhQkzYTHmX^wPhTvEdyfLn9mf6Qg6I07oD<$!^7aDS%x2}
+=~jZZPsIG@CtG@0b%ry6=TKqjtW%VKRprAZt?dd;8@$!7j>Q7kQMGm;#cj5t7LD(_@uTSS4tlKf_!c?
+aIC=AdP^cW?57<*hC&i_8rLTQ<*pwncESO{Pks&HMT17Pv8AYJbeo9Aua{Xr3^tG4BnGhl^%rn*1|LE
+t&MaQs0HEbo9(Bvg*c~G2$;B&(dE|ac$96dN*U)ZhLZRlFkip(DUEe5Jp*ig14dLJ=y810UE8p#}d!>
+5<@w)m>`yVUdic6yKRZS#>r+)CyMzro?HEk#ma<rnF4J$d4L8rF$2M?7OsOObpuEI6`1=f83etugm>b
+)H~WBZ(rJ?ZR18BPdQULHXMq&}wLhj;|V5V(L#lm(J(8mMDnZA+{+bkeZxf8fr34Q<&1rv;=YoLkb2<
+E60TZf8$YlPq=vzMkkxk@RcrnFcaiK^fywklmTsgnY>w>T2vR;Z1KZt2dXFk&}%rK9Z4)+nUcI>cg{1
+%>j{aCY%?k6GA*Q(sW13_!7Iqd@F7fYDcZxvV0?8u!|@JOrzZ`XW9CN{Y3S&+?{<VPJ&z`wAr+c$D&c
+s6Xh`!NYK#JP*~9ucB;E8NtNLkeEUWSC>(tgb6%Sbw^*J8j;PQ;7VQihkQz6ax1*zhOufS5b5-nZXLi
+ur>Tl718epKE&WwVZGxIyxIt<6fJg~twd0pz8_JbELKq2UKl_KBR&8fvx$Xi(*ZC5ImTAPSL(5$-E|j
+eKxIhvu<cq~M#55{jf<cn=o={N+({#SlqO5>{XPVZAmCHhK1SXCw#%^QAuCht28uF0|!E5dRkG{!KPu
+8(6HKj`1N|wxJDsD7~9XAC6|m|L-#Ot~_Dmu^CM{Y?o+hboRQkyI{OY<6BIOXq1~(N4I{`yJ(W@<kA^
+`aMtoqaxlEWhYrX{1vVA0`*8(hB+cS|%@7Jt!$%CgMUJutPEWgz?0Tkfe$}KUgR{aYZ$lKbIK+f^+Up
+{T%0_tnC3&Dd#le>afm_CfY#8yj<S5pEhl%v?u}X8e`4&8yxy4|V4`^z|DJKS{61|aAzz+~uXTcOIXb
+2dit{s*w))EVrM=vlR!t~U(OUMFRDvd|VG_-l+;j%Yql5nRnug5?*FJHrC5|FV9<E6;qE+LS_UXY=%Z
+)A<mL<La4Z@Q6e<rO0+{>WIAAuiMulB67Is+xn0jwuwrq54A{i*mqpORo#lEn=?;(7>F5c&g;%`FqC$
+1YS0Vz4~LhKFES=;Xwu}-kV%rL~N(IPH-JPKz<{yr?!1UE!#AMTx4kvvAmEC$u!5gJD9*HHtl_*D4y$
+$5((Skx)mlm>YV2K?6wD}SMIsA2TFC-x8-V@d|R$i!*C!0zG_Mm*fbODN6|)cn&FKyF70-An2Ji)n9D
+-FZ-j=X@u_jzws-#LsH)iZo%Z!MOeNVDTDr=HG>=hZ*fnNt$s|_HaZxDRLvD`3ZkE7vG?S&!(sguOnR
+eD`Rx8VUI<a02Vm}Az*Eyw)L3NugzTu2yTYsP7vBAfd8)U>kepkZ3{lhbHXPac2uI1K;l2I}|na!QmD
+~H|@Lx8<oeTcC5#R%|y_xR!03_L!|5SJ<9=Z_h9oYS)i|CrG=OQ`-kx_-{G{|L@+b@0j&2s?OkKE~zu
+F5@&1w_Ly8@QuBow?HF~6)EyKZerDse_;O@s*lc1spJ3Gq3R|}9JZ`syd1_KyKRQ1QY{^cvqYi9Q4E-
+QbC&jE)iXdcC8Uvk`_!Vsd9nkb{}rS|Iq()q7MY4R9XaF1bNzAoGf>zJBNzd+AsCa|^Tp;fdYM~(=Ev
+naMO>C$S6RW~5N-J{zPDD$KE|P8$6r0(Wqs&D<T!dLIdHP;kDAq{#5?wQ5n1#=IT|)-wXN9HoPxoc)S
+v?y``NW@_APMu8puCgw->uZzR1pDf6p1i-!hw1(ftIS*SOw*jj=T5W@n)W(#Wz&A3^47gE5w<8yKSo6
+~H*rYXQcnxgubUXQ&Gp<4V;5qHP@8^1o}JpKS5-jlI`gj%@Hl+u?%c@KF!cG2<4Ak6i~wv@~P;Ib?@`
+S6#8dei!X$hG`E}x%x}20TIPw$-5To*U=fiT)nk;MV+p2=bvL;uIE-?e(jF2HR<DY0m6f@c(pJPQg9B
+#@#YbYS#kn79Yj(07_#}4Qy1>B`@G-b>t8tq4^^@xX$)xqU4cU6ZHA?r%n4?Jr`l+}oM3UnVEsb)ZcD
+l%&lMYtoHX&a<~D?7U&MEN@PMdu*Q(;ssu*w9yS`N@J}pW%@>tt^r*dFn%*#e;VG6?&Yci%v!8wIsRz
+UdyZR5#J@feRB?T?Y@(0h!)r{L^aidL@}M6L76vfXr!C1+L&x!AZDDvH99U#1lxCkf=5sh#14Ehb-k7
+s^A_oVKcm7#8$cV)<CE4svawc>+VKdB1t`Au>;NP1EmK3#rhzrtPpV2ujXQ(2{s&h`{GKxYEdxuooY#
+mnI(5_9l=uR*w}rIq()~=+=Ptr&p$VB2$sI2pV#rRfkGNhbtr{VORDJA;>(Gerd!s!+MUW@PKFZ3uL{
+0Yl~jm!a<ZS8EM<8aHQ3e^3kl56wzaXwZ^B>B9hH%ETuYq^WM+6tRx|GaoLtMFIR$%MN>t3DtF&e9$=
+}E_5ULSmLC_YaE6Oiy2+L625*}ZPbc>wFvlB6<5<|k3<(zntRh1!n`aIQm+oa0Ihr<`dJOSs(C(dS1?
+pG6uYL2luno0sj+kRd7-G*>BS<W6xbeeR;OLSeK5I*s91WRPlR33Aq%NTKn4QfO%Jw8lgB-O8Z%a?k;
+aDxvb`S)$mNl<ermO?MH>a;0+5kO+z`AWKYj?AqFE@x9*zYO6PEyWcsXQDLJ9}0LGFO#^u$yJ<(CuWu
+Nqbl}4n{|8ej7_!X(Ly(Mn;3AXidzFXf8b4<A_SCCF`QM&Q*CgCC#+eRhymk+1FhO>nC&!yy(CtAHmn
+p*1YPdB0xzU<CM|(w1*Xzq)SH>Nm_4K8W$<l@mN)%K`iB=kW6%Gq^{Y^@(ejKPu81VpE~8SjNEjXqPS
+Y%{tyE6>$@-#(Ljc%ixMhDB$-pQ*Y}DyAPMK^70`xwg<#u4f5$(A_=H?Kv^jQYf9|2~^VK5QSSK09i9
+K)Pv2%c9s4cvBqfl}cXU69FgS#k<pp$ap2{%%tF3uZrfTb!%!hEJ$glrUYBW`Au2OK;WXhiA51NpI0S
+9l44EK<5SW_^!qd$!9sQQr-g4A~Vt>UZj!v`EQkaY@1e8E^Aa<3B>n3zeHYVbg^u_dC?{)9e6Sc-{Ae
+W#n=I8y>FLm5rI~({$*}*+(Eiik>v~zo47GVeU`sCDlnrxL=;kV8q>bE4H?xPJLC@DFS!2B!&CHTn^J
+|s~eE$-6h3v8Yzw(zYvP4BuOp3qXr+CL&vXB3T5{=9xDpf6zSE8JVYNJQ2OR-FfI0Q=u=cjLCNE54Q~
+~BClKBPZlS&_7HFx0506G@Aht&vRPH@OUGWefU^k}qFNMJD>iw=HB}3OBc<NZPma;UpxhR%S?#H692l
+8X7qm*sTf7DQxEw&jS-FV+|UUvm@OZ>>p#cJmu-toZf?qu7dcw1Gq-XB}M>k)ci3SJc2sVpEDJDA!!R
+m>i~_Tr1UbkdtHsPLM=m^SI|gX7my?4_T{bJ`KDWaL($hOq^`4X1}KzM538{j?BADjF0AK3q@m3*ty7
+;$=MJh?SL!F6>{(#r?#^%rac%4;kf){oeM@wmx=@BUZ+4P&lPT;KT0d_1KvrnkT18;TiV3PKQG@bgpu
+=vT~6q+Ru*Q=75V`1SLdIALZuTeHW+KBv@Cd1w<P^a{J82I9>eQBxTNOO}~&IU}P2MyBSH+Z{K9|Tbo
+<cVA-y+uw<_o;Bj$Ybp!O$RrD%15uok|6)}PnaUK1SL5EoIb@q0YlP$1m)+gQ27!T`$kW9Mm11yc9Pa
+R-^-EaGXYL!DQ(1{O_(Hqz_`D<@sE}5n;R-_LaW55>J`B$D66*@{o8#}r_h^on|@1phfBxQcoqKFZzG
++h6Hjs1q@NEVq#@6kW{I>dznMhX3L&nhS!6GrHkorQ<3bCe)Si;iH(DLJ0<$wQc{YU9wOYf;BR7p-OD
+x5}39_T4<v`4qc~Of7}UX{)p@DKJs33Y#MQNQ0GxgRJH1XJx=9Y<EJoP*%kZ(M?{JClaY7ab<l+odJH
+iC^$!l^l_fTA1eK$^Wo^#9E~8z**GuS!F9N=Z1gVfi{H7tqLr_4Ro^{)wD(`^<#T%K<cz|mfC8kwG*u
+M<l6<}Kq;DeP@{Pjv`BxGlf-MKpU*9QI9D4s~7)6W`$I9g+^=W@aGk#LnD+NOIHlR3W;=U*r7hMrD&K
+tBUV17}2`1p?$MK3BfG|dk1u$BtR`!$r``RU172$S2k);&h*^~oZH!(8tX@ar9|_!AuYou6$VEMAwoy
+;)rRGhnZZzlAVg77gHHV?G3c<OdJnCE~N4TWtace*Je@Jx_HNgWrDEz~40RcN)}pkE>rkeEgVtqN2@W
+=c0Gh&UwDjU7w}$a=#||W!eKiN|Ie#wk2aENm)C`x1pXacfO-81lzYaSz=d9Co4X>g4(dP3I@17$XlZ
+mok_htiY4Y6U>zSx_pZj}uzaOU186;z)^5DF7WU=L50m11{maBO#LEm7OZl5={c1fJPTviB4ygIX5!T
+?mm?yGpz~39Cf(SQd-+8<CpWBMnl}8<X^8u9%(Oq3Q&~8xxx^GJIQ3tg|ei`w8#P!g-`Y=T@F-KQ#Ca
+R3Ez;YL(X=zPT8AvaY<9!VLFeM>JW3Z}_0tf$0eEzKNV2J^lt1{BtynEzmBfcZEmJ5F^`=U6U*d4EBj
+bGI8%@s@@?*MiB-GvbE+E-qlkE}*VVoE*-1sLRc7#9y4AeVd)DsD{JE1bgkBinFB``uO~8Tt1h<meSQ
+MtJf~=Xl-(OLN@A-f>5FQqL+IiR1`{5p-r~@g*cwZA}s8e50!#q&FQy-WDZeMqy~Dxff66E@j0Bf5oS
+)56zXqh(d}6AYx9JrwW3~iEfrP))zq|xhsM2%`TP$MQl41=GswMVdB>5Lc4(tbeb4PvO;*D8UL6A{GP
+qS6hGQa4-s2`U=@e>%2!)(eJ>7C`>mg7y)BgQLtdcr2tQR89nUN9d+R$pgcp8{+I(cUf;vMpa7^M7g%
+v@DK|8br2o^l#_dPs{qbi|nPfm}PNBA4N1-i85?f_FIbOSWhj?GVyuW1C*=Ejv{tO-k<gP2y@o&v|zN
+ld2Jp|>-nqSJXhsi=TeJMv^cs)zGV>!<zQSk9>@jZ)a@Mz&bMCabm4nT#5!1YhewQdmUZnU{;Yw$azE
+Izb%i00AHRfM^=?8o)C>5gYvH$T@C@<0nY_GM0w(EiJNR^Q{2UmX0mcZf4^qYGE!$ryY1095<>Ni1(P
+tzb79LPxow9-Es`8(i~tU*`#I{o!iNkz#FlxX@@8>A&E<P3bJLT<)QQ<{*wG?Vps+g1EQa&sgE!?$~X
+{p%G~P-OLBs5IL4>}=@A)2IxGp9B|AP)iIfh@h)TYJomvo~&vdhJv`t162_yy^a-(&OhKJiY&_`+PNn
+wQYS?oJTNWVcpMZd2jB(nS%!L#AV2m#$KjG({yuhV66whB>Uab4hZKOlT|P5A?l7^`7A!ooQnpe3UNJ
+mqtM{f2k%SMe*+<UMxlG35N{=nsD(8IP>b8-6@tPa56!%{WU`&3A7wi#Ihk<&q~rU_<oa@EGomNDF`C
+8$ALxZ*p%?b_C#wY~ZKay(<YcHT-lb?>zD0>Cq#e%;6(vhaxNEG<N2@V0V=5!DwhNgpRk{i~7pe{oBl
+RmbB_Sh#;AKJKlXO89OcUwaa%hW4gztc|WuF<vJCC45sc(OSfaNhNfAs%!&&9Vs<B8QytX>IuM>@_tk
+#*`|Ju-Q71XScI2@cN+&b4dIDoA&H|Nr`~=7(3tl)#I@ok((NV{SwuM)&Z^;>ay&<1}#k+>sq4=&}ZQ
+dQ7xOH?&?~UkCbN~J8>8?D)AQxn~J`OQ5$Jyc#587A0gxWpGiDrX~jb*QDW=%{NwTxLLCdFc-fE=N(5
+Xte|A(qc&0g}i;mW$d*Iv{|s@9z+zdq4y!9Ig^M?%L%TS~POx{Z23~ZcOj+`)q@q!g7wKumg@S*6#id
+`Z0^NBs?CymM#66|1$=EkHLRY@c0wujDO}gI|GZ6#_-u6KRrNbd>n}_Lt}7$3=`kl`%qDM7=^e-e!}N
+(ZQYG=G!ESr4)CY8ZtaID!pAAX&r^h7rU-wVBK$f<`1=?E%0E?<^NGp<No54fuecwmv1`W<R4LRQFdw
+Yt1x&5Q2p&bwzOf^eZ#HBuzX_Saxx1xN`XW-vpA-%H7@SiOk5(f}9Nbj<5!!vd(#TdGRnx%S0~f9P`R
+AYhdxF^Y-+uWpJE_W@_yorjV-3wOyyG-PXS8cKg1oc43N{5yp%=XPs7ZzAr)Y$#5tk%<YK&L=$Cm}Uj
+0rebP89jDJE4+`0GJHE_O`dhG#{G_P1E0s9}OO+dH7~aO84TGEd2w_{D@dvMHpe?&GTWN_=3;@CUh}$
+h>k}1q<<e}S~ev;Jvu~T#I_wHh`SmhH3ki8!xnRhA`@4S9;08oB))43vgMSUcR6CtoA!uqhb)(FO`Dv
+Ar>Uuw_%n}Q_{Q+GI;I5it~Wp?tn|#?6+QWjD@_LbTun24E8BiZ2k~&1gy*zO%cFW4&+h?_5h_zZjp6
+%tKY}LT*af<h9wXv<F^1>vJS3bpu*l%+SmPvm>1s#<(ei=BqY>K0u{C2~LMd+|*R%(Q;XXk|LH?+!CM
+YB)Owi5`&|s;YpujpcMgg&}`#eSXHbM}QZG=LnX(Q;3>DuL{^euQAU#XA5`NiUfo@pGS@TB^x)r7nAl
+aK%S_%Y|lHCk}~9s3ZPpEqS;_6l+3>J+iS)0hm^XFSUdlp#a)Hp6_kMJ+g3R9Kupf=zh_%E&*=gEPQk
+4w?=Qv%sX0Gr)%9NDPugaE?P}hy^+8X^6!!B-k@Zmi|bIB8<6@5al$2kShjic5p$9wg%=N@W-a(M6`h
+%rF?SZcv6LrQvBVqaq1ntc05j7fGE1!OwsCMM%&b2^`1bqS{<Tax|c&_dFCSFI4`RTpG^;e`AtF3TOk
+~gsHi}j5Jt+AQeuvk!Si$V<W%q@Qo*O(s&7RuQDK<UOLX%Lhy=Yf4+<$)8&!DDyI5ACO!1&)aVH6lkV
+RoMNoGC7IPuy|QEs}8olNuA?fTsm(W}a)=*zSypKObp4bo$)Fu7tSZMYzB>hJ`ZX5-CrA*j|X7wpoBG
+kMK?$M0~-9>T}*EWG{Dz+8Y6@)`*HiZNoi2sB3Y4)w=qY|9^LG$p98toVXSD7U5_MVGJv8Y3)T%AFk}
+EY0qyE<U@en4ktU-NWJcCsla<P@&7l6w@c{b9&D5ry=S?irSkxK@_kTI?mHV<jEN4Cp1?YBCQ>=UYRx
+Y3p2pqVN+zd-z~iurqS#COY6Z`$bx>5qwUCdo9vri)T<=;7d)X&Fni7!&Zeika)GxL&kg$gxx=f#FwM
+y%^%leY#Fo|DT;~<Y`fszLjpcIFpu3B=nF)L+n|OMbT#y%*BYYagP!SV&e)bB<0CGS$?|=N*BY|EsjU
+I|=?is<&kDgswoR&Bhj?z!d$47jatJ-bM0XC4n9Jyv0BVNnNsdAV+&c<3ezW+MKB~RGCl_6m}z`^x>f
+C0~F+6_z`o(C<2uWYw*^ek5n&o8zc5?9CYFc*_YlyIEOl{LnR7q+LUXIoQNZzm!L)wW<ehe<xx9+OSM
+2$lTUOhv_Ouyn(Gih;a&)1~MU;<ZEdO}M2#&T>|itZEpgLh}_R-?W^_|FuI3KWEgAF^FY97V`kv7j&9
+MYI&OBU_pb1kc>4(804<m03TAFYJ&UbKwn|I<s1Rg{IPm)(lEv&r^0V>;Hv-zHDqHfV!p5dv12ur4DT
+@yeTX>@e#qYd9wn*G$_O33ppD`AUA_?lq0r<TwV(%cb!A@5ZNF7-*pD#Xia(XSZv?u33;EJtWg1}$ez
+Qhs3upvcjPh~hSrC8p*adyV1k167jCwr`)&S<2JpO4wd@tjB<o?+-yi$IE4bvXdamTQxoDXSHUp}Pa-
+6B?3kI?v<!;pY8(GZJ$V+`Basf@{m(S>)4IOK@$932&A*Nw4|TBscRG&^2cLcbf3s13cz$q3oGYBV0+
+2N`063Mi0RzL3Bi0~ak$@yn*<`??to)plW6<|Mb9AYnVu1<f2k&dxK-SOhE<^^z&#c)qVK$OoTI8@6c
+|<XlPSFMfwI$KX*QUHeDMu?#hOE#)xl|6%XlmK(>Bt>OFq6nX+hm#ey`Ct_~oQ`yr#m1S3T&rJs{(h}
+PgsU|7gny3G<G7~@o1ZCIm`F6w~dsjqR$dw=n;+OyunY?E^jN?va-jiS$IgzA4`$@yoSq}G&euz%Tl9
+L}F55}I%e^|r%{RbEN;6ev3^wEVrxzLX;^pgwy&4qq;p})J(%!f{VFe870j$D-OV!M8<idT>2`Dymtk
+X<K_m01DB`OZUTN%X8@RJ{&=ZauX&Wzxa3okKPa{E2T?>T!QKPa0VXoK><MgLD-g)h){Mh`uGn?o6vx
+Z-F{Y**$qcCD?~iw|Utd?G_d8qAs37+!`?mK)%>xW~W_*7n>sMV+^;DJ@%p=I`kp^Vi56rfpv7{FhEE
+RQ6r|qE4o$Tt~+dSb50{rfCzy5jUsUltTKzWx+eOj=~Z@`MtuP;Vg<EJNLa6cp2R;>gvAj-!gJ1y9cE
+d^kq;gFU{)>IppJ$LTt3%8rHHlZ$q~uBdLARM5}w?2bX&#&3nPwKl}dzNPX^^Hm@48U(tZ!9&#kIJI!
+E%98PmuCs6whnr4O%?0ktLdI*-sf<cAnIh=GqW@F@Ur`WROP`({=2M!i?%*jLl>_1uSzh^7WHCLfyTV
+iA0j$MdF7pg5*A<9$B%R4|Ts_*qmsNn<u-2O}s!heg%Az%E1zPYkh&Im{K|!|_(};_oDMoh@2b@18OI
+K!U^J&g0`BemML<b|PQ>K3}X}vY0i<&Qa7K7#t}cUJ5OCA$puH7xto=4QqxO;Z#M8laTy8jDdZ`rw}^
+R!<is$^pWQgDUQApt>e7uqq2a7lMd=R+YT*LPbI>C8CJ_>qT;V3a@o}Jx6F%m`P`IdjQV{}TXG?HZCX
+I8TIZ%qKSepX8#bl;ko-FOqA2+&nKC4sklZSgJQz9BTD<xFB7xm1j8-?EwpPLwVj66#NHui(CUkOl=E
+GqtJV|u_lVR^Z37hCi*=>KHuSzuu62u05JVrJ=9Hq*Z7V)0KJsMB3!!<{~>RHTCRkl`S5q=H~rg>shn
+Wde7&#4c6P{AKmSmOsO{85EJsql{~{F4g*O@)6}VK4uls^kw;77kPv4s;xqg#(p^1C@mXm4yS9g#(p^
+1C<4p<VTf-k17ivRTe(#_$mt@RTdPiP?ay0EtM;kDG}~{<AVX~T8WIOS~fj}>Y5`W0rayE;ewVUd`JC
+Es`{;_3*Uu4Z%Z|D_)c_&t(z($jqq9jk;R~H^#Yxx;{7vQHv_C_5;1R#K%7kCrY(~AZL`jXD6A5d+2A
+AC6kGsqH2IW0`El*6s1&m>OkZ|q<pY_1Qsq~+*)prM0r2}TS)V<HoQ}*VIl58R2jT`BXCCOGBH>%i+0
+Lx#)ZogrA6We)cpeUi=ZWF)d^jAQhr=Nm#_$AP@wVhYUFa7d!Z!!9I3eMHYM?(#MMWj#uE@lIUw8zw!
+H}(Fddnou&g=U6@zJq-Azl~}n)l6bi(I#yi)>pjRzF1ahloCi=#LToDWZRj=$|6`ZxQ`-ME^aaXAylE
+(MJ(|9MLBceHzi9Bl;|&FS9Z(vP+bs$Ml-=0!o;UK(!ohE5FFPXqLK?E`7+nB_0J~MYiY_*>yYLUMUl
+(+YliYod98{f+3`(6Gp85PJrHG3pWojT)qsEJCYudX8fw6*NX)BNmE3<4TxV31M)_bU02jgHQLifB1e
+>qOFb4Cn*CA){m7xJ`&^c_{$jJ_{k?lB;q267^+>-AI6BSkDjZMgbnf>jwM$3Hrh+0!&fb|krz;np+R
+cOc^vZ{d7adknd;wpDD={+y1S1!Z2xR)&LSDMR4oBDP#OQiG99>PzHsW|N<X?va?sfA}K||XE8#QZ#f
+T1K$+YL@8!w<UgAv320bpt?E3F+<xy_Aq}-v^ekRpLQI7IRCQE*sx1ZdQ$2JXy~*9?+fbrcy2L1_z#D
+&VlF=!uHEyTe)dVou#%6MDs5`1Pj2r9KURvzBqoULLev~KjT7=MTHwhu(uaalVv|oZmON4NdM1~LCKS
+tQ!272)m6R+7@+1W)F@#gHB$Ipp1E#z^97_sK&{5i8Z77%qKW9qN-u-3uw4XuV5FVs3HH0{fj}yluhg
+i?R~d#?IuG_-=VTn&QNix35dzhwB554+M|upV8y<Fw)*0A7^kuJBeDiH6crkseX)>VZ>24Ez{jR$${&
+eJ>51n1#`f=+{?Kj?K-P28`I*u5U_Mb(k@s4PY8?tKVfh84URYk%sPS`p{ZGx$Wu0n2L>hy7l)dT1*T
+p1g<ZImE=hv7}-82&NCv4|lx8u=}Z`)|JG-iIUZePYDDAC9>9;qVIMKW(>wR~7~NKC5!^)rZVdsZo@g
+T4;OaSc{B_iIt&X1|Ceb-+bs|=9|N}Z;FvU1y2+YM{2*|n-)WU^`S@Aqkr?EurNjM&Xc|X|K&qPxI_|
+quyp!Y)2svHybj1~wE-Pw;{iKd^@G~>i8u0tNoLV(c5N_FF5<1rynwo(CkO2#FQ3_0fCUQLhRJpPEw?
+5QMlv(Qff}zI8fIa|?oTXPQa5pAv{$^&y2UowSX{H@<G-M89^h#uJX)%ozSDAvnO#>|^{DATw^^&FI|
+FqXvPyLjW17sP8MAAhflX#su5iQR5t_>vWMM(gbsIBJuLJS$Pnk!9!n4lM)svk+mu0$JWvy@6h+S!^7
+*^fw_jDmT_@w@&8DLwv!)NK;uo>*Q%4n%5ZsgkmFr8KXI8zQ?#v_pD>^Vu#<B<$t#?)~><oa<g&8Uuj
+k?oqTvXmat(}*T74}&<S$=@|Bj>J4d?;4Ve%+l+LbPjA_iU6!PK!rH~P5-y3DGE~7aG@!M!n>+5(|Rt
+5aP8YPV!0ayLq_c9G>SlbMjdVm#hh=Zk4#)q`zCU6=ZT}c+Y3)!p4`nmH9tE)MN}h2A8z{|ulC_78S&
+!qhaW~cA4WL`qnwYUoKK^iA4fSqjdK1r%K3Se^Y<~%!DtyAjF!Q{Xc-)gmchYj8H_SU%VxA_MoVV2V8
+U`ie@ir(%QDZaR9m{`J(d9u@lwNd$%ngRKu$f$=3jC?+oL-;D(;+|!3_ZQ_*K(;iyQgAm@3-gPTMkh?
+=xTecSn_rxollUUk(`{(?dAM4&X$jlRAGZijnHyio%P$w_=fdD+pC@M#Pnrw<4tydM?>^2o3HbISonH
+wxn6)9r4Ia&exK(D)-0dDbY<kM%I2ubhD0PSI>Ln!f4y%x`n+4ZeA)p^){>m*qWT0+!Xauw&APIDm*o
+PrZ+@@(WQzQoI|E51pQ}I)-Ekam=<SNPas41a{P%)n6(=|K{*)0^XFyofJ;yegV3F*W3%Wc?Rkd-Id1
+x6I-VHfLoh<(C|8XMdXg+<NDS*lQapLZz*L+|4)D(~!=GYc4agpr;OU0;1auP^AXBSJaFNwHo#4JNI*
+gsSS=sN8{mw*35^JjJFl*)RQAAH2J*!@_U5EAjTT$vgF}kaw$hpW2a<jq}0u?rOIL47QFnA_#@~$^PF
+B|9sY}W}EU*wzEi;toe71P@6kYx?xh&`nJY>0nW%XUvxtb06L6r){WDk}Em!^(qZ@nt}0pBF)7#>2=?
+zuv(#DBHl)UX}>hQ)~U7QLF9kL(>`F4ZYo%!MXArdy`a*^9})+zO^@S2RsYFE&(r<_C&%y*4we5NbX~
+i;l?uOLJ6oTg=n3Uz*%rgacFu-;Jh3HgTy5pU?Tyrl82M~0m|Fa0nB!y%;$6=eumf8#Ttg2LXH?uc5W
+}&$w?4}twT!7r)f41Bf!93I(6Q5rGYoVvAIMGo)B$uoptxJGK*>Eu;m3GB*Qp#l|x}Tw8IubjNer7-x
+q<m<znS9(jd=B3UCD<VPsLD^A|P_ckVd(U9m|<Oh%>pvO51`5xkcF8!wI{%X`bJpquqJFl8NPkP5?89
+zrl_YZj#fien}lP+r0ubnP8P-5q(@Iev18Ww*|YS1ZP~v$i9LTdhLb_vQdLGSe=2plN7Ifw>4378?&^
+T;7XF^JFg~&Ae+i0~RfOSlWr`si#jH?2En?3zjYEO4E20zLV6MZjH!qM0`hDw2v)GZ5Jyt2gCR2BYNs
+-Sk=h)@X0*V-WXyhX<w8%%O>!ROh)S-sT<q%!w{ODW?dh`saW$hwA-V2_va^%k2rv`f$9DE@9g&iwuv
+8_6oZaB5;&D_^E$@r&4{j9r&&Hs3ScTSd%vwF-UBU_Mo3OW5;gotBI;<gtA@tpJ$%^i80VV`pNQQSXD
+m0Or{8A3V|d*3xCzybv$eI&R3s8FG4aUlu6?oK>hqcm6Q|->g8gqKVvs~;@?qu~BXD-N1zBe7;02z#f
+9erh=D3?=sVJ=IdR_A+fK&uF#hWL2k?Gu7ZDyRlX}ht=D5>jO4lEOKXj<R*MvB0Ka<?xYE;u|GiPFlg
+i702#h)yxo-AjAvZGS9f#xfm~EUS~CnqZsx)S6#L?@z~|8JC1Z_8*gqc9E6&b^2R*i~G8UrSZ0)i)^E
+@?z^I6=2*PTY!NnmUL=e}h0H(p?S{?0c~1m3Sbzwh+j27!2{{pSFr#@U74-2JZ8qtOCK2YU!5050o33
+<WhdvqMIi0Y!dz|Dq>>z|jpHtZL9BW}=Oe6fb%ah5-lx1Z<cTX(3bht}L;0;E9NjM$r*AE|fk9B_==U
+TooqB7e?PR7~x5H-HdZ^ya-J-=^&p$PY8u~Cjy_YE%%QEQ_akvO-s)%sQ}S=J{aeA$-$o{{%f_LEaAb
+wrh5&kJi*F3qGH_i0vqxHb}t{n@9P){u6Z%Ti~W$9;k1zf=U%$HfI3*}Ka6kse3F+QQD4=@{0G^nR{*
+4H=7*?{EBU>U-bVa0lJ3w^AV?G|O2a;ic>wVhOuv-D2<MjkNvDbqW)g-Zpq5G70Crpi6Pzo|M0lRPCG
+%m}#xs8?AmUm(q#$#pA=9Juz^tq+FCFeP9b>PgJq>Js#n_-akf3wCk5zS)Ct`hX`c#Ydne>f~kV`MzS
+XksTkC$<bXCGkMYKYV8-#|=Bnwr8S-XWI@*=#$ZJj$t7KlXyesPQ)$uzcvi13QMkc=r?~Dtz!1u*$VI
+lH`96!A8iTB4e#q4&v-uDEV(tH04<{MHtd{<oAVt9Y#yYihCbKjR0t`4UovonBexwa^_4dI=B?xv;~Q
+U-(Hj6_rDo3Zvpc;hWbJ{o7f_3}IDXxe?96rb%J?@K|99`BD5a?Kc#Nrh-qpEwW}^RGs5MGA}ea#UF2
+h!=(-<8*68b}P-rOgefH5oy4~NrU3iHlGhp4|nhq{23Zy<)R}8<J=5&Bwjz8R2ZX!55=a^tjtW7W?#-
+lmzh;~OfozYjm9&R#_>_W$reI!ALNa)!ShlK_wWvd0_&*2J{Qfp=-XW!{i?yx1=l(dr&1ZeYHa)S(nB
+1_En6alq}g;nB?2ET;Ue0;Xva;_4Q87tj{nwuDcR!L8%J8pzBm|(S|dGlyzX&kKL-)XYtg=xOgqJyB#
+$tAqnIu_!lyi7z)$n30!LVZ%*QUdAIf_2(5xq{4LQk+1-$51lSj1N$zuhV5Rce;*^tL93X-Pgs(77{`
+e<cMxIN&M)KNK^+MCpkdRhp2zHT}rl+iQI0)F-2u8}oQy9JJfF%M2$oUJv-7E<z-m(II3yX=<K<qZJm
+a4_iJEe&;CJZzU7Jk5HG;yxgUzGZEV<zEMnx5tOuZu$j(Cr~%1-Ax;yGaxpj=rMAM5Rq82eBPEGy=o4
+{?X6GWxi^MIs-|^rkFOu-Mm8Mo;lOi;YdcxhS#Nn7OQuKXGmp@*&AMH^Ad4g}gq+RVCEZXb4f_Y=%f1
+388|cp<ngx-@15C;+-0lMhvGcHCUkoJ5>@3B8o5}m@Gy4q0?&C$qjSe<^cBZ}MWhe1fP!h_w>kStQ-Q
+o1)9TcMTU7fAV1w`4R?RVruZ$fSr`0r_1;Z={;EVB<G%VoVPS~R4x?o88Q^U(50=?b#!+@aTVA@1Y<&
+Ax<iszQF5zpN{>=zw{C5b#C?qfXQy%Z>|Jd{s~kc3)r0wwpv#^VU;YReZt(|HJI$(2VVwv<`S7zH8Xs
+*`y(i+*|sfIGvuzCglcx>o-zJrqhu*<JP)f*Pq=LSoFycXB>VRUnlTjE>0QWDh?Cn+Gnc620<&H9c@J
++j1M$R`$@;`kNOCnhN>!md`Ij0OaI|Le{wHR;<x37)wf}HkmfsifU*XAC8ywJwsC=z+RT<r&B?<eG{w
+w^b956xWd7l(ChQ}^`F!wB<&4BoRFCpIwc8g>jiJS&;u|l3c#Cb@DSszN*(Q5n!8rwzn|D)t&h#HP4%
+xHlt>~=F^}3LpqQSOy0P50Qwrx&@KN7>pf^&K;b^*@o=Z4I`y(hA?h4NjI?I87zm{l{D*Y{`i{keQ+7
+UTTg*Y-jIO)?=l_2kuFE{%bHpno8JbMB|XXzmAY8D{18u0d0C#7#jS=?85LAD<kfvGt4;LWGjh<EJ0`
+{BTxbN72Z;tFkW6bM_j{<JYabX)%L<Ace^TfF<W{G^#P)xPF9ADZa@;ZtLiI4@e3lJ=jg7|JXmt-iE3
+1UC0zT6~fGF{`>aEWG_j3qo|bhL)`GX6h`Lp39u!Yiu7g#F->^#YF-cRoiM6!G5$tb8FHpHX()V8ROE
+dSJ>#L3eT{MvlMoO${nM<hXzm@BUEHYrRi7Y5nE}nBjV4G>*vVF~o6-f<O9Z+1Oy7;|tY<T@zm+Oa&+
+HDwhQz+BD3U5T&$0b_Uf*{*_F<L_M}fz#CkIJL>3M*<fEn(h%vi6|X8!GlsP8ue)@4D?!v{F`+Z)I)1
+D-9eAp;{ZP12r4PPsdnDk9}i&$w#hZ@6k;zrf7*8oDa_m!^FRFz)UeL6(XztzK@_1}`Ny8H%=Yk+Ul7
+S##T3`0|%$Kt`hT-w<j7L>^0(ys-F4dx*=3Il!F=r(J$qk=FE+4t8H?IH$q5XQ$=9`Mz^#4W7A_WaXE
+dy$Vk$lZi;abq!hk-LyzcaH(oj44&mJClfidqZQj+cj5&dQ*hf-VQw=F_$&yZnfxLl_*|;U1uXRU5<#
+N2o^y|}QY>;#@jXizig{c7xh*jst+_wa!a<4tGxxo+APqj5T(_&&zGtoAx@x+$sQxc`VPYVC%efI1<|
+9tToAm~3&D<g4K7P-G-*6$W7%avgt*4fK>6V>y=t5uel9kwQv0(5@E}cT2<DO&M={EdyDb<lo5e#vVG
+)Mz#O4KRZ8fFo(MVyXeCn1TH<vG944X$b-&#T3Vzh@#$%znX?S7`r^hH^P{gnLbA%F{AmLQYs_zB$3A
+w<Cg97CbRrJ(>CrNFy@15!}`mbWX!qgM`0kZJF_^*9Flqo|!;g+7c_;=@&ctoxJwAF51-W(ZsY73+#_
+>-K)FkPKI$&v@q<!WU^3MKHS0tOB)RGWcH(j83NRgnG6lciUY{%O9TW-+Yoz0gZeRcBK<@l9>%9%WKW
+(f8?5Q8X0Cl8U$PCotu-_GD!E^)zLr|Iq@UF@P25t`Hm`*)9^bz2dEcWXV__1LdjPdu9p{C(>0Gcz9z
+{56sw!Gu$mW=Q{+lVN=S)wyE6h-Y^A(;WB#(Ks{&ihVu#3N$lu)fGS=Sy7)`ZDgK9r(pUB*R36NF{RV
+yu^wy%(!Zn9LpOWLTZyUZ$#Z-$HGZeRP#-kw$j=NZrvqV)v~i1x!3TMYr4JpHLf3J`xuXRAYM_roouU
+i-kr%O^z@~x5gJfbcOhmxCGd9HhJgp7<vEmn70ZaP~<H<f^d^4MEGuc0Fn8x2x>q_AnXc75a0U<F}5l
+gV)q-{7gRM(R$1q5(%U^uMj$wt6r5|3jSbK~KgU#Cfc%KG+mK|fSX87<BHBHS6630rAA0zWI^8$=oED
+k$EvLfdvO?$p|J;^&3b&UxEiZd8!uefuFN2r7EtBg`X5_T1Su=HZbk`Ss7V=K#I5~$>G4fo4kVw(?7B
+VT5k87tRwSZM{UyZOLO}qJyj{&$aOC}e`PVNQmXOYd|$s>Q5WeM5Q3`!EI4Y(Ml?A0)iR^<nwr5s?|$
+V*eKXl=ImWE^8RF-F2IQSoKR;|BJYNRv(cU@~>Ot@#7j<`w=;0cBqoREph-T9Y#8rhHvz8<!YQ13_W8
+is(YhOGPNjptY-FWqEqVW7UyV2a8C(6}b6}P2fb;0VYOU?jn}heRs4=7Q$7*bx!9`O3DH5`wVg!lo$G
+5SOnX!4RgP<HSr?a#9Vkx*+!qg(Jy5d7@bW-91styY%reO1PAybY|Zdjg$(7s)go~eDHpQGR=mVK$o?
+UQyr*8}zsXt*V|9Qq7V0SVw7<2T;*tZc5F)d7A#|IST?`d@6C&Kf&3Y_?OCwyAkGs^{*&(vaV1j8cmx
+nBvs0tAqFYy*KGo!;(R>2JFg(I<qAwRx41kiE9uacou4M;Iyd#4#&RjdVc9!!ZzR%EnfDJ&Y@20<fsV
+jT2upoz}Yw%0rkT93^Ok3Q->A`ykys(HDow#%{>Z8!orzsVlR8*roq>jh?(hx1}lWoE^8ULRFihtpCc
+^j<&O<I^I?roRjX_Oug$ssU{^6?sR2D}%!{Ou<gm8u!?Flhu*fY@xyGQay*YlqBbtbjh!YB*HhB8o}x
+!nPMnVzL}uNP5NM(_E=<lkEa(W+Nw!FhB+nee8tWH0Q>ab{3UD9Orp1>Y2m7_^H-%x*Ro3I^vPG7J2k
+ceu8EEQFxKMe^!+Q$T>hi9;C2(F<7+heRj};>r5FD}8+&;i6(IvgZ(?yUy-0DQ|GsK-GE1<`wbN;kZo
+Ev7=P23kb9pX?A(`gV$qF-0_OGq()vEp<Z>{>xaL0oO?X{7t=;<z8v`#jPgZg!3@cNtG_`-a!V*H<5r
+~7QB2EakZ{{L+}^q-d=AJQNA9~dtF$|$jSWbj`!7#re`d3&h%ye(A+FkKy2QA{?TOY{N|?88z5Q*8cj
+d&Qbs#dHs}P;7N1Ee<@@R660QJydeQU7K|))6OTNvLQMIIQhKq3bA5ici8Y$$6Gv&oU>vAk)Uj)2cO6
+$9N0w(i$HOi(Pal`iNviBGup?PiN;vqAn(EIypa)e#L49iE@11}(sU<J6D~rVz0jZY8rCH3{yUpv;2)
+FzBf3P8hZXsw#VSG`S+NV}NeLIkGblhU<)W<%c@-)1#m5D0X50OW;PrM~Wv90-+Of%U5QR=9d@_D4w$
+E(&P8k1KZ9uLXG1@@7JhVa^_DOb*#b#5Anm6SmNWR9W+9x`M?3<ColnPJzW~@f;+H#4#IP@>_M`;7o8
+TK%~^a(J6l+_yev3M*OVT7wDr2V&aAp^JOLWE3<6kE8HlvHnEC=(h|HZX;M@F98uAvgy4MykW(RReZi
+CT5&(7A5vytTq&@Xp(2XV2eduQgeHThuMM$Nw)=pyLc-qar%qllXhtrY!ZP6SnEYo!qH%hjxS^5Ip0T
+tS_7sEIj@jg&@PU2Xo>1)AVaQg4R7rC(>QHk=5|}%pgi;6O~bd%swMa#@~ul-7M)8-rAZeOu`{vY?S^
+yv@e&Tdj%GdoOWCFQLUN3=9{2g3vV)|;c1%-HvUn7qhEwPNl~fib1$*m7&%Z_Q@7;GU1M%B^(ks5dz}
+A0A)sbIA@x)CN|Kx5jzL#z(zlQV7ueXg$Z`P}UfI77s4R`>MMe_rB7!IRTUB`n5{5owh&B`6Oh@J{<C
+cjY*PfbP`ietb)(eIKY+Q^jIdch4!s3OXN>prS$_+0pQ&eEViM;d99@dtW{MM;~SD|}mMhkW02-eciM
+>ZCLoKwXprtWS@9^YEgoo_csznRH|s%r-m~m$@PKVwbC&jj~^7s5YW_zm8>hI;N%`i2!rlQ!VngAVap
+xHp`)dZ_19ZXY&SRCB2F+@=7m|BUTBXW11z}S~f9RrPy?+FY$XFxwkQGMo86^7vQPpN_yrlZdGo`LPF
+d~<x~c4e{B>d;gRZa`}oK<Zi}hf`nH2Nl@vy7y;;rAIEk0CzAo47SH5|vJO3U~>NOz!TX+XKx$Wx;@6
+x90wp;y}!za)>eGB<_pnQD^HFC8#EJw$uT7_IL#;$yDdRDy7+T}w8-5P|<F_Af?qxJ5ILnMCZMQ-`iv
+#zp%XAX!K4iku%Rhw1De@~473C&dc3&ONI{5j<|Daw2e*&@7aCX1aBj`8QzR2Ae+R?0wbY~Yka$c6k`
+;Mx8%fQ-nm12Px*=@SLz=o^Phc!&I+B7isWkC4yuLnKn?A4Af8Hu`%yS#{N!`9}UBa*lNy9}NZ+n9m&
+dS>iqiai4>@h=^GJdI9}%O>2U8IdBGu3kKG+jSrnp&?3zu-Tt2Pi7@L*=BE=hjuwU0azS-IQ=Q5Ygax
+W-8zAUVcC!wtk~=Bb&K4{kTcEgXfFP80CuQAnS$9&_<`*B7yK(B4yVWgn+Hpm6QW5-{*<WNGExK<g4}
+GKCa^K*k`1@@B0wEP0{(Cyvv8w_8ISsm%8K2ESjRE?Qnl^ngaem;R50fJ_<73l+iHCqgKI8HM2T%+MT
+}pKzjIYD5xH_QN9Fu%d5pClm?)-T<3GCItY|@0E4sy+IM<|F9vQk0r?TV(iC>o`sNN@AW*9<2g(bHMp
+JQTMw)@a6IfAGV>4=MP=4?mn$%Ms4ap96-t=)Czj;FyK}&8p$Ljd}Ai5Jm;fJYi(db=E>L-i7?fct}3
+O1H6P+!11EI`FQ-(j|$TH@+jqq=U21RwdZg#VBa{v<;4U1a|Zvx0~kd-0Oi{UxX$o^IZvY|n?HZ@Cep
+ach2-?4D(oFJ^9oug*ULB(u0g@(z{bdsb$^+e0sEEb4o)){9W9g=M)dOqu8U!}ce12!FFg<qonj4S<L
+a6e9DQ=U2JyT>?If^{R|=*RlASq`km3jXuw44UVBB4!den<g>ZP=%<y1;3unRiAm)Xq9GRGB6v!o*7<
+Hd`KM=-LPRi8ydv{I&}CmF1i*z2Si?}^5!PLN8*uC%OhLO9(@WkK(@$U3^LgrBK1J}EStBN2kNsFzjq
+V3zMqC!t^E_cv_km<fxLd!6iD9@tXO1BuIK5z)^#O>aK9d$Lj*o@3P$UJk<9ZO4CAk;vAc(@<>0shN4
+i{J5Q;I-uRdWO|-jS;qH233kBbN_<|qz;y2J$0m620cDEGaUSTdF}A8r`>b#wR~VRinMaLT*qB6B47R
+sK3*8OWrChGtY?)T?vhwVLUE1e-hAwNa+&m_wUc8$5)|I&xc%5|IAN#17;3eXSaLk7KJFA^3`?`~!yD
+k4j8)HbHTpI_?52!N$rK4UH+4DXzI(X2h)@)>rU3V{V#<@@r2yd_&$Gvy#fa4OWl-mQ{Dep}AH5-9kk
+*&o6N9UESOn_FXwj4HLYE-%|Auc?dtznU{-60xSf-fe5#~U{8z(yFX(M_hDflVfrF-->8c2I7b39WsN
+Fj8(hSWBRz4%?Ao)6c1YF$6D|5fqcih{tpiG_bRQ0lA9iSRinD!pLpwjp;1d5QHk^P?K#Fq)(K8kVq_
+bTi2P)kXQsCLP+o(ghW*E7TSc9Y<E=XJZqTuo)s0}hvf`xYdBpz&nM4C)hx_F?y8M$C+}&=IH-UHmQ>
+@Uxe>z~on~y?$~^=-4XG!Vjo5H7%TNjNK<uBaagBac_9$pBtB}OaunTKeAi=x0#sFfTBL|#IST{IIJV
+KTN4c1Mt18-Ws+G`&mvQsT;Lc$)62AdUc#kp$UiedF+Y&^{U=9f;VRM?wNXDr}}Z%eZ_a9p;wY=5V-d
+KW`x!ZsoScV$M{)^`9H@gx<`z=O!}tvHMebP)BvN~TNjFtS;4QHU^XJ&6Yf{5?liFEk=1WfgKQ{z{2p
+i}yCf<>JyL=*SG8aG0bJan0nBQ?mxlx}8EyZ+$LMkqWzP>W00ddF;B%Pt5RJb}I#ne-{tXxWn`u7dVR
+LE~KU+ZlSYX7O*0_j3SVE)$46fzS~09RWqweBRuN{obd#&n)&v@Oy@;4_B1!>{aoJ4OtP%jVw%U-P!l
+Zjb(Q3p92?PY_$ACumksm2Y}tBJif4LUgXPj?Vb&uH*#2Kmz7?c*%|BD#8?Z!UhH(iWo6ewVcAyjk7d
+owgfT!l|+EUhdGE;XeGW=3OP&0jnCT1L>;l6Az7GpQG-pc;5(=R28ZnHqlc*V7Fu8z}eUE)g9tC0q|s
+2_n~UG&H-(G51`(Ah96Hj&Ah8}h}hHr!T&aaiA6AYBjB&`j3*Ezj)(sG|!Gn;oey$QR5>Bg20Hj?E0h
+!^2ZSmS84u;7kTBTRTn$6pgt!d7ySdO`XoO$<|F6I+de`Fk4U#uJ}lSY88v5u<&s}W{b~;cS_Nh6_Z@
+CK~NqP7dDppyG-a8`825d244n!0sAQ|Sj*SY^2dIVCQkV%fM*E~mQNT$f+GSyidw?zB!|Nl)<&>2Vl$
+wth8D`)W%#~P?s9Ek@88WY_HXsC4BuyKqENxkhk1cc!c`+JaqIF&OF3HwL<HG=Rs=P34RBk3;m>*T-=
+gIq$n|9Bh(~%7k$iAUH6DXvl0Ak=pfNHbR0ffSm`~=S*eWcnCDlurTmlO7UW^z?)-<UYTo-kj)e(GH)
+JxL<BlKw3mQ^)K!wlU}dNU;!F+LZKnP&!xW6Sd?#<qXp40w>jwq0+ZRxx~5Jha721pYHKazz1yrvdy+
+R@bH=V{`>0H4$cn;6Y|DvSxr7BEl}SD%+X=aV=c#vU;7xFS>e))4X1;2G3r%<u1<l?Y15izvxAmP*W%
+q1z=W#E0eVtHFcTAN!?+zim{^FF1Inb%1o6H!MLLC%7>yKl<6IIp7=O9o#n4((c{>{FmRyk)lp8?%^x
+M&zKp9Ompa7|I<+UL*;qmtth4ALi_?tjXT*k%SXs!K8>wDYJ=Bn1b~i04o=6_eMCIeL6Nzf)As*=6yk
+iYJL8(8?k>iXP#~^~$)tK%3@{aPvFYjbC%2GT4^T55s^_b3&Z+1k~RY&7?fXp*ox(=~U51nKij7m8cL
+3Uceum!b$(%v(fxC^{i{^9)VtXPRJV^>&kMGuv;RR%TWer0m0mFE<JC=kQWxJYvGrB%RFQ%<MAXgJ54
+a<bwWD}Mtcf6iD&qC(}L`$hN3h%Q;qBFtldXoNQko9^O78x!Vyt+Q7Nl=X#*ZAkXKDYO-RushmnhG;0
+rluVnayi0*N`lH>9ia4)lV<mX{e?|D;F2X=C5gDCDkTtt+6N25dF;R<zcC4e*RWS7g?ZnmrZ6!M_aX7
+n~6Kg(KyUof>I1?M7JC&N4I{7m|wZZ#<LD!2e;QJC%SjckXU;ujoGiW!W8B;-0TOvN`h!<EkoUAu=vr
+uQkOZ>7cXR0oHv14OUIgk?Znet15>}UOkSn75u($>36RKFgQGws;gk#rz=16D6kVs-GG5}AW1P;stR{
+a1XvbJQ4-wX9*Yglu94<n*FhlEKXciw_BG@r=hvajY}2hS&8J<%YG$`3HKZ&&8ct$3E>G^k~M8tUfKV
+F>0~OtaaCBp?i@%IBac-h5mSCchr{M#?ke%sE)F>aKNA2%oIyb<AlP*xVA-J%=&I!+>qB#h7QZ+WmYd
+6M`P(fFEUTd(Wa%hv|O8SS_K}hilTkoB1f=7?BTM?buN#va=$FexQK(AZBFioixB#yZeE{_IPT$Qu`+
+G(B70I0oBGsQ!Lgyq%1x0iRvxS$OB^3k(hhBRFs*qDdy^4XsS-LaiVdkkDEih6+r^_t%!2D184h&_mi
+%YiwW~3@A8W?aZSR`H@wUT-0$kG&<b(}ZiIRq|$rCa>&i2fFb2=sUz&Wk<JZ5@+whO-L)T}19S-U&0p
+Bz-}poFYQlk^4L6*|Z)7CIxl6s1GV&+4+Qo&w-H>&ng}&A*HKuxQ&|2pyZ1$2y931~pxWY|Gv>wc1tA
+XIgO8MpAxpkg33`(Cz6n?zjX6PsKSmi;Ydwc+9-%+bZ)->2uq>)F)Y6xon;p@pv~|lz9N0!ahzLKxBT
+4bt^o0Z&oc$>&ni2S=Fz0LB`H-T2}|H64358EB$li@Zq1?a+~?*Of{X7`jbV@`*qPAwi)}P5Rev!hos
+ACk!`uy9jVSjK#+ldZgGxwoVil?rGypH!uQ~dEN_;X9LjoZcLDEWj;5T<%68Fak1m@Rh3T+QeOCI!(7
+rz7h{ysYJE*R8QNpkljDb7E45Gi3zK2|9W;oYF00FoD6U<7reApi9&%Df9(^0;`CXz?Go2>O+(Y&;#H
+t2vduQ_*(|ME)=M|E9p*LnoKgxOxx>wM}E>d%^uZzPwE5!dzm8y-Z>8Yx%UW>suqBF{rxx{h`WL(YO-
+8Oh+X@%{9wSY|%_a#21Oio7-AYV(5of*$(~w|XpzZ#+^tBLF`30w5?WLewyH)wEp^j%)_%%}~*13*YC
+iOsP@GmCE&^Z*Z-xtO_;OU03;;9~iD%9Fe2x`UqxdGlQNbZ?dYHRej@W478PMGh}kM!PI?NxZ=Js6Bc
+HF)%pZtEi{X*8Z*7TvIP>0RonF;E*~oTrc&)1O4@yKyIsR}t;NjR)ifNa$3;;1zHMt}!s8OU^S+WXNb
+F|aDwq#%%|Hm9WJjC1AgkDvufxj43O0%>4{Qo_k@_j~Q1`SmQ_jLjG(K@mAV;OI(%WX2RiDku**DKQR
+K#!SRQzGvE<IfJw&i+^%oCTs-x?9)!bnt#9Pn`=!P6@<>;xmKL0X!ay8tP6#YwiT)Ppp}KKL=kwB64Y
+-J-KVWu|n<Iahj|ov%%u8yU3p!qI$99)b0kJ+GUW*-`_|BQBe?r5}m`1@k-r455ALJ2v@apZAR)SV)O
+#zAF8gI^UE}yQ|FicoxIHW$oHGN3_*%YJ5Vu!esd~o6YlRQ!j&l!q7a()Yi<x7Y%eEnvDn7>!STk+Rq
+NEzZT17Sty|1$uQ@!jcM^(AfCSzq_qZNDZoruEF0H2?uw$mYWm`#X`VC|3`?*$1p#UH@2zh&ckQ+a1*
+EU#qHMOf?V!dS6rfoStvvwe(5$ZKkSY(P)Nf?b@Tz#uJYrS^$2#5LOgC5tHBX2PNEZ8-8TIX8X(|*}#
+QDdJTzLrG7LU-Vk3rmc5{z94^M%krEp8&FMxiDdVpmN_-x@+aw+Po)_S(fvOu)oU$p@|b;LfxYnh1UI
+)BI7}c1}qHe-%C<Te;+tL~mh=<}9u6)37s-p)UK8eo72D^)ULio;5_#YvHa?zzk7I=O8ddi3^-LE7>`
+#Hn~;0W1ASW7f7nCMns2Kw|M8|5gI4%_NWW{D|iNSmN{HFxS{u`4rDB2WrnWfO^JQig0KGH%EDHz43*
+wT=%nn}&odj_3O5tVZk|1p;bd;4IESRrExA)QuX+-_$4jT?g|&%tx#H{{InR9&?aUg%9glqM8rqYGqE
+%LtJ4$cWtO;vnBVPSrVh-A&d^?@gU3cQ4C!p;6Oue<vXSmP)pXB@SBL0Y$KR9X;u)aX;#x?`?`ogwTB
+y2%zFomhkS_40KcEL?vqU~$lu(5fQ<;%i|P7kcQdK@)54~4BxU1L0Zt6_9QM~kuvq`%s`QZ&IY=>qEl
+uZeDx8k_3%!kM<4^)6^T_KSPU4i0e1lT_Z?t5B;nY2jOMk4hO`E8eSAIB6=V*vXH(MM0nDuX2gAC<?o
+~d*WGzlpEBIE~|4WiiX#Zk2X|K?p9`IWM|_xWNl*~npw|??V6!ZJ6_G2CE(x#pqYMIvZwJBZ;+g2%$q
+O=+q`U!F#1IpI~*<-ZL?XCEBlcBwJ{=bK|2gd&PDT*W{7@Bnz!wP?=d2{86I{+<S1jkivc5iEtWkj*T
+<L<bu?szos8}f4A8Hpkqyyr#e>GIT?P#q;dl|%0^34jgS|0|BP8d!J>o%_z@hzs@dcw(>Ircxq;au#5
+amcvs9ui1w*?(y44F4j<tzH_CdF&Z^fSQ44pfruyj={Lw*@ZYB^Yxoe$((QmCzh}Pzr|0j5E^%a<fW`
+aoia;!>WQ|&EtqR?<1_)>|$u!M+h5mi$L6}j3Bb67GbcR7D3K<T7<*WnS$8v2b9HGk9WWd8wF!glVA{
++ko&M<@fA&M<k$TLF7l;Wmsse<tbcAhcv<308e?2D6INq95@$wuEcwJt9K(^`Q;OlH$BVw*AK|vIk`Y
+AdDaGQ&Z@+4rZ7^v182-@2b3Zp^p;ZHC%{q)hwpcYlJ<JGO0eG)FDkfhtn-O8B*`ErbyTKO?A3#PhCZ
+7n#jA7P{3Dn)AiEzG86M^i<I6$#_<crENYF0Z>1Mn^^5ZvH0Gi`*3F((gRW~Gr_%&@&$ha(;srj}m94
+*&|IGv{mE|HuYUT+(&PEcFNskq;ScP(SR8U?dWO3HP!{p}TN2aPXWxYlWO>Bm^|fnwhV&6I#ne;3=Iu
+Mc{D2B>2V%yzql^lZ6!?FypB@Vg_@z<5g6ZWDsP8J6~-d&6+x9n~5!)Qwg0H#S<(l#FcG%iFQD&r*bp
+;nBk2)c86PC3foq=Od)v>s!MD&8Hq9)AcXOa{3ayfDjb!0F?x$DB1JTQYF0da-b7L$P31ur1)-mC43O
+)SQ5Bl?N?ivj%!|dgB|}8P2x;L^xWf(`RziH6XZCCwFR3Gq#kg;mVYi-}B}*)f0mFYYO4sGT!>?e)p9
+}ab<OS%EwY=W;1NauZT0?klWQfIT2(Pw%9uE1i_rjKV<{MmA3UYOC2E5eA10S{)5@%%r8o-5eZyGUfi
+$@#-4p3S;EA*S`gR7#Ag(D4LMU6^$r^O2$+je_cV~;k=AqdawSoIGXb<l(?+T;4Eg8hnjfQG~KznW%!
+TK0$7BnZ*-Is&fQ;OjPH)i0QIB{SK1F82vDTZyc=MjG<iJa`lrQruqH(4ocX6>RFdZPrA=(2HMc!alW
+;YRm4*)Gq7Tkl7b?=kYX=zJmQLpwrFCLET2fL<G;1B94pFM|{1~rYn)-t9V2?sh4QQK6r**;*gx4(<i
+1lv@as1OnePESB>9QHx<T0n9LH(s#Lnr+z$$ucSY69NQKbtj*>v*4CW|fJYo|?jGyq&@3Vu$&$l0c_#
+H<|m?l^Nh~wOTK71<<q8uc_H=p}t{=FILC-d*kNI(Dh<B#u%^wS%WVAkX32&7^fVn6>JM?AXx?U$d2F
+sw^ZrG5Bmj1xb?YE1bMX2UZfiW^r6=wf~tp{4`|S)lq&U<X6Y)YT9)#Xba0g$==B!5DD%;iuD^*H5F2
+y|smC9}h;JXU3b)|MV#dzWLnG>CXZD*0aBkee<tlAM<M}m%maL&dHJxZ7%xYl!LHTkpf|=s3MyuIM>)
+kRudk|-Uy4e*q3~OKjDX6UvxJ`i<2NfkFb%gg}2>6L0W7{(58u#66hx#mgI`TgdnPMYTgu*4ISwe1(O
+j>=py&=5e}Z%SdU}WnQ3}q+L>5X7=owd1`FT92QTP+n}RkO#Ik3PkH5sJ^{)Z-8?F*p6C)FC=+8zBox
+{4PRj@a+CuIcZ33X9TO3F1I?m#!w4FPu0Cv(mC<5cw5to+75<_*o`BMv7?>zn^_?kOk*MParQ+_KS65
+~Vk7(a$=G(=H$8m{#Q%nP)T6G{MNvT_eiJmSm0K&eor`g=9ZZTUZn8L0jwj!Bvu_?yRN7<M_l2SWxT{
+@Ee^sa6#CMUM}D=z_!Ln37Jfs9`1Up8_H%0%^%Z}yGh^B+$jaqH#e#%d)12jc5BagX(SG2-t%i~B!fs
+Xd8@+HSzXGGtVXfSgL|V|Y(8lo%(0OYZU8oGx|xq{BPuP;)COHNeo~uNU`>{>G|cvLG(zFKz(PyNht>
+xqoQyUSuz1jH5@0ldpEZmR;66*pGRwFneaLfx0bv-yUP;v$3tP#8VHS1T03HC_2R4KpU}APdnB62QgO
+Hqt<SB-Ly)i_Eb#EMADF6KjHVtmZ0c#Q*`IHkq4N(Dz(FqxM$fO_lxj(k+%^f#v31eT6>8fcq9ILh%x
+jGcf%M*JZF9M|a6JQ&u(y*<;J|TyaD89gU1`hM$I0mNtk`X4ITf+Q;=^rCeL@dH!ITAyBeU5US%@zJi
+j%OyxhEL4M*(zDcJvM{SqSu23P&Ii*ec4r{ZLaUD(S=!6bNW0vk%3HSUW9U|J=uBxM1w|9s;sIo<^Y(
+Wp>FWsYAAn7*Hmi~*C#vQ4{3e~%TbK(4vSJ4%IGEzv%><#)Zt#k7JpJj6*gUU^zC0|#};UvMA^5<+)f
+?1QA<VT8j8wy=TTdv3Ub4V?Js^3h<Z>oB?Tix(6MNoly=Nv)vy&X>{yy<ofrcji8AaqAvf7=+(5qY)6
+{o1-9#I0!dYaKnmPXTHL9k__q2s*j$-5e!xu!Y#<mG%NI9G`{)4T?wvq4!;h>AN4*t^EsMS%n$=D>j3
+QlLH?`oRurYnF>Q%=lU#u>D+oU5TpA;sl;_iXxC!>Op&#E`;nt+gSA4O6>=eh!)4NTu;r3<hcJ*SoUP
+WikCN2L9!;$mK}2=Y!K(**=hgVTHM)D24Gclmc$HiziLPY{0hD$X&C=W>!AHWN+B*7=0~UY%F~i?{cF
+IZ^BGIucS>tPdKaY1si-bD;3pFYNa3LKCv@vCh0vKu$N!Y^FU9}+rNu+abz6Ged&6`U(W1PkP54x?RT
+4IMs8EQ&Lx_+e$IX#FsQRZzle7Femo@COIK#3xQCg!(~n2A*Q3h|)|K<>P$B6IE(1L`<z?p@PB#q?9!
+fl*j2+g`&6BkXUfNlPeVL1;Z>xmo(-|Q4otUw!LVf~OxKpKz=v<(j53{JzU`BTq=2vih%Z?;Mv+s%eP
+qiiQcg2OMMFrGUl+i-)!n|h-@g{_wQN9qq-9GFh$Xlrn@jEh4#Dbw^bkdw;#xwI$kvpm_HkDZtlU>lF
+UYez~Liqer94OjH5~cG66_Y9=)R<UZ`Rc9x`V{&-78@U&Sw(MPam<jS86d{&U$P4x(;&T{1?+2^|K_6
+}pa#tTEMe=)Dsg%>OQtacA7P7&Ng3#{2c>O<8+s1?N+?s?fYe1unl&ntxnrL&0p|uM@1`XNJTbPUsp*
+Nomme~&niLAPb2C#}vrTMJ03V>jP~N-C9s&sB?*OpowG;{k6b&4)-O2!><EH?@UReNa`+yehq9J6x#$
+T{4shE9I=hu(>c(8tx;8A-|a@o*)0Fstd43OqZ3_9(VfFTFy0k*9wnQk=<Jr?JrKr@`iNa6i;4Ed(+v
+t^rYRwI$DH8&5z1m|5tB}LA4#+X(CZHzyt0_LHR$h1J3wdX0Q=#8)jmBuVv_9O4J?2&g`_Q-oJd*t2H
+oW_b!*n0|5Vhl2eGux0xftFDpB!xE(uo7N?cqc(IE~OSH%8HO0fns$4kX~O1@OgWP(JT{Sr1uyDvoL2
+~LvV<WG+4z<mbKy!N}74e2J2aSo*Fb9&l)ruW{o!3kUjFw(FPl`N8UZ!U<3A^LL6(bUJ)=tn+Txwemp
+OEM?e}CrGyxQS_04c%KV+RL1AY7!;&r%z&}GrTQ(8}<efEAX2pSZjr+ea`lfA|*$F?qm^85A{b+;>*3
+71Lzam7g!e5&f@9H1C9<Y-uI@eM5!%5_E6s^L^7IFOe$G`UYr@!*}$G?{OkAE%mAOBkBKmE1LfBI{g|
+70@1z>R^L4iK>hxNA7U9LG&-(|Xu&FubsAyMDWtgFN!mG<$@52>sfsX`W_1nVmQPX;;zwekDhTVvkwQ
+k?h9S1oxkt$;L>%aPo^AB4l+LKQFwaD(7a%C1i1Sm8`!`ZJpAW(gkDx%@b(JV>iitJnir7z0tx3Wz6I
+LnWP1Ad-WxZStfR(Ovh&HC^j^u(2RC>0tjxjCX@=_f$>2jW%sw+nyw@$l$1epjo3)TeR-P=*?m8S6_U
+h;yz_j_`ZmEnrr*0PYgm0yhrjAFArmqpnjkd>>zRSK+v(+M>z!%bkmD^?7qVkzuqjWmc~hRfZspMid}
+<Hfeg8XlN2OS!ZE;-NECBOgKcsrA-ukL!M`LfeVcg03-}Odbn0+ofSVP+1F!Q3K?rsv7Gv*~fMtcCkI
+v3}}B-PKi)?0GWCIx2ix0;x`Cqr1S9}31+t9^LN+ddzU1q*m|vp&UuwD|dAjPvz#igOErvQ0n5ycFl_
+wtC8JS%@A4E~55rvvb?<(mq?huxKkxZY9c(a{A>Pi>#mI)WmLH<J%0W%DMA7a`i;fWdAO%Bxaf>yREp
+yV_<qwKA4xJ;gk6!!|jB-=FoH%`c&-uwFU0~qf1FKNN>0P4Xrs~^soo=Qzp5|&Cn#in7tqC&X(Si&JP
+xH8BeYo;!TB3c$IbDpLQt)WHM>XeVskI^qct0Z6&0No&0<F_jCh79A8S!z}rlg7kOAiByO=^wk}yYNs
+o$Q*~xqGN|y$tV!k)3u0vwc4TeXoNJ+?b3t^6TiBy<O$e3Yn6U3nXn>I5GA|r+xK^kLTCwEo{$ka5%^
+(KMe7W6&$b;*CGM`n0z8x9|rc_Z+7y;yMwR$fYS_Q3QFY@&0BTuVHfZ=`YG21NhIkqzB>HDdCg+tQ3(
+=6j6%;Tr=?lXv!4p0yM|Dt7QLZB#aD=SY-fqe>EPgV|0b)I=$3E+pxDn&03y0y$AOzWmsG%D&9o)YFK
+}HM%-!YLR?c`*1$FyJq7Fl%=!kW`ep!(WYcK;k`+y*k=680Nce|u#<LE;$_?MsxYxUAs-s#y^xn1lmf
+2y43-`)-!^cbtKf9@LqL59sgQXPP#;5zY@-Lzr;tiSxWUO%fROp*0QxbchN=7%P=5=kp9AXe0cA$CqZ
+l}jfs+7e7pqwe9LB&=3>?QmkmzAh#)lt5Dr5!~a2Qm;VNlwKKZewx)DDAEI}A$gFetUdpwy0j3^I@1{
+trKdkoZ~i$nixGfgLaz3A|rmS5t9LYB*2X6dyh$(Ss!VDTV$$1s*1&hDGJjpHk@24@oqc-J@i7k3J^R
+WX_J#dH5-r;iJDL(N(kkIL1i6^t^s1gG~tzc7L-v#rh?C+8&HClJCESQz95K8?tW9R8GE%Q@nQZVGRF
+agmEx}e;mO-jo?3y;6IJve;dJn9>J4s_P4m2UW>(+mfR`OiX)nNn$@_#{JAjlS3SzOD3)P~3-^8=fJW
++QG;qG&6m6MRAAWcZJFRAX9AkV+G7iR)`f-Hux7WX?;GbW^CSmcvk0fL8psD<`?831bz=r`ah%!jzV+
+?$XfgfYwrx^HK4E!7eK^a^WIlPqzNL0ZD4CV!PQZYnEBE}QA__&BCahSK#bZYQN7yjv&2>E!BKn}~L2
+ET00N<L_nw4p-#&KlgBYMu>{VETrZcT?sGh`%2g9gK>g9?`*3Ys5O;{`=p%JuD?{a;*QLOiw;xNm+<*
+2{@8vRr1c36z6gLEe?oDhr&tRtrE7a=Ap1CC@jdPZ2hJ?&$U3Bt2<w*YhX9|<5x2ckQp%-ociGJAAbK
+d%K2%8GyCu`!uj>nq%K}ap5FL{-^NSqBL53RD79t)nOHA`PowbvEA_EH%m&zph{^2wxY)o9UYZqMN_b
+bS)89|(g<0(6v+s<5_`dkO1ve6RQ~o;2`7O<n>m7S|mzQbo)t0Z#bZPd@YS-cB{&=QTjFHUoWs`B1$=
+bqSGRdhf2iDVK;B<&kp*kb__Nyzl15O{{!@o_|+@5HGELTY>3`>H%bHCBwzR{ogLSOX4nNPG^-deQ1S
+2h~|uPy&yTYgW|{eRSEMM*E!XeBAKR8CF;Tu7{!yQ7D34s8v^T-LHpfM!C#o>0Vs;^axqrqmKFToO;=
+x5bi_eIpLMZ?hh7DsN;ZFT&VnT?Agkqej1r;hSRcMt^RnO4YjN8bVXLawoRW6I|<zkPN8~`Sc*ZtV?o
+H%CPJDlzeq$B9x3NrK7<feQ(Pk5hXmnA4>=~G|hlQ?IFP)I%Kd3CO?j#>uukadBN;wmT1#4jVw;)2a<
+dU<@IRBgukz5VLjR&_U?~IhmZTC;8?9a-abAixh-zqy!D#Ui0fE|@WImcMjB94?UrP8;e{Pqgf!a0bM
+cyFUFW3Mo8*CpzDkn$t@PeEyzSb<s-#tx7_!AlN48m!vr2y`cW^ujj_8=W%ofi24AZZ$b}~^1b2@x5Q
+Ri|TrgGvF69Mu^36u-!#YD)2F5c-F+LntaeA+}E+i`eqQ}>y%)-Q?p)hxLm3XF!idH#gGPE(kVt`R~f
+>nKEHAO++o8$n)DaF7a_!r1j^lueMCyb@7*!xI>KR+)7~Nsg#_7EvPjhPx2^dnPXK2*`9o%gMxC!bko
+7yq-JQLpWRTB@Fs|RTO!5OFk&+pkK`qxO8VKskJUZWgb}gfqxN=^y11)&nArwVD@96)Mx%juWiX1mRK
+(Bo!SL@TKJ6#%?VisF4Z+J8GI)3Occ@6i2j{T<-8dSVg{VDyf5Z)lP}+XHLTPZZ>NaESF7~>9dT#S9{
+7&<=iik&bk@En`g8GiAs?5I)_3V!QBPhM)wX+2iNLBPJI8%1CdGP3eO$7kirt$L$-`6jc0Ag=dMlEgR
+=*jIY~H`;bJ>~HJEOg;F>%!M`kfKq(}X1Eds@%0%`lFgc)6GF>qsu<RnxyW-be`!qs;33`_eQIe0M&s
++wYD4-LEi3{H_P)#rqQezS8;bqWP|J`QAcFmI%-Er){?6UEhEtPm)8(2u0bSTlO<~>*hoi3>PN~zi7G
++h6UvsJn$&SRZ|}|-5L((NhlBryVG&lmuM_6s|XNi#<K7grh*qx&tjMF_A+RwKsb;^NCKn3tiE<5>*~
+m_qZe63JW=6O5=st3e||}E<-v$Zx&N|QfC=wcx@eHzX6=H0k5*7Vrx3~JTJX~{r1Nz+6e!0fOO|yxTn
+wbmpt*Ej0^KKz+LeG4Od|=EEYlac<B$*d1>N7W0&G%vHUFdPGJ;~q+L_SvrH?{@5$i*NJhMJ3zo@u13
+)4TWM<Q}=?8_h!BJK7|Q3qlpU8eL^CY}VW60o<-6KZsZl-06fq1gtcy@}}r`mo51g4zoaY9n45V+mAw
+2}pSWknhCaJZqz=K_H;I;JQ5D3oTw8V5M)tp{wRy1&IIjDrXgH6_-$z>I&j;M|&Cc***CXcRA`4>eA1
+tY*@u<Id_4_^Z4yA!K))do?d=Z@$s4b(#lnZaZ?qSj>wG3FsfyzSm=srj$8&4PG(lz(!)tl%47<^(%Y
+aih4w(d)D{p@-OG^Fo#=w^3=VhLpKZI~*C2G)L~cnlX%eD`g-eJSUuk4(>KaF05@rQ01lp#e(LgMwJd
+{Y*Dq`Ck`UQW~thXW2u|}8O(j94dnPMLbE({$z=suh5*@|<@Uwr+xqOzQ<`HMFEjWc^Wm%JYMPych9!
+4w&~Zu?wV#cGwfL8S0)zS#%Psm*2QJe5y6s3!QdyX}K%m6Ux^N5ez5vH}VQtjL-@)U^9X%GWc)y8sBm
+lvTNgNh_$+6?vk)@)jWZAD)v3X;zVyoxugQ#ue_B;qGaknPG;_aUm#E^W+axT>S7Fc0-)~mm`}d!eL6
+#NB4;dWz#d{KV6cfXQ)&C=Fe85@1aeF&s!XhpW~1gSAkF-nlSPOU4RQPLhMk?W3Z_UpE|oYp=B~Fy!x
+Q^^Pv&kaqy&7@KuoW2cod^Ivb>P<-;B0w@p>}&=iLGZPE-><S4W+4$Um5@R%eA&eY8nNG^5;KopDo)O
+iv%mn&Jk4KQ(E?Ku}wOfthBlH@DE77d}7WkkjAyK=!!qfJy;H@FJ9B8LP~w%|g}jQ1Xh_^_mW2TR>SA
+qpDBmB}jxcu3{y%7RLIpg+DsM1<tZc<@yaTV%9)*sf9LsF{_kk5yC)WygE|1?_z`o89#z>n>!~gr9)(
+Kl)?qU|rIG=5C_mYiV076huO!fTA2uoj=NJ$0e?e^r<55Rl(Y+*cGDdmHDGtjl=W=+k$F{Fv4!m6Gue
+z^(mMe5YA28;ARhP$r;(f`Bl1((iuW3DaW*_k@TYz)Z<A0$cB{$x1~@nkh>}soWhiXreSwh)83|}0&h
+Pb{@*$B|B`d$|9M3pv2d-tU1ZySWzEB~WVY~)nM4UPxcb*LHgdTNeV)7Euj>u&Skc|h?^Nip+DeTcJ<
+_U6`_9pQ;g27w(-66}!^n)w%8rg)Mxdma$oQ%IQbp;HbtBHXGlBP?(XOJf|0o*BbnfrU-c&_Tf79wMg
+=}^xS(5GTrlm$qLcGrdPl65IlN=Ew{rsXON<Y^~GJip+bg&q{mB1<cs<Ya7?yH^CH`xnG>EQ(nB)Me#
+Ov^!S1DHH2u*g~T!PXGvA2m*uqvsK2ww6=`++r!9rnCMK+f}r&6?0DNT(H23^$>#o>6>v95$-!OyySw
+@^JNXk@q}pnzOx|g_FlIzCh9`d!*a<cZ51Zc1Rt*sxEEz_nyA1dGb_DL0f(P&zk8-Vn_q<FS51m(_jq
+bn<Zt(1>3sLxT5J~kvjb>)Y8pyUUKvYq#2Q7oue)+tn|XBC7yI~tmvY8D5@o)^{)fq%3@9!%J-<Bq5R
+wNW`7tCvDe~&;hl7AT&`I6@_VqVK{`TP~P5rEi`>&rqe29R9A8rQ7d;lFpz^6|E@Y`2SBD-18vxs6Z5
+59H7YPwm+vsvng3eGSP<DuH}h{{4ej4?Cm+V_IZXb&gMUB+t0OS;F5&`Q#(f~2rdYesaw+ZS}c)?VDk
+iGAkumb>l4Nxfau(R|e6c12Y+FBEIHedZ!iL(Mwdq((Qj8X*e_u<;>R>Ah|C_t;{mtGCBiLZI<6ZJ=G
+uGT7I+kQgAg7TAZT*m<-qyDx`jkA2~U?R8|24(PwbG&)(T9I<N7?oRB$Z4Hl)7#R->o9^sSsALi18H%
+^n9$^csBx_S9x8#OQ%*eUR{uJFMC{A$Y5_n20L9_G?cLz)bm<{h$k3}VU2IUv=UA7w9tr;^VmsPwi*s
+<3^+PkBPjM-+%TIV*%E}EF4O*{U3xHAG2g}94t_>J^|6gH!&)n1`j1zB^<e+*5oPHt3EDr^l9YUl(f4
+Iy+&h71Deb5R$xMpGDxQnd2t{L8gpIXelyhD~>d`NnSFpW8xR8wl9<!lf=`mNIz#dG0PQ)E4ni%g*rz
+-Em^1j&SccxO&Tz6q^PTQ!Q=R+g3ZeTkCJ;(x!tMo#<Vzm3P`kbF^V9`8!STfbz~~Xez=z@&EFZ#P#u
+i<lEl=X<xP(#9fjGU&$zC{l|7m(Q`<0O}<^Q(I#SZ0ER^K85#5>j~4E*2h_>7Dq3Q4bZfU)EZZ#2!Ui
+ePuS&?!`blL+$62zma<FX4)6e|RZ3g!jwRv<SHgr%lE|kkzSuSRFTFK5`LnCz7S_>u|l2|50-X+MR#J
+?sTrQSD`^S;p;?VIQW`-ao_bUb<H#9k-6$-ixZhw79A^Hd9VQp!JwyM_ITMOKN)00aeY`3FOJVKwTG^
+mBA7=N`3`XL87A49EWAO@qM|1Rwc@4*c|?Ih$FH0Ji!ZoUIR{%(oB2SS(nO_P7sDe=%*f$Y=R;M%M8Z
+$E*v?RAYovdjy+FB(w6NLu(eXI~K?;vyH_kS;xDqroq8L{wiyE%8pO0WM0n;j{lgg%W5Z9%4>EfN)4V
+0W{IT50*!k6sk7EYC_TO6!PZ;-b3<z-o;2w6X;m(s$Wcciidcd?iJ5WVXCH?>?i)#S!7bZ8!K+pL<?T
+mni3b~x=FPlj^7h7&I>wvU8eI?ra!&3gGYm$?Jy}m)xVT=q*j&TmGerKO7UP3cdkm={Z#p=v4tp^8#t
+b1t2F54na)z}824m-*5%U!ucGMSa&0ulzYE8-Sv6kD$ab?3d1bxaF)kn-|Ij;jQ_VOY7=@U0+{`)g6C
+Fsx3JW{vIhmQw53d6yZ4VcGh#lU}mCQ~y|&@llztKMXE0yS7E;Q!Cgxex6?;DzS*v$ZpGOJ|MpVly@_
+AI$P>TL($mFJOJYcz2s>`>^O=0{iAe!{)I?^T2uD`wgSZHO=IX<I+B~jNY|uvj;i2DLZd-rtF-h8M~3
+l-ihe`=n(RDwPVh&3G6r1zw7N|MmtC?EXUbWTGMKfZjZ7pWW9seq{H^zZUa)~G=c4j{%Z>S&4Ik=RD?
+^4Wl^2iA!H-BY_0T`OyBviH#UW9<zlIgWFxnBvW4^<HH7E1Vf<&?EFRzib=F5f=V{*+*$qK*y+j;7R#
+stgTySbF#0^<<v6(jH@EV4Er}eBsFoB1LZq+pXaf$0Si$a#0fi^uqZDtwt?o?h?f<EYMdmnjjK)DE3B
+S$6{lYPW}R;bGf4||tcZRXp-=@vY`nukS0(1oWGp4GdTY?tDkKU%wfDdw6S9`{9+eD(@@66D+Gr6Zeq
+wCRy8WHSe_Miy*HJ1;w2t%qfn3`_0qW@VOe2NO6$#=)f6NpmQ@%EoThcXnJNw2e<8tmm;;5WawR3aHS
+GV7@W(@lN*Lb-Erw(yq+0QMcF*45*P30ktO=nynwo<+j;&rl>M+pM4?r!myxbZ3MB{-dPtt645pfc7C
+FCUgV>Gkw?4%*%up%bDL_WX3bzTNIB>vu3vz{FYg{-ud&g<e<b!9!t?ZQQm``qGe2ge^#=?zY{Jb6KU
+O7f0s+y>L@0#R<1Rm9NrZ0HkYfb$LMDM}Na4~CA<zxz$UlPi?dDNdAfWZCSO;YS20~q^(;BP`a{Ww0)
+q*Tc)3TPNO!h?UY@y=k$ggjUbxB7L&bB342NmT=BLZ>qP>DpcMzkQGwnkioBSKylOBOZJ355*1P$xbE
+?yygYoR;jdnuPDNBQL*BgX`FI5~a_Tm%T*uAR9;)n99~B%yX(pLgdbh7vPdpO>{ybr!Lfyg;w+5$(^%
+gjRg$rF(~-NfoA8CuP94dmx*i|+*yQm?>?5ZKwUsY`VvAjwM7*6+f%AfrQ><(YZVSX7L7GM>)xlz6_g
+qLt+FTbz3uMGP2eF3`q!0NyshPoQgmg=$eXT}VA$wfvStKuZL4!H=wU9A3WP#jaR{QKoL?>fUeP1r`)
+DtIbkgpWbZ4bacsIt(9y(f3IL=t_^P98hw74?kSNU(OXR0&Wnx=7pItOi%GbO%IZp|dmi2dXI!I&_`=
+U!zfGe`7IFTSXv_HdSZX9B;-9>~y0(c2j3amwW2rQro+H)sb9x-GW?t4JTdF+}bA>|;^IC9@5N3sBXX
+-^9zF2au{%s~v8{S2EXW=6Al#5Yp4x(mDVWoz6iF)O`!lRQQ`H#SKeftPLHqq8{Pxc!Iii;{_-=Rq#g
+!wmDn>r2dKCM%SN9JtQ@~nl+k_x2q^)-B4=a5sRHdv9sR=xrJ9@?>5P~UNZf7i4E-`<Ra6)xEXP})m^
+zRV%kkHCIP<HVTzc&m0GVwUJ{|jLK;4GIJ+al#Q&UCY1F>d3=&)C;^$kNZD2xk+ZAkOkK9c;0X$~7H;
+ggdOTZ`JWwSazGYkLl$rLAelx_~YTzU=KeN49^%ewBRX>%M$`K=y}vO#I*x0mbO3w*kcdB1VnUDxEW>
+{euAvPIjxSP9RF)#}+!27K~4ck=kiJ2fWyd8fRvFmQ=O4z_E(FTHV|TRW0GNR=^T8JPMRBxp>ReoYl4
+-iWm@sKo}<Ad2%qXC_A~p2K35J(o>80PLeZN{<`NUAA$#+161lY@=d}Xq%jYZ~N-RTPJ>571k{uU*3s
+<$p2PkJo<m9eQYu5{NJ%>ElJ2Y%|9|yYhrp_JZzVCAr*1V9J0Vt?Q~mHPwv79n4f7&)H*&5xVN}cbk#
+s5l^w8#?71m`q7ggKlfb~U)mlw~bXnCT$8*9PG23EqgsaA~`C1P7-r~JtO`3urZGioeq*{{b$vlOB{X
+Bu|bJsI9Vc)qY0(Dif`Veq<;hEx?F>~WMw3o|aryruoh4+|l4UuzGqD@Q{kv4Y~?KB?N*&j`775CO<?
+Fsht+`*BmC_CpWfi^7XE`z(T&g}=Qn6fh*BB87I;~?(@gxR;d${}>A^UgM<1KLYT*YYjww$*D}=V5|T
+<H7XgzsvN6dQn#46Wl>4q#J?IZn|dKmh&}CM$!lp&`;w|ntaPMr{czsosoZE{hf(+#Ns;p3(|zF?G=K
+x6)g>|o~#|%++_exWg{MnR5EShuMVg%$M-t?>WK(+?^c?t-g>?LS~^zi_d9*qSWmC^Y<JQRy}-VbSJx
+f=b%(K#q&dfOUl(C%k}Aw=DgvxC5F;H)JRjs}w7e5_ICo6t$`>d3qz{0pRT8tuecmT0bWQ01iLZ?6TW
+H?Hhu?3q)ic4b?FknyGPQEg&;^gMs~!7xx0dh+`+jB7QJBo1Z*4+bo64YE`I&zxSV|4K<C8)5XdKbg)
+AF^*<-|4SfwpqcNE9(OKf=ZCshP1$m_8nf!i`Lrm#|{O+ipHMrHvOjmhlkWJc7{JeZ7!~ncHc2&?fU&
+e9C)KJVX186xd9KI~)3y%b5zYlU#mR-PDI|k<lIyOK?z0CrE6kwxJFEV5cRv-hZZZL+)C0i5c4U_XQ?
+a{-0RpzZ&F5l*V<25_bKw2fJa~*)^_zwYU1;>v+A7)Y}+?CTP7<I8=s7)xWK5Oc1+gv=lXT3f<DqUOq
+_Qb|=j^a$`cG>0=j7_V3HWtVvcyTT)wgGr^lNreO@+ApG8E=9^+cH%zbVYBzDN;8?LeB&X1eKW@w@%}
+({w+%cB-G8Z$`&s;U5PjIIkXK#wCqFy-~<y-cwp0}GszC#R<DTQ#&Ed7M=*%$5z_p;3MYV=ulnm)#zZ
+y)BgS3DlUROtRFaLda+uFu-yQG&c(_aGl8cOaZWgQILy!Up}nc|HYn3Vj#24R*wigKX?ea17fwC5$SA
+JR7LCkhKK%ZHgfDd9X=_uo$$)&F~aLLmp7FIfTjpL1F;w`(jI|Zwvcw=-E7x1s<kkFUwO-b%!Vu-ArI
+h{wCi<Kz+^H62lp5z!~5hk9!ns+T3Ot+H4ECvJ;1><Q?VqN)N;G5BAsxwIHag2u<%CWvj!|zD5KYR*E
+pBUWBq$BV<@RDbUK#r@D@W_SGbSttn4RWjVmsmj=8Svbfd+^c5#SP<MiTbJNyoRD+P=ZHIGxo<P^hG)
+%(j5e6OFqBg120esuMI1Cfdws%je^9`G2cR?u{jMXN&nz@JBOysdoWU!BO*Q>1ABam&Fsco2}=QumT+
+{c>DF#aIUn>aB2r6@MiEgXh`!n|F+fHG6XOAO&g(g3kuQWFfCY7#g(T@7&vIuUf`779ZgWtoEA2I`Q9
+Q;H#)$chmtq4XPqH+nTT!b@aI`>;)A%<_ks3mnvjtXme41B@N1Ca`q%X!o>9PU5xqn+QOhM7;s#Ec#t
+<+IZB|l;t?IacR6E+q>2cU}SjwA-q|0dDfj|+>B00i`*`bO=)F4Lrl?X6sNJWIQ4(MWI0@{Cf24{i@J
+Qt$-Rw6*DgrD)!r^Gp&6{(nzNI4ctGZ0;1pS}aDC2k=uckZUwtkN<_SL8=g1s(ro|k&E+l-`uPX`i1(
+{M@tvmI4tV41P7EE%+CCthz&XNHshT;aP{S2S$Co@vnRmOGA3xdhIXw4!fssj&dKu2hvi=l#u4V>5fL
+e?7KQW5hD;@iHnm>sn{5BX>;9Z2Yej^%|Ar^ZDe=iEY`44J>A$^c6_rPgAnCG<JEcr3dJ+pM}WYmTLe
+EjXWi9z=bP;^{fW_PBU!>(nfdNhRC{a6=}CcEk&;xCH2tnFQxJ<bXn?k&goAw^dUW=%U@kHW_QQ7H18
+x=Y@ixnJA>EM_qRbRk8uYW}0t4k8$tYYQQ^fVLFU19z!{e%<jonwkM`&{T2v0a<47LvR{|xvJAB<`11
+CUFRs5wn5IcMj%jC$r%ryz**pa;0H@-!I(K-d861-gOi5~4{>QfK<^E)4H=dm8E+<oL6vXKO!jcAsEW
+d7TA4=M4zmGS`e9#?5+j(-<`>@=>6th+4FJ7!Z%W6u|xr-c~MPx2RuivgU^MmbHHi~TR^W=d}!;+WV@
+vog5QeTG_QQ87_RF?h7kaX`7RJK^e2q5KH_ABKN4^}R8xKo>$3Ux@^*^xajvWis}c!NvAPD`IN<n^+Q
+aLDGb$_|A)v(*eOt$Ii!j(r#xr}(XYyA-!1T;syFnf*Spvv2Rq9s1U=js}4><!2G7BsW}t{A1dvjGfq
+glWT<5R6=XAM}K_2TbmoVW!pB5Om?y^L?ccv5s%YtLm#TtI-+VJ9t>4Vj>C4M5VbRi+1Kp|I>QHH)yZ
+BU&A}9oOBP^Mxa<g2%$-FRCaSEgtxn8$EzP`+3@xaFCc+!v;dLQ<q3%7aDwlTOP@(jV`{us!S%#}nHs
+oa1PYwO?4FHs=?9TF>59Wg$rRGB?8{sAgy&3`cauELYws*ZVld1Qy{UK{V)O$8phj#m%gxlLhF8eZ&2
+O4$3&M1Cp=JUa+7E=_g#1(~74;sSf^)rrGh78D#Llje+pgc<RA%zO_oNK*MEBvZSfKGZF<0Ww9L14Fi
+PO?uxO&#_7ta{0I-R#jil^c(9SU@j#;*`j3V5;`2B8;lmVTX|+{se={2Sb?Wp&tDXMu-Q;5FzWR$%|9
+kryAlHW+>ibB@nXYP#^@=`9;W(!;26co@0dkFWbhfp6HY$Waxv9kmFA=BD^(&LRl}pb|Z{H$~8V0)yS
+P>*~25Jm|)eezN*MzpD;xIeqewPcLf8s><tE(-60IXaG!9T#W&(L+wB<!sK2Zj!frz`fPu_NcnsT^-g
+1mV*?5d#yZtzX!>%ygiVRqOLo$G63o^viMx<g`RqLpy(Li_DkbRI8I3As)g_x7-e#AP9vkEZPmxz%BZ
+;WgoeihJUM<Gt4qYxhT2&e=S<hK(XFF3|@C=E(87Jec${!9Xm_!7O7;IIV{^u?@YOWgwr<)vVV#R=L&
+1Bb*Gls&^AxhAl%Lt$QvM?qjLo1>SPuPM%a`#9k69zp~KZHVV7)_;h=Fk9DE{>DfkF$SGgcBo<M!eQ~
+TvSS3N$r`Ps4;(dBmEo#!$ix)QT_NsSNp{r7l5wJvisB4<M(Rjm$VB%W&7o(G<<G|$%N=5j=WU!reR?
+!!iaVAy6=f`M6lG5q<XB_K84RwDV+NejOgr9KmR*Fg44Vie*`+$B0f9WDwHX;~NkxiLzQo|JT6iW7D#
+8_Gz>CKOeJ&M%!^Kv_9<Gam2=;_40Hd?6G%qej!yBG|IX1*(C;w=F4CehFC(jU;qJ0~6rHW{Er-^7E8
+(DQ!PTHN04DYu&xKuJ(+35vL*{OAl-~Z6dmXf_)I7%&1%FZ>a5OI_kj)<lZ)*o|OVv^02IFNR(WjBLI
+^2QI~o1%6RH%^Dd1|7C@Yy9xWT6keB<sv}6){*u=*<W@g(;1#*n>V_6`$iRS-{@i$qgswq#o9M<u?k`
+-rM^weRl5w|rv_+M|CZu0qf=%*#A>|kr1#P4n{u7fSfV{kx|>N+I<HN56l@|g<|*B{yk_CxDM0?LBJ)
+Q=s6n5`AgiOAPI_2W;i(G$4i%vyA7?jYm2)ru?I``;H=sw4vOl*CPGHB_I2h?ixmVZ>9%I7c<eq15OE
+_2?<FWx%S6j|hCoK`_AT)&d5Y%DkwLxFZAW4(ngPPwSRGmd?imZd^CI2=5Y-DbWwGLhTj?@ojrgb6jm
+PEZeshMciHbPBAAF{J-TH{ckT*calZo%P9x;llz&~*UKp?)0sM^fp}mX+))bAn`^<4;*81fO%Mqd|pI
+`rH>EIpM^BXLFk8<x(EoC35zOI4h58Op<Kbai|ruu`_;vw)0$2N@1V{>`HN%8C<etb$Z&T^1-QF+AEB
+z;I5&zs$jn$SD;@-4?dD^XWNLZ5<1M9Y-`&cbNEbj!Rh>|+&G<xF6QtdA=fM0y09*gZm~~WJZBYsZ4#
+XdRRk8O-VxQWUiL>8V^Z&lWZzD+h!jX<;%c!f>=wC|iD<tzP-z#nf!f~9REJaWS4yWxtny&0MIN%Y04
+TM=gcwglrbWb%dEKnn2Rd*)+mK@c7b)m%YgPc4uIJQ}5=ZfEQRHPmGoN*nz-Xty>eokU(6|<1*082JY
+Dk>ZsEhPeB+=+}<KG|O308M{)g9lUt+RCDUEtD=pF*eNO9p1Z6>2r*1T)q66@~)&Hhf?+klum@5Pf?{
+iit}xzcc7yQM79xV{(Ft4}Yc?VgQW@yG?4x0B(MF&981Wpa$rhmo@b6wpGP$+|a%n|DM;2YKx<o${%a
+iWEZ!>CsQX;w3u0QtwBc9izqSCmG`4NIRl_2ov!xYR~>@9=fWn$Unj43jr6HqSP5M)19^RSoTiHjN@p
+p+-Zp_L5q8KS1|{*MufyA<N98(h$1Ic};!)Wy0^qn<lu&9`NZBnEdC|NSE#F3qz}seR7VjQp1CI*0-)
+x4D63CCr4T@TCbk%xqE4b7U?1wqp$8`EL(s!9e_`e1MdaSJyU#ikmaT6|hhLW{i5t$A_H%`&EC0(<+G
+y{59F0@f4H8`+_3}%2?PCLpND$xdKb$(+y*%B_W=deP6l|VNUkMrbX=w#jeQJP3(gOM20kZtdy^yC>_
+<d)-PGS`j-G|MW)6zv-BBXP6A^4`i0;+Q2EuDS<r+-~T$m$=g~G4P+qI{uxq2~5SA9v4+f4gxd?xkJ+
+|ju-$J`$<Hwf$3#d8%YeL$F7=?hL{i`CIDkqtD-F;l(zcGct06CbFusdp+{?SCAh2O46&Ge&f1o5;+y
+c?2&?{@IzjFdO|Z-!o_ZTW&wg)j6YZlEdn6Z1g7IPX<V8}^&5@SS|A<$MfmxJJ+ag++_4lk7EyZrk7*
+HoVcBBh8Vuq))W^&u+1?q6-hdXi$Ubit~HJ%@2mb7LAGe@+Qm|SAVJ1&D5V*kf#fZM%<aHoMrfMh=QE
+-)VSCiTN$OZs830sRncH&=fDxQcd*t7vbyQaiz|+TCsAz1%k5xo!16?RT&HbnN)^A~1SVy;ALy2b4=D
+-U$~dSV+2{-rNpJm)>Ce+F~jhzuBw_mqfIk%!qxwchC0WgMIi^?;aVnt;DRZ_J{Nx#o(Z1q4xb3YBQb
+I1|u8Ui+ylM7a!Fg_V8w6kO8u8?DHU`y16lu3CHQ|^+x|rS2(b-F>Vab3?0kDM|S=}T_|&k<wIzC_e$
+G9NzP5%(3GBJ-m;U|B#%8ErCH?PG|9SiMsBnG5B9NJ^gKHw{5r{Zq(sE2Bjle@7P)6eI;xA%H1|2N`S
+x<hCb8*C6q4eQO$yZd!w2*K!2JI>Ss$42fe9a&@JAE=Xu=;q!oVs1lh_T%&Ca+v``7$p{z_0}MDmquU
+E}f(S=&a<TOYY%q+5Kz(sPnjWB_<W*4XvV@4eU9ny?*6_Or*f^6;12G2P_8e&`zL$n#|Nt;C87T7a~<
+EiAjV>#d5Iev`enI<(eUh`y{3I}^A@+#}v1tD)~^f1TcGRwHTq>tNG`>rgk9lrH7c00E?RX;t>kl;zB
+hb?`f1dlg4nT5!NyZzcV9${QKH^PkbN-mKG*bNX`Xd0j5_R9r5!r*WAr+U75PItX=%AAYo{ws|4-cF7
+n)hBIMJ8wLd>p1^F0ZD`Vbqu9vra*@@()Fv8o>jz|lU4Qg}z9D08m8-U39h9pWt|jZU>|TR(7a5?niC
+9&25UJUb!x}QvRlaWFK*jdH3l2T=`&`fBlc<AZ7*r*Z^R8is;*J!D;NBy_US9wyF96=6e=n)Y@2Ruc|
+M6HG?|=1cZO1ls+jTYz<C(3pznb~<H*93Kh`bYwe$YYiL9oKj&j$_(9RDwt?zjI=whoSEE=knEN6UK&
+GwcjNlF6<jPg${BnFYO%Uli4T3nFB5+$<CO%ujP0SnXxQ`NVO_Sq}+8Pnp5hKrfrinwXO9S6V-tB|GW
+V2W-E*w(S4ahPB8B37Zx4LGo=1L1vL=E8B1iJuCA(M7+s34PvJ_2DwPBRb*$z%?w_+orjx6WQqwcTlj
+BaLR*_OA41_wE8CdZ!-Sutp%MDxb>q^91~xfH7Zbbq>rEmqwnhq*h-7(>o2Ci}aj&fhCA&R^Wq>n}{^
++&&IwsV4a<euCbe?+y`GHSO`<7Li7xYIAH<Qs{KMmS$z<z~aH{$-r^ok7bx6G<XOrkimI8Vin?D=qdh
+7zNKOjp=Ggro>FsGrF+Gs}%G+&$Stg0tX&?kvc*fZ{k!pD8H9MGg$j1XL7-)6>Tin(#Ipb3XL5fxx(<
+vKz_YOel^P6sd}c=%A3+E-rft5dRWbMVXh%ueS&3Z7jK6jjZg7-{D9MMt4UVx3zpO_7ok>w(BibSbco
+ES>yd*OuFo`!1;%BO&Ze9uA*3kq#y4LfOL|a-7)T9az}x>kL;yI#*OWzhSQ+6!w#8k=E1S8wR`-F*bI
+eP@8B9t_oPmD2gkkMqFH$Q8=5ZifQzr25MP~f$HbSY?<gPFQn%3=leMME)|t&L)E0K(ttS%a$rS-RN8
+PYhY-=*Aw6C}QH1vy#k<{6kQe>wEh84VfTf6NPiVS{+=05$P4N6R?ILBD(Yq0CbUTo+hy`pc6@3G#<`
+*yvxkxRa9-KGJr7*)y8nHgK?<i_{x%gG15%LytrOTIXHMZ1u7TpD;^RH>@4isVaKe4!)Hmj60&>yq7M
+7p(@q#p#WCq!Ei>XGOJ{e!(?w3_P&fRc&y+3(KcXQ`_rGVFdD5Bw{8sBRXvII~VB6<{hVwzcSd6n!#Y
+vO~FWciFRPQuC{HJO6x5P-V6WAS?{lLio?Qyws)=F#O|(8hNKy0#0s7%f}X6u@$>c4MoH!L8?=E?2^{
+FK4OJBIxxvd!Gl^DZZ4KB`W%@MOCG|gs5Wd@fM)1Y_7EYQO6co5Ki(}LDDT)6|r#jfVFcRE6doJXo7f
+mH9`_vHN1N10@wnjEs^AWT?NXsmj8j3|xq`VRJSQc#no1qz&izfwKdXV&V%ntd;IUQw1+;!vns<cTs2
+qmLfxCBb^!v@+G%M!xuvCfr4{cX356*%OGLVb=H_*ccjdzAX~Y3K+ZaoOT?obFU--(cH~HR`wBIL9(X
+*><_D(^=ofsl8-$u_vfnj=<g^Y`>PxRZWS>%P#1~T_PpdCKDT6QY!9pw|a$l-(+9J)#w_&(6*jQ<G|E
+yi6cZ;k9UnrQiIlBr-RUjBr{x%zP@HUrz~6a&JbMuvGbxw2k(ZxSb9{p*;G3li`-2(0`E!`goeMSiuv
+62U02Ag2!!);>FhKzQN+Qp#ARnBdfTgIJ4?nsPpE;<4`udPE6UFB`;i$M#jN`o$pww_wk!L}b)7q|?{
+lu=;FT9<KpYwW=V}BS*iR+rK9pZN;2@G8pp9%{xISh9TM9<DZFf?yZ9&|4sOYv;AB?5)LuThCd`q$H(
+TGPnp>!4;B6%47*3{7aSHCy;jsH`h^#z4JIW3DSr@`5Urn8F+P2F9b%;t9rIX*d^-Ct<r^!{J}`c2U{
+XScKYi2}Zz-<@6G-;HHsw0AG$42!I;=S9xXU}c}xc?6bZFvs);+DS?lV;{!o=boF$8W-=RtIN%%==b)
+ATh%ZVpFsjfZ&z=k#qng)xhi@y%|3YvN&wP?8#Xrs%JvC1*~x`aX>IJtjBA}_h>p^h){U3KO}%m6ES?
+H4q@G{P&GbWSF~$a_$GBa#GKtUf9P+5=+!kgg6qN3MI!+K@-hGkn=;le^nCeY}(^<Vczu6z<{O0-7n=
+yXcA49CPB=dEX(FTEOC@wUm&~-iUDspw!O}Oxg(BY|k@p*0JjUm@arZr0}x5cALF&{=jZ7t1e`mSj%a
+E3aJan^LOMSluqm?2j_X~=LEzJ@IG>90E@U#%b!vc-;D(_+gul|hQ^KZJcSzZq@xd!u;p00G+=>3HLx
+O>A3*LpChY_616AEWaFPzfz-Iu3VD~Cr6A$wWd?X_@m!xn%Eh<W3IBN;?%q(nb)qOlcYMUMwoP5WX<d
+j<J=WSC~C8IH)P${k204qx~JJlCmQPt_qDTTu_q}}z|#bqJ*=>aj5%*_jPtxI_D2x&@OvYrm={pgtFm
+2+cL~R=iwydg%?3B<_C~tvlW)hi+GW2TFNWJ<QJBnm8~Ec<=Vm^9Pdx0)TtCiDiI|Z-h#=>dK0GCDyC
+IAY#PUVV;7(lRqpaj(=#-`ypJ>q)@gV9Jb@H+MdXah`ALY2<biU{}OltIQkpS=W6sX%cdl7tSaG+7rA
+vfjVuE94<Tz<&OB@@_JC#HuAySApk*9$Tj2oHcb++H;uk8oZ~4(Gpi9<A6nc?&~Hc9Pl@W+^9pgh{4D
+faA%KcxUGG4aP|Rn;z_G6%}}|=(cNr3T@wFX?g+ad)d5@gD#&PA?@Xy8=EP<py=|&<m=8Z*(2W(RP@&
+WpLmT>LyjZ8X(rvGyTRi@WM8l1Eic#;%u4KWyM}FnV^x`fWaUe>5nE?=!;amAcyA%%APOa3twS#yH<l
+;P2FO={e$8>+9XIQ&tWmILkU-qp?F07Zn$Fjs{S^fLBwC}?&-Xscy)+h1xfXcHmx<@LFiZ0!PGYd;Ts
+0x3=l4i%IigjTn-J~9-Zd3mHYp6lThU_j+_uG#5r`r(AL`lI3xZZ!G~bTvSa((DG3(V(-5Qz6kNGE|t
+KT?qbTzv?;o#-3{ChQ*n<aO*9GKsJ<-py=T%N!C^-hKxv%+j@T<7*x-dWpq=u)SRmtWQBB6pqaj84PL
+|Hs~&EjNxM3&Z#Q6nX+h+g06D6VW&FTAuONmfbZoHx;x<**ry&8iKN|e)=D|0f~i@dzSB<KcX&d0hvk
+cNF;znX3+WU9F#^aZX;^rcdbU!oXbLPIS`D2i5-2-=^N>+NJ{KX+k5bWur#?RF$hsXO->MG5@9q$B=t
+=}?lO)v5+!#-%bt(AXM@+iTtQ5@)peRHuo=@>*08LfHoddTMyw=84D=QTvmF{UGnVhv%z7D$7bf<fzg
+f^z?<#3;@UKf3huH3GWtu#k%27&l-3a_GEfjUv*Y1fps&8tB@QRmfQDXP5UOTvmi9gCTz~mS-A<<l5^
+<cm{RScLa0E}2HtSGGxDLHY-3u87_sgNn*ZI7p7meZy<ZY%}&YO*QyeZMhmt=?9!>d6*rG2nR&yF&4i
+>FJx@gohwimH=)y(}zF(oWOoMIAjyb&XzJbt+4BjuCYU?)E#WTK`wr~d2H&%U#l(NLaiVlEHL$|WD$4
+o274-5D&Sfec*)VGZb0vvmo^qbZ&vkiw_JQW`1Ge!E5nr)ULs&d&KDbu<x4mfJs2Ueb+Bpt>8C$^;+J
+_b-5MVq+4ANJc59JRIMkXhxAN<)^O4%KNfJ>D=){f&KCcJy2M<kB(3C(VGodgzPGk2>;$&nz4<Y{TBR
+P<}@8C#eC*c*m87Y|%{g`-hE{wtnOa_$skikF4;G@1PO4#?r2;Tr>h+J|gK8Y;l)2_`aybQO$tg8b0)
+OIwt6&V0&zhSBn<~<rH%E*>X#4=do+@z?@ydEm~?4hl#w1TmRmOiqB%2b@k+ARc&Ze5`p`a#LPbAgh<
+4QM{WV(e!hqeVI%VmJ{cK!QmS3yy&z)OGd)-pUXP#R|Xm0zGKFX*N0W!ER!3r3CQ-1Go?IGAPAAdn_c
+09ZkWYbx4W9$?m5rBlM<h+^T%(K8~lL8I0Jk!XGm7=z^jlXuFCE3Et?}H7H$mX!jhkMxjxg3b#P$dLC
+)HG^8|~e36uC7}f{js!vZSZ<hXa%UEtDX<qNZX3{<k(|)#lq*c+1h5*_yC;gRG@n%Wc3_aKcD^>=8sG
+`H0DwJgGe$(r`U=n=bz}gJF|N1<d6KUe4nGsy)H_S6xTHtuDlvV~c2G2B^aPTj7*YH;u`UHsM)7iyU3
+cI|$PJyV;Jp#7Fo9z$e@yDOX5YNC?#*($`RRv4#2pZQtm^*p2b8VAHJ6oW6^exB%V>lS7c@)}w7|U{A
+Kec2vK8J^As_oEs&8%s<*JC>&$tR(C2lYsIXDF{KD?gU+p}gs9uxGN9kn}L$mAjo5v!^{Z=S}jv(qme
+xPfD803Tl;s4)d2q4*UQbrWrUKJ`cH0hFkf2FddC5)ON3(k_2Z@T$4RixEkh2z)%5k#29;ga*da1V;N
+XHNCqkV_VhNJ-R{)ziVnTRXK>BQ>^C@L_`PeZEdHu!?KCVePBO@~*`WC}5;qdOmG9s}0&N(NAlZ0vf<
+;#+R^-8re~Ja|JV;>&%JQzv^uRlo6zUeb912vZPHM|HhH<QMDzzgdqufvw;ZDXdqnuFi^sZwJ+bxP+<
+svIMBglDW*H3T&O%lz!sP0gg7<HRQ=yCg&;<|5j1`Ka>h}E51p`<L~<Rf30G0I&9^51~Q=zG%Ebni=9
+?%PJvKAFugGr-?c*ll;41zvY>wvu3AgPj23?F*<=XE5u`AUd&w9*jNY2GB{p#B&{31T&-e6wc2RV9__
+*?3}hs6&%^-!N>PGM4gi!>_!^A$7GfUxbR4TpX~;%ubwjS%xupHV;9Q|=qf9mSUCGdnAf=uyI8`@;<0
+b@^Ymglx6Hk?T-dhu*ryNeYInx8g}8&GjUKk*->MdrB|!5l?N@g*nP4u9$EwLd4Jle@(gK`w7Lg!9;V
+S`-v9n7w$!<%YV6HB%PDK|m!4+>jVA7Fvg-Yk$sFZtE<<_<9({wgpS5Mtg=jP)LUV`JR>x(jvy)a#qu
+QH--4aO>m_)+Bi_~!031HL?lJCxDS*5qjU%a<=o49ZjtUi-`0Vv5X)t^}TeukYh#V{)wvcOB?&BEj5(
+s#$J^1L8gvnQq6{>sv4fT4ca5Jx0KAxDDcEZW!On>2-=AxhX5r36eD8GT7jvwAxECCa5~PacLDvM&w6
+#ID1>Sd$2ne%RFz}C8#5>%5;Z?+eP6y17A1AHos6>Tt6b-fz7>bUVfclKAfjOX2y8SIEu|Jj8=xa-Sq
+36aB5MSCFk&8sz<LRlsN{_B&eZivZn!>%=X$&{HWBgiN?4How<yF?QSGr&0$1F9N)J)3@KYC=&o4L@?
+t-Y_lLWS45qIa^m+;gv<SZ`9ljXKfcw6Cg6o=MUGO8Kahj1W-TiTT0(74;^ZWaBE#mv+6yB}tbenCfx
+v2R4O%_M02^mz~WICA4n80&^k<HM<`l&C<G{J}7t_m698I%xk!ALM@01-U~Z*#Z|uuhr&zE$pv&0+Tj
+5h!*rn7^ql(ak!4M)x;7t`sa;*zzVV9_zL$=~;<0QVpl#pr3TJye;ZptZg|1<!}o%6N`c1ZJt8_vTPF
+FnBnhDKcn1wx?)D7vbG&y4Dm}AIpAay+>#?+ywQJ~EZwzEUc-vPS$cdfinkze2NtVx=&hp)yYn6^k0v
+;|Q%ew6U_&#3-c?{PhTz=Fk8IVAuHbxFeHPc?Ry=g>xVb}ZqT*E|(fKgm>kunUEO?A+&pBOfdF+xSLM
+t?MN|!_5*pc3kqj9cjY*CiC6|PC@{DfZ72X{2^^b@N?H#LPxzJeiY$8wkw*~&*9yGer~{sC+BP4^^Ex
+-+S@)vHPf492Df6)&x<TG2aA9plT2);{Ab=?)>2YozXFb}M)pQQ5lIg-r*-h$_57Qn6!zI@H=r5a=Bx
+ba}n+ge=mbP4J*&r&XL20v;rRqE$+iC_|5sglf(sM1giyLX*)V&d}^uB~~Ah)?W+=wN_JXs7gA9A5UO
+J8}*Mc5mxjPl~SHFV@jorey3V##2vgf^GMlJ&&iA?W`G~p%Y5g|{0}Hxa)1UZouMb}+zk~Un$kPb9Oe
+YwbmuVVYSbw(tS>n@+>d498wEz|V_8WTj>Zf;0nVxE!pmSPDC~j2s|dajB6)=`h&({O)gWL_YnftJWb
+C(VdZ-P%fWH*Iv*Cp|P3*?pIfkw9Hg}{B^8s!hDwn2HLj=__uw)1t7x_=UTiab}3)LDbvhFK<b5z<*)
+rflYeg$a6ofV+%WC=HDUkvxh&L=`!(%_K>;g`u_cZf-I5@Vz#wVv~>&Io5)l+UoIWyH9|68Cbr+c55R
+lG!z=JS(*&1eYi=-~znQ`*(>$m`!f}k!Htf3kE+<T65aePi(M(k2G??X$a(XU=L|ijS^h6m5@9-H6fZ
+3RKCl4Nr#MOkiw*1qZmX;l$}8@sOnb*zILvSdoE+8oB?g(kh-NE94^f@+Qa5+BCqY@@F1nSQh|scmI0
+JZ)~FW3Igm|zl_Wk62exg=CDlw{;JA}#f0JUcBjIraH?^n%gFT9u7SDXYtgZ37Q{ujGx9O&^LVsr&Fq
+t9r>4~C@Pf{z*fy*Kj_$a<pY1+{pB#VBVp@Q_tGN}_CN!S!%w;{i%=;$J_EX`Wlq~ZD39Mw-?DdxbG?
+QVO(W%1@Ca4+!HM``*^N>ukr8m}-ws7xr-2KFVGvE^AX-%y{7G+em+q#*5V!J#%8q2NIP^f71dnE+`U
+jkL97s1%vSRL?v~iOU4`253`B`$=ijM2RzKdds~MvjgC7kIGJK1w8zRexwzGt1JeoF@n}=-B*q^8jxq
+;OM0@(#A5J}qM4G3z^vcImi{J9^y?G|wYi_WHCcG9#ZEj~gmemlG#ysOH$GrA=qkml_O+$g3m5Yd`UV
+fx#yAgD9SgF-o@jGBQmK}m67mRm=ObZS^T|>jEFw5W$>X$}{%n5h*u5W?g~@;B%_%vmOsSOb@pvGxij
+n++!U7x=Kob>>gW^4oWdstp(&ge=j^+gD7OX3~8g9Tdjv~^LsTK%B45@DhpqrK*=_nX-h5#b#Ph5y7K
+0UG%W#~Ha0TN-rxbmhEL&6Gi3VVJ~8jTSnc}~C7XSKK60sCS*W(@l3vjLLfTQ)Uco1^Nvwqi-p?pdfe
+tSa5%LV{}S5{3Ub)1$3ZAq$|a=vkD^R2czV3g2Zq;w+7cu;J1bb5deN*tL8V&%BIqqf=ZyxDaZD1~EG
+@TfYJ)D6bkEqApN>7^;^b&>E)LDvgnMn-&jMV)(<_gYXnAh+!eEyc7c6_zA&hWm!j{i>j&)KK%J(2K?
+#A!-Jp35I;w7r!yUbZ=bug7`N-FN_KL+U3On?XV)>jsbf-^0U`9ax*tHfJA{6*ORXp>gRBXwh+T%fUa
+^h1FWA(hU8?)?Rhc4q-mJjPaZ$p|;+aI2hoztFYIKo;m{c?K6bv!-y<1C=zv3ic)hH1>wDq8$%tU9L9
+H8BTy2J26R5*j9u`E)ws7Zr5Pvg%0@@RNC`wo(OJIukA=?KXl^h23V0P8J2jwvL<8#RdspABnni5LUo
+(GFA$yY6BL9A=oG2nxoAc&|u+g_ITsp%n-HN%OP*F<xiBHbH6FxI10@5Xe0W#RpkV2KOQ850s+f(%`b
+L3KSfIE2&#+*Xw7dBG0Jv^2+%V#W$#Km?p1L^;mT~XN+_`U96*ZA6L-0@M;rmb0R~7(X%>)-3Dob0j>
+<~Si$Hc{EyXgA$lNAhiMUz-hz7|JQ|M){X=pO^Y6$NtQTEf{f4_DegE+n+y8V0PTpMWZ+E|~{#7TkXQ
+zcCZ+Z?M7!}cx=`O1w0ipM9%MAfatDuaWr5-sok7)+9bOq;KCzelH=^{q}1H_KFVLXX*yQ+<2!?W@ng
+*(u*q;PIfgZI>N^1BMQ02zF0*(E@O<5bwh$yrgBgv^4>)m2MCz!Bb<Y6Bx7S(gDuFR`;9>ZWk#NLfl5
+rTk7ikK~8r(Q$v4G<e<=Q|vZxlTzpH+w7tnAEz11H7P#0BMH!X(=`DJKT~~Zi_k1hNHk(tCLnSrT?`E
+#(T9|y1-|dPtD@b?C^Z=p?kmyS9wiv(J4}FWH;&fRfbLh^f!L(9c-X+$B%V+*^as`1ixl^Ue#c^8gG;
+x{TZxL|(ZOo))L!-rE4syScD-cZ)VWK8cN}z&$qp_?3IvI{59%>y%Px*VTD-)N8QU^;$AQ6<K5a@fD~
+9+BkXYtOFP+pmd+xn`42zmrR=jG6AAuRUy@S1|zu!yW?wdV1xX#|JgW)u`z*2R5%ehdpmV#-uJej&~*
+xt0%-Z|1_(ajOzxzD97x;%Uuqk%KqT{Pi66TPBjHZiXjo#j2dKXbQFc``T$+*eE_+E-385?l3;IqXRX
+4`y%(K46E!B+L<>+GXC(l!u_#Q5UYs))P*vmDUNKS7*rZttZdGQ9Qof0izQ82<e<}6#b<z@W5*fe_O9
+%Yi6g#o_svvo)qo;HdgL`?h7+od%Dp%?#e6$=`R;e@Gd7u7~ZJuq5!jVXzwCNG{=k13p}L8ah)TwRaS
+2mM=1IzdR4ql;<=XqrnBa?*z$Gm2$ES#iYC43k#7kp-}3f4zEV^i(*%*sqbz2uIV$R<9R#pF$)jOH=P
+>Z{B?sq+AtNaLL?ch)o`>Yn`c5m0=Z6zH98LQ?W*D!hQ@&)R9xTC75PvTLl>D$xoO-+jrl0Gl=M;L`y
+{15N72x2}O?4RM40qF9cbC8_i)FQ&4lc3eb=NLBXd=tbu~#C>Xgs6!7Vz6Q0-xrmf%{BJkJZ8%=ZBiW
+0e7|dcK-~T@m;f9Ongpl1w5xu{Q20>$<ZQ~b;JQdTHz}gI6J@wpksMw%4gRRl9t>~_El!|JSnXRLk|<
+^)kt+f9!zS)CmO0!c&;HPiXy2oYlvyF4va)XSJFFJyH-Ea8CgKXb|TsNdY%ZO&h=)Zf5F0LQW`uv+gF
+}pZ()XfNh1A>-GZl_w)v3^u9=|Nk5;6xiQwxl(wcB2VboCkD5eKTkDXgA5aiAnF@^_G;J$iQ4UPmRFL
+v-E{5;S)@+YG*1pXPN6%Xknt`!7TLCF%d$|pVuRYUC8G>hy&%Zvi4)5uVWJIthd+BXZcRz{pyjpn@T;
+JWk0)}@^A9yk8#uCgm~i|%LR&wE56Kd@=YHUlKGiP`YPi*BVU#fTW3%r$l3nd^9l212@39oo_Q4D93B
+au%e%S^BM?-My+$Nc-ZBJO+TMb$2<LZ!EE8Nmy5B7fF{+x{eh8(Ir@KCkH%+di+){52E;?{`L-?E$vV
+oj8xs6(psBQIt2ZV#WO3S;UI|g#NwPuw;;8(W0wuuM?X7Bm~~4iGT&gfpj*PBR-N3^jvkcaA@CQ28rV
+gNjx6JzwPSfQ1LthyGRz03X9e6KD}Y?mDbN@4cR?ULTy~*pa3br$M@3+WZ4B|bFwdl-GDbly;l_DDM&
+{(MiiHBJPsPel7U_;pMzA#PvdEx?Qe^iCZ${7&sG@-5JiFPnE1ZJDT3qshTL^XbcjUx0K*P>C{t7IU^
+q`}Sx=b+XJT5p33{$&kn(E0)e8T!Psx8)b%33yT>vdK%4PFv!ys=y7dQmHj1p!)Ht@iLMxD{=m+^ac-
+y6(aYBYF>~@%ce@-Q86!KM4*~ltkp+oX61Mf#<JFu#(~t4{e1{<g4-uSlLq*;IQivFp51cQrNBe=A1!
+mq?L}krxrYQ;Tob*PI)3<XGM@}N?4Yh5!H!$)C2jT@+ME@JOY(4QN?qV;uP(I?xwj|2kN5oN{xNVg;6
+`O`xtavttRSbf!vP806qOuBp6kI-B#1AiZ+8D8k2{zZd!snZJK&*_g=>vc)*pQ;hARw<U2w*#BH8H=y
++ZQk?F~E6gNc(I9-JCt0p12Sr>Ns31N3cgniAwVj2<(>Ok_Ycw$!ydB`B4sSBOdM%?T$d)h&TPvg$u?
+Kin?9VNW93<ykr=ovgtO<U{Zdi@LrTAd-(eILNML?<}=)5nV40>c1}h&^c|F&xpu0=bv)9z60=V>tGv
+!eC`F3y1Oe+rif#v%niLpK0e#26vbR<~|^mQHcg6oZe?LzaP(=PzO2KIQd}?HctK_2g{NByCZJZNF^-
++Op%A06t1`o9YDxXN(j+n(!4IKS+maILCj8}c7;fRG<L_63WilA@M*4iYqx-wL(jMEP`rh)=^4D;WQj
+Dy+*MDY;%Frcne8F|OWl+UFpJHGWzimj3QuYKg)3VK-oSE@!0lXtV}T7`C;|4@P0^6bwI;)b#~CzL2t
+0AOD{PYRP5)H1VvS)8fu=u)<XhVXb<vOk#}EOJnQp*H^b4FY(!Q3|lj&)4wOm%{1r3$B$tWcUoxuQjS
+WLdyAV3Nj5JV?;5I`kwyYDK&_a5BW4!7SH=HL*NJ{x#L2~4W=8qM>nS;EBx!i?S3!l5l#Y9O^FfM7TI
+pxW!N-7;Wwt$Du~t@1|TItQahf(q-W1f+`&i~Z2S`aX2HWqHBlALZF{WGs7O2i&REaD#^Rc2>(#)2^#
+a_lhFab%)e&@rWK=v0XjB81?{e*>BZWY;rS#O>r|{k$_k?mEs)L1J@Ze1|Sv}CO9*=hL^RR6dt%)KB{
+5YevRY}<4){!1ncbQl>g%Qb_f5jeW}D&Q13i0G@FV6sO1R<hdME*8XdOWBK&ZHeeCS!hqMeNDK9{1VN
+o3il};YitY4mIRazo6lWGkwt9rTogX#1v8?dX5p;rR^W<A`n0t*i@R2I|C5d+8o--`B63VvZ|7Z1;}e
+b0KE`8&r?XICQ|T!UJsdt(O=i&a6QIF-X6M3bd6A17BON^?QBKIk=U?Zr=TSDD|=(8T1}ZG@#&E{wtB
+C^%Zfl<Cb$I$rRIFf(LE;NCk&G#CNG!wL`5Gb78x)4>I}k?{qnokI*%F2Yd;XYV^lm1q&_j?BQQGtqJ
+O*tmjI`^+c_&h2Ro1R&=nW^5$T8LSKjrOc=d2D?rl{LaMhjHNf+PB>~K;Jc(z8g=CWiY=00#F583DdX
+e>t>AdKTRAr;mf;o4$|plOap&Pv&zs_AQ}@o&h^U!o4*0@-DOxP)+9zC<Au@lqEyPlQm6st@5~=q-#N
+<Xu;~dD9R~(o+7Y*ovq1O_V9aQLGz!R%(&;m>jF9&!z+;unn9iO+=dHh}VKcvl+N7C_L4(BW!k=|UMh
+HM$}Ibe?B!3wyWuwtUYn>Gm#rf@Bcv10cX-EHQubitHIizO@vmocgUw-M7<C>vz?%0q!8M2_h+>Z)kq
+6<H<9NTXOj*bUHdo=0%9cpo4IbzHP9)cQVd=zz#p=%P$|N|Pj`40&Ds1O-pw`JM;VeZO_vPY-=)3$_K
+PlLD!p^dziMS>dgR!+8ll+Z$Q*MN4elQ?cxg6EYof56HsrJ34?Ss^APLAp@Z}H%n6D^NO?07GF`}O7s
+p=T20RC-V7sj?!JfyqPh&ru+<Ffgi06gV2(C%vgcyiOg+pFHZRd*9z1%;s%(OsCnvzQUIqE;Usgtb0?
+tsK7-O_xg^x}p)o7{BRn!?lazOvkp@4G_Hnv|<3{^iv)mSIVI(efiMdENcx$N{JArZVon^lW7>XvoBP
+g656h=6*Yr*0?b5{z3zECB_rK}WTb7!yWO0f(Z1h_Q5;oI$XP18knM82rW-47224I7*}wr5H;67C;|b
+r`U{e@)s}fHOG25eSA7<D8zPHyU~5`+E%MnOXz58<t*nuHG<!FU(oJo2n84zrrI^m63y%AxV?faQw*t
+tco3mn32VbAX#UtB?*Q$6J2Gf$_~#s#Rj+~g>e{?h>yG(%w^=-=qHR~K9`p`FDSv!FMlR>w!1|+GjrV
+OEaymg{n}t8Z9@N_i54x-$;VA@qisH*cIsM8aWifHcv5z8p;7v50J%1u7zh6+$vDednZ|@&e!wo+hP;
+$fkha8_zY&(!^5qdW9KKpb3R}9XfUsN*C3OTG}0?&EK7!bKQ^&gN8EN|^0wpb@`?EaX=I`{Z-o;Qi50
+Q>CKx#j4WQJ3zT+&xAdCs%zZHZ{!Tf4bT~iAR%$R^BOIstC4{sDFaL4wK@SC8S4>_Bwjvd@c?RmnMS-
+sD;MX2wVc3U;46B{A|-wD=P~6B^CY&>7wutSe+=*WQvN@io*bmAO)IBCMenxh~i{U`3$V9+0B9#lItN
+)!n-YCe|zv;;w%*uG>@^8?zUY#_Z?~s<Y}mi-ccz&Pv`9DuD5=xnp-=V6W~L;j=+|A4eo1ne8@LIL1c
+QeZHraCIPTWlEaIduUb6_SYJh+ZRxTxirwI`}mk#)j%B2JFTsq`yswnZy8J95h`}~NNzbIKt5pB%$-4
+<^jDm+1772qRvO*Xe-^xJ=S{uq8xtr|@kcg5G$?F#P&6a~(NWPG1gkDI5<?kS_V22eW#anV%a=}bmSw
+=oP4@beU1(p5F<wHUVd=Aw05!;1%~LhZh>3{mu88Yo}s$QxBK-pnvgb~qfv&nD|`O<ZPeXBmZXRg{d(
+(5*R~ZyqVeyn>q~yB(4Ms=ueu%kDJ=lJSugj+$F6IC(7T3ewMXc6$*4yed<OK&!AJ$jWGC1xmGRu<{(
+@?w{+v1S7cH5Y7(K@N|<ge%4#L%CcS<o=4Sl@ltoa$Kev^quAKD-8zQYe(<2HqW@N@kFX9tdTSXuXza
+9X=Y)V@hlZ>?c;JI&M@z7<9F&XZmTEESO+xr45I9)c;GmKIVBJk^WFs6WX!e=rGtZvcFcgbt*dVANTw
+9|NXcSK8paW7j8c#y20$g`0A(hJ=DyoWMt}(>)q-zI;C>pU&Kl+*e<miuo666ABJY+Bp?%=wn>s5^kA
+0(D&{|Wh{?Ov7KgiJ@t>4}v#lBPehUt|%~CuZ`D-iP6W8xQ}y0aM3RRoRH8+J9y;z>$F!6ya2A2!GKL
+=L$y4Yh4b{`$q<AsHvLQeAdZ1Fu|%`0}nR^Y&1<=Hns?se1*3y^dXvWlW&>oo*gplSXyL}hQ1zt{qdK
+*GSlR#v68}Og}-Rrn_I}noAq-6gb?ogVtYz^W{6^Ch&$QnQ3YN`_?OIV*oYksbieOh$q<mm28#IXjvB
+mhvqMZG;M`Td)A2bN%7-<V;ao-+R`_GPXybDi8^q%~{*^i()1w8-6eBc=IYKskI3hFtiO*f)_Oj6RZB
+w)uh9o~c`p}CDmOkWxOCR#U+J`*Q_>c!~9#v3*YZX*rqk<0n@zIAou=F7hT>6j));{Ec#)mx6m-eG7?
+MGkQkE*mEeQ7_c(q4gmOcx&TYDwa^<nmpj^UdQu?)EsIM%;CquTBW(;@~puM*XpSFJ;F7a*>0REch@F
+{*ZueNk`HV%;6}8Q)^$kW&@MttOm85gDmtgg8KT8!CyuY^%$H!SZ~uFU|0yq7dwMF6b$Z63`e34@PI=
+Fh*~#*<>;tIQP9Ar-Nnkq{TSFZ%^7S}pBj3OPt47@I4~a{^XX6=cqQ0slDJEkqW7{&0l=~)W^@?l34m
+eRVn8Hd%dBJSL#%-~5N~84?d6D5Bbx`5-3MXVaK!O!9}yI<3KDhw0ud~jA~-Fd$SR)?`pHWA11=C2mS
+DNEp0*|ZXFhL3vIL#Jz#H+dFAvHv_7X&wVJtu%mSHSJF2k50tu*?4pu&e7#=0Kp2w=!`0|d}cyZ!B+F
+hSom0x5O)MMai6%m{`_wB{d-+8y4&<Ms^hNpUeeuUZ+d=kk<Jt=;F~W23VxVf#X{lWt@Cgd=o7hQYI@
+D+UIGpkueE9OHvR3_r9r2!$#Gy!L`0D~$3q!3CIyI);6lV6=3B7YQw0z=3KPa3JFX4us1RhX_b&pGa!
+l47f0&=mKFLbQi`??F%F0@4~pbcwxMta0zlOY=E0(7<&n#br^F<_mQV}q)gRT^P#r8rix=<K)R*yH(y
+XFJG!W}!LBIXg&{@ls@m7sz&^I*7@oXSkj<8wDx{CV^x;#zxLMoKRk6ky3BODFJ>>Wy$Itt^6dDXG_@
+RO`JqZ9o_(er(9cF|r6&^y^NZqaq5cA*&(pSUBmK@8}H3Jsv+V;5TJ`v<40i~ZUQ=&SBq(ml#Bt(a03
+Q38UDI_JTQ%Fi=Qb<Ddp-dqu(K3akM0E;DiA)Mfh(4AnBqds=kd&xSAt{kbAwYCpy)vgEOANTRkl>3C
+mnx{hOBGb$S_Ku@sGtXX&U@1j&z=2+m$&!NeYbf6-hvCiot2n@L`aZ#G2>$ByI~o`YKh5f>SYXY6#wW
+tU|?9JKzNNHFA1nlA&v;IDInZzpSqTr1IKQbOK>s=@incC6y~j<f)Ep+F!M<`GxH=i5`Seu{xcil@9q
+ll&3W4yoUJPM5=56_EJW5}EJT_x79c;AVJt*0!&r!{!&rzkVJtv?EW=ocT!yg_S%<L@X~GyHos}_;IK
+lO<S_~!sF8R0SU&6!lc^)2j6=<d?i3I^}MY-z+ybF*Jq(=uk$K6ZS7bv#R7X^tE7(kLmZ48Q2WHhVjx
+Bf&S2EC-PG6TwxEi<4DS)Bo8$V>*5A=^CWU^&7%2g?zf94saD91O)W6ssUY=Q_N(QZaRo#88$*RV<}J
+3CD#MJ`e{&Ngxmc!u3B``omQ}Sn$KOK3L|%6+T$p!*xAa(!<p}SjfXQJXpTNl{;9p!}U5?s>4+}SfIn
+TIarp%6**Xp!*w`Vg2UA}Sa`!VS7LtHSjcJnvh<-B7p#4Vf#+3Q`j7`MeaHiAA7Y?CstC?9g2N*l30A
+)#{t^M|IL-vYu}FL*5+8@)O589@a}mg!w{r(U_(er(9af0Lr4DOEt-}iOVX4C!QR}cmd|c|VM$|g25V
+RZz<ss0A6eKCGinUu&9*jEd`HgS)6$B45aCS=Y#fO(FsKB)fDzH&O5B^Z9paL&dP=RX|RA8fm9{jOXK
+?Po_paRz_sK7=AJ(z@|gE9dmB+CSlkeCDzlN^=_AR$>MfP};(fSBY%nE(=!WdcY@Oah2WK3+ejpgIL*
+KE$Ot24%=Hscq8a(l5&dkdQ1BKtht{ZW2I3lBq|g8fh&&^Czf^*VQXNeRyi<%3b7i6?+My%P<xq>o67
+~O&AN1AIdNmB9~z-MAl&}M4B-6q7*&$>0RkN$b;{9kl*hhzu!TAzk~dK2l@RD^7|d+_dCe%caY!jAiv
+*1e!qkKeh2ye4)XgQ<o7$s?{|>j?;yY5L4Lo3{C)@d{SNZ`9pv{r$nSTM-|ry5-$8!AgZz)(L4N#t@D
+<+1zw;szF4XAA%(KemS~7F@cx<J-nhZvhbe>#Bx(FWd;qrwr+FDvxepXc_I@5UX%_TqYrSmfY=qI-X;
+YzS~Mxmn;286UF$lQrSY@~!dO8FH0U%x$#;dP9t-*L~Hz=Dq`5<W_PYS71-0<rO1xJb3l5nRg3FSYry
+-hXq8k!9xUHoZJF-|GLr-0uBfzUlg}-)%|6&tMN*zT@^Qd(lOxI(O$qkqdM^xS;(0&`nr;`311tWX{6
+L_DOmxmcId$I-H`}<b)OKD=`lGMm){4nDkak8!!ksn8JA0l>%`zrr^Uo_(L9iS!_8^e}iRrP2kk5;`j
+UiySG=PH$@!AyC@TK!tnMeT{ZNLQq=Yr#;+YC*G)E@>E8<zE+9LuiTu4y-BNCl4>iRt7%>e`SHS{UF2
+|kczW*C1xqZE=LAC%397R8fvX8WXkP*RT|5~P?WeUoCxJhA$X<~<IVuzUzGl_jj6Z?=R_963OCb5rcV
+jt7QK4w0Y#9q2@c9_sWvk)A`=xM~Ax{e*eqFs^D1dls<6>*{C^V19zuTaPW2%X7pR@pI`p2Z?SgaV#h
+!N81Rb$DJ&A<tg_AD%9{w%mVwba)cBP<*V!k%Z{~@o|%$Z~yWE6HPij+y3Q~r$e38hw|S!lKP;N`dI!
+uXH_3{Qb$d<_$Ee&{yWE6K4L}oClui_CtM*!t!7$;IjLW2nm8JInH>LICg(Jl$$`pca=vg&T_1oBQ_z
+PL^f3kHHvSUi>Aw5}d*s`~rbpg|?B@7<Q-e2E2ST&H;DV>@26J2WS1^VC7R3HOsaj)Kc-|kAeWEoaan
+{u9HQ8;Z)R3><fuMr0Ajt^uck;*^rZN|UPH8Rl^(=XA00%MkQ%eS#U?zVS+fkR6rw?GI9PPHX!;#$)f
+(3DK74&Kc8`v5aiK*{i*(M!&5RnAIe3MEO41vap+Egf2@KUW)nSZO-__2`~uQwdC#1xLpV$_G~EB6W6
+^bQ+_maf<`AVI;rnyq^n0}E$saGo4O#aUkjKCe2<Rjo)Eg70D9*fiuBn4Q#*Q-Bs4pAm#aykIYQON=(
+$jzNeDAm|Uv84aTp(8@CrfvM)Fi9zs1$pN%1XIz3K&Bi<<F^dbXh!)QkI`2b5@Kmgdw~GKvYYA9HcA+
+$h{FmY_%Srss?Ak0rIkS{#kL{vuVf*6S9X<FuH%K@3%Pg9<rY?07)X4y31dKX?o6n%F-xi!|SkC(myJ
+J<n$<VR++VKWmZ8?M?2g=m(<koymsa$v~Z#{a4o;8j1H37IqwFhu2mWJ?3qCw<j*n8(0YbQ@J)>O!{q
+T(C3M|1h;IG2zsvI%!{$*`2olvw5?W*fw&LCi`wJF%4g4wA!@-Pm^|poO>h67Eg*!_IPXFYll@-aK0A
+di@TPy+r|ijG}$AwF8b*^j45)WxdUSrUbI%_Z7}~#tGouv)O?^$JyQQr`VU!C0It@joz2UH5l4dc--o
+SQAY|c4)UnGYI)zu7{@#By0sNJsryP=Gl5NA=x#T9z8if%;r_<M92K5&__}&R|Av3th5Y+2<UexA+s@
+RZ$qMrCyO95wXk(<<@-cwSlIBtRJ8^vK{GGP8i|p#Xt{3#|0WF9!@?y2x3}^<}&s*6HCp0nQ`u66Yd-
+|?gTVM`j9FPl1a9xP`YyJE0jZfE~@kNji34{+>BPg?u2<peHWyC#rY)L-U>>@#4)oY8xWg<Z-_86f&X
+Q9^TpDCP?6;X_H7{y%M5cpbRR6d$ZBtXe$6ypO=n3*vE4cDpzQHwMwQA~g$EgM2r;VC`=3?N76cX51{
+0KW3MX^hCi>DnfN$d!#oTy9pDjez^-EHo|cb;lxHTD80LD0&pfX9*x%ev24^=fPGSi{e?jp#CT}yU-M
+ms1JTlAvdS<82I5Zg?v4+e-AcS`!oOa^>2qC6^#W4Nh4Vp|D>YVU9N-=aViA(diT@$&qqIv!N1;BFB#
+nV(ND93G5F{=vyUU-%ojlgxnWKYKh8g;;JfpKgQJ5V&vF<GpB;`OviSn?&tFe}$|7c;M!=b*Vp2<U{^
+95_55@19g#(MVq5*6%BY-e@npb1kBap7gkX90^+EFab1rCyst|P>JGH}Q+1IDZ}@S8SAZL`im|55cFf
+my_7xzh>tQJiGd0C;#3$FoFw^%+NHKK&4-FRmdpOoZ$lFq5QT?n0B;L5#X1i#f3~J%U({l0fWiiePry
+C6KcWX#VMMX@YoZoGVVa9_%K`Vz0X_`0n7~>*?(H>m1%gjNl%!xS!8b&_xP*NI@f+{hZGzZ9NORNI^+
+P#FZo9r{v2|$%miv1^kpRpRmppJl?S9yIS@<)3oQAwmr`@?)g~jo{u%}d8U2OGYx#6X<_8WF)VH2^R$
+W2N80#&tdVIIN}-viI?A=xQLeF$MqBG>w7HIQ?RAuEu%ldy;i{hiGi`R1X|$tHUr+Ck4@TgJIry#JTR
+-!Armx654n}E5nqss|{(SmV3Y=xTWR~rdS+-MV<GnH)@0MA%UuM~knPq!s_Avv?^~@~SH8bi1nATb3S
+dB(ocb4bZAhFNp_s3rketbLlaToTdUC5tzAwP{H4|is2v4^ABk8dAGaX;<Ejo0Moow)Hze%kTfr=8zr
++venN_Xi{J4<qnQ{$m~f_2~BN{Nnuj^yKT=<<0CqPw{a59-8b>%a{M_?Ed2LdSu`-GMgaa4n{s?T<*I
+>l$rzc$-#(`?Lv)Dku23u?;-m6Jw)#))Zx1dm6=K@RXU|onxEc9v%dv?eizODM*8%QbUwW+ot<qx!i?
+u*tL6NUESEq`=-ku^u^)C~b8Rs;Q|IwieQ4_epJpZiarNX}{QxGVN+`bc#TpN9B``(3<@@fa>)}2u27
+|#954@^D;}D#!;~}hrb6ou0$?+{+He$l0^ZW>Yn7BCL2rs<>S%jAYd?(4yyXZquUzn75{#M3E+2T_Vo
+Ix6KA@vlU8$K7}wAXux0zb_0fur1{d;d}5sIN9>^;^XX@N}|{j!O;Ke8vp{l)BUn=z*F^11GyTOHlo-
+8&VZUP{*L7x-gSf!P)`djF7m$a|i8Pfn4eootM0N%~y?f-*{C#Q6d;i61Jc;nR*Qm1?U`l#fedIS1M`
+SXm3R09BU~jRy*3&fO4xJ95$M{5(}W>(bsF6gRf7#Yn9)4L|9n1uK@0RXkAjjpkhYSH3AKK2mQ9D9Yp
+S2qdxM$uzl&twdxoG<kHM_5BdJ`Jw$QUNeaMe`>qPzg^4R#K2}1NJ{xt+!YKF<_!P6V7#*QaUYU0678
++hsKy7aN8qDs|&y;?Sx?$*S?Uq9bzwg!vBt8P(-bP(#DxYpQ>texP?C+`)&fVnNhg3M6Mx}FkeELSd)
+oxDbe1awzcgQ53)bPipkXE){Rac#5v|XY_Gg|c8fTm|NcqhXhesNKPuEN635b7!LIt)c)<xf@@n5!sz
+0Y+DGFNN)N25?VjOWUJ*Yh2hzw2c@Qxr%t;Sh2a(kh&Rc)=~_jmzYB*#bQU-P7Cd<SlIU5PIAucnD(~
+smaN#rLDVCuo{EL|&35kp)=WztmL(`uFZ7$sNc7IBjp8PQTYfvfajcH^wQ3?9uSquab}ge@M~KP88lC
+>K%gZPV*BV6+s(b{G(E$?QIqji<87C@zq|B0fzAU@8I^Og>oW(Bz3z}%4g7?%HkNU-c*D^f6be*v(zP
+Yba4bbB7_r`XFgu&G(MC=5huMK#jKjxBcf-1Nc{Zd=eWiY;BA!-}e!6`7w97t1S3cM!=zXO>;Tp9nz`
+eRa9>1ep`@V>#g=pEMCb;E+%Dk${(x`r0J|4a|Lj-WspuBM5L%BYcs0H1W<ZMn1~zg!-5-M3ZIe?yBG
+Znnuo%!{E~ku8k7&dy-?H>IVGf}+)iv0IQvF?3%KLXGBl%5JeiO+^VDKf~HdYN!lSWfD+4`ROGN{-1&
+<a@`GouM}$}4Cv%p%o$3P1iEM~s|2MIFiZ4mxu%1ogKzkP+lk<y5A&775AC<Mdu?5e7cDF6RCbuyC2+
+oYu2$9L%E}8+sI$6i$}l#y^4YU3c?d*qWgG7VhGhnoeDK$53uQME*!GVTW-@76?ptmaRh-y-Lv0#Dsp
+Fs{vDdNFgV^-4c(lDA!u-1$ey2%4<hfWPVEGNSL^yiAX&MQ``;M(d9@>T}7Y)qNik@GArZ4K6KyYsPI
+ti{iGUI1D@cm@P^|G_+i5G4clF<hM{KR%X)e9g#L?hpY^k=@xYZ+1!5VD@0*r5U<lNf3q`eC}vxTi-e
+qB2b}a&+&4(^=bs)u4!CYHPBnJ{Qe$0F^F<I0qFNupy*@sJT3Atf&p{={+2>UIEL2hFJut+hTamd;vY
+<z+5mFu-n{j@$I!X)xoD9Gtk37<)D97K$?)f%g@Sek_lF-1Ov+;Msid{?K|}a>U_&bcGyJU31m*X?9w
+NoB`fQ~YzeY8M~*7X>|x1RZ|!nolX>il-n&0;gf+rw0a=YCT*LmZJAN>@>6^*#mPJN6=D9JLc}uu4ly
+4_9_E)$VedwF_aAr^op3$74iIZ|{8rn~~wIF(Jmzbv_Bb(#9D){F)b`X;+7Wk~2*I=(W9mX9ofw8(O9
+HFtUDlBN*g|E<S{Ob!A1LTAM*;q*%{@F0CsZs4|#HH%}$}*S_PRX3#vt{?Cn@^+xSmS<3Fr(en`(%C4
+BmcRv!tpJ+T@U)rXQj$Nx9z@oe*f4z*3&{mcy1sF8SG8#$75!kE|5PjG;iKfW84ohucw&d^bJ;kr<RV
+4jNZ8-3EDxH7d%R{NI!=VVv=cZo0AG8^Itt1r5SIVg|cv>F^?F^4W~;iHNS6g-?~LB2JCH2IOS1!B;u
+GZE1a$AGRnx9FZ!-&W_F}HvA_jrfMePYL_-^4Fcpzr0@LG-8SGSb@w3`CBA)7L(0xbGk-5IqjkNKlCL
+crWZ4ilHS<%0?OKTL@A^;X#0vh2MAjal!P-2Ip3j5Y~^G%1-&Pgj64dj!k*vy&bZ0=T-!wq}M7a1b${
+w0Rr{qDg&C}sOyQ>g}kVZ*0?HnZuk=T$c=OE^WG;BgW2c9`k?R(|>YkPUC)X^WkX3pg!4U9E>LpY4iP
+s%_!UPOaux&M5f|>X=jXK}SL9LL*7i&>}%9WJw$YeN_!UbiG+Uk_?BUry)8f3Mlj(j~l>F4L+{AXqVl
+jfT>cwt!viPt<kvhvWC4OJhn5oocKbHSxE~PKdrRqq<r^qmJWX*Is1F+Q?xNO6AHhh->IDVnc9wmldf
+#Ms3`(D>rX*bpHYTh@9AcX1-xrekPExrTH4}+NmMBvwxR6PG%@egsHlV}@Bt)eX|Ux_;oQ!SBMiUQFr
+*4u<>^y{Vo8NIde&7BqZSXA_@xmMF^nU$Nx}a&3uHca2ST}Gx6rtC#pkbhedd!1IH-^ErGXlMMhC3a!
+LZ73^>A_z-C9RwubMWz$@KSe-P`&3ONy937i(L|w*d?ZA<?9_d$bLXqvNXO1N1wB4PyJxhjM(uKmAaz
+KzJJ-1Ewd{lbvm56meCzn_)kmjDEhC>`Og7f38-wSwB~OweO>MQje0MnsgYQ`sm@wIPOD&<AV*=#D!g
+lhYh@9L_UZ*kZn2py<TnXLR!%8eTV!PkT&SHG6jFybnO#`@Zs&?!k2{#d!k^cGuU!vMuC$C3tlEf<f1
+XR@HL>}SNS)U#;p-h9R3`yyL1Y;1h_<yPbTS%@ITn=j?M;nQ0mjgbq(lodsu*|ppY(TcT^T-=eEK&^a
+^<mAJeNzh3u<!Q!J{m2AB`r9H9_|CzrW7M|VcKdXcr0cUH~DK7+`=uVT+Y1plyj5HNJ^GFs!RuW>obR
+T}`9ZN3HEr=zvc)?2M0uKRt+zdXyqz%P`Qcee_6-osFvuPfWw9{Slb-`}CJn#?C~pIHs{;<uu&izq94
+aGU*1P?VQ@ajfUZb76d)WbX32TnE>WY}2XXFOz8Qs>`EYZJ8GicCYNmaJW}$$lk@A5x81HNxKc(W>RI
+ls)pz8zqO(_g&F<|rIHNgMxV+gH-c`dCotTFRm%!eND6A+Cj;#G-W~kA++*>8&<14#7Z$-Fm*O~1r2k
+EjV`g-?{qiV}dGxo@6vX=;X7YZ!Evh4sl|dux$l%?#E_NqIAG|o?4ME5iHw7Ij@y~&ggJ80}bko+mSn
+AvoHBAkTGQwMAsr8W4rg~u$3-a}RYvtrs9G@PYUYy)KBw*Ssqudaq&S#ewm!~%={PN~{HlL^P+Z2X-c
+eoOd5x@Q;lLA~HF6%bnP610wSdnWozyC2&L&WTAp8H0D{bykI!?H`eM<W{_Q8d5c2fg^e&DH)(yOJ!&
+inx$8gSluQOeJhggW*WV!Lv;3U*Jl6*$S}^{7<7^LQ~q6L_iQkVi1Ww5!5T7gmCUIgo<3Mx!Ytx%tk~
+bb!b7$?@sCWdQ}zKWpw{q%Xi#(0^@^lk=BrMObDObE+?xPtiOkLgw};+sWxp$7EGEzdAx=fl0ZKiv{q
+2t9)YVVG+c?}YU7Kr8KKG5I6ueUF%u^N>=p_y*Nr2H>Di`fwg@Q4iLSe09|@}v__SPmMx*>c)-6F%q;
+nz^%}$5(z2<ucI-rM}N?OzXp)EpBY@NC%eWpv0iNew?WD1!g<hTQCD^@sPgE`kRB6Y$%LV`CZs7^OR;
+E&|T2%fuFJm!S`zzEHKhxU3fta8KPbk;PtXvayxl9CfRDlGwh3757<@RL>XM!z*(Ppo~$7^KAuI`F=8
+dWvtPU5EBBibp!B^WP1f+_(kZO7{rEW<A=aoMHN9Fc9_*mPxmEnw>l}T*yr9nB;IipVRgU?7XS4tQdc
+-wj<!_?d@N`X2#hlVMo_tJBik0YH}wL>tO66LHP^KeD9^YwQEZ62WOsCj`4As+(oysV%gg+iZi<+ovt
+3M5;ZAy5pHPQ@1mhI?wjTQ=D+FTq_*%Ab%YG<OQE99o|@t<248CIA-h4<`aMK=*T08mUoT--?l1Tnj3
+MvK4F(0RZto-8-3m0v_ZE%F#2(`g%3tXwacgDLy=3p`rC;CEx_6afufDse9Jkf$(+H{TXMM`%9rQ-FK
+l?{LX^k3JyW$Z{K!PQ;dNFCMSI_*(l08K9?w-PVmTC9?FILtb=j)&>ct_$p9yRP>^PJYGk|qfC$U7zA
+7Dc>)b<i`sNz5Sp)oyTQ8(;6DHpU;j;>9LhI?AOd=oHJ*x?WMUV9nLds;-%P@DN^wN7WRn%c3pK!cIx
+e>|hZLqqnx*`=XA)VG~K3Iy`b6OF|uY;p9a=h;C^w+VE=Da@zb@Kn)dEf3{7c?Th*~)P<(>c*Ms+oec
+G*CbSlj9V-`{QV`yyq)@manAbUav_qCat!UQ|_yMmQbVsBk(`&TmmBZYYOEK}|7YPYX(Htm5$u6izTo
+xf*F=`*4Vg)texG=WUhLDOzedhDi7GAup^T4a31p{vy1r^C8a|wFN#|6L0NHDJY3f{e9Gk8cQw<{7~G
+Z|jhW!Z$Fo3`2Bv>|N1vU{dX?)N<n*#EX5&I8?xgRETjxqf<%ml;NJcmz9NfFYR_NlaZwrn5&}b0Q#K
+M~5&z!q%V*Xk2_q2>+(Xc2f2og_Y4>2GnK8bQkU7nL<~!-5}Ea2*z*gMZqD^Tjd365eU@_H|rNpJYKL
+2Ty_f-DoT<&ms+@#cV=$avlNL^4new5+UxWrUb{KD7U^v5B&W5Sb?b5|k4M&OE3u|^jU<_Le}x&!${U
+Fc!GhfTKE+!R-7*B=#=(fR4@9_$NC`)@E?7W^+eR!Wzl6&)Td)Ci!Z<7^VXJwFQ~3A%3?sg+AnKb-Hj
+vUv;f7LT+*UpsHy0`m`bNqLRVFVvjqO<}A5w{tvrbhOlR%waT;ClGP>T>loG>PF-f)Le8r79q^flG8H
+hi9HL#Uz-53p7pTw2OSH9XarwI!)f@gvaN=dFS3IhQLRvnKGhs<a-XtXU+j>ME$NV|*R;9StXJcK3+v
+L7CY0#jmSo`s-ijG(3|-Zn%ZP!Q(=p+G*3Ra;Wp7e?-Zv;USYF5|5Apn)17OZEfd1*XuYwJzlTJk$<t
+{V~#!NX%=AXmssk8io=DQRAkW_tju?hMZ-0HF8KVuUO_|I*4<d%TZ3btrg7zjgIzr1>o;p)>Q<&FTUj
+=MpL1$9>O;T6(+U;!!TEOe*fso2&6mBeo<L2i=Rz3rF(Y{b1BgC=)7jdJqfZ;C;PBjcR2n#T#&#ilWg
+Ac9gI-^cM}idqKoDdTXK><;N8s!jha&F1Fq!uw)i(@t<uJ@g-V~;)@@cx<5ZM{g;J=xHVKwv{lm`F;>
+M`P1$<9pn9z~m_ig<nnhHvqKxorxEq(_Mqt_^h$yeX&R+j(8!wK(^-aaEz7eM03sp7C6<+HkFEqx;gv
+T<ETP+B5~|c!BZ>CCAmb0jhg#e8p|JZ*XDk>w*kvQ;BV0=!WgO(mO&93j&oFo9!u8f9RxcLwCY=M>Z&
+x8M?pBsV|3)>tp$_xV5oiT_qcHp|nc=5~G9C51o{rFEw}oxx{x4A#$xW5p$7PRvt}Fla3$XbS2zOaM#
+1*p8I`mLK*263GZUK*i>2^7MP?9O~D4fx}!rF>Y>()7_6>E6cBFht9Fqf=3BcVe2by*FNQtbT@Z-6$4
+(Z0IqRPJjUlE48vZgT3Nuc52QS@QPdHy!i@Ipo2BL~!A7#L<lL+^(&Ti_%%Jsy%CpbL)wTa`yjbx&a&
+uKl2?Qqvq_rEw}lj%A-LEV(}(~roxEYTRg7|04TG}JX{E0f+Zgkb4&L*D+AgMC{yTw)g08a{-}KWupk
+s3jI}P8{5(kpRlN4`DWSX;8^TmtnnbSTETLA%bJ!9v||-KfINM0Eo)GJkshJKKYg>m1jjwjzYRY1~n=
+E^#v4BUR)SjWAQmI_h9XXBm2);C5;6n@?+tz?xOf~X0~=S)^}~UF$t2?dFG1Z-+4BPMg)%8f=dS`2<*
+m18+73xntD-P3CA8mV5G<r3q>%>CX37_DUOnkp%78uKoq78`iTIoObO_BIDFHbmMQm25+2G09fQS<yG
+5qqZBh4=$HG)lh{bc=l>C8_*Lz|vf?~0RVW)mc6nF5**VqZ!Y!%dKuvXJQbD|&(NE@duXaUC;(#W{ke
+5tUBP<et1id#!vIuFpT69czD#1rS2NW2FXPJHSKZr5sdadLqIFY0RA*ln|Uf?G<8MSQ`vB>7e4If3p}
+2u6pR0|?68qP`)jx0;>(xZG=(HM}a5D3-voipAzpJE>{#$vhVZN&&Cc`8-I3xS3JA3vqDOR>N!8e<LL
+wl5YDfP%K|`%O$v>V(UUMKB3~kFtA-h^ax0XD;;utDSFUoF!z>)7j0SetQxd-t&I)v&rLnBdQ{j=1dD
+p3ue^d9a5x!N*^%V?0o@}7?T(W#)7tQAWJfc>MkH+tcRn#zXIL4-Y8x3fP9m_Y#VQ(Ko1pSwY=x57gI
+>0Kn^hZa=2?Lq=D^C<#1<CUw@%G3{0em^{D*ML58uF@y!y;-!EomV?Hs@5)unO*bYi0hri?B$FaL`S5
+BA&E$_wOf(+U;ikMVub_J*unJ2tzp9Ksh_$@KCvDEXpdO){sKZ@i<U7eyJ=l()&$zv;7I8kDlVg{B0z
+Ize0|r&s7WEyHlPoCiy}L{wtIe1ho_r-<+B{nL59aO1bK;9&$ufeX>|`8a-889RQBhTqn2;C$8t#GlF
+%AEws=*X7PlOdc4_B4M#{?6Q3l@t!p9Gtji-I1`(U&kn_zFd9lTJ8&1vYr1ZWX#P{84m}=Z*<{(FUoI
+4QaI%M0*ekMl9*~hh9FSiI=Iu5}I|4Uzo4pBGeQ7}p*6w)P8ATw3adKG>0XkqW+B@X&aNR^PeC?p$N!
+k)y4qUG{vcZA!b5Qu38Q7V$W^cVunIBQ8GVkK>BrqysRC^OA?2D!_=7>yJIbO|zr~XD{DhWW*j%~V6k
+VOvYUM=k;!lfgN0b7r7g_Xmp^Qnn`Aw>~aR@$DUuCQ0L?b_CUOYD+xxW&@(n%{nd>>=CG3U!VtqBgE*
+EOKCYl$CU7ZNBt1(X8k}1MlUkGR&8IT5n1*a3u#MYt<M*#5J-8qO1xg2gC{*u5a+^t1VBicdv?dc6sw
+Eu?v5bWEoyxRlisKBFJgWeyg^I9`ev7HytCq`2XpYll+m?Uwe?nCPhb^S6-kW>2T<>hMjVwly!kIc&O
+X_3#i2<R$>Md;}~SMsTbdDX7GdDFj#Yb2?=8P4iyxFbt6hKu{RYb2>R|~bb_1NMOSD^RNfBRy-EyF%l
+=hNt8Gj*P4{XbE4;)Q{s>t0ohtTuU#y?&1so79>!%IBTP6+I;Mg5**jE<25HGPP7J8$hC$@2((6VF%y
+RzGasy7<C9-hgV7X$4AdU!Hf>x5ykKv^e%&Wjh4fZR(S5m{AP31{Zra<D>b<u$1DRUnyD3h!cEY-eSY
+3QQ$+8onx55UaBlh!L(1?m<ynQuqGL__truf+HQsAH(f0nShh+2+gV=b`1Ytc8F=g)NqDONRHwd56)Z
+;GM5t81YOpU1i?JPPW0M5+W{h@m)5`^(pfexIRX|I()D0YEMGDS^rE#JBYv9Za9}*d3KMlxTDjq#-!?
+ex=fYr1wu4IU!kl%BjhTa3uc6NEu!G$^S`PbCc?{-=Q&9!EjHEha6NXHgBg8~4+N>*J&o)klwV9P=Rp
+zroJPAA_6tPp{@w|9gjuWtj(s6=YJd_#7i?yh63e<qwg|6BvUr%S;bo}ezYEwT3$-9r(ylWJn(o47zF
+urliqv+XNjN^xNF*ut}K85>kor7glaPRWyeFW;GU0XpOj|mH$MxX7l=}%v9N)Y6}+bo^~NL60hT}E}Z
+8Spf!@MBvVQGsqi!#)8xLN(-rh!DWW7TD{}atXpx7<D#!a7qmH3*Blch{eRBvjO4-a{|<S(GhPJ%gfy
+jTy@)j4i^jJB7c!l81pTT`wvA-+w|aUz3hu8w2*;C!{}vYR}LS&>U^wQb7-?#)2Oa0c0=sU;E^Zt+pZ
+xtyCf^j$6*^7-U=^uPhsSur7SRVvl&zj(p+qHSef-&REn=np4hQ5Pew4wiJ4>QzN1x!!gfTVk`!Jr>o
+mZiIR)rlDg8*66eIEd83(FwMU1Ov#JF$AdIdKjwY*miqmsTrN$E9+ITF9haKavd_J={7vJ0TG3*60;y
+>W-5rdINjT56nqb$^6wm_1qHy;@^iT8ZEhW7viq+up*76BWnC?#Li7#qC-ScLwLEk0CLXXE}`g6CyAT
+G*aRLf$c_xwhO8t?>nD`CvpT(cDgLKEArwSmkpr4i!iFHg7L620C{L(3=se>-f(qph5gux+p&%&|9Y!
+YeWlG(LJZ5f#%UvVj6t)99s%I?Os~lV;Sq#k8Ys?8q6GZWASmzR|KPN+#L`~K<J*MsI-usg4j8dtgh%
+W)E;t`sD@F?3vmy1C<A{rqlD6RkK&3)A!c_nTVjBOl8s1{#1I$E%=i(RPgj5i=xKRy%4Msf!{J;+lq~
+H1u%^9H#Y{Rd*j&g7|sp3^1)x~M<c^e?r@HhDPcT^dty|m$^@W=J>02UX~U>^qAQlD|hTy8WB(TpEle
+^XG8^&u)^6nA%ct!KOx*6eoE`rf5;0QVr+OV687I*>R`lNT0tv87+AjU?~a=c;O`v}{UWvrdc<^L`~0
+;PfN-w}~?yx1G3Y`}^eg{O%SC0ONoxw#6HVn)ftt3Tf=3z|Ru-`amUv)vQY1d?dU6+p0%<)0U-w2Cd#
+GK0PbUaCUTqwyj~N(XjyA*w>M1YScPF)AAUCP`RWk|DJxj;BCv1vYqIFG~k1n7DW)~EOB$ht?G5t&^r
+Vd64a_*!_LsMRl7CBW+Rh(&@Ah)SqvM><aW>zWnz*q(4;szE>kupICI4#FAz{5;sd%&WV|Nmw-jW&iB
+55q;0|N-QA-@ok48#}?-8;-2(S~uh9w2Og>oCjV^Vyxgp-U!*mYmQDn<55#nLhT_(wMsXOsFm0v8v~d
+x_s8m4UyEZM)z}n5_=Ci{FGR*Qj@Nzs|==elw{~DJT&(?e4+uVg{Aj{gW8JJ6L7T$l@Jq?kp{;0pv1f
+<2<|{fzup#Z=Sy(=~}p@!wa+EA|<{#36O9ORH}$d5DuL=C4EGq!cNpQWOW?P+)=>wp-mtE&Bz^!(7Bs
+M8Oz>&r8aA)7OGSUWYC}KNPgho2S+-2S0U2l#FTk19c>4GM;4w6f!hyF$F`z%o@^ymgLnpzj{&v-EWs
+%xap&}u?mK+m7U2PQ-+8Kk>k=)}@ZoDNnCp=ePw&gC)eO8+)#%-ss;TOA{u#MSOWI4Gr*Z2Y>)zrg2^
+pANtsWO(8(}usJ@YQI&vuIkKE$9PZPn}{C8oYJ!3#tDeizNnYim5KAx>nw=qU(KQAi^I*s{yx!N<fHi
+Z5Mp?N4b)@Y|6-5$s9jx+55FrSM3Y2V)o)yU^F2^40(iz`Pu9<$@@@_<E^43>AVy3VQOlljPSSM6077
+l%S%xJNbe3o3-@{uh1!qE8}U)NJ<jy`rn}!9!I9~N;<)=wa}!P5}o5bs!j+KdknjW<8g8}4e_dExA3b
+1EmJog?yK-U7yXYUEUY?lKjdcD-UpnsY@=ZJ*l}g#9}c(U$P43D)*bxVwH4bpSs`t$l42(=Q+VD#@jb
+(AUAu62Y4jA{L_8Prga>E#kvLt+sg)^fyK<iq0R1qAyIL2yaPm<}`+ku1AFCc4HnUex#LbGlM}hx55`
+Zw-8Tq1_58YZp*|d^^us&6`I2tOF8$h2c;OR7;{?a|VH*F-rB+X@^=c?gVG;Di?@V7{rMh&2<RWoAlJ
+gs>(M7&}Mqs|aNuOjpFqr%jSb3XKg!TXCs;$W5&L97CYbqa6-5r3GZif6EQqC}2U2i{J|35Gb9xX?(Q
+$;q}YR`r6Xl+H?42dY|f)ipo2GA}=av-sY2zy4Za%mk#f_4iVZoUOXK?Fkpb77k+c7(DYGTi7B?PGfj
+m7c@F~u#ezyAHf)&t#)}dmKW?9T7mxX1Qpb83-FWI>hN^dycS#Yum(9Ohv(kPp+LeK!&t7la+tn&1#^
+n{THc4J5C)CI%g)aI90J7eJjNtYK2M3k_wZ=Ivi7s09mVCd5v-X=6Y_v`O{yOIY<bAIm^qB%AENk2AE
+$FzA3w8wF=(Y76+yEAKKjstzD-qz1rTWPr2u^j;#1YzE+p~4@HT?^;i$J7{52X@DZw}<Zog8E3)CeNJ
+w6-68!#7|8GHny<5&$3k+FsVtR0-K(m5gMPG1P&NewDP03x@09tMkoDiO;0u22%wd9lK*JB*|R9lcNA
+ePCCsn<e`)z%bD;!{ep}w&@rZVKN|T%mDSGO7P;cS3!836!f1)<zR82y~LHuvDf`e$VzxM9bP%sjs8r
+1_$I*Wtegz@%Siq*TfMDc<Ia@v{A3TF9TI!9#?AJfpQw|P!g*>X|8aB=2!bk|-JQ9(W!=)&R$O}A)J^
+GnwdWOe7NzE{0QiXQDoPU?P$i3E2RnU2DNSOEU`GvkFN+`XNr3$3$bZPK%>LjCT|`15F?QV@!4qZ|hv
+T%`ZpBZ)n#0PbjE-`^Rj)Jl`CP#1+tS@{K+34JhbC`e2INY>pZRjI6;6@aM0tqrA@WeS6&%p@+Y|qX^
+W-NumeDYp-vqH0cmxGI9J+Mk*V9xDYoV`gsJzY|0!{sVu?Y9j*3kMeL38yNh3h~nMD~Y?9MwY@n_|q3
+#0<{$Z64RxZ#fL)iz+i?NY<Chq2-RrcOpCvw@V=1I607U#deTjAR;8>Fgzyk)^pu=pd~zk(%^z3fhn@
+H6fDAX2-Q3(#Be=QgquSSMcUPP(MJ+E=~uAZAA0JA0}1T*Aem^{lNEaTknX@DAm4`Bz24>#yt^EMFFH
+2-O=-buNoyqB@6PMThAtY&ai?vnpm1y7c4&dh?iJ+|wuam^j@pPBeD`@W4TfmUs&-2@IGw+LWU}Z>+u
+6+Hc5WfY8TYeW5S$C^RmykwvFguhDtQL3c(bf4?hE0<FA+jlIXK%GT`OtF)cfZ_w10w+!^D8|WgA{IM
+R$Os+&6M;iuYqAwfJ+MkOVbAXP~1wMnV1Pv6wAp=0dc<I3~?NtXTrwG))X+U+*DMZ`xzrd{G;drp@l+
+W3VVF5_~~tM;I}<yQUX{?Q;cp6QwY`6|qykh5{Y-{~^mG%x8Og|ByY2NxM-W$LM1Z6=pXOA5IPq12A1
+1C7|EV1CVIi20(EvoA(UpgI3fWfnRq@ML19N0Y2uVcL_}S(CxHcbS2rk%Hru+%Lww<O|_{~ES&=Jaqk
+#9g-g3&s%LhW-E5Jg@1Y!_2^5i2G+nD_>MhoK#!7itl{I-0_BVqH=}&Q!51(uKmYdJ@SxOOI(`$lEx^
+QH=0NtV#``f1ZR=CHN4o`xVdXz3k&r|4>A9^bA2;rSwbL&-xkmPHXg$GOtK$mUhD1PoAAnv5#+e!kd3
+`zF5oL}nr=O_*>NdmC~inab{yi#*Ube<|dsPyr44gYOIN9YCDWSiN<jbdDOnlH_3y2oA&|B1zlQsedW
+|NKsIIkFR^O8y_*)5!%%aDJ-=*NHl-j<2}lg<V~3Wl_IIw_WpL%XeuQl1FeJaI+ck{j-PM6*UY{514P
+-Zxwpr3hw1O&h~%hSr_Zya3_G9;A0+zu8uzV>!xT(2xZG)GDbNH=^qDY)JY#-x*Ysv0YApR%jDxN#k-
+H@+1#+|F6Nt(t+C>x3FB!7M<7~eKcvU?iGRdM_Ko6GA3yl{Z3p&n7xLpS<fmOoG`H#-+l9cXG<3EHT-
+#`61u+FdkK9fGmw?^++3oy&cUnFvAkA@*b=OrfcsR%7Ee4%$SXc{Y;TL4c=)R+&4cA<1f~)OFbeI3^F
+YGfr70awaIY5|0ym4t=UZQrjdAxh);nTZ!G-KNs)W+DgmD#ax%Wmv4->OGg!H|u4U#y`Kv9@IQ!;(3j
+UfPiUQci{U+*-*eA5K^y#0s&ts6{j1po~ryFf&xLl>L&TWJ0<-A!lg`nMn|v`U{s7ZXy_8wuC@^)sn~
+LlK0mvB>efpT2359>|g{%X<*PXWg4RM5b|3M?j<;c&q!dF`%8v(&?e$Z(F7;{Y#}tHgW8np0j?1GbAN
+m_3nW<bBUhLp4$93K=ZgajlX*-GvVQmw)j5i@;+8LnKdAp<Y+$5sn8)9^YyJF0x!c<d2-T@GIrBt>a*
+YpIw)V=ltY`E4<F5xlz8(A+Lw<?@KgWPiA>c4c#6k`O$j7&jLHwsA9_IRU5)TXUDZ+nB@UDzU#|J)m=
+z|}8@S_j@<bywd_TfKC@Z@jz2Vd{bkK*`D0Y1clp8~+?{qZ3HJ|%$JK@6HXB3dLla(D2v3ZA*}heIEB
+UqUjP$VN4t&csGeKTS$F379NtxY(r+xipT{#nwG0rdJPQKlpP>CA!RNY_f+<50Ihkya%XQ#;L&nNwr6
+AC(tue3hcYIA^)i~Ip3if87u36LI@hq5)s$+!hcGGlFSsdeKPO62N)BYDhA6UR-SO2E+O#dmhZrKD=J
+da)w5SG0%NH@hLy*+<uq(q%yy3D?=(IwqK-OOL#!oKf^Dfpp6>DOTBX~nc&P%@eLM1C{SDs`J7}3`cY
+>cgGyJlb0-v)#+W;6r;$Nlk{+Ti8IvG5?!n^IBJu3b1uGDvz0mZTz*krJ+YCB_9m?%2MsHo)Kp<O0c@
+QMhJHdcPUXgLZt|H(bDLH`WLWGMwLIn)M65|jgV$lD;g?z=a*%>`4W(0^~+ANJNE>xmH$j$CNUjVZ=m
+JmL~n&)6=c2Vd33I4emgX?R@Vxsf4dbz!bM>LP`>Sy$9v*Bw0py=jjdaQkr`77tB>+AXxrb_KV*3dOC
+yoi+F{2r3ekRPdleyTB`9jinOtw_+1hq2U^9NZeI24jnUg!yVh>3ch@3;jEPIDX0KYGSa2RQt+gbD07
+msr20prf=%hbR<0BSXU~=`4v)6P&WT<E@ef?-DAVAD9GlV$7zP^|Lrnn+kmWJOXz;4F52iZZui_KHxG
+YWpts>S$T-xXHTGYVQ1@yxn?m|@W;z92%eqgrEysrT7=U_j)r>MEdEPUBB6}$QrL;FRzMU|<*@Qqo!F
+LCtw<%VEvA!&3`0!>UT3|r-dk%q?c_z?=-tfucBxdUlB?5=HSArEc&3x6Njic*?D7@u&FXEZT_*z~Nj
+4FZcNuB#yqO}AJyOJeh?HCCXp%ekH0P1Sek_2U<XpumLj-auLmfQube%1AL*ka>aAwFCjaLDBF+ka7&
+rUY8=&XbtF`B&`R*M?V8u&oZa<J4VD0W#1;-$?rjGwhb)bx`c<nf1nKNtGz`)Dmppx!Rb+tZ;ch?r0B
+ot_+?Bm-?Z&k1MXkzCMNQhtQ(&%9;-@htRe(V>ye?quU5DM!n=S!+Gy(A_w=43x0@0d-ktD!ssh`4yX
+k)y(fcdOAMCAJ!QR2G09ZfL{BT_*p2J}i5utTf=i9!+C;Yps;K<%z3HQmrJ-t3}R&{Av$@}w`FZQ?KB
+f34Q<O8_=$7>V^fToOza1{^fa=E`}0A1XHAPXmBf1rBmqrEk>oWDUGmIX^6E;^FpdrEy-m+vpFCEi;~
+@KSE+ypbG=qGNP;R}0+5VO^Zi>`6QToCPFNY2H`EKg7%5$Hbcro^fAp-jZ*}$~3VONK@V{*@2-8tL5>
+`Lv^xO#Zy}iqf2{VSsvG(R~;HdG;v&|e-~oL@_2t^>96*-S&p|IXJ9)yh;pa+{$i?+_LfrnYgA!ydRd
+)-zD^8$SO*}mZWV#huvG-R@776b78X(Y)w>&YHaSw!_e>46X!C~_ZTVtvGp?DC%?-NnJJxR@e_sv$Fw
+1>E!-c1mWa<F|*)-l$MltyE{vyg3?^$o*jPi5?&l!`sBFT($r02r?1OMssC>#ADAx&<!-zuX98|^4k*
+wop+)YB?Qcvinv<vt?VZ)lpciUtz@PLoZJL*Ub{o7Mxu)E%7kvhX&XA&MtEnCG<u3CFA+<U%q3R<FT@
+8~8k_#4??Gaa{5$JSn)O4kL%Mu;II-PX)w%<VZ7pl7YFE8LNt0Ods?}vsKTA>C{FZWU^0Q-F_)ZzAm}
+kF5nP!Ai#5geg0_k{nc_=FCe`mU(yWBy*I}5Ahs_D7sf4a`g;}h<}26}rwz!+sLheBGg?K%>Q<$%aBa
+93oiAx{{HKZ)#6lks<YrNY4VwNTfewGY*%>&=;c;NFS>*Nr2Nl}Qr?8Rsau&A8r!m(B!kNJU;*~G6cX
+%ARD3+0iHnuW-0GAfNb@8VEEkxg_n#27?IP}4JLNt+0L=i-lNf6Y@>DVUqCQ2lV`>T;GzvYqg!x(Q(T
+@QHkxZXN$V5OR$+PL)YMc?B+JpUf-*6m^UmWK3@(FdQ3C_y0r|1FAsJpz+p5$w8pib1!X2|<64qM3yL
+o+kA7G@*Y)(M&@BNE7-8CR7`KA4-;$f=JLbgNj6LJh~Q=)a=q^19DktB2h>9AWPfPe_#+;$h$V#+KAl
+WUF6M$wi1d{AFaPg=UUGBC$X&_Cvvf{Oukrb#pkK`I7NEU+qp%zu0HH$(8UcaOCJ@R5;=<mrVuzd`04
+P+A0t=_`Evp~{1`(%d`dtcKgE!r{`7MU`ZGX)?;X|fa+(8E2>cXAe-5L63ZtJUeh~W6iw5jeoY>>!tm
+$6a8ifu|KNo!ouLW|r>u&5Td1D~B+oC6L;P5krff+);(0B;B?!x#@S%!f5+HQ9QRJV3;up0s$nc_wFe
+K&_kCmA#}({a&TKHbBc#>Fs3G_P<fY{&5T^d7PqC1Oit<3+i%v+1HOVU_9n9KpP@vQJs`cB`<c>>`Vf
+=ynpKLWSKJ3<0g56Rfll#`#&qbvK-WB2=D6t|L?U0Ph|0$Z^aqv>y5b%Hx&YumnR_O?fP=k+xm(NLHv
+HLpm46?mjh7sqB=2u@s!M5}4k!;GOw%(JaxBiiU@P`&Tlx@+eG60!{|D^4Yi3(3&x8L3<BQr7#T%Xt_
+5SqM@9M|8Ev3H^UP}KdDvN9g{U1^K3V2ZHZn(j#R<O;boW;-hrvH4;pJQXX(e8nN<VWOrYVN`wu0}^*
+SN7@HtivVO<^;AhAt292O2=Gy3Y13Y}O=MXhW4m3!B_us{gWl|v2h0q&&X<qh1;;`KXk-Q55ITd6Q^!
+lcGN%fY=IDoJv{T_J|)k1mXn%X4th9c+Ba(`mU`XgS*gf3wx?dIb}+ghjhq+70Cfe15o&Tqj8wECD+V
+GwhvBI?|B07qc}(wQ}CSUZO0aPXBCdW&YVr9FYXb@EAB8y6av&lwQ@I!Gm0Y+x)?WE~q?JiyHlgkqzE
+4#PoCh^z2~cWS8Bm1F`qtchO$7!-vCnlm7e>mcwEN+b?_*6U3%RcA)p$2zb#(04o7l0oR#2kq{{2V8k
+fc9D5`ICjdC1FsgsVfgv0&xbULs+DgX^zQ(sJmTdD`^GKqg)B>X^j2dq^zLdlyfaGOggNh9OD2SO<Z`
+A^?%Moh17s9<+xZ1#?#XsW1i~U?Vtq<5J-*;?&v>h8z9V7(TZ?9cn;>17|XWKvYT)anfYtAtpv>6qfc
+H*v?z+4#IW3bg%-Ac^iT)kPLOTwdL9l0JCOz}O~7vr}B_3l75M0?7`!tHWd!@%`4mO9?Bo;<D$dGqDK
+^yKK!M^MEDtLH#hbDJ0|H+i64(EItXmkP4Yklom=L8H>L`?cYzuYwP4#4<<~--h|KcmVMU)kzNcg4p!
+v^5!T8fewii8=}uq`XvWm>~T0II72TmWF$Yt05`ipD*+c}j8cq&m};CX+N33ew0P1r#01ch<t?~od+w
+StO+buk*#WeJh+aXXjsLoeu~;cw?m{>{3bai68|*1V+`S)fadHoBy+9X%Zb=}gh(VMNO>rPc2xM1?(A
+~ibt|@4GGd#<4$sBrKSut-EEAKb?-79GOI3IaI%nIP3+3#Qxmim7TOV7*3uw+$b4Ex2_P9f2vqiXzsK
+?m@NIkWLb7-f@E=Dn3Digl&df6{s;?`q)9f+tsPJk2S7Q|7p^;=XhM;J>=8+Na@})vQ=3*u#}`e3;p+
+t|;8Gx_tLAR4g(7@(2HHeB;6kl(p?>xVJ$MTboA^xgIM}M^puO@G?XgVal7<k-+7Prb(DG>SA`}(u#V
+CxU(Wu3Ypk#E;RL;lMzj*n@Xcl>KP+cYsRQxJ0{CFsQ&X}eNTS8#Jx2fGkc|5@(l<SY?VangL8kvc8f
+~Z*$<;rT0ZU0ID$(whKsEP+J5oP0S#nw5hvmEs)aQGN3e4DiJHnzjG)oF5+8{zNy{Q%_F>7{fg5Gut!
+28n&k@EdC5?WAId!c;>hj=i4Hk<xG+1pF_SxGum6SaDgx6J61ndU~ht9Y-p#y2vDLB!7@o};=%U*v(6
+06|Z0{PD7ERH>%T_iIB*GlC;izlwbr&h$<xLb!5G^NWkw7|Am*@?A-#O@djNU-2plPX+TKItO(m@N)s
+dBdntaU;Wsggq2U;UAU)Lz|&uk2&NXj;smkYooKSf3=$@9#=fl{A$fU$o(Fj7KuQTRSdP!LIy-Ab1*T
+4|CqB|mI}==L&Lh&4#C&kMIoa@Ued*MOjUj3M<}im`-Ii8s*$S^7=!VU!#bcoc=F~1hcT&&t2c-jEmh
+mM%Re!W|JiestH{#U<vCd%Fo7SEVa_gj)!~f{gwRVVYUR*>niEhgaFrDLE6uQ(Z`Iam-@x8MJnkkO0;
+$8v8#f#&q|qY^o5+@Zl(St(3iCJ$Cx0dlFlN$JPd0b`Gz%ZHm*j7cu-Q+2H!04c`tC1XO;cO~R#Ixgz
+Hr@o5a`1oq?c+*z`YZ4={Rk?U?t_z&jWA1wO#fW#z>B4P=rcG?k;X3A>_A@L55jQqu$p3A<hHus$%w|
+m<}j-(|<fQp&&YP#?UqJ1q|KF1n09sE7jd>2F~k0%dU2Fs)#cQ1M++aj6367EkcC%)<cFH1@n5G{qUU
+kb{>!;{g4~4zvOt+<g~2e{W7>i-UgBBO^c!obDjuwRkRy;k^TrrClT&W90#%4cG_KVgj$ayv^!8|C`f
+6)2f-3cKB;v1kTsFeOxM@UnwZaVq<giS`|e&GQKPv!iw09W$4vp=mstD;^9mf~F#|CvB0kR=W=+E(IJ
+`65#`xm_O3JQ=phcZ=1bH~l*^;>yKK_{V@dp*zV5365UaVo`uTV22f)0i}uL`i0sg@Rm#z!HfY!m6+p
+nFUBeXB{K15=t<F}Z~YME2Jr_^~&pI+`bn*f>7pj6H@9`hw_GUfg+bOo4|qAqCh1AlC#Ck&u~GFR1fw
+22~UF8QU9lU%I#Y-p`ni8s~S+m))?DrNX_qPr}Yki%v;L96^}0-IzT+L0=>-j0ZPC^X}^bY6sr(Q=72
+te5w!<WxGpZqGxbdA>(MrC`&&4T*H0A_8p&2m=w#V!qbzgT5~*r&!53W^{b#ncM8+ekx02pwMznVo-0
+*RR9M~hoao$qTqO?2p8nIMVeEw8*OL(*1S)YY)Qjss<{MWEoMh#_|NVi?9?@T+tvybl+X8lnQQqXzkS
+gk__LYWi*Z$Z5HfYtzX&w29_L3FS$Q`=TKT7{8EYmxNCp%IsRmgIyMYA!Mf%3%m7`WSLnyO(0Uz_pfA
+&5;+tiXMjyy6aNQal(sQ5?`f1sS~+ce-K=R;xI&=PIa?4|;cU?D<<>{Ue=@xSLW}l9?gP@yt%c8Q>cY
+*o)8FKk{de>Ao`g&f(ZES>!~W;!LkQuqW8H;?@<^0$u7Mp`OGSt!7mrT^Q2^*BD(eSMRx9G&&g!Obs*
+5F8dwc@CGry*2|*E)RRNf@Fwq#U=L|sv4>l@+G6ASeoZXd*eQ8?x58Jk6?%1XzX%+elu;^1U(>T?!6)
+=08;)-9s0*La!_!UMqV9WVh9Fx2P>64q;xZGMirrHx`qiXl0h`H8AwZVmtVKt%KqXbwm4tt5;sY;Fb`
+ZTh@rD%Dz|hB*HfU+_zrjmqu;A!|QyV-uhyeF>yFEAzZmySNo*SkS+u3B@S5CgK@CBBrnyPO}Qgo+VH
+~K3wiJ?AphDz$e+iW}P-uOJi*I__{7sm4MnQ9C%0h`E-(&$dcI+4Lr;2UN1WrWk6EGpf!rwz%#tPD-g
+6lHZr?PVgcf~6VQ<q>!rBJCkJmSF0-ofvPxx}uzPeCO!gEuw$R>#8dCFi~FvEGnv3`lZtO)m+_Zo<#-
+2Gj)fRmUd2FEz^;jkF_)WpRm_9c7|qI>1Jg)=mwwElUT;66EYrgJfExi7~<wv7ndoLMkL>Bpm_=^fII
+jQ>#-KbUR4tmcRzR4MJcx(-q4Boa6&fk$Vd-5q$IQTX!wpkiHhUG8M`@|E~hNLX%G-YGKO3LoQ`L(eS
+r^m;2vB&d*p!AGrJpY@+itPkNZ;e$by!+j8<~i^I$4`-hS2LqaUgQ@%Q=KpV6}<1CR0@6=rQ^Kz=jtL
+R0kHt>X9?L&e!qw}PO{l*I;plGE1`Fc5P7$|)u9xEz9W&_04UnCSY8z9uK)Dh#f}mDljVVff^qUu?DL
+znwc|RESSQLg4A!nx8?orO42>X;zyCmSc$7#`#h`vdKd`c3e2|^9rWy*~LQ;NnUwOV5E^o1b<uBhOux
+gA>z>XfxR=csf_5OFlt=9Dg^>kwJsGN5af~`tz;lQueHiC7s9eJQ#@6ozKIQaMKDT~ETiB{M)OUti$O
+AQ2G1J-TuAkYE}SeNk8r9{kW)8OEGrs1tD(YRY>r~gW_X6X)CIr#;@hA{)Fnc0>^>scRaCD>@S}9!p@
+JJlAUIU+1{w9&$YWUt1F<mv7MVQ**6oH`yx)K$_s`&#@45I^sqP=qUerR8S5?H1Rf0DxkUE^KDR!!ZZ
+$m>Oqfv|AqG)Dii4zDTs3x=0Jq6sEZ4_O!i*5yW@zIkYzsiYl+-`!+elkL9<&mc@pv8;qjy#@s33go|
+8vrj5Rn<#1AWYhMHh|TEfE8Bi<(3WFkOWCjC~5TozLg&#WJd}Ak5DA)oJGl#=S=oLtl}xZWHE=1dsrh
+BR%)C(M|$)j1n!7^d<doyuZg4mlSS)hCowQ;SX7;owk4kNw#_Sw+A$URE6f0R)MZS<n9bvwEjHmzcQ_
+LVUvme0A*pkWMOgk|R6lh+Iv#ta=e;nD@DUe5;A&?qozL+Ug1Y*`8eMX;GbOP|H92-1!iA<TG<zg_xF
+?Pip!?mF@Tl;*+c`Yw%AtvzZtzd(GIZzA<+Imfn?thEE;v1H%}7Q}Lzn1d)nZ%O84PW#eyh8t7%8DN9
+8KB`f!(iwid=c{<BuP6`1{7VZe+V;IjXL^+K{!M9QsRd8HF_JMD{$gN8{fgW5B_O81gX&{1gLzjsbs)
+0iR+3D{YJoJ<=ddOh%aoCpQ0r2~E2T*^p&12UQ@jHnirOBDL6+nGHN$k|}#+ZYknd3s-a0y(S$8PX|j
+98IU8B=MaJ=Aw$@L$1RsW$PEb*&-F2m4y<j4b;5-pULD@MCJ@v12^rsFhK$AWibOHFY3oH@mx8R93PH
+9}_&I7aX5yKq(5!i`6CSAlW$(}C*b~lNc@`1!w&d#_OkF}wRx$ZB1<FGgc2{mgCQ>FH0cW;qd{jW<zm
+?@WcT|cov2yN$cs8WsPK37m#>F>01p*hW3rr9Hqfg{+vxXyTK8dau{0|qq+RE|vTfXwcFue@{ttl9W$
+1Z6y&4BAZZbwQ{aq^{R02e%nQP~5KHkRj0ArZbpfO5b==%RDKev8bTF*ZCqF#;g<vhL~0rbj<zu4CM;
+{u%TgNA~q-q4}`~>6G;Zk1&Fk{n}izT0bH&KG~LV&H1@*gYXmra6ON?#R$2rPmtGLlF%Jqx#E5v&l3V
+9T{|lzvOGZJ!6s;n;)+2UhYT;RY}a>Nj#c<WJ4)h<ry5c<Yd*S!GbXv!?Rv57jd?rsz*u?-i1b8Pw)C
+0uu$*mXI8*v1gPSivDRgG5F(Fkn-uvsw6!zLUz7i<-YfpfmZBbGvsHvn-)U-&Tw^roKX9$>wbp|ea8V
+Lq%!=&H`^uqgeV)w)1EZ9Y+5=o(`JP|>=bqbYxWjv+`FxQ<*y<5BIk)nZ-hfZgYHYFU_dHhjjrP>|%n
+|3GCdE|iMbWhjCIy{}VpjB|ooK0i+xKl=@M$sdoV`i`#1L2YMNXw)u<ue+hI0JledfI|Dkl$)k120qv
+?;iW8vwVD&#~q_`LLPSyj~Ed_B9RMDDR|3{=yQnM`mKWJsBEeEsCq8!xa?C1S5p);$MBHRI2Ls`=h`f
+E7y||8!7kh27E$041q%74U9Cs(_`+fg36^^En0bv(7(7-PD&=Ek+B^u*HbhgbO$3Fh!il7arw9gvC<e
+W)3(_%DKwD~zp|%R$Kr}d8;cHMW0vqB6#Ru-<qJI)^4!%kvHv~%qgvE|+J7gA&aI$ce6plbiDN-+h={
+ggG&plXFda_}5(@+MptJK^~A~$x8!$*@2Dpwa}miNG-h5vXm8eYauXlV<SdQhQ`Z{cv5vL7RG6XTjrd
+4}Oqdw`l_G4QdFg(!m|#Xzw%;{-Ggcw5G{O=s-3o8?HjGy_ft#pTNqux)DzKG$W5&oSc8qgNVAPzfSu
+psP;`qal=fGy;M;*SBi>*cH8<Z$-a&j-up*l#cSzQz@=mcn+2fDlcS0tK$F9xu!*oIKt8JuH$jngJL0
+_q8>SCxBw(IHIOf@2n0s@Gresv#S=d`8FJsb0P|sq0(&K;wi#;b61T^q;2CwyI=yQvcVX)sP@${8&@g
+_+O#Uo4y;;KMVH(7EzWb{@cBAgD^3=2hpsqYRcJ~ue#lyMC2>qyA&qyn>lRST_C*xQjNAmuK8uAd;qc
+@8C0h}U8`w*7tWQdA@DozMo19|qSBdRZldDK}Upiw?vP+igHer>;f@=A49Vmxi?(lsMpWx!Ka1JCy+`
+QdJHuR#ktaauKjhj4{F02>2t{h`<REOUs9Hw0zV@;Ng9jKB`cH|%LU2KX9@rz+;4FKO*UkmsHWJm8(;
+Xzi4F`b%v#p!%>FTo48|810rm`eElDLhmr>`WuGito)yi8CaDf223e(fmame82Y|LA0S{bXfFk5754@
+<y|1XMf~7kudY%xAu5T-e#H))X%fYzpd{ON@>f&?@lQ#^I!W?bsO|!}~Gl?PFJlHFsBrTbYb511zDth
+O4&xeWG;gsI2Jwcq?OOn;gNIo*E{P21a%>|v`i)uxfW7(0_um`pHK!^}L$aQ2&5!`lV;Md*wH?Xyw57
+l~Bmb=jN&0`MD0`K_uo?s+}`;OHcMv!C-ijl1Tt|LsD7--88q2;)7G?dbeqZJdG(8I@jQ7~rDNc85pM
+!$kpIa{yo+JR=31;oZl;NX|i#O;1$_$si;y5{zu^uFvM{lEd4UyCo&EEUw{>UBxTb6_jM$WotlI<9kK
+ZSOA1)AuaKe05yR$=9UyO|9eKD5>vt=NdPZOAh;VD9R!r#qQ*^k+r>L2~hU)oWg24)7Eu+)V*b<8l8s
+Dx2s2JxFBYCQWTHjx6KBe&23`%1DfQW^&nhMEK}^2BoIcY9KG+@GbT0F7?B+R5EV2f3s&r@J&1#+bS#
+JnUpf54T4VV|I|b~DQ>;Om<fK~Iootg5I8{(a6ixlq(gXCMHO1v?&=3`EW8LlXvVMbeX}hb!y9Ou}**
+k+5=Dp|w;)^rc)4+Oe_Xh*NFLqX2@x=NZ&bjCCO2`YE>JhK(NZdFD=e8iTu&F*b=#&UQ=p6pP_P%7fa
+b!vGUSFXvpv`of&8aSwlvyd8)bb={<*Ro|gGfk3Cq=LUP)gO;Pxu<{v4G0%*WGidgTx3AM<5WZhp$L*
+%lE2cw|p|4hJz;oRaLIkHba8iwewk;m6-b8?Zc=vTe31kW;ggHYW67hAG5+RL~us)jKGA_<Twq8M~>l
++faZJUs@x*llP68mKSzbn@XtU=N#$>1Clfxq*@|cbAvgX0uy+uSgoY|CAjB5(0=W{Mw(+42y9RO{mVg
+7#jBIoqrt-J}A(CYjs3_sFUukeN%E%pg{D4Mg@&=g?IOnV+Vrknc_ovu0HExdWP?wUvDdYv!ywZ$#_S
+QS0!Oy!<J@qS4UZatQF>$wPiSGIu5=^g9sL?U6%~wVB#7d@qk8aduI9}5lU$J26$eFOQ(rwvpuY7+lx
+ih2-Gu@OU6d36DJ+ZSR6!Z5za@Qj?JgN8YKm+r;fEor5gT%h%92;!jO#>Q5Qt|*gY0@w<dc$WZ$<<ND
+)EEJD`jb-+s+V$+1diWL;Y|@KCO?K%0CzOXxz5Dx1UHIIA#A;7+1-Qv5e^yUWdEX^9-5TBCm9&$Mv@n
+{QY+^!fcqtqJP4Jftm<wpwL=^SuDM%Ft)zq=4PBf(@WP$TXJO%k_pqw=YP>6aY9YWq$2%;87oSm!;f>
+5?D>zquT2RA8dE&9^h${NrPGRjT?i{cB{mf*!;kYj^0T&l{*I(QAyEqRj;#~C}Z1}<}9tAq6nPNOg(+
+30)-N*pu1{22!2uI_n5Kk&Pze&D}7ktooqQ;~9gV0OYkI-BQ(6%P;AY8sFk2bm{#JZzC`)@<H7O_Y-M
+&?Agpb7Zde8{u;hUf5x4IR2Dl{{+=gYKMoGBsYDD!)sYMef-RtFE0F`oVy`f5TSE?Q`E%XvN@q3+aaV
+(G+IR_n*65yDp430sg?rjw*WLDD<GRt+ZcqzE*LT!XXseyl&oX>q3`<AoLRYUvqx|Z3r15Zey`P6va0
+t0PX{c@y3iK9LAU&_2%wc_L?>84a6NARxr|y3HHF`rr`BAjFN>(Mz(xHtA^`hHwwegC{f^5sVfG0j*S
+6U?s*{S`X}2Sf}EIAepv=VbGa|zS`O*?%5&zPQ!4xL)&gg7-wxaXITCc^a=YI&tQs0<{;hD;;-*2tYi
+%aViN<i0OF5;%F~U>J5A~|2$ih>JgL`JH#(b<vZ5<K=lsooZ$yhEog}WG`CIfMJ-qn;0L;(T5I-rH}X
+*06!g!<l)0E6m)11C9Xdr{T2@b(1cLy+PGhsD1i&B{EpZy~Qhc|{Q(X_DK#I$Aak(|>ok)s*keBs^iB
+n9Z=aGj!$2qf;!0>GIIxLfw{Y5D9m&Y_4h)aTf~6k!bNruvA2+1)oEswt+x?70Z(p06|1l+)yec;{3g
+w;r}S>w~EaByF5c4rM`C4234nwP<Xu-I+>*K)-^FmW#C@8;+XXVJGkM+Yh}G8O0bzk`b!nXw9*Y4ph1
+qtmS1ZuY|-;5Ca@ai32eGG-6})sX@j8&owPJ#86-45eR5|fF%$H1JBOQMXb)+`f#e8dS*Max>{Li#^S
+0^aQRYIRNoY$830{2Egy+(5sf-j9v}nWFNB@oZDk8S=i$K(g!X*_`o$0U@gnVaaSb+Y>hC#$~jG(<>I
+T>CaXL?cOY^>*163(d(pL82~Ye{-8VS!vq|54g?VI*pjUbJGoOVgLIIVRo7f<E7kMVSO~O6YjOT^}hH
+oQj!L0eCA*U2%~6WM=D&R`o&w+w8szlHbq)-*ctWo5Q%_lX&gTUyU_vT3Z+`SPq#Jrv#5?O?vU<g2>9
+W*|4|5ERVpn9Q&qT{AEX;Xxep(h=XxQMu0A}I14vVn008V{?cyW?oj!b20O#Ndk5YZ2w0&-_KFmr2TO
+9<5G8?PdYn`ifLo>SG@sp?JVfN}ei*=Q9~PUEN!lHy{T9Tw)P1C9VrEyi(Znr9`gGq+8?eZuD)%&p;f
+~|KIc_NNYaL84N9i{?7=BjVe^~tfF}A+4wA~7prlU_MZf~S;fDyVJz?%AG47(cn*dUe_ayF^V&Ux6UD
+02yJ0djK!)RdJY++;8^8M|+CaOc=59Iltlo8>z;XO5kn?x1-_j|F1eh+6Ojx?_$3<-Rg+j)&Sxm*}*R
+x05?2qass3CH#h%?&dl+iCoF+OxP|Y-%R`?yJSyZ%BCJ&lui8=scp+OFc~jA6Mju#z|I8tFBSN&b)nG
+7opNP}ySRM5c}`*BI-Y_)^@kyaU4}#k>vjiF$WNfij7WfFFP}pHK)pQH%2SpNCukL{96znb&xru!{#u
+{`IIfQeWLN~CsiIAES=IeRFJ+EtM9h0mqy^}}3|+~R6GOhVb55uJ=(#<~7e1ShbDW^$lb+4jj8rlDlv
+~B^oHIf!I6jaY3Im86)0yw03=%c4#6?oZA`%G$r(>b(p8~%p>5~Z3tmg=&;~haNe&AcU`5Y;7O@j=`t
+0eu8e%G=gWFPCF<ez%?lE)@~=9h%|@oQC=A|w2F{j}O3p^7Q;QAX+3UaGH5sbn33%GgR0vYbc5Lr(>0
+KNyn>;t+-}HL%<E--ua4_GtVA3j#U~ojgW|L*pG^<b`BMQ{tgz!+EYry|qp#kz*DBgOVEZuOSk1PH4_
+@5}R2pck7|=)}^A~cKvf(D)_(aBKWddmB3#+|6(L7Vv;*IhbjqTq5J*zEd`=7@ByWNY0;;4yH8;kJEY
+@N@Kv8eXoPbpo|hi@M>`@&I8{vU`z+W@3{wV#PfCGj=*cL9qP1fJ1QXqmOTqBvDU6ibQs`BmL+*PJq$
+l9(?->MUaRS5sDF7$*i-~#&V_pmn7!%-K^U{`Jg_ix%js*~Xgs#hqG!Dm2<!h);F3eS7u#hALOr$svQ
+4*fnEMPBCJ9E|LWS4LA7(?`M4Zhed`F{1iDvOJS8crjHEFuJE6|xKFkUnnvW;%*>*}ojc5itZhass_Q
+wulFP&Cz9)!U)f5=pma?wiEmR(L|lO4;72SeK+D)@$F=3n}M1E=B=ZC$;jcX^f~zsbE%=!<O|505f~7
+x2qmKXsQntwu5N1rcD-i&T~b#lC`Y9vGE7~feb%HDG-k?dd%g0V3rbZDEnW{}j90H^CaOhve|Ti%T%S
+zQ2xl_PL!mQ%j|yT=O^h-^X4+msi(mH4P>{R)JK8Wqz--|B7;iAD8r*H$s?>&#CyIBiNj|i2|I47ban
+aMrC9`QpaUgYqmI5i5j{$z}`|lS!2ckpj1klOB6DPnx4$=`o8V=x0R6*#M40XFKqJ@r$6EBcYq3!kXt
+o8%844t;Uw0CdM+iv%LJn>>J6830AfUlUMILQ|meF~H!bP%x~&fBT!w)&jvS{cz+cmp~EJAvhf-6Dwv
+JstC4=FevYv3-gLQD25_8pWC>@LD@nQ=+}D05GJt89{iIF@uE4-XJsDTnt^T(5H5iL5ibV0>Z1GC_sw
+NvLruRK!P8#SPV1TJ}-GdXAiQ-%D)-<7ozGd-vOEIxEDQ#`vHbT<Cxt$9n?`JhUm?J_!I+C4J?1<cQV
+Tu^CFprZoxTB$xHVd2F3}*0P=4@JxWtua>eJ{byh>W#tveAL!Lm!eXj0<agc0=9W3b5b)K`u@h`LPwP
+y=VozL38xM}+?=C~cP;w#hVHG%6*90T0x*X=_y$hSr(4dKT1+^UN}`UZ=eB1T#5$zj;)Y!2x-;a|9>b
+bq#;AWDsL=%wZESx_ZJDM*1(O6h}mc;`p&N8I^x@v6X10D-$XCV_3#kD!va2H<Fmz|%<}gn(ko%7AwW
+oKx_CpB4J2#Q9`z98vah2Yb}#!iY4$+hvsse852{@St@W+3zODve>cXep4mv23f5MFjfp+$}q$N0$yz
+{?d<A_91D5aQb6%6$&gATQ_-?06cvWfVU!2ZD`EWXFxvee@lq`d>HK8)@-<%8ngEtmRWTGpBm6e>uhW
+Lvz!?OhS%#kZ*!_SVH57tw_iF)9&7fzos4(pDZ%ehxIf2a&uWXVaG!McZ(Sz>78+T}M8KAfQE3k*eVY
+SWS+<`3Gvil;GR&2MG63}VHqWk7M1TJ9KO}KWF&?oIa@T3|Q)1PQxSBr|LmepD<gvLZ6#xl(5xWfB72
+&5$JFg$_dyD$rD6{FwKr4^nTz!(*Hr-SPsJeSheQ~Zu+r&<3gYY(4RdP+HTvDgK6%B$hr-KK9>3$j?N
+T&k$6qwN=A{F2)Jl}xra4JeA!&*Em=bUVr1HXSI+a_;W1``%(1m{h?31qvZB^$BF&oWAPW#t?Hi4d_)
+-n!@i`$nWO4uicJ|01e$vYHC4^_?AQWEdkd<^Gff1WN&p7rT7CSy=Mf{cEKd7BxQ#n2#2ZUxdVwdXGE
+FcmOapaH19CkeN;P8rFU1!rK!}8({Eu*3is<&p2uKfi1Cytz?fqeR_DbIDa0Ss4B8d2XrBr-GmJtbG~
+=f}T&R0cccov9?UX--Q=c)AB0cOPsPK(wfT$nJj?IyO$p|C6GH=%k;FifRT<7=qy*ff#wc(3$qJ<xaz
+$;I?u!RmMv@4+*QcQBUFt#fQr^Vr!T8#UzDI<%Z!b8kwG?2^Y?X)dmvYnokkP03K5yIxG4_Wg8<X_;h
+%Zq*~IDuO3R-4?tE3?y$F{|t>2Ff5D%fi0m-;f`hQXXv`2s5TI%mJC=Du7TnrH!<>yP9OWOU~?x(zes
+>VIWhNQp>621dwp(C9zOH+#dY5Lj&9^1U@iuj47dH0C3x^yTfRbHqg92${E5awI5YL!;l^Qh81b5S{2
+r@jY_Cs<UtBZX`-OyD^-JzE$x3tUqAcFg|_u%SWiDm*Kj?y`D}+D{{9}5e{k{#|Gv@hFV$9NN<{cx+$
+mymL5|y((*$nF)_KV(C~N?oW#X4)NWg?CKhDA#ROPwpeuPc#rlAlUE*H+)kV;_T_r9lZ30tXcNC}Z#N
+Mo?4Q;d~GUj5|>oB0UN)WR`~|0L27iQ$yf?3D2&ne_;RbV%u&M`|8tIYXMh{A24Vj^K9N?Z?a&Ue#Y7
+Y_Y6j%-dlgkC(uvRr58@MYsY>4FH3O_w0eB!KzdsDPS*?yy#;=n)%U0J}`**(iQ~#=@#5QTA*x%oO6a
+;`3~#!GhbtqEK$sj`P8D(8vv*&5ugo;AbmkddSkN0F!e0y3<cqZN(rd5yk8>Jc8x-l-ch(YJkAPzR6B
+ESZTC<fTgabG5Z_e{bG=2dw8IGM-<CD&KX>Zk7^53S(vFnWf?|)H^<g{ccA)!$t`=iCJXkNi>Iq_B!<
+O?oi0XnkI?MH1wvkypc7${U6D?fdgYzlM*D81)><)JX>3D7Er)Rz{METUjfPEFbYZzLQk{v-h-mse{^
+84p;-ceU?Bds07I$qyx?;K|w!8%?aaGcut$`Iu}HMP5=H3gJ+*7W`^QE!a%?`Evy_1*XV_P*QCSI0>2
+s7*rT9H~#xexk-}bRvDzcgH4c>51d-VgAc})r@q!wtrZcEVDS3x{&Nl0r(h+T1GU)zig*Xzb@mQ0Y!v
+6XIQ)UJ+UV0nDZDMHCn2>*v%lH_wBgDz$OhyXm}&K@8#k0Q=uQOqGeGLg|5{jZAM(}ET+x`4w_WP9Z^
+JrdK(o4QR}D_6Z5K4NGq}a_!Wq;0=fQ=Ky<FYkEiXX+pXyn%MU;##8KP})6^MfFx~btkN(aEd>PwOy_
+6ch8Fm9I?!maY9LNhurO$(7E-AoPQ$cv$Ku%l8OgYS}k<*`gaOD1iGln4d{b99n5U`LqjIBsAn)M61m
+8jfx&}X2}hCbLGwhe~mTPe|mkr&wvjpwzy=b-8oPAt%$+M`~7pu<7ub41%VpusG_V1zojW*6#^AJO>j
+JBr7#J8+~w@=ZyRwvmw2>CcWvC+;lFer^My5wqw#nsYsS!fxd%DQm5DK7L6iPkRD)`6D_bMDHaRJF0{
+-&~!{)A0`7Qcll2P`t3viBACGugOueVusis$UDAhwWgYe}Sk{I63`~XiiI_Lvi23-DUEDo00P$W7fZ}
+b3P7l|BEzV4QhGm^5=(vp3^<&6jq^EX$`i9e(_K0qTy>{>J%iVbWFhZyTn>>ZUVDgNLy}I$s4n0so_j
+F_QD!{4xKBU!c410p<A{pM<(@~>+Y3widkU{xy1xHI87&%V!rocI3xrWRwhshFD$wzd7xJT}L`v8W~H
+0a?t66A<zkrV*~kwq^y+<FN~X0qmEZE!MyytJXyd!Fgx_umgKx?v}O@OvDKz1!l5d4i3jBr}dE!{e~;
+M+pw^H*E=lna(HV@5WIYdQq1I!ZiGckH-I=ucFnMq$oY`5kQGp^%z~Pnypo{c6U{v-Cz}%?6EG?{b_Y
+GMY{vpPt`jSn+!CLk0gpAZnHr>#O6tU34l9-Bs3aF!j2TjR%8pBEPRv_(=0%Tb9TfLpo5MkT_fGmjZQ
+0#Q#3k2B}pQnPu$SjjG<K>yfINIRY3T6<Zr^if3Suj$(=Uj6Ls~S?8Z-~K8f)-aWh2q5<kPcP>NA5W6
+CyeN?L|-cn&+ahf|ieDHI>@&^nghWf!I&jTbs?qRIP8o7Rt$x065d+iDC9aX3`wZb1Cxp2nD#8Eik8|
+E0>Ft26GXN;a`Xp#@AsQ%1Jto$_wwP#_O)K(vef^OD(GMCXd{O%hybe8ZVmtoTV>^m;(6cEA&FG31EC
+zvRhwP&j{{_Y<5l%$t06{3^~#D7eT|dv+`=&Jmhrz4fm<IK;Sa+7QiG>=UM!<|&X|#;%i{)2?M%f*GU
+j(zHEhjr=uX!d;q=h*`zIcAug<fcYBM4^FsvH}0D(K&!SgI2%-iVa^ZnTXAA^yZP`hAj_8MFDP-(gTL
+6in&JICY~!L#nW3520`)cq_Y3Aw=4PJKi;k;$VIC=14j2)j=Z;E&h5k|vdz%S;{$h*%#TNaGE&3N*^e
+?vPUu@C8*rI>2MgL-p{>2tO$`*C1F#m;IQqdFqi(~p1$MpX{j_Jyn?*0S=RUY~8Wv32~hF&XsRVm^1U
+%b}8c&-26@>=C2_)l_PUo3gQE;3@(!`Iu1uI@iIQRUI{xE@svuJ0d^MGFs;HoCxO;#^0BQd5A2c)w;S
+_?V-~m)K`WZK$3)%XP!b$fLTX7Ip_QrZiagsXc&a<!%LEkQPQ5Yenx_S=Q=3-zY4;JDb`ZcTLKttg!g
+G{r2st-@U*80>QJrJ%DRqdXje(g5feoaPeKRhvZ&8q*#1~p^*gQLZ~>{rMP6*zM3kmr@g}irEvc)n2G
+QkZaKp1&+8BuYvY}&^eu5`YEZiv|I6%desm-L)75~R0{@sbpc>0dc!Id30i)Cy+$!f=Qhtj&5#<fIGw
+Sa9ho=5PsUP-7_YVTTIpCiJ{L=!<%@4<E%B;n!Bse1D3xASdoR0hZp>4@mSy~7VlmU)4e{S9|`miJyr
+(tJ*Lg$NFQJ8dXr3l_ZKn^2=M2`<3vtF~Zx@Dy!Z$A9ubq9WFJwu9D5tvbOOpUuvOp8&@#lI4*Ms9NY
+0TlK9f%@V+kPzWQC8ihAgR)%8d`R8&;+0;ma4D)dP9m-wz)#(<n%CIvWY?!%ZSG%l7pKTe;vhQUnGxJ
+F;x@sTs~r+n*-Z=o$@{3&;*E*KIx$N8+;vE9KdCgZ6;WW9%-fE9JHvlRXdbz5kf7=oI1U4e;OdlpSVs
+>J92VxMN&S6To72=f69IfHQMr*Qwni@+NS6Jg@|?meK_P6#j{8vwT3S1WxJIYR%m$F1+!<*q1ms6M`f
+SF}cD!v;VY;(KxuEH8Boe4+kQUXhFu^DIbEms-x_^JucCl%w1tNs$G;jiuh{e}sYJ?c>$-4ZthDep&h
+LH`6n|>BbJ93_gN6uVNn=s1H{knVXz}o>_zXp2T+;l?M2a0v9wofANzNc}-o<i>dW4mToQR1F#9pn6h
+D;2!E_{N1lq-d8b^`>Gg${Q__egy$dkbaqMV`8}qP9MWf;CVkoSdh>|c8?=n@Dn{7?~O<5+%_X#px{?
+{pPZ47@E!RRjldc6o<=yoa}eGQ>W?{Xmjy}dWC{@T?4R&C$A(%r$Ri&GL}#e2->&ESh(cMsvp(EiLWS
+^Kt?{ew4)5yquz1=n1Oyl*_@?P07uPc!dM#Ws+U+?$@e{K_36r0=E*PIG5>6Ujp_N`xsyexLH|WkDdy
+qX<VSolS6<vp&_E`^maL^UCbRdVTiJg-ID}UHE5Jm3$Xq+0w+Q>)VLG%^m13pd9<YBs03A$MjS4H>D1
+4|zCT)^6uH-n!G)Ds1DRn7~*Nr_}is+i*QQ|aL;KG|bKr(T=%%iQH43+)D8JMViwuu6~Cg3rY0)KN)-
+jBIUgfjL7Co+GUYZfQ9Y2zU(rt@+ynP&lW}Ztdap!cPJRvCMP#XCs}G0nh^qMMVgd!E%Rja2jypS4IV
+AU^flM_#}T^6117^-F<dJKZY$`EC(QY&rHj&`lMcpx2|5^Jjn4Kd~pf;<6*l!j)kO9^A5zT{y5Ivb2F
+qZGx1pyV$X=0uy?L^e2WN>`3poUmI;dkqhX{pf27-qT@D*2uObv#=#q%4eMG;fTz=uV_sOIgnRq4^DD
+tOqvaiLnTgtM=qk{(>+17y)*SW5Nmlc9EXv`*Y&{8d8p;&#0*qp?6>|<Sw73$e^7&~2ZE3N<|)~@!8&
+y6t{6n6vUYhTEuct(?#nZekCSZiTXjT^Wm7g)9SQ3P%ykCmEW(%1@#u^yZ9lD+SjD(7qN)MIiNd}|OP
+tEtf*i4d(8m~m#A5HEo5^XOn1|1)4--L!VaRu4}xj4d9yMm^QaZq`M0Rp8#ioezEK7$sKac2g6T;T^L
+W4|8>xyvi#`J>{-m3bwRdWtma0?jjmY)n>Q$C&p0y=W5eF>s>w7tL=8Slk}pVE8K<w88>{J{~6`mfgH
+3WGeEnQRhd_;!a0(s8YOUXJDH}T3zTOok%*I7S5SghNs@7}wVRHq|3<ys&&e44&*%m#Kj5FJCd~Z~-A
+J+SEz}6^5}!Week#zJ*8}^`<k=!SZefKf6dgOGpo>Qp8(7d&Ce{VG)Qh9;<x*6E5l#u9Fl-1cw99Klv
+wVs^<TYYj;S~bX2h@d^$=_)NjaT#KoPOIUTXM<KM^ujH)T-TXZ`t!s>d_;2-yv$!sS~_{gFB=+6oGm5
+=tIeS>PQ`Pn2^qMt}+Z7UwGtQb6%LPZ8Pe=E==V=<+h?f?8{*tj3X6^_?&q>#}K9z6pzyE`Mk-=o`@<
+L7Kk%4&5MctQw(X_&`-s<;tF)A80qzBd`_ZykP3;(1v(qC084KfFeOdAMpGt3v1$TE2=@bC1B5cNMGN
+1cV<(C8XF|p;i;waydYz|e$-tabNVi_MyE_}622NuM$D&cdG)7J`jDf}^VNDE6YLfA(k-|+1HTc5A&V
+WzY3do0@Gt>t`1pDC(L>_`@3n=jNmi%FD`zM&5)C!wf#^c>|iX7z@1llS5!Q$V_vR&XTmvX!ToacQ_h
+pdceI4M@)I-_T>dD`|$=0#e(M$>5U!m+V~B3B+^Mxqdb;>4S?<YB&u35+z&=*}g1j?X^Y>Bn@ufhYo>
+lA4Aam(Fhk=Su|Ug{Dv6JuV-@vb^t4TQ;K50{jBr2nfP+N3s+_(mWxP&E(m~T4jO70d`wZVbCSOb~3H
+eM|Qey42k1wxXdS{Qy`$!Jq9#0QIZ6FmyI6Z$MU&|(hs}dBEXHVHrjT!0?k*tMVSHO@=Z%<{YC>J_h}
+fTTUh?KI`vFedPlL8X)E_?sk-oH0=d0#d~NnRgnVaY^p|ct$hKqBOLv-}URBjyv?=97F@qRa&w1IGv4
+tQ3u!=z6g57<SSg(k!97Tv@7ak!tW<Vr#9DhwMXwOK>;YdqCu^Ms?N-dVCzot=ZtWkq{P*&o4aE?QJP
+!2<LP?B`KOgaW(QIK^*O|3`5EjlrV-^;LyI}qz*1D}|&-DwAe{YjbxNp26E0nnK6OD&N^jOa4?HUy%E
+KVHM$#&`q$chgC@86_P@@h<)22BtAB&wZCF#6(LucO9#M81^l8wdPo(PBa5~W4PGaC@dE{8;B+3w8jh
+WEJ|u!E*!vh(gV>II8M;jrdM65kf%C~oBqinO$OtK9~K43xVYtM;uX}$J&k8jU}7RAim5OF{lIa6AWL
+rPnbV1S3JvK?%T)mewI9d`lC(gjl!e?5A#F4jo`I4_Kb(SCh!j4U`o?%PHpplBd3ifMOE4iMrA(aJa%
+nsW1!4AG;hK2|fvLjePD5wf_>vf|8=bCmSUQSN7a*YmnDSu1$%G_s`80Lpg8e<d#inHnC>2QH7}2><6
+&~r8cZV|bJ?=!eHQVq1e0F|ycz(dZ5Z>=M#tc3oK|n_ViWgxLov_;B4@z7^+}QRBXb_GCZ!!>x2iojm
+a3gY%>%)Y`#w(bt5E|!k+rOTy!@Y2#LyiMs#;py4zMk}gIokIF3%c9Ia3U*B#`=K%X@6)OUj7ZA66p(
+H<6YRgw!DS0@^1!tN!3|#Gs(Nv2q+Hg^&8Kxu=-GsZLJh3KzK*s{eRugiXNYl+X0t_t}VzR_uUHBepL
+t5)U8T2=)N@P>0?82uUxkhmwaGdzDs-`L`R`*wk*8lmwSCv|G`%GMa8-N8zX+!1e;&`VGXYDaX+PiSo
+BO$nEA@szhsP<EGRNjs<7R{DEsW<PIsGG9K3cT<(!vUzG9)Y+bwtNfKxA@c^d8iq*)a&6q;2nKvgZwS
+S6Zbi>!VG&K;`V!0v>tSS7q!CkKGc&~Je=CX9ks0$L~^Z=Cf-0lwvtGZe;`I8d7;8`(^L>|h1`0COR$
+UMEa>wGbk?+}63apj&vmJ3!Dq$9dPcS`NH3J8_zCkW_fs(^hR%I8MCRW*lyF0$8s0r`qSj+T<oPgVz^
+&$XIg@n>?3i>AnonU`R($+$cbRi6s~_gr+5(g)lqu31GSq0eTxJdxWG*MB%O6&{rFbD07cuowFDZ%4T
+xTPRpZnurS3+GwSF}N~c8}_(I3$I%IH(sE{>Fe=GOd#pf0o54Ga^(8pU_u7s{6!nF{RHXnB5ZOq>^;|
+RNO4gtXR4w{_^^YK$f@wf+lA<%JH^?M-@B_^m*YGfl$Ad6o?Q<1WvuT2gZE_BpWUcbs`ms0{Tf$jp7_
+BTwzS(LmHK=G}>4c&eNoo77ogutPolc@JhOTCqDP07zT(Dz{y#;uobx1e;4L`F(HY{IlD$S&dL1ZFar
+(x}WN#w=5^-FQi=Uy#)JfskDH%a<@Km>v3MXY*mwGf}&5Mi4T>&bR5e>lSbLVJ}?w;a?yT3|9}Dzuay
+sl#16CMy{gCC<#4F*ObZYGo4y$1Qln9f-FDl+zc6P)aGhP!=cwy=xid(BayEiN=ja?V~|<KojgY$nPc
+L2+IU!vD+?0}>xz@Qk%qB4d6CEb{z1%}SxLi3puyo^*fk!f`~DWiHVC-y_xJs2A3FH?gtlDlmzZ3fHW
+NlOFd&MK3cJAx^g9lgBo-fswvD;FT_E^k4*21#isXZ|vT|8S9_A9l;duyj1414eiLj2lkX$N>ro_9*)
+6fy2hr~w9%v_8p6=euAilkU2cEuWX9Z3)qaZ39Qu02~4wxLXboa|GS1>*A!j!k;1&85J*uOtQURA7AJ
+-lP&$doz;v5vAV>qD+5%v$A#N;rPXN;@VI41jm<M2Wl<oH$m9kF*c$h@NIzl7-=SXSYjcTDg7{>xn7J
++c1r=X@d_U~hZtXuTnEH-67&=TYsF+zcyE>@sHI<uK0563YzVjGSK~BNgYV2q79*kbDfELSVrd$suH-
+t?){Z=tkXRGlj93v2@_<-U18HmoNzy>h%-eLQu5rws3_!7rC;c|nxaSa?qallh9){_O`j%{io?3xOXu
+b;{Xz`Y&wW*1@`KCW?=uOzHMMVcW?^J!UI08k>e?+nto4`DEaF>)=@x}Rti0DEG>~AHp@HzFz@nBV}+
+SPZGwuNift|c!N;{L(e8)5j^Fb9(T1-S!byoEGtub!uZYLV%wJ-0E_POV%>bR?@9cFNR*+DOnK7|L`Q
+#h}_8S8mTSM%Q0A%{1O`z#vhp(K_@vi%+YeH1yu9K8&H2?SNc{D*@?+R6@QpMHG_@jA?#_0qX%eW@Yz
+a6;&w108fR2(21+I@(}7N(A;~1?aUNu%=hL2b@XC1c=A-)Z!r+OCQrjie@6}1p%Gj06=_$n^=rRB?2$
+BH>sv-l6E><>i@H0>8&)j#lSGs#z#b%Ra5-uQc<G?-2uWx;bg12@!dwlPWu#X0dL4e<)!BS80px`)M=
+zxFkNTH|*Y5F(ID67&!lH0}hXkQ0rxZScp(X<Gx$Qe%B`Qme7xK&aow`)GD2%lwFYiGuk)s3R*CNHL^
+e7yhfqX;_ljTn4!S(L4S%vd)+fAkiMt#j>-Z9AwLIUfGPs9TxFB=K=X6lE{(f8j(&B0kU*`b<}FG=z;
+#}4(cb1Qt^!7Gkf4ZuHM>M@C$_{fX^)dw*5hK=HS$Da<!IgzM%NHHjw);Geq8kF#w^deTvajJ6^6q^K
+uyaYW;h1o|X!qEdYT5XU*L9w>$4`WuMHIv?tDPON+#vVqfh!7D+V*M?X#|gOIT0A<VBaYix*zbxKjym
+78iE6~@u>2{OE;u8on^{O<KRpW#7P%$ljpjh4JmtM{B`65a`RYQ7wNIvMD<Fi>^|7l;(YwQ}R*X^{R-
+LR=W0E&!EkL@@6cgos(vVV%d?{?tn=tMuzd~iqo92ncumYgF8iJl_1+oyzqZ^oc!VMJ#vc_}CI9~u=3
+u*!;4Ngp&E>)%<d?jw~1-}6BP)Q+>KK>IpxZ*UZfv|r3QWWKt14oM|s?1|sU<I`biiexrAfiI2=*JOq
+xGJttukAkIT|YizWg8ak5PervJV!kCm)lw;^!Vz?;^w;J;cH$dcQQDA#Y{FNFLs>S1Jw{lhHHiJk=tg
+k_qe6)45Oc<fJiD<YDgNVDwB~wR2N(@6>L9=R;9<9C_ZXF_Tl&_4gXIMb2_#_ByeRqa>oZP4iop;mwi
+Z6_;o`qq#b-_Ul%+43$7~vbfqK4F|5u+H<s0Y=orRu-!Zu$W@8S;Ykdj@8^08I4lW)J_#tT#*f*yzj%
+S&Iulf{1jLRH~Ob8GBqa7)>IZQ|R7tY!a>1)be?9@7k09SoP{o4UZKgoS<hMgGp1(=~F!hMcLfV)%J(
+$tP5yI4MiD`p0S{!4+Rf|Ehf@FoHBbjZM6ILL=}3jPqF`>YNalN83`i4*8mpF_eivd!9h{XK(#hw%i4
+BUb<-HBTQl=EbmB6CjvZmSBaJg^5uB(MRBEK>z=Sx2{ubjLtv8HhG9^N35suE)Q|fS<{>!U&+klqkzH
+dc4`7;K<w@oM}|x290>ndgx;CSs_7Tf8teH!^6xTdiPqwp<mwNNikn9)JhyECj<#)v+08FvW01w|+u+
+W3b3yX`JpQb#->;@It&H>7#6%tIxLN?MX}eM0G`kpHJq-?yE+@9F=vAT3JGc_Kwn2!+0iWU_pLNVMXx
+&@8-D)%Q-g1Cpvida+on4e*@hP>m{-SIYVNk~)r72}t#tPZk@1y!qFfYTrtDYSyXoc!Ck=;(2625UuR
+T{Nfxlo^zmodn{kAZi-;tVG#N3l>+_dQ6SlO`Z6s|=y8#<aRAt!v6Fnvz=FG!S)Ix#Fmf%5R4*-f(ja
+kvgJ4nar2bMJksLE$$0!GOaSLuc@mTr;dB%ZVj?#V6>Bj$7I4`fP8xgqnfCF6uEtgo&nn38l4MJGWtA
+-w^5<*9^iY#L|w@>2PId;03n(?CUt^0JJQDo?zZyb1M~*vlr;a@D}q>!(>E*Ghe`>&mPr;J{zcIzG2N
+tUwDOKVvgV}L?B8_Y{YnMb73p+c7){1vAafR%6Otebo2CbSq;zg*$Ixg)$CF2}BH%)tNT8X6o(s6uOw
+YP*Bv2efCol#9F$j%?;NRNmv+WzWlTx^F)|fbr<M`YTPwiROMdXxZ<$SZkp~vF~G&ypH@fEXzXe+x;1
+<_9SY&a1{s&(dPN|aTY#`;B<dIULlBLpXKG9Vn3MSCpjdYXQMqs4u6S;Fi*i&$}U$;(Lda5we)KuAsv
+>zKaJ@klz}MxsX=(y2R=<VC3*d)8G+^h`p+?Ss=sAjP3u+5=TUh^_du2O$^!Tzj*-o1uRKnOFJt7;R8
+BwII3oeV~N*25Lp(QN4u-r-BJ0s+P;$oHg57K`4oaGq&vhAx<zSW{F_&;u9_zV4UJrg^k5eA$E=`(Bq
+L~?WJu)Neh9M-AOT){uj70(yvt;6!1Ghcbo=|m~o$_n-Kk=zrL_hAh#wOFr>Z3zvqX+_86O((+fCrD<
+ypQwx$m?QwUV{%}fZ&eR`R+#P;j&v9kg-I-c<tCO!7!4QGk%tuyp&PptF@u((%kXvw%b4&#PCpmeJ9r
+$T?rMKYh6T0#b~&&;`7nup@m!kWSo|1Jy`By6K@n|0S8ZB^0|SAjA#OU%;f9Cv{}GbsrtCHYZJKM~#C
++Ug^*bA%L%>)Lycp&UJF){0xEsRLSM%`zMLyJ(9#<wnKG+nQ`v+Ej><FwBr2Gkr`IqrHH4s2WYK7HpF
+9(%L*~3|IjBi9C@S`EG-f@B$3Ai;M$vxeAp~FT3@6+rASS^_AX<iw+<a0i}odf1#pV%3kc)rkb*%EkQ
+Y|7?4>2!!H^$M?*U>E?{ym4dU?7t|hxc3tCkHl={dM+f6%Mw&Kn{kksS>U)%+fz6B@HD<>sbwW({z0?
+5!mcLn?a-8Fk@`1tn>@(0QxTl%k+h0{LF@c|~bcU1n;29l<m-b&NZyqEklgc@yf@o_)?%l}FM|C$2+j
+|0exI051*Y*hWk-YSy(Li5Y*Yx6dSOTbZ-T^-}=re%r|mpdgd!9ITFGK<Je*gbs&mJ%N`_kr*}f_b-Z
++x213_f?PkqZ>a5((!&1CJGRUzWBV29E{TAumJEntrS~U{5y~1-E;U_uwN?GqvPPgQOi9Y6o<w=fy}t
+@A^qWLBX2DtRto8Wt`vHox92TbCOHgkAv!PR?kIh$LxgSo9jF97e?MwID{O`?3Wee@Jb}c1Ngp-K_!j
+0uUYx&AR9MoH8|@4?2JGc6#Ui6UKo#BX6WyQfZ$r1w34#=h8+8_q0Bm|eX9F-yEmXOv4#+034k$h#(|
+Sok*h0i<i31XS=^#MEqyW^Kx4=l~Ij|wM9Gocw2ikYpXNOxLQz8zk8XPCwnY_h)5L*fXkm@aGNT#4!p
+_wJibhFQ9HLB|)1|VxRCb<bIG<5ZA3Zv$v(7Vmh?Y<+_n28jvL<+_s&4`HrV5c_GMu~gM7%j1Tl>vD0
+s5k@%LsYu66BG>@-K(5IP;}_@DXSi@`sFvsdX0~(F;ILs`5<&+2kw$%YOSU@T+xfK#VtUbcQdr=eb~^
+I6tWo*HFcow<$wrUJ^%@t!%tgKg)YFusdNX?!}6;DNTXNZk<k$DW|EJ3AGUBZCGH#5Qs>vQB@%Ji@5E
+OY^_s5%mtwJ-c$ETIk}joeQv%I;YRLpUy%K}NwvHq~Idb*-dZSP2t<@`az^_ctyTc<Rvyr{QR5Zd#IX
+u8iwAW$FL7)s^r0!?$!gq`t^5tB!=4RnHS;&j|DOq%fdn}dluSS?sDVNB*@B)iC$?LmmDw$J9drAp!X
+Eh+$mhyA^WJrG2ILB)mdC38`EA=|j{QM(EXJX$7d{+%kW?zH)R@_7mw8gqVo|*IrG+<()Sl6CBD|`^S
+1+&>trl}NpC%(PFY0|sAXcdozh|L7%4<cKO+zL)Um>N)=6ot-zUst6K=Lg*DL1(Y6dwvt0K8pHdGNkR
+t!s-Niy=#q-z*-lOjy`8(64)7GH0i~1<IG``U@W$2v>EDN3^A?z2lRkc_~hKiB3la9rs7>6Qkde-toG
+>FIo`?f?;v&AlETn>9j?~T%`R4LzRPYi{0Wi;HLq)QF(eX_q?%;?3JEKm^JHflT4o-n-H<+4+p(CF=w
+q3q4crf=HInS&?ChJNakHXB*e9Ox49N?DsapUWnl~-FTz8xs3#H2EDwPQ_n-wTYo0g!wrCgh#Zsp8SV
+qP+fv-@xEO5h6YwZIkF4)aCC0~g(fwA9@cYytTQ6pg^NR4n(9=tv9QEy5P~aY)L5X;=bMR~F&Lw?kR6
+z=&V+GJnUhMd>}qmf5M3l<>;Q3*z<2fz1`k!}<6~3&Q;=yf^$Wm6)5AEAjI$wEe@D%<+77arWU`dMzy
+!xeKK&M;%p|9@+yb0!`y;1%5XB!e}Z$lFb|grGM^HYzk>!R|`<lmBIs5Flvp?7mP2@mW(gvDLwc8bk^
+sk$DaPgK3B@6GZia8xLgdXwEg2_rS$jeThk?3EmabG7AtIKa9x|lsSRJw<tP@OLj25GjM@td{E~8MwS
+q{_=7qWwEjgUqJPN4Q&!M2p$2kPhl$tB|T%aPx;o(?A14^x-AXr=1*0|ezlOnsH`XaxhR?2FFqX;A;E
+FiGOS*4`^QF*ZzR^O}`v#&N&>jq>x%my{-#m(h6LSsf_bbDFEQlqqDDX;lr+1;jlH2kC)B;gvRDDDUn
+3-A<&PZ^vgbZ1O4;yII)i2t|hqmHVgA7*16M?79()ag&L^zfT$n&QxH6+CI}raG3s>=>d@wsQlVV3(0
+T{8()dWB1bP3@i6tj#vEPc;0_1zb_*EUPhp^JNJHDpQE)WY7>_5VN;rG!I84>rR4_85b27_ay-(<^Ii
+KHgsHWfiTOZ^NadCjM((t|h=#)XnQBPLK7(-I@8^nBr|&5e-&)XjN4Xk<QS1-){!lAtUZ@r6Whlm4uf
+D=97IIa=M|ByKNXE*#Fa%|#Qy2rIVa~na_n8;aVNp9v0Oh<Lzfb*s=7SCGS}2-tp3tu4`ESVAIzsjH!
+~&`|<d%fp9CqJ}jZA63%2+5_RNki(((5vBE@8k7jmRKS-8TF8pw^nj#8&C^sVO3E+H|Y$JJ8@MVzD=)
+Vj0RkqV{DG=ScM+Y<Uh_D63hgIN*!3Hi&#TuTM`#pcj>Ak<gvx=MN7s%PM0*q$N-(<*H-(Yz4Kiqf#E
+_I(?!9?k60KYVm9vkVu`S{XAanG*ztMXBzX(ep9_!sJD6Kkj&7^U8Fk2<zh!ZRfof2&0$oUO7{%hBfu
+kmd9z@w`jlpbISP_dsvp9|U}Ig}Jq<!-YhjEd1S;G1;?_CyK||Z(;f(%gNz`&PgrgJG=Y$QG0v0!p8C
+5E#J7~4Uat)3k!FSYgyn$UEEjrSu;vhMU<{ecOWeZm^l*wDgK#p#;ROKSbb*iGp&21Lv*eA2!hf=w&>
+E$r=uMqb49cVzSz5|W?*d53FvY$sf1r__v5gfX@5B>i5Hz;#=9!vSS*vNV0IPplt$-?H@XXs+{j>;|X
+l>E`Z8yz}i9vkK<Rth()c~l|ikd~WAwd}rGL?9lHj~HMDlI}1bN4wd+2kY3BlOyja77)+xLVCwyaHr0
+@Pz|S~fQ=V}V_UF60t*P>uO30G?$n6m82v}FZYy&ik!Ckp#HenvT6)^d^i8xlU=LMwOm+KIMUg{z27{
+TPB?R8W*{15Qf1F;Mfi%+b*?P(1_U_{5+w~6BYEf_ZXK<Ih^>Pco?cVTQY@=%fR@3p>#of&}+_AuHuU
+3ZZxl$%Bd@IFxvQ)}w1yu^alv;Wk3dVN0ZNVI}UJhn*g;HJ);DWzg8hW)w0<csZ>88ApZ~T=<i5H4qE
+fR+p84ftPID+GBuc}C}*B!xO*B3{yz~{vg6w(hpf+RtaW)RS~#1SkBK~qQAx4R=KXw7yMXBv);1Ut@n
+2i6gkKics)#<AWRaLm`$IXHakpWAwAy#&_Fd@1yK9b>LksjMRtb_kp6*?FxNC_Vpuw)o?0>8IJ!D|YX
+Z7k})w?9!&PeMSTk`JyMhIYjX^augBVd(V}F^O2*KsEgk@q$>zk2KLdjSmaTB4&%P3IKCC6nNFUWgF;
+jo*X0GQ%XZy0H_f5AeN!P?t(42|+V;D;ub;uGABKeTz1ttHCg2>arhL3%+3#@4Y3EBX4^vyNT=>800%
+{J)dWM?AQzub#Na8yx$4T5ARYzDT{5k?Nn%;>;#-FptpWt3LKaS(5>|hS5+a1NBun|Ym&`ID?tS`H99
+*=J@%HUK++_6W5*ZGbIhGyJU7WeNUSi0ME?UqeN(cVN;=-|HnwltQd77Ui_O*iHx>}?<gi`I5l00c1I
+>(i1C6ow*)vx;d7N1}W=o%RE7r>^u<!@eG}g2-V`i|}5S0>!r^)<$}<84ifrav)qJfV-TPT=kWDz{oR
+$<$WlA%^VPiC+{V7xsevAU+t`*d)Su70VN?h^sxJ0Xw5zCs}A;MUmkd7!J)1&y5-i?;_lP8QwT%G%=1
+l)<|n4<77<qkO$#yKwB@4p@eMs}hq~mFOCMXpOk==TurPu{80@h8P?!C^cyYCr(9xInTp4pqF)*IPvi
+B<k2g>1F^eKaG<T3=&G=aCU&dH}hcEhGJ*0I&vpi(}5^IYl#aoV&)xI^JONBbgQuB5GP5wX`j;?TS@V
+<U2Z9L9%fwW+@-YJ+@3^Dc4jP{F}~D@oywqt5d3T8?AC>YAziw&9uj?IUc;U@kaqN)y*0hE#OuP(eaY
+%TX-wN>h57@b^(>g;kyP+q4^VBsrrh?<IaNu_G!d!uI+m9)baIy(8-{;@wp6q0+ERk5|o02eC>oc2jT
+8pVBk5|7x7->z$kxCFFCAa7uAd3$sq~K7_4gKcb;~lW!M_CXr6QhG`!L0{x_69PVvtm(j=2A=Yw>u@3
+<sLVv)>gk#R=2A7{@`)0BMDk5xp6U4Q=zsl|4o5a!rhf~dJYKJ3uuuj;L-Q&@HiL7UN!O;GQUOFspjI
+r<y<+^BPDLhP%Nx-nlgI8#t5?QYb*37mID0Eb?d)(bxc8&t#$1uOI4`Cvqi|0alx80K6APhVE?kb>xe
+c`?M)Ma`kMN)6q;g+`A6cF-_iNHrb*7}FY3uStuyS+mBw%_mHSYKf*A)uxPukEq&Y5Y7my2U#%)q1`A
++%_+59UqUw!W6SO$f^Pg;<iN(Y7k*guF#c7=<RsP0mlQ`376wiFI~fVCLvv_Pkh;R70RN9^|9%;>{Fq
+Dj^SiRjn|%_$nEeO`HvH;pBh%t(^?JrOSl9g75-6#jUu*pPuzq)m*Wu`)_4*WTjCveahnr%Z5>@trOH
+uLmn3+!Znc4`zI{AwNr|koM@Rkp!qQVMsc+T^QUwKg{3LsL82jx30;;gZXypNNM)XsU+`?}=y|!(+?;
+|FqV9lV%QP9K+%WxFKy~<PfV58q<oo*Dz@DPPd$r1@sHR161s5A9VzUof+%w;r;1~898D>Q7L=vt+M1
+3pH2G7K-4PyJr+b!^Gt@krt88^?SpO;$nSwqAtJT9@bw!K1-N*Kzx{naF+3I}nYpof3BF2y`^_o|<`E
++o5TF86%W%tieK$h;83DK0&W{=tVUh1J;E5=B&3J3hQrG*0q)%x!*A!5rJ&LTR1%gEi$>vON;S7z;wu
+IEG{J<B3C_9t78#mmI6{$7P(2;@FOYaHe6uPB@~dZ6gY7Yq4|I`8%x+ySfKS$ca6r6E<aJwPCgaH>8O
+8-xnhoUR4T_w^LEuw>Rq*hc-1SXr&J6Sti*D-E^lniPWvX|Qu0Eb>MhzqQRUeRO2Z^o3cuB;604R5bD
+i8k6)*x-x!o?uZQIUNQ#f*@<ZJW2{Ze}L%Pw>zIK>UUHcYFOuHlKsd)Q1_7_D#WX|jZN7p6yRVjU$os
+?1*ah_BtBK;z~;{Iwq_S}zgRkb;O!6k-YD(CGQ3$;I7SZU<K{M$@uNG1<RW3fauCQi_&wl`=U?Dy3`@
+S1&F!S(XNAUW78yWsJ$iU9{Q7(*t$?D&=}g7mK6nV7WZ1`IpO$tC|EsjJ0YnP?O<W1%@5w3eLmi2D%<
+DtJS9~a@7jX$8FzCM{tNgUn!J9BX*HP!i7>91ya1MeS@%Tst8uyu2hmvAt=c-?`k9LbncYLFoRSZX^T
+_nA8cgx6IHfZ?!b~oaTOyj^KyBqyIgUljj1tlt+ducMX2?lwMDM9!DuJeb_9!3Zi&IDHN~LRCXTaysW
+jJ^`&QaQJ8P{OY++KZp2*v3xiyghI;*(!EfU^)XRyGWcfOwR{~eVS)(4lh%~0#`0tPFVrD(KS&2<Z7z
+<rkV2P+u(f_W5b)=X(-<ShzZ@6%$ZQd%fO)9G5>#&WvW32avY%3<N?I1Cio7yUQ4YYL(e&aSX8vHK=r
+nvmx(=Oag)iAfr2VkJb$l3%uvQ5DLQr*;QURY{YH(Kp?6-;PsKf2Z|fyE?89Gh5fV9o$p*#!h_SZ^5<
+M9vp|G&n$49roA@e`qF^j>UE9azl)=_7)a4Z*pbXlvu!7G>1)+5M->>3O88)lM;!;u9(LSD3aT70kCY
+GZ=2RML8Ocua2KL6D(jYkDnBhPpZrkZF>`r15?{GegLMnDzo|hmEoP&RFhOUvTF8K_M*Ta}!q`=?XVN
+{yiffiDPp^aZCGxJf<uwQ4sd1#;JE8tI<tK)@GvPxV8H2g&K$#>VxMM;3_4JiY|q%T7anV6K<3S=Y`X
+tcBO1@Q<<;K=&%u-}Gezv))QCQpml0LO#bdyNOG?-mcX&Q*Mg@g(94)Nw`vrfW+AWRFE23SKNSh*<Ds
+1;&*@S}0z$5-=-}7od4lqPHVopvw9G1#4}synYC=PMaq=1BDInWY2rtfEyTlFo(*>XWHyar5EPG4eSD
+9YAozw;Pu?)7AC9$cZ)AK+TO+Txo0sjg9m+TM&yA%QhtoF=g?YkN}X=TuaI^9Yqc2HxA^#5Q6M8oQ^3
+1G|0Cz;5$Bb@5#x{I%5)Lnf0=ztt)n&Wu{t!1r_)%eGVU3*T2~V9_YrQG4ZGW<&<*J9O8no-@~FH?H=
+){#Vk|7=1=gy84y;u{ri47xY=$O-gWSTKAjpc$1sodkSA$WT&|>qMxRY53G4octW7Znh{y^8kMAg6z>
+-v#YgwfY4h%G=3v-$$scaO|H{g86&W2nGLhM;fSna-xIz4lQo@Qb`)pI@AY!+A#vp-Bm9Jtr`dCuLv|
+)?Dve@nNP+()dyjSU}Y9B?g4RFyYIgjY<V2+>3Fhyq}iqe`{9AyGje?4Yq=QFdm9rF4VPaza=opkzGy
+(hIqNMImH39K3exN1h|ANO8RDW&B@1qcGQ3WmtW_K!GkBg7kr1@Q-BMoU4;>q+J!Qx%_`*RkPAvlE!6
+3bfn9+ec?nE0KyibTcVTrlBL@c_xvn58v^X%Ei#r%8@p_m#rSnkL3G-kQw0j_jfTr-O*l<i?IH)iKa8
+f)s=-q=CIXEI|M*V82X{0dM^6Ag0g|MPXTEk1b7Vdl88IFurbv7uW_YBe_n9P-$Dv`$A31C8tb$K+e+
+|M`FSlih+;7p}G<)})wIpiI=5HKm?l;SXy$O7at)auBb#20E<cg+^`U-qz_N|<^PdyZMx?D}c7;YI28
+3=Lgx9G1I_vb`VI9l)O)_8>c+8Sa8p_rhmUEaAJiKwNG41V#tyta)9jJ5cG>-NObDx0yv`2$f0=Ge~q
+V-*wXbGf$83Swg$SB+#sM88I++TaWI*fD2(IvL<a#U<-xQ*XH@;b)fzweTolaxJ=og@S}#^L;-Y#vfe
+6Zk;z_e>=5~hSO8*x{1`);ERde$`g&%!iubzO{BVtxHvwZ4FF*34P)U&^qi->n#M+y-$$X=JD3fMGI{
+PSE!ja~25^!rRWs>~JD(qGoNtz$vfRkc|0++(tE9mxH>jiP@BJ<j17a|X5aGb+FZ|8ARf^#{6$$U=0J
+b{nW$uc>wA5rotS<s&Bb_klNW}p)0dZoJi{m<+z|J)tIYzH`f3^kg3+uV9pcF2(#8WG)0^1K8TBIa<p
+^yeiNu+g4qpiU&A;x$pJFmsC+8pP{oRK8kxJ+;}PJr_rbOr11Ou3jX^PAoL&OQ4=qpvk?J<QJmNotFq
+D8Sf1R3?ob}l~UA|tms0X3m4(OpU9O<9SeB|!we?SL&#l`0`0gIV5WIi1amzDUhD$J(-jJMC1h~fTp|
+<WbU2I~qTMN?$XY)ulBp4<ZI2+FTO98uK2n;9crI>xh_;UL5DE(QN+U;Qv6r;l3Nc1tTB80xQm7c7ow
+NTuVbNGzD{GS4lkr0-HjpisZlZwPX;9aI2m<(i5Qz#z3r>Nq0k7S@<v5M@)fyrb%8d%O%P#0f?_uOZ!
+^5unY85Q}^uRBB6Hm)UDMrL4hI<`jQW$fJ>OS#pgwYt9H@Hcrfij}v)NR|0;Uy_xApz2}g7g0HAZ9aJ
+p-~#n3)%W0FZi<izJoqx#c$-Un)E^~oh{H>He2{rpFJ;j%MIHItT7mxC`>=K{WCa{zz8S2;KtZ}(FJ5
+TYDjC2Wdh$x0Y$9__Q;wz5N?a~<uH(xM9zf>DkiAO$;kTkoFDO&2@l!PB*M24&Lz<v^;w*i5E?9n<Mh
+J<)jL0JH%%Zah8(gW2r7F9YM@pwM9CZuz84WpRAXk;en1^I3%Lrtvhkq1{*Z#cw))&X2>PB5+h#D8MW
+C%OLT!~1inTVYRTvW(wb14(4gmzshY-_fj<d3gzSqbqdq;2}cS(W05+zlwZrmE4FOneHo`=D9kUATM%
+I=`=#ikiEI$!BN2`(<>N(n)C;BgAS1F10`wCf$k7Q$f9Syyn-Z0rUMrj_?ZA*j*0zn?(}(N~Gv7Edn7
+Xdm!$;w#f6UklsfT#IRnjiltELC{0yyqOwKYK$Sw>7r#NmzX5wWzNSXZF-n;UpLJ(-fy~*^W&KaS3>^
+F*pAjc=ol}2OS$XGjzT%J)iR8}V`47~Y;8hi_*oNw1zx5{WUxV+v_RN2Jme|l*u?iv{CyUX&X9?_VX}
+QN#SWP4_fGa>59yaCTUjoU;@zxvi^1h=0ko7YgqE>|;1bpl1(Hy?kOJbOm*tINupAfUrz3v3B_3C{S<
+ey?>_4-v?c(*^t@lJrOV^@Xf0ZT28dI9GTfp3cip(C&+Qn(t+COh?(F)=pZRNXGS-!SPYbxG<{qm7Dt
+!wA!mrH?AM`H@OmDDI@^bdp+_bzOlW0<gTr&>;&K;u50w+Nz5fYM|UBRQynlTa;CCnmTffQggxG<2*+
+52O>{;vfkQ1|un}0wu!Wh^>%?2}|D`r+0W(F+fljjsPhfu$5HHeXp8e7CdI~Td>~9VGgl>4IMRr*|X`
+TkY{(tAw``9{_wb`LK3?v{APVbCn@&_Wp0u2Ik_Ityatyn^+*8!rv2<<;&Q)2)JbhBXY>VNyaJD7+V>
+_v;0sKk+*sq+epsVDE>NoSC0bWV;0J-Tyf-d=@pZg%1=%FdH-DYmC#!b5T}C23<aEkHnwKb~{h|fP2e
+`Cy8qLo*Z9^N<e;s$4%XWq64sT!0AV%h06(irqbb<`MvmW~WW%u0T!3+u__{?M2`ALG8E)Xona{-hFI
+0yR;znL;nbBAT&U+gQ)k$R;x1=HL?koH}MmuBuVNaH*4s6dTP?m$ZSQ;%9gkW-q=zGe&*CVwa-fT1?>
+;dB;<fC2P1l!31q=#ToJf~(*6`1!(Wr2di|29m{7z|^g4iL24$4sh&gNcCo`s0K%c`%xGQ@*BHE!U-!
+Mh8Cc<f{mx!H4wyNxSg#ysoO*4-5}+s9w=58f&E^9Q}ewoej*fTqR@z!0thu&WtC$F;7B^Mc5DAyS>{
+-Qim9Uv+~vaIJs>19*DPOcwe2BlEWLjXbL<hN7swxb?1z>gk(;}W1o&5FfzuRy)6iW-D+e-&?*k+gfk
+aPZ_c7LOuJm@Kl~$(Mvs1YJGW8-fjT2gXhJYbxv>L5rihWoVe+y9o-S(;#y$+oh<d~t*g-d~$Nfr<5&
+u)Jt)S?ASGAl~UjGp>^HrV^+ZvCm>u4njZMtCqeN|1dYO!S-7`;!&Ar$cYCpV?m%F#0wI*XF&_fe+&D
+PZE*mBalxWIJkS`Ljq0_h6GCg4vyBtuxep8Vm<sDt6_kvWg|XfLJKxrz<VlZDcB@uz6{%NWPozvc$zh
+{8$YJ6?Ds7OVi<M}_;mh0B7{-{`Q{zb&BskMZAJ=hoj$=p&D{A1_^U_zBcDJySk}K32A~)VUj0I!0KH
+DOzd*2{JGmT$%B81=?Y5o3;mb*A`p`r_3MlXk1PESeY-aJX`_Zl~<&~FWAcsQXRgXlGgVBc&GH{Icle
+l*viws<_G~vPt-Rwh$u91TjKj&oC?C5R*$FLF&0eTZ|zO7zJ_iy+w4l<bz$OG_j>;NhgcYT&Y8LzQoV
+Vyw|dIq<|6}n0b<?%9r5XqWn0+h^9OlT4?29|5FCTNPcJ1}A)S8Q_YYu#|tcK@+??zV53ya?x7x56a4
+kifet<kSKgb6<%p?()th(5LBnEAgziO}8Tf!>GRPx-rz(-?r;s$mT7NJx!o%{<y83ZLqk)J%N_Rb2}(
+s%=9>tLioWaAvNI6jSuf}#4&>X2K~8WlLDF6<G(oeLMknBYB71VL~17?(U^Z{CMH1avE)~mC7)u8BTx
+=V8+gX>6KtBs7x{U9IQg9A5#<~YD(B+3G9V5u1HS5|2gh-QouD*2ra<@`5O`q?LI>F6+yKCllJq`-cy
+<7VC)0yi5!BD@6_Obo;iS}nYY9Pc>J^~{>@zeqIG6d$0hUKHFU_S5KVwSTH6@Lj3N4w)?*dMmDf0Ycd
+!|xjrXG8L>a|a&K6Y2AyvKiW=Dyl?{@KID1And)5`ZnJ?O|aps~v8xrXtbpv878%{3g;K%Bn{!;Qd84
+&XAGE!R1H0hGS`T8Qtx0Z;p&TPU!Wh$l!}_qCCH>19j$RNpFEeT~+cqjWPjc46>fSyviy9nzY>o?8l6
+3R4zQU3dir-)XD^`bx|?(Pfv7vr@Ke0Ba!BHdiDFypeQf-7ufc@Z8s?qL`<--`7ATxW<mXibm+pk(ar
+oP*|m`!3!_1IZ&dhKzEnu#4FD6u2JG-2M7%$-Y@`I!=XA@J>)la~tbHSA<=UaLbxHFZ3arAS(v47AEJ
+BD#s11WFu>f13nhYrWfXC1hLg<UIpG<Xx=u??+qRLI94qVoxt<5tiT{58EOqMjVKQFZoKD($IICor4F
+q2s#dt;wZCozd*17bFLWqU|F7`h%Wpup~AqCqGZF}N~UNwqTtUovu?b9J&w?<{*aY(LE91hyV+>(GfL
+D<h4j6*$`4kF6$vB9Qd@KgAZF<prY{6GKL|BW8#N*1W=(u|$)9phc7lG-5bcy08trG335K4|K|gbFDl
+wUhk~l!G?H@hU?s!5No)Y(akC)(WN6LL!<Q09yVKYL$l6V(;wvZVc!L}EN99W-yx9LBZ@x5vqtt9Ro9
+TnhWi3k^(Pw{uEyQ&`^jildA9T@yAN&d+3WzYd?YUwJ6Vo%q_rb7oeTv`^1O$DB2!+n>#XFXc{j5?gd
+8;g%^6oa<7C4uvz&!5yAIStlrcV5nc9|zJ=t0gSrtW|c6g+~(&pui5=B1g$VT7iN4?t70_DRi=SRPb`
+CR5W(|k*r&vlkFo`kN^ER>uFfyL<y?SMFZ%A=-*SmRdn;+)}IpXugxoQoaT?JP^X$i(JjxXQ`Ch&Z!c
+>Ix%TIn18lY`oz3tTLS=c~E91_bMUyk8+CL$WFBkeUN7WmsbKlihhz~6gzSVT>>u9Cu>-dQ6=?#Xy85
+)F}GkORD8x)`))>bSfyB<Ccxiwg*%OS_@7s7>ANito6wMv-9C57ewJxC$JnNINzG!pP?{d_08(GV?>N
+Tv&=RKho*dT_@0{c{_?9C)^x|L}-nzCaIa10;#}Q7vIZ6IIc=EmJUCW^V&RwG^K$zpz>-sp(ws%YE0`
+A*9e=&g!QJYzuu?e9AYNvZBg@Uh?$dQ^9Am5-;Qhelt7{q&M2^BTcx%+$pjkAMY^<`W!3r#Bz@N!c^L
+AidOO!*V@@btxBc4HYHRx6I*3s~UUK?jCTdIiwPPe3M6fUXt{Sn0rkC4tlSOiN*XMFi9xV4ScPfLw$B
+_N~9G6Ds>&1zOa&IEb~(mn`(4tYvt`ikG6DFW7>cUk{Qi(JvY6CRJKS#q{&`rCYV^At-|^Zr0Cqfv6N
+g9+~^MK!3gu>*Kc%yH#lFdij(1r|-kR1HJxr1$W>5y;|}|xkQ3=*UK(1%cWO`XY%}CF232kji_*5ZIr
+>NG>!vhSBpZ^Zd>5<;v$Jj*qvT=?I&>Z_h}9&Q%->o(E}1mXJF47jc)IG8_2m%Tx<yR0`4f}bT|S@2N
+<V4x_ajHsG8**a3+uqyf`!!aMu5J7>S>a(w`1IY-)=ieDsuuW^56aG>qwONLnoUcL0C$E1P*DcOGp+K
+ItflAHKq<y7-@Kf>CCAg)f?90Y7S<-H55wNFG#xkT&GKihk((;qDp+ICLG!f5HzqIx-@ts9m?l)w&Lu
+p??d%FGzr`(}kJ>KIRZyM!<4-!W#j#7qaMEJZ6ExA-QmRVXA$6Y|*<)_<)Nw%cE}4w-@jrVtsIf3bYw
+ID`p5}u8?sK)PQC|AKrkj50k;?zN0iN&Ku+#ba{qJrWlwe1m@vm@BI8kLJ=np+E^=-n|z+YJW?x%r=f
+Yke<DkVv;=;@4El-2lsfT!Vjn0Uu%9%G?c^42BrH})&@S^)WJ3YsBSZuMY9>q(LVMOGc~EvMG|hm2)Q
+7+!6f>m`eC&tL*z{{DQ~(fgqXqo!(1tD`l3BTpF*5>FNag`7WZ)64Ft!~qhsUU;$f^4tNb7?{;IJe$I
+maeLpK#Q%7h!l7t-B@NubVA!kkB%sM>C?xNz@d+N83aR_71QHcL8|0rOyw!+dz3Vved<yz;9tZA3}eT
+(>?x)Rz};nNZ8P9+dt`MAJc!FfCynYd2aUTU5bBy+x8FPLpaCbFP_2WJ^hd68ej4mb|!Xgz(*G6aKdt
+0d|=>t&vp!g9j)YTn#>z0&rg%<3S}J7XChR31v7DHz^v(1%)4$yGlOS+03zr3G<_v6jvdO)B+y&8JK3
+Rc5nZPs0v^KjX2;cd|M4)oYVBdtf7m^t;WDQ2jhGC}h@*Z91A1?pu(yZz-k#H7-nti)V%x|8xa!}?ao
+9i~uNwvDX|LdnZWnZO<OMe1SsZ?_mCWYkA8P(U(Id4t#xNCQhE^7_T%stOPH|_MVh?gxV9s&}S38y|%
+&v#Sq~e6+Y<8Dl++`8MC$w09nKRTIgvIM{l<K+*ab#nn@<~+X#jHxeA)}00<?q_4bebiXnWYP~G(Yw)
++!5UF?yuPCZaRv0)|hg(il5m`6-4agclxz!JOWhMXjeMq-71d&#kXr4g_ZVfvC@`y;(eJkp>cA?s1z1
+zm7>FIE_UHL;ST^HcCh0qs8%*6?lx^JrVQ5ubH9^=&hr~Msh;kEa}80u+R-$~*g-fW2;M9@u;8Vhh}(
+zH8FaZN#+>j)^i*j;3hN+r&L~783n)M)mEEc|%PJt?uYWCvwi-dw1^_8@ilR794@}JIkqJ3=%!K<$<k
+R?JGh+r<UQ``1?3<AWE{+;r?0Gv4-EZ~;<=-S@1!hD8?SF@zC8!R&xYRM7t`Y*$IyvBQ^N%h{%3gM1)
+1!rc@Uub~?L_k%P7=f>p^tdQ<?+gQs#m0IUx|Wv^%LjS%o9qp=i=8mV`4Ij=iLPIS&yW1>eWr3*En}x
+&BS>%v&N)-m3T||aq^aP4d~PnWA>%hg%eW%%&gVF4T+4!a4Q^Tipl4i=J3*D45;jrc}r3s5YeBr$AxG
+VPR9jfO`T8y%j<1s0f$iu?!s94lK%O*n~EjmgBCOYyI%A!^`d|EMIXab6<_ea#Dr;faJVg%;CIu|POA
++ASsB1)+y_G_w?I6*ayeyVhXt%=oG_+^!^8;4U`-rmM%Y}2@9fsVAwh7^Qh!y7|7E`TU-M$ych|cQ&9
+HsDL6h(dGwVxJ7W=dIwejie9o<k|F|kbU4iC8SlDC6I4OCde9#d%BRe!v%Jq||WD<KtTbFr-c8t*;U7
+4qCV1)0OZMQ+GBymh4e%BAplspND2)R*Ap`9)-eNiUY|(C5&zZ4)ThRbFt}lz@FWpjeTm;n*|4W@4{w
+{DZqUvX>8gL=nMqRG3;P8dQuHr?QA+A29}axZMNE!l91BC4Re){2sWvhy4wXXDEb=5#5f~C;gu8;NZj
+#|1H;R6iGb=3ZB5C?y#rcqk9Hc1b2uqk&rT1Yi}1qSo1>goau+gy*yCP`*tAO27~944!jU&*L&4o#ka
+yQyNqwqp@I?CLUX8YSxHfmHp$vqFq&GV3jaKiC)}jTfYGB(m|kaQkX~pUp!;6qJM!ZPkPEt#wHbn5VJ
+1D2Y1osI1)Ul=bYcddK~dzc+3M(Dn9+Rd!W<d2-;?2r)!D&`wfVu|KGWXTUKF>+++Fx6bx!D)zdvuo0
+o*?W`S)wgUV)?n0~GYHVZ}?lBOuNx=)k^R5s@rn9eMKXe0jfQPpYOumUt+Z1iS@-Y5HC=89-4gN{xv`
+F-q*1+_t+Xa5dMW>bMGC@%I3lWa0J!Is4Yoqb)kmFSf&AiaK}Nw3}ua)vZ-bgNHJ7M9Q%pKvx>@M~C!
+f#2Yw9+zRUsZ{=VMLBb`azmxpc9Ybu-3Wz?4bJFOKL-S<7GI%bhwSL%z>G5_8A@y2NlO||v9_Tv`2m4
+YOO6-hvze2&T*fz+ETKYYG1I{v~$J4j_<_Y-^86-5NgSGM;722LbZ{v!U7n#`*?jxsfp<jlfc?;<~9N
+@x`$=4@CSHJ|CIvrqOoJ<|~d)$#>P*_(ZFtniQyPg^t_U6MwI09g+Lcci|b}4Z;WV2caxG_T;(+&r6q
+4a&d7tWtJdu%3@F=tAPlYEXLz3zEL2H#~<WNtUI0jR-~{Q3=mrd_t<a0lZPvwiGmZGEgS{LErMXt3J(
+wwys0#BXCbY!G7s3D|K*P$(S7Rk-HkxA`@iWbt|j5(V~e*JbVOMyQE6R7sinT<EwpyzVlb3M&#zjjSE
+sjVLK6Yiiy-VOo=_oThY2TxnU7rvZ+|HUnkkztasY3Wy<2G<}TEE+h-AbnT!S9N2+?plzN{pmyv$Ni6
+*2R4}kFJ;d&(Nr^obk|Nr1JuuyR%B5u}WPFM2&>n~rz68@n;0v#0DLH6yU-u}wz0)zwdSTM3BgtRsa1
+$Q`{f=Hv`d(LuXOJ*FqN)?g_%ta;gx#f3f_4^bWdYSA3A-SD+Jevzgj3-epsnml*o|(um<~h1*r<~!C
+iQTPAe=v8b#U82*aaP{iFi1MMcB(3MeDH}%SUB5s`4VZumO@T+-0~wG$pSD8!zrQ6h`6x=hr4u4PS0A
+kcPbL9xxWKNlR5b*n#P=;*|jjqS{CZ16)L;>a=%AZh}L&AKJ(6hl)q!MM+*>W;N!R5M%YZhMZDe>AQh
+grMjmchjHrNFovuf#*pV>oO*3&OzJR35Ps~`OWQ(<hEWo67^hx`aq7$CH}wg{3SWX|x6L%OpJsa>y(T
+^9=8m>vd(sNlmfW4tFZwT@*sc+|fpp(?s1x}A0FG4^jQ
+"""
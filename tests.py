@@ -1093,6 +1093,30 @@ def test_import_from_qtcompat():
     assert loadUi.__name__ == "_loadUi", loadUi
 
 
+def test_lazy_qtcompat_classes():
+    """Classes of QtCompat are built, and their modules imported, when used"""
+    code = textwrap.dedent(
+        """\
+        import sys
+        import Qt
+
+        print("asyncio" in sys.modules, "concurrent.futures" in sys.modules)
+        from Qt.QtCompat import ThreadPoolExecutor
+
+        print(ThreadPoolExecutor is Qt.QtCompat.ThreadPoolExecutor)
+        print("AsyncioEventLoop" in dir(Qt.QtCompat))
+        """
+    )
+    env = os.environ.copy()
+    env["PYTHONPATH"] = str(REPO_ROOT / "src")
+    output = subprocess_check_output(
+        [sys.executable, "-c", code],
+        env=env,
+        universal_newlines=True,
+    )
+    assert output.splitlines()[-3:] == ["False False", "True", "True"], output
+
+
 def test_i158_qtcore_direct_import():
     """import Qt.QtCore works on all bindings
 
@@ -1216,6 +1240,33 @@ def test_all_compatibility_members():
         assert not diff, f"QtCompat class binding {binding} does not define {diff}"
 
 
+def test_site_config_module_subset():
+    """QtSiteConfig can limit Qt.py to a subset of its modules"""
+    # Keep the QtSiteConfig out of the tempdir other tests import from
+    site_dir = self.tempdir / "site_config_subset"
+    site_dir.mkdir()
+    site_config = site_dir / "QtSiteConfig.py"
+    site_config.write_text(
+        textwrap.dedent(
+            """\
+            def update_members(members):
+                for name in list(members):
+                    if name != "QtCore":
+                        members.pop(name)
+            """
+        )
+    )
+    env = os.environ.copy()
+    env["PYTHONPATH"] = os.pathsep.join([str(site_dir), str(REPO_ROOT / "src")])
+    output = subprocess_check_output(
+        [sys.executable, "-c", "import Qt; print(Qt.__all__)"],
+        env=env,
+        universal_newlines=True,
+    )
+    assert "'QtCore'" in output, output
+    assert "'QtGui'" not in output, output
+
+
 def test_cli():
     """Qt.py is available from the command-line"""
     env = os.environ.copy()
@@ -1232,6 +1283,100 @@ def test_cli():
     assert b"usage: Qt.py" in out, "\n%s" % out.decode()
 
 
+def test_lint():
+    """Qt.py reports members that are not common to all bindings"""
+    import Qt
+
+    source = textwrap.dedent(
+        """\
+        from Qt import QtCore, QtGui, QtCompat
+        from Qt.QtWidgets import QWidget, QNotAWidget
+
+        QtCore.QObject()
+        QtCore.Signal
+        QtGui.QMatrix()
+        QtCompat.loadUi
+        QtCompat.QHeaderView.setResizeMode
+        """
+    )
+    path = self.tempdir / "lint_me.py"
+    path.write_text(source)
+    cache = self.tempdir / "lint_cache.json"
+
+    expected = [
+        (2, "QtWidgets.QNotAWidget is not a common member of Qt.py"),
+        (6, "QtGui.QMatrix is not a common member of Qt.py: Deprecated in PyQt5"),
+        (8, "QtCompat.QHeaderView.setResizeMode is not a member of Qt.py"),
+    ]
+    issues = Qt._lint([str(path)], jobs=1, cache=str(cache))  # type: ignore
+    assert [(line, msg) for _, line, _, msg in issues] == expected, issues
+
+    # Qt of bindings isn't Qt.py, unlike Qt.py vendored in a package
+    source = textwrap.dedent(
+        """\
+        from PySide6.QtCore import Qt
+        from mypackage.vendor import Qt as VendoredQt
+
+        Qt.AlignLeft
+        VendoredQt.QtGui.QMatrix()
+        """
+    )
+    vendored = self.tempdir / "lint_vendored.py"
+    vendored.write_text(source)
+    issues = Qt._lint([str(vendored)], jobs=1)  # type: ignore
+    assert issues == [], issues
+    issues = Qt._lint([str(vendored)], jobs=1, vendors=["mypackage.vendor"])  # type: ignore
+    assert [(line, msg) for _, line, _, msg in issues] == [
+        (5, "QtGui.QMatrix is not a common member of Qt.py: Deprecated in PyQt5")
+    ], issues
+
+    # Unchanged files are not parsed again
+    data = json.loads(cache.read_text())
+    data["files"][str(path.resolve())]["issues"] = [[1, 0, "cached"]]
+    cache.write_text(json.dumps(data))
+    issues = Qt._lint([str(path)], jobs=1, cache=str(cache))  # type: ignore
+    assert [msg for _, _, _, msg in issues] == ["cached"], issues
+
+    # The command-line returns an error code if issues are found
+    popen = subprocess.Popen(
+        [sys.executable, "src/Qt.py", "--lint", str(path), "--lint-cache", ""],
+        stdout=subprocess.PIPE,
+    )
+    out, err = popen.communicate()
+    assert popen.returncode == 1
+    assert b"lint_me.py:6:1: QtGui.QMatrix" in out, out.decode()
+
+
+def test_build_stubs():
+    """Stubs are generated for the members Qt.py exposes for a binding"""
+    import Qt
+
+    binding = Qt.__binding__
+    subprocess_check_output(
+        [
+            sys.executable,
+            "build_stubs.py",
+            "--binding",
+            binding,
+            "--output",
+            str(self.tempdir),
+        ],
+        cwd=str(REPO_ROOT),
+    )
+    package = self.tempdir / "Qt"
+    assert (package / "__init__.pyi").exists()
+    assert (package / "QtCompat.pyi").exists()
+
+    qtcore = (package / "QtCore.pyi").read_text()
+    assert "from %s.QtCore import (" % binding in qtcore, qtcore
+    assert "    QObject as QObject,\n" in qtcore, qtcore
+    assert "    QRegularExpression as QRegExp,\n" in qtcore, qtcore
+    assert '    "QRegExp",\n' in qtcore, qtcore
+
+    qtgui = (package / "QtGui.pyi").read_text()
+    assert "QMatrix: MissingMember\n" in qtgui, qtgui
+
+
 def test_membership():
     """Common members of Qt.py exist in all bindings.
 
@@ -1364,6 +1509,66 @@ def test_missing():
     )
 
 
+def test_member_index():
+    """QtCompat.isCommonMember looks up methods in the member index"""
+    import Qt
+
+    index = Qt._parse_member_index(  # type: ignore[attr-defined]
+        "\n".join(
+            [
+                "QtWidgets.QAbstractItemView<QtWidgets.QWidget setModel",
+                "QtWidgets.QHeaderView<QtWidgets.QAbstractItemView"
+                " setSectionResizeMode",
+                "QtWidgets.QWidget show",
+                "QtCore.Qt ItemDataRole.DisplayRole",
+            ]
+        )
+    )
+    original = Qt.__dict__.get("_member_index", False)
+    Qt._member_index = index  # type: ignore[attr-defined]
+    try:
+        is_common = Qt.QtCompat.isCommonMember
+        assert is_common("QtWidgets") is True
+        assert is_common("QtWidgets.QHeaderView") is True
+        assert is_common("QtWidgets.QNotAClass") is False
+        assert is_common("QtWidgets.QHeaderView.setSectionResizeMode") is True
+        # Inherited members are found by following the base classes
+        assert is_common("QtWidgets.QHeaderView.setModel") is True
+        assert is_common("QtWidgets.QHeaderView.show") is True
+        assert is_common("QtWidgets.QHeaderView.notAMethod") is False
+        assert is_common("QtCore.Qt.ItemDataRole.DisplayRole") is True
+
+        # Without an index, methods and enums can't be looked up
+        Qt._member_index = None  # type: ignore[attr-defined]
+        assert is_common("QtWidgets.QHeaderView.setSectionResizeMode") is None
+        assert is_common("QtWidgets.QHeaderView") is True
+    finally:
+        if original is False:
+            del Qt._member_index  # type: ignore[attr-defined]
+        else:
+            Qt._member_index = original  # type: ignore[attr-defined]
+
+
+def test_member_index_shipped():
+    """The member index shipped next to Qt.py is found and loaded"""
+    import Qt
+
+    original = Qt.__dict__.pop("_member_index", False)
+    try:
+        assert Qt._load_member_index() is not None  # type: ignore[attr-defined]
+
+        is_common = Qt.QtCompat.isCommonMember
+        assert is_common("QtWidgets.QHeaderView.setSectionResizeMode") is True
+        assert is_common("QtWidgets.QHeaderView.show") is True
+        assert is_common("QtCore.Qt.ItemDataRole.DisplayRole") is True
+        assert is_common("QtWidgets.QHeaderView.notAMethod") is False
+    finally:
+        if original is False:
+            Qt.__dict__.pop("_member_index", None)
+        else:
+            Qt._member_index = original  # type: ignore[attr-defined]
+
+
 def test_unicode_error_messages():
     """Test if unicode error messages with non-ascii characters
     throw the error reporter off"""
@@ -1401,6 +1606,1151 @@ def test_enum_value():
     assert isinstance(QtCompat.enumValue(enum_demi_bold), int)
 
 
+def test_byte_array_buffers():
+    """QtCompat converts between QByteArray and buffers with few copies"""
+    import array
+    from Qt import QtCore, QtCompat
+
+    byte_array = QtCore.QByteArray(b"hello")
+    view = QtCompat.byteArrayView(byte_array)
+    assert view.readonly
+    assert bytes(view) == b"hello"
+
+    for buffer in (
+        b"hello",
+        bytearray(b"hello"),
+        memoryview(b"__hello__")[2:7],
+        memoryview(b"h_e_l_l_o")[::2],
+    ):
+        result = QtCompat.byteArrayFromBuffer(buffer)
+        assert bytes(result.data()) == b"hello", (buffer, result)
+
+    result = QtCompat.byteArrayFromBuffer(array.array("B", [1, 2, 3]))
+    assert bytes(result.data()) == b"\x01\x02\x03"
+
+
+def test_image_buffers():
+    """QtCompat exposes QImage pixels as buffers without copying"""
+    from Qt import QtGui, QtCompat
+
+    rgb32 = get_enum(QtGui.QImage, "Format", "Format_RGB32")
+    image = QtGui.QImage(3, 2, rgb32)
+    image.fill(0)
+    bits = QtCompat.imageBits(image)
+    assert not bits.readonly
+    assert bits.nbytes == image.bytesPerLine() * 2
+    bits[0:4] = b"\x01\x02\x03\xff"
+    assert image.pixel(0, 0) == 0xFF030201, hex(image.pixel(0, 0))
+
+    # Scanlines of 5 pixels padded to 24 bytes
+    buffer = bytearray(48)
+    image = QtCompat.imageFromBuffer(buffer, 5, 2, rgb32, 24)
+    assert image.bytesPerLine() == 24
+    buffer[24:28] = b"\x04\x05\x06\xff"
+    assert image.pixel(0, 1) == 0xFF060504, hex(image.pixel(0, 1))
+
+    # The image keeps the buffer alive
+    del buffer
+    assert image.pixel(0, 1) == 0xFF060504, hex(image.pixel(0, 1))
+
+    grayscale = get_enum(QtGui.QImage, "Format", "Format_Grayscale8")
+    data = b"\x10\x20\x30"
+    image = QtCompat.imageFromBuffer(data, 3, 1, grayscale)
+    assert image.pixelColor(1, 0).red() == 0x20
+
+    # Read-only buffers are copied rather than painted into
+    image.fill(0)
+    assert data == b"\x10\x20\x30", data
+
+    try:
+        QtCompat.imageFromBuffer(bytearray(10), 5, 2, rgb32)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("A buffer that is too small must raise ValueError")
+
+
+def test_points_from_buffer():
+    """QtCompat builds geometry from flat buffers of coordinates"""
+    import array
+    from Qt import QtCore, QtCompat
+
+    values = array.array("d", [0.0, 1.0, 2.0, 3.0, 4.5, 5.5])
+    expected = [QtCore.QPointF(0, 1), QtCore.QPointF(2, 3), QtCore.QPointF(4.5, 5.5)]
+    for buffer in (
+        values,
+        list(values),
+        array.array("f", values),
+        array.array("i", [0, 1, 2, 3, 4, 5]),
+        memoryview(array.array("d", [0, 9, 1, 9, 2, 9, 3, 9, 4.5, 9, 5.5, 9]))[::2],
+    ):
+        polygon = QtCompat.polygonFromBuffer(buffer)
+        points = [polygon.at(i) for i in range(polygon.size())]
+        if isinstance(buffer, array.array) and buffer.typecode == "i":
+            assert points[:2] == expected[:2], points
+        else:
+            assert points == expected, (buffer, points)
+
+    assert QtCompat.polygonFromBuffer([]).isEmpty()
+    try:
+        QtCompat.polygonFromBuffer([1, 2, 3])
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("An odd number of values must raise ValueError")
+
+    path = QtCompat.painterPathFromBuffer([0, 0, 10, 0, 10, 10], closed=True)
+    assert path.elementCount() == 4
+    assert path.boundingRect() == QtCore.QRectF(0, 0, 10, 10)
+
+    lines = QtCompat.linesFromBuffer([0, 1, 2, 3, 4, 5, 6, 7])
+    assert lines == [QtCore.QLineF(0, 1, 2, 3), QtCore.QLineF(4, 5, 6, 7)]
+
+
+def test_columnar_table_model():
+    """QtCompat.ColumnarTableModel stores and displays values by column"""
+    from Qt import QtCore, QtCompat
+
+    edit_role = get_enum(QtCore.Qt, "ItemDataRole", "EditRole")
+    user_role = get_enum(QtCore.Qt, "ItemDataRole", "UserRole")
+    tool_tip_role = get_enum(QtCore.Qt, "ItemDataRole", "ToolTipRole")
+    text_alignment_role = get_enum(QtCore.Qt, "ItemDataRole", "TextAlignmentRole")
+    horizontal = get_enum(QtCore.Qt, "Orientation", "Horizontal")
+    model = QtCompat.ColumnarTableModel(
+        ["Name", "Size"], typecodes=[None, "q"], formats=[None, "{:,}"]
+    )
+    inserted = []
+    model.rowsInserted.connect(
+        lambda parent, first, last: inserted.append((first, last))
+    )
+
+    model.appendRows([("a", 1024), ("b", 2048)])
+    model.appendColumns([["c", "d", "e"], [1, 2, 3]])
+    model.appendRows([])
+    assert inserted == [(0, 1), (2, 4)], inserted
+    assert model.rowCount() == 5
+    assert model.columnCount() == 2
+    assert model.rowCount(model.index(0, 0)) == 0
+
+    index = model.index(1, 1)
+    assert model.data(index) == "2,048"
+    assert model.data(index, edit_role) == 2048
+    assert model.data(index, QtCompat.enumValue(user_role)) == 2048
+    assert model.data(index, tool_tip_role) is None
+    assert model.data(model.index(4, 0)) == "e"
+    assert model.data(model.index(0, 0), text_alignment_role) is None
+    assert model.data(index, text_alignment_role) is not None
+    assert model.headerData(1, horizontal) == "Size"
+    assert model.columnData(1).tolist() == [1024, 2048, 1, 2, 3]
+
+    reset = []
+    model.modelReset.connect(lambda: reset.append(True))
+    model.setColumns([["x"], [7]])
+    assert reset == [True]
+    assert model.rowCount() == 1
+    assert model.data(model.index(0, 1)) == "7"
+
+    # Display strings kept are limited, and formatted again when needed
+    formatted = []
+
+    def format_size(value):
+        formatted.append(value)
+        return str(value)
+
+    limited = QtCompat.ColumnarTableModel(
+        ["Size"], typecodes=["q"], formats=[format_size], cacheSize=2
+    )
+    limited.appendColumns([range(5)])
+    for row in (0, 1, 1, 2, 0):
+        assert limited.data(limited.index(row, 0)) == str(row)
+    assert formatted == [0, 1, 2, 0], formatted
+
+    for columns in ([["x"]], [["x", "y"], [1]]):
+        try:
+            model.appendColumns(columns)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("Mismatched columns must raise ValueError")
+
+
+def test_data_changed_coalescer():
+    """QtCompat.DataChangedCoalescer merges changes of adjacent rows"""
+    from Qt import QtCore, QtGui, QtCompat
+
+    display_role = get_enum(QtCore.Qt, "ItemDataRole", "DisplayRole")
+    edit_role = get_enum(QtCore.Qt, "ItemDataRole", "EditRole")
+    model = QtGui.QStandardItemModel(10, 4)
+    emitted = []
+
+    def on_data_changed(top_left, bottom_right, changed_roles):
+        top, bottom = top_left.row(), bottom_right.row()
+        left, right = top_left.column(), bottom_right.column()
+        emitted.append((top, bottom, left, right, list(changed_roles)))
+
+    model.dataChanged.connect(on_data_changed)
+
+    coalescer = QtCompat.DataChangedCoalescer()
+    for row in (2, 3, 1, 8):
+        coalescer.dataChanged(model, model.index(row, 1), roles=[display_role])
+    coalescer.dataChanged(model, model.index(3, 2), model.index(4, 3), [edit_role])
+    assert emitted == []
+
+    coalescer.flush()
+    display, edit = (
+        QtCompat.enumValue(display_role),
+        QtCompat.enumValue(edit_role),
+    )
+    assert emitted == [
+        (1, 4, 1, 3, [display, edit]),
+        (8, 8, 1, 1, [display, edit]),
+    ], emitted
+
+    # Rows removed before the flush are left out, no roles means all roles
+    del emitted[:]
+    coalescer.dataChanged(model, model.index(7, 0), model.index(9, 0))
+    coalescer.dataChanged(model, model.index(0, 0), roles=[display_role])
+    model.removeRows(8, 2)
+    coalescer.flush()
+    assert emitted == [(0, 0, 0, 0, []), (7, 7, 0, 0, [])], emitted
+
+    # Changes follow rows inserted and removed before the flush
+    del emitted[:]
+    coalescer.dataChanged(model, model.index(5, 0))
+    coalescer.dataChanged(model, model.index(2, 1))
+    model.insertRows(0, 2)
+    model.removeRows(4, 1)
+    coalescer.flush()
+    assert emitted == [(6, 6, 0, 0, [])], emitted
+
+    # Moved rows and changed layouts emit all rows, resets emit nothing
+    strings = QtCore.QStringListModel(list("abcdef"))
+    strings.dataChanged.connect(on_data_changed)
+    del emitted[:]
+    coalescer.dataChanged(strings, strings.index(1, 0))
+    strings.moveRows(QtCore.QModelIndex(), 1, 1, QtCore.QModelIndex(), 4)
+    coalescer.flush()
+    assert emitted == [(0, 5, 0, 0, [])], emitted
+    del emitted[:]
+    coalescer.dataChanged(strings, strings.index(1, 0))
+    strings.sort(0)
+    coalescer.flush()
+    assert emitted == [(0, 5, 0, 0, [])], emitted
+    del emitted[:]
+    coalescer.dataChanged(strings, strings.index(1, 0))
+    strings.setStringList(["x"])
+    coalescer.flush()
+    assert emitted == [], emitted
+
+    del emitted[:]
+    QtCompat.dataChanged(model, model.index(0, 0), model.index(1, 1))
+    assert emitted == [(0, 1, 0, 1, [])], emitted
+
+
+def test_update_rows():
+    """QtCompat.updateRows updates a model with batched inserts, removes and moves"""
+    from Qt import QtCore, QtCompat
+
+    class Model(QtCore.QAbstractListModel):
+        def __init__(self, rows):
+            super(Model, self).__init__()
+            self.rows = rows
+
+        def rowCount(self, parent=QtCore.QModelIndex()):  # noqa: B008
+            return 0 if parent.isValid() else len(self.rows)
+
+        def data(self, index, role=None):
+            return self.rows[index.row()][1]
+
+    model = Model([(key, "old") for key in "abcdefgh"])
+    persistent = QtCore.QPersistentModelIndex(model.index(7, 0))
+    signals: typing.List[tuple] = []
+    model.rowsRemoved.connect(lambda p, first, last: signals.append(("-", first, last)))
+    model.rowsInserted.connect(
+        lambda p, first, last: signals.append(("+", first, last))
+    )
+    model.rowsMoved.connect(
+        lambda p, first, last, d, row: signals.append(("m", first, last, row))
+    )
+    model.dataChanged.connect(
+        lambda top, bottom, roles: signals.append(("c", top.row(), bottom.row()))
+    )
+
+    new_rows = [
+        ("h", "old"),
+        ("a", "old"),
+        ("x", "new"),
+        ("y", "new"),
+        ("b", "old"),
+        ("e", "changed"),
+        ("f", "changed"),
+        ("g", "old"),
+    ]
+    stats = QtCompat.updateRows(model, model.rows, new_rows, key=lambda row: row[0])
+
+    assert model.rows == new_rows
+    assert stats == {"removed": 2, "inserted": 2, "moved": 1, "changed": 2}, stats
+    assert signals == [
+        ("-", 2, 3),
+        ("m", 5, 5, 0),
+        ("+", 2, 3),
+        ("c", 5, 6),
+    ], signals
+    # Rows that were moved keep their persistent indexes
+    assert persistent.row() == 0
+
+    try:
+        QtCompat.updateRows(model, model.rows, [("a", 1), ("a", 2)], key=lambda r: r[0])
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Duplicate keys must raise ValueError")
+
+
+def test_filter_proxy_model():
+    """QtCompat.FilterProxyModel filters and sorts by the text of rows"""
+    from Qt import QtCore, QtGui, QtCompat
+
+    source = QtGui.QStandardItemModel(0, 2)
+    for name, size in [("Alpha", 3), ("beta", 1), ("alphabet", 10), ("gamma", 2)]:
+        source.appendRow([QtGui.QStandardItem(name), QtGui.QStandardItem(str(size))])
+
+    proxy = QtCompat.FilterProxyModel()
+    proxy.setSourceModel(source)
+
+    def rows():
+        return [proxy.index(row, 0).data() for row in range(proxy.rowCount())]
+
+    assert rows() == ["Alpha", "beta", "alphabet", "gamma"]
+
+    removed = []
+    proxy.rowsRemoved.connect(lambda parent, first, last: removed.append((first, last)))
+    proxy.setFilterText("AL")
+    assert rows() == ["Alpha", "alphabet"]
+    assert removed == [(3, 3), (1, 1)], removed
+    proxy.setFilterText("alphab")
+    assert rows() == ["alphabet"]
+    proxy.setFilterText("a")
+    assert rows() == ["Alpha", "beta", "alphabet", "gamma"]
+
+    proxy.setFilterColumns([1])
+    proxy.setFilterText("1")
+    assert rows() == ["beta", "alphabet"]
+
+    # Changes of the source update the filter
+    source.item(0, 1).setText("100")
+    assert rows() == ["Alpha", "beta", "alphabet"]
+    source.insertRow(0, [QtGui.QStandardItem("delta"), QtGui.QStandardItem("1")])
+    assert rows() == ["delta", "Alpha", "beta", "alphabet"]
+    source.removeRows(1, 2)
+    assert rows() == ["delta", "alphabet"]
+
+    index = proxy.index(1, 0)
+    assert proxy.mapToSource(index).row() == 1
+    assert proxy.mapFromSource(source.index(1, 1)) == proxy.index(1, 1)
+    assert not proxy.mapFromSource(source.index(2, 0)).isValid()
+
+    proxy.setFilterText("")
+    persistent = QtCore.QPersistentModelIndex(proxy.index(0, 0))
+    proxy.sort(0, get_enum(QtCore.Qt, "SortOrder", "DescendingOrder"))
+    assert rows() == ["gamma", "delta", "alphabet"]
+    assert persistent.data() == "delta"
+    proxy.sort(-1)
+    assert rows() == ["delta", "alphabet", "gamma"]
+
+
+def test_lazy_tree_model():
+    """QtCompat.LazyTreeModel loads children a page at a time"""
+    from Qt import QtCore, QtCompat
+
+    loaded = []
+
+    def children(item):
+        loaded.append(item)
+        if item == "broken":
+            raise IOError("Can't list %s" % item)
+        if item and len(item) >= 2:
+            return []
+        return (item + str(i) for i in range(5))
+
+    model = QtCompat.LazyTreeModel(
+        children, root="", pageSize=2, hasChildren=lambda item: len(item) < 2
+    )
+    root = QtCore.QModelIndex()
+    assert model.rowCount() == 0
+    assert model.hasChildren(root)
+    assert loaded == []
+
+    pages = 0
+    while model.canFetchMore(root):
+        model.fetchMore(root)
+        pages += 1
+    assert pages == 3
+    assert model.rowCount() == 5
+    assert loaded == [""]
+
+    index = model.index(3, 0)
+    assert model.data(index) == "3"
+    assert model.item(index) == "3"
+    assert model.hasChildren(index)
+    model.fetchMore(index)
+    assert model.rowCount(index) == 2
+    child = model.index(1, 0, index)
+    assert model.data(child) == "31"
+    assert model.parent(child) == index
+    assert not model.hasChildren(child)
+
+    errors = []
+    model.loadFailed.connect(lambda item, error: errors.append(item))
+    model.setRoot("broken")
+    model.fetchMore(root)
+    assert errors == ["broken"]
+    assert not model.canFetchMore(root)
+    assert model.rowCount() == 0
+
+    # Pages loaded in a thread pool continue where the previous one stopped
+    import threading
+    from Qt import QtWidgets
+
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
+    pool = QtCore.QThreadPool()
+    pool.setMaxThreadCount(1)
+    model = QtCompat.LazyTreeModel(children, root="", pageSize=3, threadPool=pool)
+    for rows in (3, 5):
+        model.fetchMore(root)
+        assert pool.waitForDone(10000)
+        app.processEvents()
+        assert model.rowCount() == rows
+    assert [model.item(model.index(row, 0)) for row in range(5)] == list("01234")
+
+    # Pages loaded after the model was deleted are dropped
+    release = threading.Event()
+
+    def blocking(item):
+        release.wait(10)
+        return ["late"]
+
+    model = QtCompat.LazyTreeModel(blocking, threadPool=pool)
+    model.fetchMore(root)
+    QtCompat.delete(model)
+    release.set()
+    assert pool.waitForDone(10000)
+    app.processEvents()
+
+
+def test_thread_pool_executor():
+    """QtCompat.ThreadPoolExecutor delivers futures in batches with signals"""
+    import threading
+    from Qt import QtCore, QtWidgets, QtCompat
+
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
+    pool = QtCore.QThreadPool()
+    pool.setMaxThreadCount(1)
+    executor = QtCompat.ThreadPoolExecutor(pool)
+    batches: typing.List[list] = []
+    progress: typing.List[tuple] = []
+    executor.finished.connect(lambda futures: batches.append(list(futures)))
+    executor.progress.connect(lambda future, value: progress.append((future, value)))
+
+    started = threading.Event()
+    release = threading.Event()
+    order = []
+
+    def blocking():
+        executor.reportProgress(50)
+        started.set()
+        release.wait(10)
+        return "blocking"
+
+    def task(name):
+        order.append(name)
+        return name
+
+    first = executor.submit(blocking)
+    assert started.wait(10)
+    low = executor.submit(task, "low")
+    high = executor.submitWithPriority(10, task, "high")
+    cancelled = executor.submit(task, "cancelled")
+    failed = executor.submit(lambda: 1 / 0)
+    assert cancelled.cancel()
+
+    release.set()
+    executor.shutdown()
+    assert pool.waitForDone(10000)
+    app.processEvents()
+
+    assert first.result() == "blocking"
+    assert low.result() == "low"
+    assert high.result() == "high"
+    assert isinstance(failed.exception(), ZeroDivisionError)
+    assert order == ["high", "low"]
+    assert progress == [(first, 50)]
+    # Futures done while away from the event loop are delivered together
+    assert len(batches) == 1
+    assert set(batches[0]) == {first, low, high, cancelled, failed}
+
+    assert_raises(RuntimeError, executor.submit, task, "late")
+
+
+def test_asyncio_event_loop():
+    """QtCompat.AsyncioEventLoop runs coroutines in the Qt event loop"""
+    import gc
+    import socket
+    import asyncio
+    from Qt import QtCore, QtWidgets, QtCompat
+
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
+    loop = QtCompat.AsyncioEventLoop()
+    ticks: typing.List[int] = []
+    timer = QtCore.QTimer()
+    timer.timeout.connect(lambda: ticks.append(1))
+    timer.start(1)
+
+    async def main():
+        await asyncio.sleep(0.05)
+        reader, writer = socket.socketpair()
+        reader.setblocking(False)
+        loop.call_later(0.01, writer.send, b"data")
+        received = await loop.sock_recv(reader, 4)
+        reader.close()
+        writer.close()
+
+        executor = QtCompat.ThreadPoolExecutor()
+        result = await loop.run_in_executor(executor, sum, range(10))
+        return received, result
+
+    async def fail():
+        raise ValueError("fail")
+
+    def notifiers():
+        return [
+            obj
+            for obj in gc.get_objects()
+            if isinstance(obj, QtCore.QSocketNotifier) and QtCompat.isValid(obj)
+        ]
+
+    before = notifiers()
+    # Runs once the application exited its event loops, too
+    app.exit()
+    try:
+        assert loop.run_until_complete(main()) == (b"data", 45)
+        # Qt events are processed while the coroutine waits
+        assert ticks
+        assert_raises(ValueError, loop.run_until_complete, fail())
+
+        # The notifiers of removed readers are deleted
+        QtCore.QCoreApplication.sendPostedEvents(
+            None, get_enum(QtCore.QEvent, "Type", "DeferredDelete")
+        )
+        assert notifiers() == before
+
+        loop.call_soon(loop.stop)
+        loop.run_forever()
+        assert not loop.is_running()
+    finally:
+        timer.stop()
+        loop.close()
+    app.processEvents()
+
+
+def test_stall_watchdog():
+    """QtCompat.StallWatchdog captures the stack of a blocked event loop"""
+    import time
+    from Qt import QtCore, QtWidgets, QtCompat
+
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
+    path = str(self.tempdir / "stalls.log")
+    watchdog = QtCompat.StallWatchdog(
+        threshold=100, interval=10, path=path, dumpInterval=60000
+    )
+    stalled: typing.List[float] = []
+    watchdog.stalled.connect(stalled.append)
+
+    def run_event_loop(ms):
+        # Not a QEventLoop, which other tests may have quit with app.exit()
+        end = time.monotonic() + ms / 1000.0
+        while time.monotonic() < end:
+            app.processEvents(
+                get_enum(QtCore.QEventLoop, "ProcessEventsFlag", "AllEvents"), 5
+            )
+            time.sleep(0.001)
+
+    def blocking_function():
+        time.sleep(0.4)
+
+    watchdog.start()
+    try:
+        run_event_loop(50)
+        blocking_function()
+        run_event_loop(50)
+        # Too soon after the last capture to capture another stack
+        blocking_function()
+        run_event_loop(50)
+    finally:
+        watchdog.stop()
+    app.processEvents()
+
+    # Busy machines may stall more often and sleep longer than asked
+    assert len([duration for duration in stalled if duration >= 300]) >= 2
+    assert watchdog.skippedStalls() >= 1
+    # Other stalls of a busy machine may be captured too
+    (stall,) = [s for s in watchdog.stalls() if "blocking_function" in s["stack"]]
+    assert stall["duration"] in stalled
+    assert 100 <= stall["blocked"] <= stall["duration"]
+    with open(path) as f:
+        assert "blocking_function" in f.read()
+
+    histogram = dict(watchdog.histogram())
+    assert sum(count for bound, count in histogram.items() if bound >= 500) >= 2
+    assert sum(histogram.values()) > 2
+    assert not watchdog.isActive()
+
+
+def test_signal_profiler():
+    """QtCompat.SignalProfiler times slots per sender, signal and slot"""
+    import pstats
+    import weakref
+    from Qt import QtCore, QtCompat
+
+    class Emitter(QtCore.QObject):
+        changed = QtCore.Signal(int)
+        cleared = QtCore.Signal()
+
+    class Receiver(QtCore.QObject):
+        def __init__(self):
+            super(Receiver, self).__init__()
+            self.values = []
+
+        def on_changed(self, value):
+            self.values.append(value)
+
+        @QtCore.Slot()
+        def on_cleared(self):
+            self.values.append(type(self.sender()).__name__)
+
+        def on_sender(self):
+            self.values.append(type(self.sender()).__name__)
+
+    called: typing.List[str] = []
+
+    def on_any():
+        called.append("any")
+
+    disconnect = type(Emitter().changed).disconnect
+    profiler = QtCompat.SignalProfiler()
+    profiler.install()
+    try:
+        emitter = Emitter()
+        receiver = Receiver()
+        emitter.changed.connect(receiver.on_changed)
+        emitter.changed.connect(on_any)
+        emitter.cleared.connect(on_any)
+        # Decorated slots are connected as they are, and not timed
+        emitter.cleared.connect(receiver.on_cleared)
+        for value in range(4):
+            emitter.changed.emit(value)
+        emitter.cleared.emit()
+        assert receiver.values == [0, 1, 2, 3, "Emitter"]
+        assert called == ["any"] * 5
+        del receiver.values[-1]
+
+        # Still unique, PyQt raises and PySide returns an invalid connection
+        unique = get_enum(QtCore.Qt, "ConnectionType", "UniqueConnection")
+        try:
+            assert not emitter.changed.connect(receiver.on_changed, unique)
+        except TypeError:
+            pass
+
+        calls = {(r["signal"], r["slot"]): r["calls"] for r in profiler.report()}
+        assert calls == {
+            ("changed", "test_signal_profiler.<locals>.Receiver.on_changed"): 4,
+            ("changed", "test_signal_profiler.<locals>.on_any"): 4,
+            ("cleared", "test_signal_profiler.<locals>.on_any"): 1,
+        }
+        assert all(r["sender"] == "Emitter" for r in profiler.report())
+
+        # Toggled without connecting again
+        profiler.setEnabled(False)
+        emitter.changed.emit(4)
+        profiler.setEnabled(True)
+        profiler.setSampleEvery(2)
+        emitter.changed.disconnect(on_any)
+        emitter.changed.emit(5)
+        emitter.changed.emit(6)
+        assert called == ["any"] * 6
+        assert receiver.values == [0, 1, 2, 3, 4, 5, 6]
+        (result,) = [r for r in profiler.report() if r["slot"].endswith("on_changed")]
+        assert (result["calls"], result["sampled"]) == (6, 5)
+
+        path = str(self.tempdir / "slots.prof")
+        profiler.dumpStats(path)
+        assert pstats.Stats(path).total_calls == 11  # type: ignore
+        assert len(json.loads(profiler.toJson())) == 3
+
+        # Slots calling sender() see the sender
+        emitter.cleared.connect(receiver.on_sender)
+        emitter.cleared.emit()
+        assert receiver.values[-2:] == ["Emitter", "Emitter"]
+        del called[-1]
+
+        # Connections don't keep the receiver alive
+        reference = weakref.ref(receiver)
+        del receiver
+        assert reference() is None
+        emitter.changed.emit(7)
+    finally:
+        profiler.uninstall()
+    assert not profiler.isInstalled()
+    assert type(emitter.changed).disconnect is disconnect
+
+    # Slots connected while installed are disconnected along with the others
+    emitter.cleared.disconnect()
+    emitter.cleared.emit()
+    assert called == ["any"] * 6
+
+
+def test_widget_profiler():
+    """QtCompat.WidgetProfiler times paint and layout events per widget"""
+    import time
+    from Qt import QtCore, QtWidgets, QtCompat
+
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
+
+    painted: typing.List[QtCore.QObject] = []
+    handled: typing.List[bool] = []
+
+    class Slow(QtWidgets.QWidget):
+        def paintEvent(self, event):
+            handled.append(event.spontaneous())
+            time.sleep(0.01)
+
+    class Filter(QtCore.QObject):
+        def eventFilter(self, obj, event):
+            if event.type() == get_enum(QtCore.QEvent, "Type", "Paint"):
+                painted.append(obj)
+            return False
+
+    panel = QtWidgets.QWidget()
+    panel.setObjectName("panel")
+    layout = QtWidgets.QVBoxLayout(panel)
+    slow = Slow()
+    slow.setObjectName("slow")
+    layout.addWidget(slow)
+    layout.addWidget(QtWidgets.QPushButton("Button"))
+    other_filter = Filter()
+    slow.installEventFilter(other_filter)
+
+    profiler = QtCompat.WidgetProfiler(panel)
+    profiler.start()
+    # Filters installed after the profiler's see each event once too
+    late_filter = Filter()
+    slow.installEventFilter(late_filter)
+    panel.resize(400, 300)
+    panel.grab()
+    profiler.stop()
+    panel.resize(200, 200)
+    panel.grab()
+
+    results = {(tuple(r["path"]), r["event"]): r for r in profiler.report()}
+    paint = results[(("QWidget#panel", "Slow#slow"), "Paint")]
+    assert paint["count"] == 1
+    assert paint["self"] >= 0.01
+    assert profiler.report()[0] == paint
+    assert (("QWidget#panel", "QPushButton"), "Paint") in results
+    assert (("QWidget#panel",), "Resize") in results
+    # Other filters and the widget see the events once, as sent by Qt
+    assert handled and all(handled)
+    assert painted.count(slow) == 2 * len(handled)
+
+    tree = profiler.tree()
+    assert tree is not None
+    assert tree["name"] == "QWidget#panel"
+    assert tree["children"][0]["name"] == "Slow#slow"
+    assert tree["total"] >= tree["children"][0]["total"] >= 0.01
+
+    path = str(self.tempdir / "panel.folded")
+    profiler.writeFoldedStacks(path)
+    with open(path) as f:
+        lines = f.read().splitlines()
+    assert any(line.startswith("QWidget#panel;Slow#slow;Paint ") for line in lines)
+    assert not profiler.isActive()
+
+    # Code run after sending an event isn't counted to it
+    panel.show()
+    app.processEvents()
+    profiler = QtCompat.WidgetProfiler(panel)
+    profiler.start()
+    panel.resize(300, 300)
+    time.sleep(0.1)
+    profiler.stop()
+    panel.hide()
+    results = {(tuple(r["path"]), r["event"]): r for r in profiler.report()}
+    assert results[(("QWidget#panel",), "Resize")]["total"] < 0.05
+    app.processEvents()
+
+
+def test_leak_tracker():
+    """QtCompat.LeakTracker counts QObjects and finds deleted wrappers"""
+    from Qt import QtCore, QtWidgets, QtCompat
+
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
+    tracker = QtCompat.LeakTracker(budget=0)
+
+    class Tool(QtWidgets.QWidget):
+        def __init__(self, parent=None):
+            super(Tool, self).__init__(parent)
+            self.button = QtWidgets.QPushButton(self)
+
+    class Holder(object):
+        def __init__(self, tool):
+            self.tool = tool
+
+    before = tracker.snapshot()
+    window = QtWidgets.QWidget()
+    for _ in range(100):
+        Tool(window)
+    after = tracker.snapshot()
+    changes = QtCompat.LeakTracker.diff(before, after)
+    # Objects of other tests may be deleted meanwhile
+    assert changes["Tool"] == 100
+    assert changes["QPushButton"] >= 100
+    assert list(changes)[0] in ("Tool", "QPushButton")
+
+    # Taken in steps, the budget of 0 ms being checked every 64 objects
+    snapshots: typing.List[dict] = []
+    tracker.snapshotTaken.connect(snapshots.append)
+    tracker.start(interval=60000)
+    steps = 0
+    while not snapshots:
+        app.processEvents()
+        steps += 1
+    tracker.stop()
+    assert steps > 1
+    assert snapshots[0]["Tool"] == 100
+    assert tracker.snapshots() == snapshots
+
+    holder = Holder(window.findChildren(Tool)[0])
+    window.deleteLater()
+    QtCore.QCoreApplication.sendPostedEvents(
+        None, get_enum(QtCore.QEvent, "Type", "DeferredDelete")
+    )
+    deleted = QtCompat.LeakTracker.findDeleted()
+    assert any(obj is holder.tool for obj in deleted)
+    assert "Holder.tool" in QtCompat.LeakTracker.referrers(holder.tool)
+    assert not tracker.isActive()
+
+
+def test_memory_report():
+    """QtCompat.memoryReport estimates the memory of a widget tree"""
+    from Qt import QtGui, QtWidgets, QtCompat
+
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
+
+    class Panel(QtWidgets.QWidget):
+        def __init__(self, parent=None):
+            super(Panel, self).__init__(parent)
+            self.setObjectName("panel")
+            self.image = QtGui.QImage(
+                10, 10, get_enum(QtGui.QImage, "Format", "Format_ARGB32")
+            )
+            self.thumbnails = [QtGui.QPixmap(8, 8)]
+
+    window = QtWidgets.QWidget()
+    window.setObjectName("tool")
+    window.setStyleSheet("QLabel { color: red; }")
+    pixmap = QtGui.QPixmap(100, 100)
+    pixmap.fill()
+    # Implicitly shared, so counted once
+    QtWidgets.QLabel(window).setPixmap(pixmap)
+    QtWidgets.QLabel(window).setPixmap(pixmap)
+    icon = QtGui.QIcon()
+    icon.addPixmap(QtGui.QPixmap(16, 16))
+    icon.addPixmap(QtGui.QPixmap(32, 32))
+    QtWidgets.QPushButton(window).setIcon(icon)
+    view = QtWidgets.QTableView(window)
+    view.setModel(QtGui.QStandardItemModel(10, 3, view))
+    panel = Panel(window)
+
+    report = QtCompat.memoryReport(window)
+    depth = pixmap.depth() // 8
+    total = report["total"]
+    assert total["imageBytes"] == (100 * 100 + 8 * 8) * depth + 10 * 10 * 4
+    assert total["iconBytes"] == (16 * 16 + 32 * 32) * 4
+    assert total["styleSheetBytes"] == len(window.styleSheet()) * 2
+    assert total["modelCells"] == 30
+    assert total["widgets"] == len(window.findChildren(QtWidgets.QWidget)) + 1
+    assert total["bytes"] == sum(v for k, v in total.items() if k.endswith("Bytes"))
+
+    tree = report["tree"]
+    assert tree["name"] == "QWidget#tool"
+    assert tree["total"] == total
+    assert tree["children"][0]["name"] == "QLabel"
+    assert report["byName"]["QLabel"]["imageBytes"] == 100 * 100 * depth
+    assert report["byName"]["Panel#panel"]["wrapperBytes"] >= sys.getsizeof(panel)
+    window.deleteLater()
+    app.processEvents()
+
+
+def test_thumbnail_loader():
+    """QtCompat.ThumbnailLoader decodes and caches thumbnails in batches"""
+    import time
+    from Qt import QtCore, QtGui, QtWidgets, QtCompat
+
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
+    directory = self.tempdir / "thumbnails"
+    directory.mkdir()
+    paths = []
+    for index in range(3):
+        image = QtGui.QImage(200, 100, get_enum(QtGui.QImage, "Format", "Format_RGB32"))
+        image.fill(QtGui.QColor(index * 100, 0, 0))
+        paths.append(str(directory / ("%d.png" % index)))
+        assert image.save(paths[-1])
+    broken = directory / "broken.png"
+    broken.write_text("Not an image")
+
+    def load(loader, paths):
+        thumbnails: list = []
+        failed: list = []
+        loader.thumbnailsReady.connect(thumbnails.extend)
+        loader.thumbnailFailed.connect(lambda path, error: failed.append(path))
+        for path in paths:
+            assert loader.request(path) is None
+            # Loading already
+            assert loader.request(path) is None
+        deadline = time.time() + 10
+        while any(map(loader.isLoading, paths)) and time.time() < deadline:
+            app.processEvents()
+        return thumbnails, failed
+
+    cache = str(directory / "cache")
+    loader = QtCompat.ThumbnailLoader(QtCore.QSize(32, 32), cacheDir=cache)
+    thumbnails, failed = load(loader, paths + [str(broken)])
+    assert failed == [str(broken)]
+    assert sorted(path for path, _, _ in thumbnails) == paths
+    path, size, image = thumbnails[0]
+    assert size == QtCore.QSize(32, 32)
+    assert image.size() == QtCore.QSize(32, 16)
+    assert loader.request(path) is image
+    assert loader.cachedBytes() == 3 * 32 * 16 * 4
+    assert len(os.listdir(cache)) == 3
+    loader.invalidate(path)
+    assert loader.cached(path) is None
+
+    # Read from the disk cache, and kept within a budget of 2 thumbnails
+    loader = QtCompat.ThumbnailLoader(
+        QtCore.QSize(32, 32), cacheSize=2 * 32 * 16 * 4, cacheDir=cache
+    )
+    thumbnails, failed = load(loader, paths)
+    assert len(thumbnails) == 3
+    assert loader.cachedBytes() == 2 * 32 * 16 * 4
+    assert thumbnails[0][2].pixelColor(0, 0) == QtGui.QColor(
+        int(os.path.basename(thumbnails[0][0])[0]) * 100, 0, 0
+    )
+
+    # Modified files are loaded again, unless files aren't checked
+    unchecked = QtCompat.ThumbnailLoader(QtCore.QSize(32, 32), checkFiles=False)
+    loader = QtCompat.ThumbnailLoader(QtCore.QSize(32, 32))
+    load(unchecked, paths[:1])
+    load(loader, paths[:1])
+    assert loader.request(paths[0]) is not None
+    image = QtGui.QImage(100, 100, get_enum(QtGui.QImage, "Format", "Format_RGB32"))
+    image.fill(QtGui.QColor(0, 0, 255))
+    assert image.save(paths[0])
+    os.utime(paths[0], (time.time() + 10, time.time() + 10))
+    thumbnails, failed = load(loader, paths[:1])
+    assert thumbnails[0][2].size() == QtCore.QSize(32, 32)
+    assert loader.request(paths[0]) is thumbnails[0][2]
+    old = unchecked.request(paths[0])
+    assert old is not None and old.size() == QtCore.QSize(32, 16)
+
+    # Cancelled before starting
+    pool = QtCore.QThreadPool()
+    pool.setMaxThreadCount(1)
+    loader = QtCompat.ThumbnailLoader(QtCore.QSize(16, 16), threadPool=pool)
+    pool.start(lambda: time.sleep(0.2))
+    assert loader.request(paths[0]) is None
+    loader.cancel(paths[0])
+    assert not loader.isLoading(paths[0])
+    pool.waitForDone()
+
+
+def test_pixmap_cache():
+    """QtCompat.PixmapCache finds pixmaps with the same API on all bindings"""
+    from Qt import QtGui, QtWidgets, QtCompat
+
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)  # noqa: F841
+
+    def pixmap(size):
+        pixmap = QtGui.QPixmap(size, size)
+        pixmap.fill()
+        return pixmap
+
+    size = 16 * 16 * pixmap(16).depth() // 8
+    icons = QtCompat.PixmapCache("test-icons", budget=2 * size)
+    assert icons.find("folder") is None
+    assert icons.insert("folder", pixmap(16))
+    found = icons.find("folder")
+    assert found is not None and found.size() == pixmap(16).size()
+    assert icons.insert(("file", 16), pixmap(16))
+    icons.find("folder")
+    # Over budget, so the least recently used pixmap is removed
+    assert icons.insert(("file", 32.0), pixmap(16))
+    assert icons.find(("file", 16)) is None
+    assert not icons.insert("large", pixmap(64))
+    assert icons.stats() == {
+        "hits": 2,
+        "misses": 2,
+        "inserts": 3,
+        "evictions": 1,
+        "count": 2,
+        "bytes": 2 * size,
+    }
+
+    # Namespaces are shared, and invalidated separately
+    assert QtCompat.PixmapCache("test-icons").find("folder") is not None
+    swatches = QtCompat.PixmapCache("test-swatches")
+    swatches.insert("folder", pixmap(8))
+    icons.invalidate()
+    assert icons.find("folder") is None
+    found = swatches.find("folder")
+    assert found is not None and found.width() == 8
+    swatches.remove("folder")
+    assert swatches.find("folder") is None
+
+    assert_raises(TypeError, icons.find, 1)
+
+
+def test_register_resource():
+    """QtCompat.registerResource compiles and registers .qrc files"""
+    from Qt import QtCore, QtCompat
+
+    directory = self.tempdir / "resources"
+    (directory / "icons").mkdir(parents=True)
+    (directory / "icons" / "open.txt").write_bytes(b"open")
+    (directory / "icons" / "save.txt").write_bytes(b"save")
+    (directory / "about.txt").write_bytes(b"about" * 100)
+    qrc = directory / "tool.qrc"
+    qrc.write_text(
+        """<RCC>
+  <qresource prefix="/tool">
+    <file>icons</file>
+    <file alias="help/about.txt">about.txt</file>
+    <file alias="about.txt">about.txt</file>
+  </qresource>
+</RCC>"""
+    )
+
+    def read(path):
+        f = QtCore.QFile(path)
+        assert f.open(get_enum(QtCore.QIODevice, "OpenModeFlag", "ReadOnly")), path
+        return bytes(f.readAll())
+
+    cache = str(directory / "cache")
+    rcc = QtCompat.registerResource(str(qrc), cacheDir=cache)
+    try:
+        assert os.path.dirname(rcc) == cache
+        assert read(":/tool/icons/open.txt") == b"open"
+        assert read(":/tool/icons/save.txt") == b"save"
+        assert read(":/tool/help/about.txt") == b"about" * 100
+        assert read(":/tool/about.txt") == b"about" * 100
+        entries = QtCore.QDir(":/tool").entryList()
+        assert sorted(entries) == ["about.txt", "help", "icons"]
+        # Listed twice, stored once
+        assert os.path.getsize(rcc) < 2 * 500
+    finally:
+        QtCompat.unregisterResource(str(qrc), cacheDir=cache)
+    assert not QtCore.QFile.exists(":/tool/icons/open.txt")
+
+    # Compiled again once a file changed
+    mtime = os.stat(rcc).st_mtime_ns
+    assert QtCompat.compileResource(str(qrc), cache) == rcc
+    assert os.stat(rcc).st_mtime_ns == mtime
+    os.utime(directory / "about.txt", ns=(mtime + 10**9, mtime + 10**9))
+    QtCompat.compileResource(str(qrc), cache)
+    assert os.stat(rcc).st_mtime_ns != mtime
+
+    # And once a file of a directory listed was removed or renamed
+    os.utime(directory / "about.txt", ns=(mtime, mtime))
+    rcc = QtCompat.compileResource(str(qrc), cache)
+    mtime = os.stat(rcc).st_mtime_ns
+    assert QtCompat.compileResource(str(qrc), cache) == rcc
+    assert os.stat(rcc).st_mtime_ns == mtime
+    (directory / "icons" / "save.txt").rename(directory / "icons" / "store.txt")
+    QtCompat.registerResource(str(qrc), cacheDir=cache)
+    try:
+        assert sorted(QtCore.QDir(":/tool/icons").entryList()) == [
+            "open.txt",
+            "store.txt",
+        ]
+    finally:
+        QtCompat.unregisterResource(str(qrc), cacheDir=cache)
+
+    QtCompat.registerResource(rcc, "/mapped")
+    try:
+        assert read(":/mapped/tool/icons/open.txt") == b"open"
+    finally:
+        QtCompat.unregisterResource(rcc, "/mapped")
+
+
+def test_headless_application():
+    """QtCompat.headlessApplication creates an offscreen application"""
+    code = textwrap.dedent(
+        """\
+        import os
+        import sys
+        import Qt
+        from Qt import QtCompat, QtGui
+
+        app = QtCompat.headlessApplication("gui", ["job"])
+        assert QtCompat.headlessApplication("core") is app
+        print(type(app).__name__, app.platformName(), hasattr(Qt, "QtWidgets"))
+        # Nor the extras of the binding which need QtWidgets
+        widgets = [name for name in sys.modules if name.endswith(".QtWidgets")]
+        print("Imported", widgets, hasattr(QtCompat, "loadUi"))
+        try:
+            QtCompat.headlessApplication("widgets")
+        except ImportError:
+            print("ImportError")
+
+        # Fonts are added and the font database loaded once
+        calls = []
+
+        class FontDatabase(object):
+            @staticmethod
+            def addApplicationFont(path):
+                calls.append(path)
+                return len(calls)
+
+            @staticmethod
+            def families():
+                calls.append("families")
+                return []
+
+        Qt._QtGui = type("QtGui", (object,), {"QFontDatabase": FontDatabase})
+        Qt._prewarmed[:] = []
+        QtCompat.headlessApplication("gui", fonts=["a.ttf"])
+        QtCompat.headlessApplication("gui", fonts=["a.ttf"])
+        QtCompat.headlessApplication("gui")
+        QtCompat.headlessApplication("gui", fonts=["a.ttf", "b.ttf"])
+        print(" ".join(os.path.basename(call) for call in calls))
+        """
+    )
+    env = os.environ.copy()
+    env["PYTHONPATH"] = str(REPO_ROOT / "src")
+    env["QT_MODULES"] = os.pathsep.join(["QtCore", "QtGui"])
+    env.pop("QT_QPA_PLATFORM", None)
+    output = subprocess_check_output(
+        [sys.executable, "-c", code],
+        env=env,
+        universal_newlines=True,
+    )
+    lines = output.splitlines()
+    assert "QGuiApplication offscreen False" in lines, output
+    assert "Imported [] False" in lines, output
+    assert "ImportError" in lines, output
+    assert "a.ttf families b.ttf families" in lines, output
+
+
 def test_qfont_from_string():
     import Qt
 